@@ -0,0 +1,99 @@
+"""Shared fixtures for the harness microbenchmarks."""
+
+import random
+
+import pytest
+
+from azure_db_zr_bench.benchmark import BenchmarkResult
+from azure_db_zr_bench.config import BenchmarkTarget
+
+SERVICE_MODES = {
+    "postgres": ["no-ha", "samezone-ha", "crosszone-ha"],
+    "mysql": ["no-ha", "samezone-ha", "crosszone-ha"],
+    "sqldb": ["non-zr", "zr"],
+}
+
+
+@pytest.fixture
+def mock_target() -> BenchmarkTarget:
+    """Mock target with zero latency, so only harness cost is measured."""
+    return BenchmarkTarget(
+        host="localhost",
+        port=0,
+        database="",
+        username="",
+        password="",
+        service="mock",
+        mode="local",
+        latency={"distribution": "fixed", "ms": 0.0},
+    )
+
+
+def make_synthetic_result(rng: random.Random, index: int, ts_points: int = 60) -> BenchmarkResult:
+    """Build a plausible BenchmarkResult without running anything."""
+    service = rng.choice(list(SERVICE_MODES))
+    mode = rng.choice(SERVICE_MODES[service])
+    throughput = rng.uniform(200, 2000)
+    p50 = rng.uniform(1, 5)
+
+    return BenchmarkResult(
+        target_name=f"{service}-{mode}",
+        service=service,
+        mode=mode,
+        concurrency=rng.choice([1, 4, 16, 32]),
+        duration=300,
+        warmup=30,
+        batch_size=1,
+        start_time=f"2025-01-01T00:00:{index:06d}",
+        end_time=f"2025-01-01T00:05:{index:06d}",
+        summary={
+            "total_writes": int(throughput * 300),
+            "total_operations": int(throughput * 300),
+            "actual_duration_sec": 300.0,
+            "throughput_wps": throughput,
+            "latency_p50_ms": p50,
+            "latency_p95_ms": p50 * 2,
+            "latency_p99_ms": p50 * 3,
+            "latency_mean_ms": p50 * 1.2,
+            "latency_min_ms": p50 / 2,
+            "latency_max_ms": p50 * 10,
+            "error_count": 0,
+            "error_rate": 0.0,
+        },
+        time_series=[
+            {
+                "elapsed_sec": i,
+                "throughput_wps": throughput + rng.uniform(-50, 50),
+                "avg_latency_ms": p50 + rng.uniform(-0.5, 0.5),
+            }
+            for i in range(ts_points)
+        ],
+        raw_latencies=[],
+        errors=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_results():
+    """10k synthetic results spread across services, modes and concurrency levels."""
+    rng = random.Random(42)
+    return [make_synthetic_result(rng, i) for i in range(10_000)]
+
+
+@pytest.fixture(scope="session")
+def raw_time_series():
+    """1M raw per-worker time-series points, as collected by the worker loop."""
+    rng = random.Random(42)
+    workers = 16
+    seconds = 1_000_000 // workers
+    base = 1_700_000_000.0
+    return [
+        {
+            "timestamp": base + second + rng.random(),
+            "worker_id": worker,
+            "writes": rng.randint(100, 200),
+            "avg_latency_ms": rng.uniform(1, 5),
+        }
+        for second in range(seconds)
+        for worker in range(workers)
+    ]
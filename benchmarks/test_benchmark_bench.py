@@ -0,0 +1,52 @@
+"""Microbenchmarks for the runner hot paths in benchmark.py."""
+
+import random
+
+import numpy as np
+import pytest
+
+from azure_db_zr_bench.benchmark import BenchmarkRunner, aggregate_time_series
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_interval_mean(benchmark):
+    """The worker loop's per-interval np.mean over one second of latencies."""
+    rng = random.Random(42)
+    interval_latencies = [rng.uniform(1, 5) for _ in range(1000)]
+    benchmark(np.mean, interval_latencies)
+
+
+def test_aggregate_time_series_1m(benchmark, raw_time_series):
+    aggregated = benchmark.pedantic(
+        aggregate_time_series, args=(raw_time_series,), rounds=3, iterations=1
+    )
+    assert aggregated
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+def test_runner_per_op_overhead(benchmark, mock_target, tmp_path, concurrency):
+    """End-to-end runner against a zero-latency mock.
+
+    Records ops/s and per-op overhead in extra_info; the timed value is the
+    whole (fixed-length) run, so only extra_info is meaningful to compare.
+    """
+
+    def run():
+        runner = BenchmarkRunner(
+            target_name="bench-mock",
+            target_config=mock_target,
+            concurrency=concurrency,
+            duration=1,
+            warmup=0,
+            output_dir=tmp_path,
+        )
+        return runner.run().summary
+
+    summary = benchmark.pedantic(run, rounds=1, iterations=1)
+    ops_per_sec = summary["total_operations"] / summary["actual_duration_sec"]
+    benchmark.extra_info["ops_per_sec"] = ops_per_sec
+    benchmark.extra_info["overhead_per_op_us"] = (
+        concurrency / ops_per_sec * 1e6 - summary["latency_mean_ms"] * 1000
+    )
+    assert summary["error_count"] == 0
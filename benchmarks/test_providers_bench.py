@@ -0,0 +1,43 @@
+"""Microbenchmarks for per-operation costs in providers.py."""
+
+import pytest
+
+from azure_db_zr_bench.keys import KEY_DISTRIBUTIONS, KeyDistribution, KeyGenerator
+from azure_db_zr_bench.providers import MockProvider, WriteResult
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_generate_payload(benchmark, mock_target):
+    provider = MockProvider(mock_target)
+    payload = benchmark(provider.generate_payload, 512)
+    assert len(payload) == 512
+
+
+@pytest.mark.parametrize("batch_size", [1, 100])
+def test_generate_rows(benchmark, mock_target, batch_size):
+    provider = MockProvider(mock_target)
+    rows = benchmark(provider.generate_rows, batch_size)
+    assert len(rows) == batch_size
+
+
+@pytest.mark.parametrize("kind", KEY_DISTRIBUTIONS)
+def test_key_generator_next(benchmark, kind):
+    """Per-key cost of single-key draws (reads/updates) for each distribution."""
+    keys = KeyGenerator(KeyDistribution(kind), 1, 1_000_000, stream=0, streams=4)
+    key = benchmark(keys.next)
+    assert 1 <= key <= 1_000_000
+
+
+def test_write_result_construction(benchmark):
+    result = benchmark(WriteResult, success=True, latency_ms=1.5, rows_written=1)
+    assert result.timestamp > 0
+
+
+@pytest.mark.parametrize("batch_size", [1, 10])
+def test_mock_write_batch(benchmark, mock_target, batch_size):
+    """Per-op cost of a write against a zero-latency mock: row generation + timing."""
+    provider = MockProvider(mock_target)
+    provider.connect()
+    result = benchmark(provider.write_batch, batch_size)
+    assert result.rows_written == batch_size
@@ -0,0 +1,46 @@
+"""Microbenchmarks for report generation in report.py."""
+
+import numpy as np
+import pytest
+
+from azure_db_zr_bench.charts import DEFAULT_CHART_POINTS, lttb
+from azure_db_zr_bench.report import (
+    build_pivots,
+    calculate_comparisons,
+    generate_report,
+    group_results,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_group_results_10k(benchmark, synthetic_results):
+    grouped = benchmark(group_results, synthetic_results)
+    assert grouped
+
+
+def test_calculate_comparisons_10k(benchmark, synthetic_results):
+    grouped = group_results(synthetic_results)
+    comparisons = benchmark(calculate_comparisons, grouped)
+    assert comparisons
+
+
+def test_build_pivots_10k(benchmark, synthetic_results):
+    pivots = benchmark(build_pivots, synthetic_results, ("concurrency", "batch_size"))
+    assert pivots
+
+
+def test_generate_report_10k(benchmark, synthetic_results, tmp_path):
+    html_path = benchmark.pedantic(
+        generate_report, args=(synthetic_results, tmp_path), rounds=3, iterations=1
+    )
+    assert html_path.exists()
+
+
+def test_lttb_12h_series(benchmark):
+    """Downsampling a 12-hour per-second series to the default chart budget."""
+    rng = np.random.default_rng(42)
+    x = np.arange(12 * 3600, dtype=float)
+    y = rng.lognormal(1.0, 0.3, len(x))
+    _, sampled = benchmark(lttb, x, y, DEFAULT_CHART_POINTS)
+    assert len(sampled) == DEFAULT_CHART_POINTS
@@ -0,0 +1,36 @@
+#!/bin/bash
+# run-microbench.sh - Run the harness microbenchmarks and save/compare baselines
+#
+# Usage: ./scripts/run-microbench.sh [save|compare] [extra pytest args]
+#
+# Examples:
+#   ./scripts/run-microbench.sh save       # Run and store a new baseline
+#   ./scripts/run-microbench.sh compare    # Run and compare against the latest baseline,
+#                                          # failing if any mean regressed by more than 10%
+#   ./scripts/run-microbench.sh            # Just run
+
+set -e
+
+ACTION="${1:-run}"
+shift || true
+STORAGE="${BENCH_STORAGE:-benchmarks/.baselines}"
+THRESHOLD="${BENCH_THRESHOLD:-mean:10%}"
+
+ARGS=(benchmarks --benchmark-storage="$STORAGE" --benchmark-columns=min,mean,stddev,ops)
+
+case "$ACTION" in
+    save)
+        ARGS+=(--benchmark-autosave)
+        ;;
+    compare)
+        ARGS+=(--benchmark-compare --benchmark-compare-fail="$THRESHOLD")
+        ;;
+    run)
+        ;;
+    *)
+        echo "Unknown action: $ACTION (expected save, compare or run)"
+        exit 1
+        ;;
+esac
+
+python -m pytest "${ARGS[@]}" "$@"
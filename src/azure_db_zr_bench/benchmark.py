@@ -1,17 +1,26 @@
 """Benchmark runner for azure-db-zr-bench."""
 
 import json
+import sqlite3
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
-from .config import BenchmarkTarget
-from .providers import get_provider, WriteResult
+from .config import DEFAULT_DURABILITY, BenchmarkTarget
+from .histogram import LatencyHeatmap, LatencyHistogram
+from .loadprofile import LoadLevel, LoadProfile
+from .pool import ConnectionPool, get_pool
+from .probe import PROBE_INTERVAL_SEC, PROBE_METRICS, ProbeSample, ProbeStats, RttProbe
+from .providers import COMMIT_LOOP_TABLE, get_provider, WriteResult
+from .proxy import LatencyProxy, ProxySpec
+from .replay import TraceReader, TraceReplay
+from .schema import DEFAULT_PRIMARY_KEY, DEFAULT_SCHEMA, PLACEHOLDERS, WorkloadSchema
+from .store import STORE_FILE, ResultsStore
 
 
 @dataclass
@@ -32,6 +41,157 @@ class BenchmarkResult:
     raw_latencies: List[float]
     errors: List[str]
     output_path: Optional[Path] = None
+    target_rate: Optional[float] = None
+    pool_size: Optional[int] = None
+    workload: str = "write"
+    # Full latency distribution, and per-second latency buckets over time
+    latency_histogram: Optional[LatencyHistogram] = None
+    latency_heatmap: Optional[LatencyHeatmap] = None
+    # Per-worker throughput, latency, errors and reconnects (see summarize_workers)
+    workers: List[Dict] = field(default_factory=list)
+    # Pooled mode: the same per pooled connection, since any worker can use any
+    # connection (see summarize_connections)
+    connections: List[Dict] = field(default_factory=list)
+    # Table definition written to (see schema.WorkloadSchema)
+    schema: str = DEFAULT_SCHEMA
+    schema_definition: Optional[Dict] = None
+    # Primary key strategy (see schema.PK_STRATEGIES)
+    primary_key: str = DEFAULT_PRIMARY_KEY
+    # Seed for row and key generation (None: unseeded)
+    seed: Optional[int] = None
+    # Session commit durability (see config.DURABILITY_LEVELS)
+    durability: str = DEFAULT_DURABILITY
+    # Emulated network conditions the run went through (see proxy.ProxySpec)
+    proxy: Optional[Dict] = None
+    # Load profile the run followed, and a summary per phase (see loadprofile)
+    load_profile: Optional[str] = None
+    phases: Optional[List[Dict]] = None
+    # Trace the replay workload ran, and latency per statement template (see replay)
+    trace: Optional[Dict] = None
+    templates: Optional[List[Dict]] = None
+    # SLO search step: the search, the SLO, and whether the step met it (see slo)
+    slo: Optional[Dict] = None
+
+    @property
+    def parameters(self) -> Dict:
+        """The run's settings, by name, to filter, group and compare runs by (see PARAMETERS)."""
+        return {
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "workload": self.workload,
+            "target_rate": self.target_rate,
+            "pool_size": self.pool_size,
+            "schema": self.schema,
+            "primary_key": self.primary_key,
+            "durability": self.durability,
+            "load_profile": self.load_profile,
+            "network": ProxySpec(**self.proxy).describe() if self.proxy else None,
+            "trace": Path(self.trace["path"]).name if self.trace else None,
+        }
+
+
+# Run settings in BenchmarkResult.parameters
+PARAMETERS = (
+    "concurrency",
+    "batch_size",
+    "workload",
+    "target_rate",
+    "pool_size",
+    "schema",
+    "primary_key",
+    "durability",
+    "load_profile",
+    "network",
+    "trace",
+)
+
+# Result files holding the full latency histogram and heatmap
+HISTOGRAM_FILE = "histogram.json"
+HEATMAP_FILE = "heatmap.npz"
+
+# Fraction of the target rate a run must achieve to count as "rate met"
+RATE_MET_TOLERANCE = 0.95
+
+# Seconds of tokens a worker's bucket can bank to catch up after a slow op
+TOKEN_BUCKET_BURST_SEC = 0.1
+
+# How often a load profile's levels are updated within a phase (phase
+# boundaries are hit exactly)
+LOAD_TICK_SEC = 0.1
+
+WORKLOADS = ("write", "connect", "replay", "server-loop")
+
+# Server-loop workload: INSERT + COMMIT cycles the server runs per call
+COMMIT_LOOP_ITERATIONS = 100
+
+# Replay workload: statement templates reported one by one; the rest are
+# folded into one OTHER_TEMPLATE row
+MAX_TEMPLATES = 50
+OTHER_TEMPLATE = "(other)"
+
+# Connect workload: probe TCP/TLS handshake phases on every Nth connection
+CONNECT_PROBE_EVERY = 5
+
+# Pause before retrying after a failed reconnect
+RECONNECT_BACKOFF_SEC = 0.5
+
+# A worker is a straggler if its throughput is below this fraction of the
+# median worker's, or its P99 above this multiple of the median worker P99
+STRAGGLER_THROUGHPUT_RATIO = 0.75
+STRAGGLER_P99_RATIO = 2.0
+
+
+class TokenBucket:
+    """Token-bucket rate limiter that paces a single worker.
+
+    Tokens are rows: a worker writing batches of N rows acquires N tokens per
+    operation. The bucket holds at most ``burst`` tokens (or one batch,
+    whichever is larger): enough for a worker to catch up after an
+    occasional slow operation, but not to replay a long stall as one big
+    burst of back-to-back writes.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.perf_counter()
+
+    def acquire(self, tokens: float = 1.0, stop_event: Optional[threading.Event] = None) -> float:
+        """Block until ``tokens`` are available and return the seconds waited.
+
+        Returns early (without consuming tokens) if ``stop_event`` is set.
+        """
+        capacity = max(self.burst, tokens)
+        start = time.perf_counter()
+
+        while True:
+            now = time.perf_counter()
+            self._tokens = min(capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return now - start
+
+            wait = (tokens - self._tokens) / self.rate
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    return time.perf_counter() - start
+            else:
+                time.sleep(wait)
+
+    def set_rate(self, rate: float, burst: float) -> None:
+        """Change the rate from now on, keeping banked tokens up to the new ``burst``."""
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        now = time.perf_counter()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate, burst)
+        self._last = now
+        self.rate = rate
+        self.burst = burst
 
 
 @dataclass
@@ -41,6 +201,7 @@ class WorkerState:
     results: List[WriteResult] = field(default_factory=list)
     error_count: int = 0
     write_count: int = 0
+    reconnect_count: int = 0
 
 
 class BenchmarkRunner:
@@ -55,7 +216,31 @@ class BenchmarkRunner:
         warmup: int = 30,
         batch_size: int = 1,
         output_dir: Path = Path("results"),
+        target_rate: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        workload: str = "write",
+        truncate: bool = True,
+        probe_interval: Optional[float] = PROBE_INTERVAL_SEC,
+        load_profile: Optional[LoadProfile] = None,
+        trace: Optional[Path] = None,
+        speed: float = 1.0,
+        loop_iterations: int = COMMIT_LOOP_ITERATIONS,
     ):
+        if workload not in WORKLOADS:
+            raise ValueError(f"Invalid workload: {workload}. Must be one of {WORKLOADS}")
+        if workload == "connect" and pool_size:
+            raise ValueError("The connect workload opens its own connections; drop --pool-size")
+        if (workload == "replay") != (trace is not None):
+            raise ValueError("The replay workload needs a --trace, and a trace --workload replay")
+        if workload == "replay" and pool_size:
+            raise ValueError("The replay workload gives each worker a connection; drop --pool-size")
+        if workload == "replay" and (target_rate or load_profile):
+            raise ValueError("A trace sets its own pace; use --speed, not a rate or load profile")
+        if workload == "server-loop" and (pool_size or target_rate or load_profile):
+            raise ValueError("The server-loop workload runs closed-loop on its own connections")
+        if loop_iterations < 1:
+            raise ValueError(f"Loop iterations must be at least 1, got {loop_iterations}")
+
         self.target_name = target_name
         self.target_config = target_config
         self.concurrency = concurrency
@@ -63,12 +248,77 @@ class BenchmarkRunner:
         self.warmup = warmup
         self.batch_size = batch_size
         self.output_dir = output_dir
+        # Total writes/sec across all workers; None runs closed-loop
+        self.target_rate = target_rate
+        # Connections shared by all workers; None gives each worker its own
+        self.pool_size = pool_size
+        # "write" inserts rows; "connect" opens and closes connections
+        self.workload = workload
+        # False keeps existing (e.g. prefilled) rows in the benchmark table
+        self.truncate = truncate
+        # Seconds between network RTT probe samples; None turns the probe off
+        self.probe_interval = probe_interval
+        # Phases that change the worker count and rate as the run goes; the
+        # profile sets the duration, and enough workers start for its peak
+        self.load_profile = load_profile
+        if load_profile is not None:
+            self.duration = load_profile.duration
+            self.concurrency = load_profile.max_workers(concurrency)
+        # Replay workload: statements from this trace, at ``speed`` times their
+        # original pace (0: as fast as the workers can go)
+        self.trace = None
+        if trace is not None:
+            self.trace = TraceReader(trace, PLACEHOLDERS.get(target_config.service, "?"))
+        self.speed = speed
+        self._replay: Optional[TraceReplay] = None
+        # Server-loop workload: commits the server times in each call
+        self.loop_iterations = loop_iterations
+        self.schema = target_config.schema or WorkloadSchema.default()
 
         self._stop_event = threading.Event()
         self._warmup_complete = threading.Event()
+        # Measurement window in perf_counter_ns(); ops count if they start inside it
+        self._window_start_ns: Optional[int] = None
+        self._window_end_ns: Optional[int] = None
+        # Seconds from the end of the window until the last in-flight op finished
+        self._drain_sec = 0.0
+        self._probe_stats = ProbeStats()
+        self._probe_lock = threading.Lock()
+        # Workers at or above load.workers wait; load.rate is split across the rest.
+        # A load profile moves it on from the run's own concurrency and rate
+        self._initial_load = LoadLevel(0, concurrency, target_rate)
+        self._load = self._initial_load
+        self._load_changed = threading.Condition()
+        # Pooled mode: reconnects inside the window, by pooled connection
+        self._connection_reconnects: Dict[int, int] = {}
+        self._connection_lock = threading.Lock()
 
     def run(self) -> BenchmarkResult:
-        """Execute the benchmark and return results."""
+        """Execute the benchmark and return results.
+
+        A target with a ``proxy`` section is run through a LatencyProxy in
+        front of its server, for the whole run including table setup.
+        """
+        spec = self.target_config.proxy
+        if spec is None:
+            return self._run()
+
+        target_config = self.target_config
+        proxy = LatencyProxy(spec, (target_config.host, target_config.port))
+        print(f"Starting latency proxy ({spec.describe()})...")
+        with proxy:
+            self.target_config = replace(target_config, host=proxy.listen_host, port=proxy.port)
+            try:
+                return self._run()
+            finally:
+                self.target_config = target_config
+                stats = proxy.stop()
+                print(
+                    f"Proxy: {stats.get('connections', 0)} connections, "
+                    f"{stats.get('resets', 0)} resets, {stats.get('refused', 0)} refused"
+                )
+
+    def _run(self) -> BenchmarkResult:
         # Create output directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_dir = self.output_dir / timestamp / self.target_name
@@ -77,86 +327,345 @@ class BenchmarkRunner:
         print(f"Connecting to {self.target_config.host}...")
 
         # Setup: create table using a single connection
-        setup_provider = get_provider(self.target_config)
-        setup_provider.connect()
-        setup_provider.create_benchmark_table()
-        setup_provider.truncate_benchmark_table()
-        setup_provider.disconnect()
+        if self.workload == "write":
+            setup_provider = get_provider(self.target_config)
+            setup_provider.connect()
+            setup_provider.create_benchmark_table()
+            if self.truncate:
+                setup_provider.truncate_benchmark_table()
+            setup_provider.disconnect()
 
-        print("Benchmark table ready")
+            print(f"Benchmark table ready ({self.schema.table})")
+        elif self.workload == "server-loop":
+            setup_provider = get_provider(self.target_config)
+            setup_provider.connect()
+            setup_provider.install_commit_loop(self.truncate)
+            setup_provider.disconnect()
 
-        # Run benchmark with multiple workers
-        start_time = datetime.now()
-        worker_states = [WorkerState() for _ in range(self.concurrency)]
-        time_series_data = []
-        time_series_lock = threading.Lock()
+            print(f"Server-side write loop ready ({COMMIT_LOOP_TABLE})")
 
-        def worker(worker_id: int, state: WorkerState):
-            """Worker function that runs in a thread."""
-            provider = get_provider(self.target_config)
-            provider.connect()
+        pool = None
+        try:
+            if self.pool_size:
+                print(f"Opening pool of {self.pool_size} connections...")
+                pool = get_pool(self.target_config, self.pool_size, self.concurrency)
+                pool.open()
 
-            try:
-                interval_writes = 0
-                interval_start = time.time()
-                interval_latencies = []
-
-                while not self._stop_event.is_set():
-                    result = provider.write_batch(self.batch_size)
-                    
-                    # Only record results after warmup
-                    if self._warmup_complete.is_set():
-                        state.results.append(result)
-                        if result.success:
-                            state.write_count += result.rows_written
-                            interval_writes += result.rows_written
-                            interval_latencies.append(result.latency_ms)
+            # Run benchmark with multiple workers
+            start_time = datetime.now()
+            worker_states = [WorkerState() for _ in range(self.concurrency)]
+            self._worker_states = worker_states
+            self._time_series_data = []
+            self._time_series_lock = threading.Lock()
+
+            def new_interval(phase: Optional[int]) -> Dict:
+                """A worker's running totals for its next time series entry."""
+                return {
+                    "start": time.time(),
+                    "phase": phase,
+                    "writes": 0,
+                    "latencies": [],
+                    "pool_waits": [],
+                }
+
+            def worker(worker_id: int, state: WorkerState):
+                """Worker function that runs in a thread."""
+                provider = None
+                if pool is None:
+                    provider = get_provider(self.target_config, worker_id, self.concurrency)
+                    if self.workload != "connect":
+                        provider.connect()
+
+                bucket = None
+                load = None
+                interval = new_interval(None)
+
+                def flush_interval(phase: Optional[int]) -> None:
+                    """Record the worker's time series entry (after warmup) and start another."""
+                    nonlocal interval
+                    if self._warmup_complete.is_set() and interval["phase"] is not None:
+                        entry = {
+                            "timestamp": time.time(),
+                            "worker_id": worker_id,
+                            "writes": interval["writes"],
+                            "avg_latency_ms": (
+                                np.mean(interval["latencies"]) if interval["latencies"] else 0
+                            ),
+                        }
+                        if pool is not None:
+                            entry["avg_pool_wait_ms"] = (
+                                np.mean(interval["pool_waits"]) if interval["pool_waits"] else 0
+                            )
+                        if self.load_profile is not None:
+                            entry["phase"] = interval["phase"]
+                        self._record_interval(worker_id, entry)
+                    interval = new_interval(phase)
+
+                try:
+                    op_count = 0
+
+                    while not self._stop_event.is_set():
+                        if self._load is not load:
+                            load = self._load
+                            bucket = self._pace(bucket, load)
+                        if worker_id >= load.workers:
+                            flush_interval(None)
+                            self._wait_for_load(load)
+                            continue
+
+                        lag_ms = 0.0
+                        if bucket:
+                            tokens = self.batch_size if self.workload == "write" else 1
+                            bucket.acquire(tokens, self._stop_event)
+                            if self._stop_event.is_set():
+                                break
+                            # A phase that began during the wait re-paces the worker first
+                            if self._load.phase != load.phase:
+                                continue
+                            # Pacers that keep a fixed schedule report how late the send was
+                            lag_ms = getattr(bucket, "lag_sec", 0.0) * 1000
+
+                        if self._replay is not None:
+                            # Waits until the worker's next statement is due
+                            record, lag_ms = self._replay.next(worker_id)
+                            if record is None:
+                                break
+
+                        # No new operations once the measurement window has closed
+                        start_ns = time.perf_counter_ns()
+                        window_end_ns = self._window_end_ns
+                        if window_end_ns is not None and start_ns >= window_end_ns:
+                            break
+
+                        if self.workload == "connect":
+                            probe = op_count % CONNECT_PROBE_EVERY == 0
+                            result = provider.measure_connect(probe=probe)
+                        elif self.workload == "server-loop":
+                            result = self._commit_loop(provider)
+                            if not result.success and not provider.is_healthy():
+                                self._reconnect(provider, state)
+                        elif self._replay is not None:
+                            result = self._execute(provider, record)
+                            if not result.success and not provider.is_healthy():
+                                self._reconnect(provider, state)
+                        elif pool is None:
+                            result = self._write(provider)
+                            if not result.success and not provider.is_healthy():
+                                self._reconnect(provider, state)
                         else:
-                            state.error_count += 1
-
-                    # Record time series data every second (after warmup)
-                    elapsed = time.time() - interval_start
-                    if elapsed >= 1.0 and self._warmup_complete.is_set():
-                        with time_series_lock:
-                            time_series_data.append({
-                                "timestamp": time.time(),
-                                "worker_id": worker_id,
-                                "writes": interval_writes,
-                                "avg_latency_ms": (
-                                    np.mean(interval_latencies) if interval_latencies else 0
-                                ),
-                            })
-                        interval_writes = 0
-                        interval_latencies = []
-                        interval_start = time.time()
+                            result = self._pooled_write(pool, state)
+                        result.start_ns = start_ns
+                        result.end_ns = time.perf_counter_ns()
+                        result.schedule_lag_ms = lag_ms
+                        result.load_phase = load.phase
+                        op_count += 1
 
-            finally:
-                provider.disconnect()
+                        # Each time series entry covers one phase of a load profile
+                        if load.phase != interval["phase"]:
+                            flush_interval(load.phase)
 
-        # Start workers
-        print(f"Starting {self.concurrency} workers...")
-        executor = ThreadPoolExecutor(max_workers=self.concurrency)
-        futures = [
-            executor.submit(worker, i, worker_states[i]) for i in range(self.concurrency)
-        ]
+                        # Only record operations that started inside the window
+                        if self._in_window(result.start_ns):
+                            self._record_result(worker_id, state, result)
+                            if pool is not None:
+                                interval["pool_waits"].append(result.pool_wait_ms)
+                            if result.success:
+                                state.write_count += result.rows_written
+                                interval["writes"] += result.rows_written
+                                interval["latencies"].append(result.latency_ms)
+                            else:
+                                state.error_count += 1
+
+                        # Record time series data every second (after warmup)
+                        if time.time() - interval["start"] >= 1.0:
+                            flush_interval(load.phase)
+
+                    # Keep the partial interval the worker stopped in (window end or stop)
+                    if interval["phase"] is not None:
+                        flush_interval(interval["phase"])
+
+                finally:
+                    if provider:
+                        provider.disconnect()
+
+            # The probe runs from warmup on, so its connection is warm when the window opens
+            probe = None
+            if self.probe_interval:
+                probe = RttProbe(
+                    self.target_config, self.probe_interval, self._record_probe, self._stop_event
+                )
+                probe.start()
+
+            # A load profile moves the workers and rate from warmup on
+            driver = None
+            if self.load_profile is not None:
+                initial = self._initial_load
+                self._load = self.load_profile.level_at(0.0, initial.workers, initial.rate)
+                driver = threading.Thread(target=self._drive_load, name="load-profile", daemon=True)
+                driver.start()
+
+            # The trace's clock starts with the workers, so warmup replays its start
+            if self.trace is not None:
+                self._replay = TraceReplay(
+                    self.trace, self.concurrency, self.speed, self._stop_event
+                )
+                pace = f"{self.speed:g}x speed" if self.speed else "full speed"
+                print(f"Replaying {self.trace.path.name} at {pace}...")
+                self._replay.start()
+
+            # Start workers
+            if pool:
+                print(
+                    f"Starting {self.concurrency} workers sharing "
+                    f"{self.pool_size} connections..."
+                )
+            else:
+                print(f"Starting {self.concurrency} workers...")
+            executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            futures = [
+                executor.submit(worker, i, worker_states[i]) for i in range(self.concurrency)
+            ]
+
+            # Warmup phase
+            print(f"Warming up for {self.warmup} seconds...")
+            time.sleep(self.warmup)
+            window_start_ns = time.perf_counter_ns()
+            warmup_end_time = datetime.now()
+            self._window_start_ns = window_start_ns
+            self._window_end_ns = window_start_ns + int(self.duration * 1_000_000_000)
+            self._warmup_complete.set()
+
+            # Main benchmark phase; workers stop issuing operations when it ends
+            print(f"Running benchmark for {self.duration:g} seconds...")
+            self._measure(run_dir, start_time, warmup_end_time)
+
+            # Stop workers (if _measure returned early, the window ends now)
+            print("Stopping workers...")
+            self._window_end_ns = min(self._window_end_ns, time.perf_counter_ns())
+            self._stop_event.set()
+            with self._load_changed:
+                self._load_changed.notify_all()
+            executor.shutdown(wait=True)
+            if probe:
+                probe.join()
+            if driver:
+                driver.join()
+            if self._replay:
+                self._replay.join()
+            self._drain_sec = max(time.perf_counter_ns() - self._window_end_ns, 0) / 1e9
+
+            end_time = datetime.now()
+            window_end_time = warmup_end_time + timedelta(
+                microseconds=(self._window_end_ns - window_start_ns) // 1000
+            )
+        finally:
+            # Workers stop before the pool closes, even if the run failed
+            self._stop_event.set()
+            with self._load_changed:
+                self._load_changed.notify_all()
+            if pool:
+                pool.close()
+
+        result = self._build_result(
+            worker_states, start_time, warmup_end_time, window_end_time, end_time, run_dir
+        )
+
+        # Save results
+        self._save_results(result, run_dir)
+
+        return result
+
+    def _pace(self, bucket: Optional[TokenBucket], load: LoadLevel) -> Optional[TokenBucket]:
+        """The token bucket pacing one worker at ``load`` (None: closed-loop)."""
+        if not load.rate:
+            return None
+        worker_rate = load.rate / load.workers
+        burst = max(1.0, worker_rate * TOKEN_BUCKET_BURST_SEC)
+        if bucket is None:
+            return TokenBucket(worker_rate, burst=burst)
+        bucket.set_rate(worker_rate, burst)
+        return bucket
+
+    def _wait_for_load(self, load: LoadLevel) -> None:
+        """Hold a worker the current load does not need until the load changes."""
+        with self._load_changed:
+            self._load_changed.wait_for(
+                lambda: self._load is not load or self._stop_event.is_set()
+            )
+
+    def _drive_load(self) -> None:
+        """Move the load through the profile's phases until the run stops."""
+        initial = self._initial_load
+        phase = None
+        while not self._stop_event.is_set():
+            window_start_ns = self._window_start_ns
+            offset = 0.0
+            if window_start_ns is not None:
+                offset = (time.perf_counter_ns() - window_start_ns) / 1e9
+            level = self.load_profile.level_at(offset, initial.workers, initial.rate)
+            if level != self._load:
+                with self._load_changed:
+                    self._load = level
+                    self._load_changed.notify_all()
+            if window_start_ns is not None and level.phase != phase:
+                phase = level.phase
+                rate = f", {level.rate:.0f} writes/sec" if level.rate else ""
+                print(
+                    f"  Phase {self.load_profile.phases[phase].name}: "
+                    f"{level.workers} workers{rate}"
+                )
+            # Wake at the next tick, or exactly at the phase's end if that comes first
+            wait = LOAD_TICK_SEC
+            if window_start_ns is not None:
+                _, end = self.load_profile.phase_bounds(level.phase)
+                if end > offset:
+                    wait = min(wait, end - (time.perf_counter_ns() - window_start_ns) / 1e9)
+            self._stop_event.wait(max(wait, 0.0))
+
+    def _in_window(self, start_ns: int) -> bool:
+        """Whether an operation (or probe sample) started inside the measurement window."""
+        window_start_ns = self._window_start_ns
+        if window_start_ns is None or start_ns < window_start_ns:
+            return False
+        return start_ns < self._window_end_ns
 
-        # Warmup phase
-        print(f"Warming up for {self.warmup} seconds...")
-        time.sleep(self.warmup)
-        self._warmup_complete.set()
-        warmup_end_time = datetime.now()
+    def _record_result(self, worker_id: int, state: WorkerState, result: WriteResult) -> None:
+        """Keep one post-warmup operation result."""
+        state.results.append(result)
 
-        # Main benchmark phase
-        print(f"Running benchmark for {self.duration} seconds...")
-        time.sleep(self.duration)
+    def _record_interval(self, worker_id: int, entry: Dict) -> None:
+        """Keep one worker's per-second time series entry."""
+        with self._time_series_lock:
+            self._time_series_data.append(entry)
 
-        # Stop workers
-        print("Stopping workers...")
-        self._stop_event.set()
-        executor.shutdown(wait=True)
+    def _record_probe(self, sample: ProbeSample) -> None:
+        """Keep one RTT probe sample taken inside the measurement window."""
+        if self._in_window(sample.start_ns):
+            with self._probe_lock:
+                self._probe_stats.record(sample)
 
-        end_time = datetime.now()
+    def _measure(self, run_dir: Path, start_time: datetime, warmup_end_time: datetime) -> None:
+        """Let the workers run for the measurement window (or until a replayed trace ends)."""
+        if self._replay is not None:
+            if self._replay.finished.wait(self.duration):
+                print("Trace finished")
+        else:
+            time.sleep(self.duration)
+
+    def _build_result(
+        self,
+        worker_states: List[WorkerState],
+        start_time: datetime,
+        warmup_end_time: datetime,
+        window_end_time: datetime,
+        end_time: datetime,
+        run_dir: Path,
+    ) -> BenchmarkResult:
+        """Aggregate the workers' results into a BenchmarkResult.
 
+        Throughput is over the measurement window (``warmup_end_time`` to
+        ``window_end_time``), not including the drain until ``end_time``.
+        """
         # Aggregate results
         all_results = []
         total_writes = 0
@@ -172,7 +681,24 @@ class BenchmarkRunner:
                     errors.append(r.error)
 
         # Calculate latency percentiles
-        successful_latencies = [r.latency_ms for r in all_results if r.success]
+        successful = [r for r in all_results if r.success]
+        successful_latencies = [r.latency_ms for r in successful]
+        latency_times = [r.timestamp for r in successful]
+        if self.workload == "server-loop":
+            # latency_* is the server's time per commit; each call timed many
+            successful_latencies = [ms for r in successful for ms in r.commit_ms]
+            latency_times = [r.timestamp for r in successful for _ in r.commit_ms]
+
+        # Full distribution, and when each latency happened (seconds since
+        # the end of warmup), for the report's distribution charts
+        latency_histogram = LatencyHistogram()
+        latency_histogram.record_many(successful_latencies)
+        origin = int(warmup_end_time.timestamp())
+        latency_heatmap = LatencyHeatmap(start_sec=0)
+        latency_heatmap.record_many(
+            np.maximum(np.array([int(t) - origin for t in latency_times]), 0),
+            successful_latencies,
+        )
 
         if successful_latencies:
             latency_p50 = np.percentile(successful_latencies, 50)
@@ -185,9 +711,11 @@ class BenchmarkRunner:
             latency_p50 = latency_p95 = latency_p99 = latency_mean = 0
             latency_min = latency_max = 0
 
-        # Calculate throughput
-        actual_duration = (end_time - warmup_end_time).total_seconds()
+        # Calculate throughput over the window; operations still in flight
+        # when it closed count, since they started inside it
+        actual_duration = (window_end_time - warmup_end_time).total_seconds()
         throughput = total_writes / actual_duration if actual_duration > 0 else 0
+        overran = sum(1 for r in all_results if r.end_ns > self._window_end_ns)
 
         # Error rate
         total_operations = len(all_results)
@@ -198,6 +726,8 @@ class BenchmarkRunner:
             "total_writes": total_writes,
             "total_operations": total_operations,
             "actual_duration_sec": actual_duration,
+            "drain_sec": self._drain_sec,
+            "ops_after_window": overran,
             "throughput_wps": throughput,
             "latency_p50_ms": latency_p50,
             "latency_p95_ms": latency_p95,
@@ -209,11 +739,121 @@ class BenchmarkRunner:
             "error_rate": error_rate,
         }
 
+        if self.workload == "connect":
+            # latency_* is the full connect() time; phases break it down. Time
+            # spent probing handshakes is not connecting, so the rate leaves it out
+            summary["connections_per_sec"] = connection_rate(
+                [
+                    (state.write_count, sum(r.probe_ms for r in state.results) / 1000)
+                    for state in worker_states
+                ],
+                actual_duration,
+            )
+            summary.update(summarize_phases(all_results))
+        elif self.workload == "server-loop":
+            # loop_call_* is each call as the client saw it, loop_overhead_* the
+            # part of it the server's timings leave out
+            summary["commit_loop_iterations"] = self.loop_iterations
+            summary.update(summarize_phases(all_results))
+
+        templates = None
+        if self._replay is not None:
+            # latency_* covers every statement; templates break it down
+            templates = summarize_templates(all_results)
+            summary["replay_records"] = self._replay.records
+            lags = [r.schedule_lag_ms for r in all_results]
+            if self.speed and lags:
+                summary["replay_lag_p50_ms"] = np.percentile(lags, 50)
+                summary["replay_lag_p99_ms"] = np.percentile(lags, 99)
+                summary["replay_lag_max_ms"] = np.max(lags)
+            if self._replay.error:
+                summary["replay_error"] = self._replay.error
+
+        if self.pool_size:
+            # Acquire wait is reported separately; latency_* stays database time
+            pool_waits = [r.pool_wait_ms for r in all_results]
+            summary["pool_size"] = self.pool_size
+            if pool_waits:
+                summary["pool_wait_p50_ms"] = np.percentile(pool_waits, 50)
+                summary["pool_wait_p95_ms"] = np.percentile(pool_waits, 95)
+                summary["pool_wait_p99_ms"] = np.percentile(pool_waits, 99)
+                summary["pool_wait_mean_ms"] = np.mean(pool_waits)
+                summary["pool_wait_max_ms"] = np.max(pool_waits)
+
+        if self.target_rate and not (self.load_profile and self.load_profile.varies_rate):
+            attainment = throughput / self.target_rate
+            summary["target_rate_wps"] = self.target_rate
+            summary["rate_attainment"] = attainment
+            summary["target_rate_met"] = attainment >= RATE_MET_TOLERANCE
+
+        # Per-worker breakdown, to spot stragglers and uneven load
+        workers = []
+        for worker_id, state in enumerate(worker_states):
+            hist = LatencyHistogram()
+            if self.workload == "server-loop":
+                hist.record_many([ms for r in state.results if r.success for ms in r.commit_ms])
+            else:
+                hist.record_many([r.latency_ms for r in state.results if r.success])
+            workers.append(
+                worker_stats(
+                    worker_id,
+                    hist,
+                    writes=state.write_count,
+                    operations=len(state.results),
+                    errors=state.error_count,
+                    reconnects=state.reconnect_count,
+                    duration_sec=actual_duration,
+                )
+            )
+        if self.load_profile is not None and self.load_profile.varies_workers:
+            # Workers ran for different parts of the window, so are not comparable
+            summary["reconnect_count"] = sum(w["reconnects"] for w in workers)
+        else:
+            summary.update(summarize_workers(workers))
+
+        # Pooled workers take whichever connection is free, so a slow connection
+        # spreads across them; compare the connections themselves too
+        connections = []
+        if self.pool_size:
+            by_connection = {}
+            for r in all_results:
+                if r.connection_id is not None:
+                    by_connection.setdefault(r.connection_id, []).append(r)
+            for connection_id, results in sorted(by_connection.items()):
+                hist = LatencyHistogram()
+                hist.record_many([r.latency_ms for r in results if r.success])
+                entry = worker_stats(
+                    connection_id,
+                    hist,
+                    writes=sum(r.rows_written for r in results if r.success),
+                    operations=len(results),
+                    errors=sum(1 for r in results if not r.success),
+                    reconnects=self._connection_reconnects.get(connection_id, 0),
+                    duration_sec=actual_duration,
+                )
+                entry["connection_id"] = entry.pop("worker_id")
+                connections.append(entry)
+            summary.update(summarize_connections(connections))
+        summary.update(self._probe_stats.summary())
+
         # Aggregate time series by second
-        aggregated_ts = aggregate_time_series(time_series_data)
+        aggregated_ts = aggregate_time_series(
+            self._time_series_data + self._probe_stats.time_series,
+            int(warmup_end_time.timestamp()) if self.load_profile else None,
+        )
 
-        # Create result object
-        result = BenchmarkResult(
+        phases = None
+        if self.load_profile is not None:
+            for point in aggregated_ts:
+                point["phase"] = self.load_profile.phases[point["phase"]].name
+            phases = summarize_load_phases(
+                self.load_profile,
+                self._initial_load,
+                all_results,
+                actual_duration,
+            )
+
+        return BenchmarkResult(
             target_name=self.target_name,
             service=self.target_config.service,
             mode=self.target_config.mode,
@@ -225,82 +865,465 @@ class BenchmarkRunner:
             end_time=end_time.isoformat(),
             summary=summary,
             time_series=aggregated_ts,
-            raw_latencies=successful_latencies[-10000:],  # Keep last 10k for histogram
+            raw_latencies=successful_latencies[-10000:],  # Keep last 10k samples
             errors=errors[:100],  # Keep first 100 errors
             output_path=run_dir,
+            target_rate=self.target_rate,
+            pool_size=self.pool_size,
+            workload=self.workload,
+            latency_histogram=latency_histogram,
+            latency_heatmap=latency_heatmap,
+            workers=workers,
+            connections=connections,
+            schema=self.schema.name,
+            schema_definition=self.schema.to_dict(),
+            primary_key=self.schema.primary_key,
+            seed=self.target_config.seed,
+            durability=self.target_config.durability or DEFAULT_DURABILITY,
+            proxy=self.target_config.proxy.to_dict() if self.target_config.proxy else None,
+            load_profile=self.load_profile.name if self.load_profile else None,
+            phases=phases,
+            trace=self._replay.to_dict() if self._replay else None,
+            templates=templates,
         )
 
-        # Save results
-        self._save_results(result, run_dir)
+    def _write(self, provider) -> WriteResult:
+        """Write one batch, turning exceptions that escape write_batch into failures."""
+        try:
+            return provider.write_batch(self.batch_size)
+        except Exception as e:
+            # e.g. rollback() on a connection that died mid-write
+            return WriteResult(success=False, latency_ms=0.0, rows_written=0, error=str(e))
+
+    def _commit_loop(self, provider) -> WriteResult:
+        """Run one server-side write loop, turning exceptions that escape into failures."""
+        try:
+            return provider.commit_loop(self.loop_iterations)
+        except Exception as e:
+            return WriteResult(success=False, latency_ms=0.0, rows_written=0, error=str(e))
 
+    def _execute(self, provider, record) -> WriteResult:
+        """Run one trace statement, turning exceptions that escape into failures."""
+        try:
+            result = provider.execute_statement(record.sql, record.params)
+        except Exception as e:
+            result = WriteResult(success=False, latency_ms=0.0, rows_written=0, error=str(e))
+        result.template = record.template
+        return result
+
+    def _reconnect(self, provider, state: WorkerState) -> None:
+        """Reconnect a worker whose connection broke, backing off if that fails."""
+        try:
+            provider.reconnect()
+            if self._warmup_complete.is_set():
+                state.reconnect_count += 1
+        except Exception:
+            # The next write fails and tries again
+            self._stop_event.wait(RECONNECT_BACKOFF_SEC)
+
+    def _repair(self, pool: ConnectionPool, provider, state: WorkerState) -> None:
+        """Reconnect a checked-out connection that broke, backing off if that fails."""
+        try:
+            if pool.repair(provider) and self._warmup_complete.is_set():
+                state.reconnect_count += 1
+                connection_id = pool.connection_id(provider)
+                with self._connection_lock:
+                    reconnects = self._connection_reconnects.get(connection_id, 0)
+                    self._connection_reconnects[connection_id] = reconnects + 1
+        except Exception:
+            # Goes back to the pool broken; its next write fails and tries again
+            self._stop_event.wait(RECONNECT_BACKOFF_SEC)
+
+    def _pooled_write(self, pool: ConnectionPool, state: WorkerState) -> WriteResult:
+        """Check out a pooled connection, write one batch, and record the wait.
+
+        A connection that broke during the write is reconnected before it goes
+        back to the pool, so later checkouts do not keep failing on it.
+        """
+        start_time = time.perf_counter()
+        try:
+            with pool.acquire() as (provider, wait_ms):
+                result = self._write(provider)
+                result.connection_id = pool.connection_id(provider)
+                if not result.success:
+                    self._repair(pool, provider, state)
+        except Exception as e:
+            # _write() and _repair() turn their own errors into results, so
+            # anything that gets here failed to check out a connection
+            wait_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(
+                success=False,
+                latency_ms=0.0,
+                rows_written=0,
+                error=f"Pool acquire failed: {e}",
+                pool_wait_ms=wait_ms,
+            )
+
+        result.pool_wait_ms = wait_ms
         return result
 
     def _save_results(self, result: BenchmarkResult, run_dir: Path) -> None:
-        """Save benchmark results to files."""
-        # Full result JSON
-        result_dict = {
-            "target_name": result.target_name,
-            "service": result.service,
-            "mode": result.mode,
-            "concurrency": result.concurrency,
-            "duration": result.duration,
-            "warmup": result.warmup,
-            "batch_size": result.batch_size,
-            "start_time": result.start_time,
-            "end_time": result.end_time,
-            "summary": result.summary,
-            "time_series": result.time_series,
-            "errors": result.errors,
-        }
+        """Save benchmark results to files and the results store."""
+        save_results(result, run_dir, self.output_dir / STORE_FILE)
+
+
+def save_results(result: BenchmarkResult, run_dir: Path, store_path: Optional[Path] = None) -> None:
+    """Write result.json, summary.json and latencies.json for a run.
+
+    With ``store_path``, the run is also added to that results store.
+    """
+    # Full result JSON
+    result_dict = {
+        "target_name": result.target_name,
+        "service": result.service,
+        "mode": result.mode,
+        "concurrency": result.concurrency,
+        "duration": result.duration,
+        "warmup": result.warmup,
+        "batch_size": result.batch_size,
+        "target_rate": result.target_rate,
+        "pool_size": result.pool_size,
+        "workload": result.workload,
+        "schema": result.schema,
+        "schema_definition": result.schema_definition,
+        "primary_key": result.primary_key,
+        "seed": result.seed,
+        "durability": result.durability,
+        "proxy": result.proxy,
+        "load_profile": result.load_profile,
+        "phases": result.phases,
+        "trace": result.trace,
+        "templates": result.templates,
+        "slo": result.slo,
+        "start_time": result.start_time,
+        "end_time": result.end_time,
+        "summary": result.summary,
+        "time_series": result.time_series,
+        "errors": result.errors,
+        "workers": result.workers,
+        "connections": result.connections,
+    }
+
+    with open(run_dir / "result.json", "w") as f:
+        json.dump(result_dict, f, indent=2)
+
+    # Summary JSON (smaller, for quick comparison)
+    summary_dict = {
+        "target_name": result.target_name,
+        "service": result.service,
+        "mode": result.mode,
+        "concurrency": result.concurrency,
+        "target_rate": result.target_rate,
+        "pool_size": result.pool_size,
+        "workload": result.workload,
+        "schema": result.schema,
+        "primary_key": result.primary_key,
+        "seed": result.seed,
+        "durability": result.durability,
+        "load_profile": result.load_profile,
+        "slo": result.slo,
+        **result.summary,
+    }
+
+    with open(run_dir / "summary.json", "w") as f:
+        json.dump(summary_dict, f, indent=2)
+
+    # Latency samples
+    with open(run_dir / "latencies.json", "w") as f:
+        json.dump({"latencies_ms": result.raw_latencies}, f)
+
+    # Full latency histogram and per-second heatmap
+    if result.latency_histogram is not None:
+        with open(run_dir / HISTOGRAM_FILE, "w") as f:
+            json.dump(result.latency_histogram.to_dict(), f)
+    if result.latency_heatmap is not None:
+        result.latency_heatmap.save(run_dir / HEATMAP_FILE)
+
+    print(f"Results saved to {run_dir}")
 
-        with open(run_dir / "result.json", "w") as f:
-            json.dump(result_dict, f, indent=2)
+    if store_path:
+        # The files above are the source of truth; a locked or broken store
+        # must not fail the run (re-import later with import-results)
+        try:
+            ResultsStore(store_path).add(result)
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to add run to {store_path}: {e}")
 
-        # Summary JSON (smaller, for quick comparison)
-        summary_dict = {
-            "target_name": result.target_name,
-            "service": result.service,
-            "mode": result.mode,
-            "concurrency": result.concurrency,
-            **result.summary,
+
+def summarize_phases(results: List[WriteResult]) -> Dict:
+    """Percentiles for each handshake phase recorded by the connect workload."""
+    by_phase = {}
+    for r in results:
+        if r.success and r.phases:
+            for phase, ms in r.phases.items():
+                by_phase.setdefault(phase, []).append(ms)
+
+    summary = {}
+    for phase, values in by_phase.items():
+        name = phase[: -len("_ms")]
+        summary[f"{name}_p50_ms"] = np.percentile(values, 50)
+        summary[f"{name}_p95_ms"] = np.percentile(values, 95)
+        summary[f"{name}_p99_ms"] = np.percentile(values, 99)
+        summary[f"{name}_mean_ms"] = np.mean(values)
+        summary[f"{name}_samples"] = len(values)
+
+    return summary
+
+
+def connection_rate(workers: List[Tuple[int, float]], duration_sec: float) -> float:
+    """Connections/sec for the connect workload, without the handshake probes' time.
+
+    ``workers`` holds each worker's connections and seconds spent probing;
+    each worker's rate is over the part of the window it was not probing.
+    """
+    rate = 0.0
+    for connections, probe_sec in workers:
+        busy_sec = duration_sec - probe_sec
+        if connections and busy_sec > 0:
+            rate += connections / busy_sec
+    return rate
+
+
+def summarize_templates(results: List[WriteResult]) -> List[Dict]:
+    """Count, errors and latency for each statement template the replay workload ran.
+
+    Sorted by total time spent in the template, most first. Beyond
+    MAX_TEMPLATES, the rest are folded into one OTHER_TEMPLATE entry.
+    """
+    by_template = {}
+    for r in results:
+        by_template.setdefault(r.template, []).append(r)
+
+    ranked = sorted(
+        by_template.items(),
+        key=lambda item: sum(r.latency_ms for r in item[1] if r.success),
+        reverse=True,
+    )
+    if len(ranked) > MAX_TEMPLATES:
+        other = [r for _, ops in ranked[MAX_TEMPLATES - 1 :] for r in ops]
+        ranked = ranked[: MAX_TEMPLATES - 1] + [(OTHER_TEMPLATE, other)]
+
+    total_ms = sum(r.latency_ms for r in results if r.success)
+    templates = []
+    for template, ops in ranked:
+        latencies = [r.latency_ms for r in ops if r.success]
+        errors = len(ops) - len(latencies)
+        templates.append(
+            {
+                "template": template,
+                "count": len(ops),
+                "error_count": errors,
+                "error_rate": errors / len(ops),
+                "latency_p50_ms": np.percentile(latencies, 50) if latencies else 0,
+                "latency_p95_ms": np.percentile(latencies, 95) if latencies else 0,
+                "latency_p99_ms": np.percentile(latencies, 99) if latencies else 0,
+                "latency_mean_ms": np.mean(latencies) if latencies else 0,
+                "latency_max_ms": np.max(latencies) if latencies else 0,
+                "time_share": sum(latencies) / total_ms if total_ms > 0 else 0,
+            }
+        )
+
+    return templates
+
+
+def summarize_load_phases(
+    profile: LoadProfile,
+    initial: LoadLevel,
+    results: List[WriteResult],
+    window_sec: float,
+) -> List[Dict]:
+    """Throughput, latency and errors for each phase of a load profile.
+
+    Operations belong to the phase their worker was running at when they
+    started (``WriteResult.load_phase``). Each entry also has the
+    phase's planned ``workers`` and ``target_rate_wps`` as [start, end]
+    (None if the run was closed-loop) and, for paced phases,
+    ``rate_attainment`` against the phase's mean planned rate.
+    """
+    by_phase = [[] for _ in profile.phases]
+    for r in results:
+        by_phase[r.load_phase].append(r)
+
+    phases = []
+    for index, phase in enumerate(profile.phases):
+        start, end = profile.phase_bounds(index)
+        end = min(end, window_sec)
+        if end <= start:
+            break  # The run stopped before this phase
+        levels = [
+            profile.level_at(offset, initial.workers, initial.rate)
+            for offset in np.linspace(start, np.nextafter(end, start), 101)
+        ]
+        rates = [level.rate for level in levels if level.rate]
+
+        ops = by_phase[index]
+        latencies = [r.latency_ms for r in ops if r.success]
+        writes = sum(r.rows_written for r in ops if r.success)
+        errors = sum(1 for r in ops if not r.success)
+        throughput = writes / (end - start)
+        entry = {
+            "phase": phase.name,
+            "start_sec": start,
+            "end_sec": end,
+            "workers": [levels[0].workers, levels[-1].workers],
+            "target_rate_wps": [levels[0].rate, levels[-1].rate] if rates else None,
+            "total_writes": writes,
+            "total_operations": len(ops),
+            "throughput_wps": throughput,
+            "latency_p50_ms": np.percentile(latencies, 50) if latencies else 0,
+            "latency_p95_ms": np.percentile(latencies, 95) if latencies else 0,
+            "latency_p99_ms": np.percentile(latencies, 99) if latencies else 0,
+            "latency_mean_ms": np.mean(latencies) if latencies else 0,
+            "latency_max_ms": np.max(latencies) if latencies else 0,
+            "error_count": errors,
+            "error_rate": errors / len(ops) if ops else 0,
         }
+        if rates:
+            entry["rate_attainment"] = throughput / np.mean(rates)
+        phases.append(entry)
+
+    return phases
+
+
+def worker_stats(
+    worker_id: int,
+    histogram: LatencyHistogram,
+    writes: int,
+    operations: int,
+    errors: int,
+    reconnects: int,
+    duration_sec: float,
+) -> Dict:
+    """One worker's entry in BenchmarkResult.workers."""
+    p50, p95, p99 = histogram.percentiles([50, 95, 99])
+    return {
+        "worker_id": worker_id,
+        "writes": writes,
+        "operations": operations,
+        "throughput_wps": writes / duration_sec if duration_sec > 0 else 0,
+        "latency_p50_ms": p50,
+        "latency_p95_ms": p95,
+        "latency_p99_ms": p99,
+        "latency_mean_ms": histogram.mean,
+        "latency_max_ms": histogram.max,
+        "errors": errors,
+        "reconnects": reconnects,
+    }
+
 
-        with open(run_dir / "summary.json", "w") as f:
-            json.dump(summary_dict, f, indent=2)
+def summarize_workers(workers: List[Dict]) -> Dict:
+    """Flag straggling workers and summarize how evenly load was spread.
 
-        # Latency histogram data
-        with open(run_dir / "latencies.json", "w") as f:
-            json.dump({"latencies_ms": result.raw_latencies}, f)
+    A worker straggles if its throughput is below STRAGGLER_THROUGHPUT_RATIO
+    of the median worker's, or its P99 above STRAGGLER_P99_RATIO times the
+    median worker P99; each worker gets ``straggler`` and ``straggler_reasons``.
+    Fairness is Jain's index over worker throughput: 1.0 when every worker
+    wrote the same amount, down to 1/n when one worker did all the work.
+    """
+    if not workers:
+        return {}
 
-        print(f"Results saved to {run_dir}")
+    throughputs = np.array([w["throughput_wps"] for w in workers], dtype=float)
+    p99s = np.array([w["latency_p99_ms"] for w in workers], dtype=float)
+    median_throughput = float(np.median(throughputs))
+    median_p99 = float(np.median(p99s))
 
+    for w in workers:
+        reasons = []
+        if median_throughput > 0 and (
+            w["throughput_wps"] < STRAGGLER_THROUGHPUT_RATIO * median_throughput
+        ):
+            reasons.append("throughput")
+        if median_p99 > 0 and w["latency_p99_ms"] > STRAGGLER_P99_RATIO * median_p99:
+            reasons.append("p99")
+        w["straggler"] = bool(reasons)
+        w["straggler_reasons"] = reasons
 
-def aggregate_time_series(data: List[Dict]) -> List[Dict]:
-    """Aggregate time series data by second across all workers."""
+    squares = float(np.sum(throughputs**2))
+    mean_throughput = float(np.mean(throughputs))
+    return {
+        "worker_fairness": (
+            float(throughputs.sum() ** 2 / (len(workers) * squares)) if squares > 0 else 1.0
+        ),
+        "worker_throughput_cv": (
+            float(np.std(throughputs) / mean_throughput) if mean_throughput > 0 else 0.0
+        ),
+        "worker_p99_max_ratio": float(p99s.max() / median_p99) if median_p99 > 0 else 1.0,
+        "straggler_count": sum(1 for w in workers if w["straggler"]),
+        "reconnect_count": sum(w["reconnects"] for w in workers),
+    }
+
+
+def summarize_connections(connections: List[Dict]) -> Dict:
+    """summarize_workers() for pooled connections, as ``connection_*`` summary keys."""
+    summary = summarize_workers(connections)
+    if not summary:
+        return {}
+    return {
+        "connection_fairness": summary["worker_fairness"],
+        "connection_throughput_cv": summary["worker_throughput_cv"],
+        "connection_p99_max_ratio": summary["worker_p99_max_ratio"],
+        "connection_straggler_count": summary["straggler_count"],
+    }
+
+
+def aggregate_time_series(data: List[Dict], start_second: Optional[int] = None) -> List[Dict]:
+    """Aggregate time series data by second across all workers.
+
+    ``elapsed_sec`` counts from ``start_second`` (a Unix timestamp) when
+    given, otherwise from the first second in ``data``. RTT probe entries
+    (those without ``writes``) are averaged into the second they fall in
+    as ``avg_rtt_tcp_ms`` and ``avg_rtt_query_ms``, but add no seconds.
+    Worker entries tagged with a load profile ``phase`` give each second the
+    phase most of its writes ran under.
+    """
     if not data:
         return []
 
     # Group by second
     by_second = {}
+    rtt_by_second = {}
     for entry in data:
         second = int(entry["timestamp"])
+        if "writes" not in entry:
+            rtts = rtt_by_second.setdefault(second, {})
+            for metric in PROBE_METRICS:
+                if f"{metric}_ms" in entry:
+                    rtts.setdefault(metric, []).append(entry[f"{metric}_ms"])
+            continue
         if second not in by_second:
-            by_second[second] = {"writes": 0, "latencies": []}
+            by_second[second] = {"writes": 0, "latencies": [], "pool_waits": []}
         by_second[second]["writes"] += entry["writes"]
         if entry["avg_latency_ms"] > 0:
             by_second[second]["latencies"].append(entry["avg_latency_ms"])
+        if "avg_pool_wait_ms" in entry:
+            by_second[second]["pool_waits"].append(entry["avg_pool_wait_ms"])
+        if "phase" in entry:
+            phase_writes = by_second[second].setdefault("phase_writes", {})
+            phase_writes[entry["phase"]] = phase_writes.get(entry["phase"], 0) + entry["writes"]
+
+    if not by_second:
+        return []
 
     # Build aggregated list
     result = []
-    min_second = min(by_second.keys())
+    min_second = min(by_second.keys()) if start_second is None else start_second
     for second in sorted(by_second.keys()):
         entry = by_second[second]
-        result.append({
+        point = {
             "elapsed_sec": second - min_second,
             "throughput_wps": entry["writes"],
             "avg_latency_ms": (
                 np.mean(entry["latencies"]) if entry["latencies"] else 0
             ),
-        })
+        }
+        if entry["pool_waits"]:
+            point["avg_pool_wait_ms"] = np.mean(entry["pool_waits"])
+        if "phase_writes" in entry:
+            phase_writes = entry["phase_writes"]
+            point["phase"] = max(phase_writes, key=lambda phase: (phase_writes[phase], phase))
+        for metric, values in rtt_by_second.get(second, {}).items():
+            point[f"avg_{metric}_ms"] = np.mean(values)
+        result.append(point)
 
     return result
@@ -0,0 +1,311 @@
+"""Chart data preparation for the HTML report."""
+
+import json
+import math
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .benchmark import HEATMAP_FILE, BenchmarkResult
+from .histogram import LatencyHeatmap, LatencyHistogram
+
+# Default maximum number of points per chart (shared by its traces)
+DEFAULT_CHART_POINTS = 2000
+
+# Directory, next to report.html, holding full-resolution chart data
+SIDECAR_DIR = "report_data"
+
+# Percentile spectrum: points per trace, and how far into the tail (P99.999)
+SPECTRUM_POINTS = 200
+SPECTRUM_MAX_NINES = 5
+
+
+def series_arrays(time_series: List[Dict], key: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract (elapsed_sec, key) from a time series as float arrays."""
+    count = len(time_series)
+    x = np.fromiter(map(itemgetter("elapsed_sec"), time_series), dtype=float, count=count)
+    y = np.fromiter((point.get(key, 0.0) for point in time_series), dtype=float, count=count)
+    return x, y
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a line to ``threshold`` points with Largest-Triangle-Three-Buckets.
+
+    LTTB keeps the first and last points and, from each bucket in between,
+    the point forming the largest triangle with the previously kept point
+    and the next bucket's average. Unlike plain averaging it preserves
+    spikes and dips, which is what matters in throughput and latency charts.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Bucket boundaries for the n - 2 interior points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    lengths = ends - starts
+    avg_x = np.add.reduceat(x[1 : n - 1], starts - 1) / lengths
+    avg_y = np.add.reduceat(y[1 : n - 1], starts - 1) / lengths
+    # The last bucket's "next average" is the final point
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for i in range(threshold - 2):
+        bx = x[starts[i] : ends[i]]
+        by = y[starts[i] : ends[i]]
+        area = np.abs(
+            (x[prev] - next_x[i]) * (by - y[prev]) - (x[prev] - bx) * (next_y[i] - y[prev])
+        )
+        prev = starts[i] + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return x[selected], y[selected]
+
+
+def line_trace(x: np.ndarray, y: np.ndarray, name: str, max_points: int) -> Dict:
+    """A Plotly line trace, downsampled to at most ``max_points`` points."""
+    x, y = lttb(x, y, max_points)
+    return {
+        "x": x.tolist(),
+        "y": np.round(y, 3).tolist(),
+        "name": name,
+        "type": "scatter",
+        "mode": "lines",
+    }
+
+
+def time_series_chart(
+    results: Dict[str, BenchmarkResult],
+    key: str,
+    max_points: int,
+) -> Tuple[List[Dict], List[Dict]]:
+    """Downsampled and full-resolution traces of one time series metric per mode.
+
+    The point budget is split evenly across the chart's traces.
+    """
+    series = {mode: r.time_series for mode, r in results.items() if r.time_series}
+    per_trace = max(max_points // max(len(series), 1), 3)
+
+    traces, full = [], []
+    for mode, time_series in series.items():
+        x, y = series_arrays(time_series, key)
+        traces.append(line_trace(x, y, mode, per_trace))
+        full.append(line_trace(x, y, mode, len(x)))
+    return traces, full
+
+
+def write_sidecars(full_resolution: Dict[str, List[Dict]], output_dir: Path) -> Dict[str, str]:
+    """Write full-resolution traces as loadable scripts; return chart id -> path.
+
+    Sidecars are JavaScript rather than JSON so the report can load them
+    with a <script> tag, which (unlike fetch) also works from file:// URLs.
+    """
+    sidecar_dir = output_dir / SIDECAR_DIR
+    sidecar_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = {}
+    for chart_id, traces in full_resolution.items():
+        path = sidecar_dir / f"{chart_id}.js"
+        with open(path, "w") as f:
+            f.write(f"window.zrbenchFullResolution[{json.dumps(chart_id)}] = ")
+            json.dump(traces, f, separators=(",", ":"))
+            f.write(";\n")
+        paths[chart_id] = f"{SIDECAR_DIR}/{chart_id}.js"
+    return paths
+
+
+def result_histogram(result: BenchmarkResult) -> Tuple[Optional[LatencyHistogram], bool]:
+    """A run's full latency histogram, and whether it is complete.
+
+    Results saved before histograms were recorded fall back to a histogram
+    of their (truncated) latency samples, flagged as incomplete.
+    """
+    if result.latency_histogram is not None and result.latency_histogram.total:
+        return result.latency_histogram, True
+    if result.raw_latencies:
+        hist = LatencyHistogram()
+        hist.record_many(result.raw_latencies)
+        return hist, False
+    return None, False
+
+
+def percentile_spectrum_chart(results: Dict[str, BenchmarkResult], title: str) -> Dict:
+    """HDR-style latency-by-percentile chart, one trace per mode.
+
+    The x axis is ``1 / (1 - percentile)`` on a log scale, so each "nine"
+    (P90, P99, P99.9, ...) gets equal width and the tail is as visible as
+    the median.
+    """
+    traces = []
+    for mode, result in results.items():
+        hist, complete = result_histogram(result)
+        if hist is None:
+            continue
+        # Stop at the deepest percentile the sample count supports
+        max_nines = min(SPECTRUM_MAX_NINES, math.log10(hist.total)) if hist.total > 1 else 0
+        nines = np.linspace(0, max_nines, SPECTRUM_POINTS)
+        percentiles = 100 * (1 - 10.0**-nines)
+        values = np.array(hist.percentiles(percentiles.tolist()))
+        traces.append({
+            "x": np.round(10.0**nines, 3).tolist(),
+            "y": np.round(values, 3).tolist(),
+            "customdata": np.round(percentiles, 4).tolist(),
+            "hovertemplate": "P%{customdata}: %{y:.2f} ms",
+            "name": mode if complete else f"{mode} (sampled)",
+            "type": "scatter",
+            "mode": "lines",
+        })
+
+    tickvals = [1, 2] + [10**k for k in range(1, SPECTRUM_MAX_NINES + 1)]
+    ticktext = ["P0", "P50"] + [
+        f"P{100 - 10 ** (2 - k):g}" for k in range(1, SPECTRUM_MAX_NINES + 1)
+    ]
+    return {
+        "traces": traces,
+        "layout": {
+            "title": title,
+            "xaxis": {
+                "title": "Percentile",
+                "type": "log",
+                "tickvals": tickvals,
+                "ticktext": ticktext,
+            },
+            "yaxis": {"title": "Latency (ms)"},
+            "height": 350,
+        },
+    }
+
+
+def cdf_chart(results: Dict[str, BenchmarkResult], title: str) -> Dict:
+    """Cumulative latency distribution, one trace per mode."""
+    traces = []
+    for mode, result in results.items():
+        hist, complete = result_histogram(result)
+        if hist is None:
+            continue
+        nonzero = np.nonzero(hist.counts)[0]
+        traces.append({
+            "x": np.round(hist.bucket_values()[nonzero], 3).tolist(),
+            "y": np.round(np.cumsum(hist.counts[nonzero]) / hist.total, 5).tolist(),
+            "name": mode if complete else f"{mode} (sampled)",
+            "type": "scatter",
+            "mode": "lines",
+            "line": {"shape": "hv"},
+        })
+
+    return {
+        "traces": traces,
+        "layout": {
+            "title": title,
+            "xaxis": {"title": "Latency (ms)", "type": "log"},
+            "yaxis": {"title": "Fraction of operations", "range": [0, 1]},
+            "height": 350,
+        },
+    }
+
+
+def heatmap_chart(result: BenchmarkResult, title: str, max_points: int) -> Optional[Dict]:
+    """Time x latency-bucket heatmap of a run, or None if it has no heatmap.
+
+    Seconds are summed into at most ``max_points / 4`` time columns (each
+    column costs one value per latency bucket). Color is log10 of the
+    operation count, so a handful of slow operations still shows up.
+    """
+    heatmap = result.latency_heatmap
+    if heatmap is None and result.output_path and (result.output_path / HEATMAP_FILE).exists():
+        heatmap = LatencyHeatmap.load(result.output_path / HEATMAP_FILE)
+    if heatmap is None or heatmap.seconds == 0:
+        return None
+
+    starts, counts = heatmap.downsample(max(max_points // 4, 1))
+    used = np.nonzero(counts.sum(axis=0))[0]
+    if used.size == 0:
+        return None
+    lo, hi = int(used.min()), int(used.max()) + 1
+    counts = counts[:, lo:hi].T
+
+    with np.errstate(divide="ignore"):
+        z = np.round(np.log10(counts), 2).astype(object)
+    z[counts == 0] = None
+
+    return {
+        "traces": [{
+            "type": "heatmap",
+            "x": starts.tolist(),
+            "y": heatmap.bucket_labels()[lo:hi],
+            "z": z.tolist(),
+            "colorscale": "Viridis",
+            "colorbar": {"title": "log10(ops)"},
+            "hoverongaps": False,
+        }],
+        "layout": {
+            "title": title,
+            "xaxis": {"title": "Elapsed Time (seconds)"},
+            "yaxis": {"title": "Latency", "type": "category"},
+            "height": 350,
+        },
+    }
+
+
+def slo_capacity_chart(searches: Dict[str, Dict], title: str) -> Dict:
+    """Sustainable write rate per mode, from SLO searches (see slo.slo_outcome)."""
+    modes = list(searches)
+    rates = [searches[mode]["sustainable_rate_wps"] or 0 for mode in modes]
+    return {
+        "traces": [{
+            "x": modes,
+            "y": np.round(rates, 1).tolist(),
+            "text": [f"{rate:.0f}" for rate in rates],
+            "textposition": "auto",
+            "type": "bar",
+            "name": "Sustainable rate",
+        }],
+        "layout": {
+            "title": title,
+            "xaxis": {"title": "Mode", "type": "category"},
+            "yaxis": {"title": "Writes/second"},
+            "height": 350,
+        },
+    }
+
+
+def slo_steps_chart(searches: Dict[str, Dict], latency_p99_ms: float, title: str) -> Dict:
+    """P99 latency at each SLO search step's rate, one trace per mode, with the SLO line."""
+    traces = []
+    for mode, search in searches.items():
+        steps = sorted(search["steps"], key=itemgetter("target_rate_wps"))
+        traces.append({
+            "x": [round(step["target_rate_wps"], 1) for step in steps],
+            "y": [round(step["latency_p99_ms"], 3) for step in steps],
+            "customdata": [", ".join(step["failures"]) or "passed" for step in steps],
+            "hovertemplate": "%{x:.0f} w/s: P99 %{y:.2f} ms (%{customdata})",
+            "name": mode,
+            "type": "scatter",
+            "mode": "lines+markers",
+            "marker": {"symbol": ["circle" if step["passed"] else "x" for step in steps]},
+        })
+
+    return {
+        "traces": traces,
+        "layout": {
+            "title": title,
+            "xaxis": {"title": "Target Rate (writes/second)"},
+            "yaxis": {"title": "P99 Latency (ms)", "type": "log"},
+            "shapes": [{
+                "type": "line",
+                "xref": "paper",
+                "x0": 0,
+                "x1": 1,
+                "y0": latency_p99_ms,
+                "y1": latency_p99_ms,
+                "line": {"dash": "dash", "color": "red"},
+            }],
+            "height": 350,
+        },
+    }
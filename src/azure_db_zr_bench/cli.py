@@ -2,14 +2,39 @@
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import json
 
-from .config import load_config, BenchmarkTarget
-from .benchmark import BenchmarkRunner
+from .config import (
+    DEFAULT_DURABILITY,
+    DURABILITY_LEVELS,
+    BenchmarkTarget,
+    load_config,
+    load_profiles,
+    load_schemas,
+)
+from .benchmark import COMMIT_LOOP_ITERATIONS, BenchmarkRunner, save_results
+from .loadprofile import LoadProfile
+from .pivot import PIVOT_METRICS, check_dimensions, parse_where
+from .probe import PROBE_INTERVAL_SEC
+from .soak import SoakRunner, is_soak_run, load_soak_result
+from .store import RUN_METRICS, STORE_FILE, ResultsStore
 from .report import generate_report
+from .charts import DEFAULT_CHART_POINTS
+from .schema import PK_STRATEGIES, WorkloadSchema
+from .slo import (
+    SEARCH_METHODS,
+    SLO_GROWTH,
+    SLO_MAX_STEPS,
+    SLO_PRECISION,
+    SLO_START_RATE,
+    Slo,
+    SloSearch,
+)
 
 app = typer.Typer(
     name="azure-db-zr-bench",
@@ -18,6 +43,8 @@ app = typer.Typer(
 )
 console = Console()
 
+# Statement templates listed after a replay run (result.json has them all)
+TEMPLATES_SHOWN = 10
 
 @app.command("list")
 def list_targets(
@@ -42,14 +69,122 @@ def list_targets(
     table.add_column("Name", style="cyan")
     table.add_column("Service", style="green")
     table.add_column("Mode", style="yellow")
+    table.add_column("Durability")
     table.add_column("Host", style="dim")
 
     for name, target in targets.items():
-        table.add_row(name, target.service, target.mode, target.host)
+        table.add_row(
+            name, target.service, target.mode, target.durability or DEFAULT_DURABILITY, target.host
+        )
+
+    console.print(table)
+
+    schemas = load_schemas(config)
+    table = Table(title="Available Schemas")
+    table.add_column("Name", style="cyan")
+    table.add_column("Table", style="green")
+    table.add_column("Columns")
+    table.add_column("Indexes", justify="right")
+    table.add_column("Primary Key")
+    table.add_column("Partitioning")
+    table.add_column("Row Size (approx.)", justify="right", style="yellow")
+
+    for name, schema in schemas.items():
+        table.add_row(
+            name,
+            schema.table,
+            ", ".join(
+                f"{c.name} {c.type}" + (f" {c.distribution.describe()}" if c.distribution else "")
+                for c in schema.columns
+            ),
+            str(len(schema.indexes)),
+            schema.primary_key,
+            schema.describe_partitioning(),
+            f"{schema.approx_row_bytes():,} B",
+        )
 
     console.print(table)
 
 
+def _select_schemas(config: Path, names: str) -> List[WorkloadSchema]:
+    """Look up comma-separated schema names in the config, exiting on unknown names."""
+    try:
+        schemas = load_schemas(config)
+    except Exception as e:
+        console.print(f"[red]Error loading schemas: {e}[/red]")
+        raise typer.Exit(1)
+
+    selected = []
+    for name in (n.strip() for n in names.split(",")):
+        if name not in schemas:
+            console.print(f"[red]Schema '{name}' not found in config[/red]")
+            console.print(f"Available schemas: {', '.join(schemas.keys())}")
+            raise typer.Exit(1)
+        selected.append(schemas[name])
+    return selected
+
+
+def _select_load_profile(config: Path, name: str) -> LoadProfile:
+    """Look up a load profile in the config, exiting if it is unknown."""
+    try:
+        profiles = load_profiles(config)
+    except Exception as e:
+        console.print(f"[red]Error loading load profiles: {e}[/red]")
+        raise typer.Exit(1)
+
+    if name not in profiles:
+        console.print(f"[red]Load profile '{name}' not found in config[/red]")
+        console.print(f"Available load profiles: {', '.join(profiles.keys()) or 'none'}")
+        raise typer.Exit(1)
+    return profiles[name]
+
+
+def _select_primary_keys(names: str) -> List[str]:
+    """Parse comma-separated primary key strategies, exiting on unknown ones."""
+    selected = [n.strip() for n in names.split(",")]
+    for name in selected:
+        if name not in PK_STRATEGIES:
+            console.print(f"[red]Unknown primary key strategy: {name}[/red]")
+            console.print(f"Available strategies: {', '.join(PK_STRATEGIES)}")
+            raise typer.Exit(1)
+    return selected
+
+
+def _with_primary_key(target_config: BenchmarkTarget, primary_key: str) -> BenchmarkTarget:
+    """The target with its schema switched to another primary key strategy."""
+    schema = target_config.schema or WorkloadSchema.default()
+    return replace(target_config, schema=schema.with_primary_key(primary_key))
+
+
+def _select_durability(names: str) -> List[Optional[str]]:
+    """Parse comma-separated durability levels; "default" (None) keeps the server's."""
+    known = {level for levels in DURABILITY_LEVELS.values() for level in levels}
+    selected = []
+    for name in (n.strip() for n in names.split(",")):
+        if name != DEFAULT_DURABILITY and name not in known:
+            console.print(f"[red]Unknown durability level: {name}[/red]")
+            console.print(f"Available levels: {DEFAULT_DURABILITY}, {', '.join(sorted(known))}")
+            raise typer.Exit(1)
+        selected.append(None if name == DEFAULT_DURABILITY else name)
+    return selected
+
+
+def _supports_durability(target_config: BenchmarkTarget, durability: Optional[str]) -> bool:
+    return durability is None or durability in DURABILITY_LEVELS[target_config.service]
+
+
+def _settings_label(parameters: Optional[Dict], shown: Tuple[str, ...]) -> str:
+    """Run settings a table has no column for (those not in ``shown``), e.g. ``schema=docs``."""
+    if parameters is None:
+        return "?"  # Stored before settings were kept
+    settings = [
+        f"{name}={value}"
+        for name, value in parameters.items()
+        if name not in shown and value is not None
+    ]
+    return ", ".join(settings) or "-"
+
+
 @app.command("run")
 def run_benchmark(
     target: str = typer.Option(
@@ -94,6 +229,81 @@ def run_benchmark(
         "-o",
         help="Output directory for results",
     ),
+    rate: Optional[float] = typer.Option(
+        None,
+        "--rate",
+        "-r",
+        help="Target total write rate (writes/sec) across all workers (default: closed-loop)",
+    ),
+    pool_size: Optional[int] = typer.Option(
+        None,
+        "--pool-size",
+        "-p",
+        help="Share a pool of this many connections across all workers (default: one per worker)",
+    ),
+    workload: str = typer.Option(
+        "write",
+        "--workload",
+        help="Workload to run: write (INSERTs), connect (open/close connections), "
+        "replay (statements from a --trace) or server-loop (INSERT + COMMIT loop on the server)",
+    ),
+    no_truncate: bool = typer.Option(
+        False,
+        "--no-truncate",
+        help="Keep existing rows (e.g. from prefill) instead of truncating the table",
+    ),
+    soak_segment_minutes: Optional[float] = typer.Option(
+        None,
+        "--soak-segment-minutes",
+        help="Soak mode: constant memory, flushing a results segment every N minutes",
+    ),
+    schema: Optional[str] = typer.Option(
+        None,
+        "--schema",
+        help="Table definition from the config's schemas section (default: the target's)",
+    ),
+    primary_key: Optional[str] = typer.Option(
+        None,
+        "--primary-key",
+        help=f"Primary key strategy: {', '.join(PK_STRATEGIES)} (default: the schema's)",
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Seed row and key generation so the run can be reproduced (default: unseeded)",
+    ),
+    durability: Optional[str] = typer.Option(
+        None,
+        "--durability",
+        help="Session commit durability, e.g. remote_write or off on postgres, delayed on "
+        "sqldb (default: the target's, else the server's)",
+    ),
+    probe_interval_ms: float = typer.Option(
+        PROBE_INTERVAL_SEC * 1000,
+        "--probe-interval-ms",
+        help="Time between network RTT probe samples (0 turns the probe off)",
+    ),
+    load_profile: Optional[str] = typer.Option(
+        None,
+        "--load-profile",
+        help="Vary workers and rate by the phases of this profile from the config's "
+        "load_profiles section (replaces --duration)",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Trace file for the replay workload (.csv, .jsonl or .log, optionally .gz)",
+    ),
+    speed: float = typer.Option(
+        1.0,
+        "--speed",
+        help="Replay the trace at this multiple of its original pace (0: as fast as possible)",
+    ),
+    loop_iterations: int = typer.Option(
+        COMMIT_LOOP_ITERATIONS,
+        "--loop-iterations",
+        help="Server-loop workload: INSERT + COMMIT cycles the server runs per call",
+    ),
 ):
     """Run a write benchmark against a specific target."""
     try:
@@ -108,17 +318,61 @@ def run_benchmark(
         raise typer.Exit(1)
 
     target_config = targets[target]
+    if schema:
+        target_config = replace(target_config, schema=_select_schemas(config, schema)[0])
+    if primary_key:
+        target_config = _with_primary_key(target_config, _select_primary_keys(primary_key)[0])
+    if seed is not None:
+        target_config = replace(target_config, seed=seed)
+    if durability:
+        level = _select_durability(durability)[0]
+        if not _supports_durability(target_config, level):
+            levels = DURABILITY_LEVELS[target_config.service]
+            console.print(
+                f"[red]Durability {level} is not available on {target_config.service}"
+                f" (available: {', '.join(levels) or 'none'})[/red]"
+            )
+            raise typer.Exit(1)
+        target_config = replace(target_config, durability=level)
+    profile = _select_load_profile(config, load_profile) if load_profile else None
+    if profile and soak_segment_minutes:
+        console.print("[red]Load profiles are not supported in soak mode[/red]")
+        raise typer.Exit(1)
 
     console.print(f"[bold]Starting benchmark for target: {target}[/bold]")
     console.print(f"  Service: {target_config.service}")
     console.print(f"  Mode: {target_config.mode}")
     console.print(f"  Host: {target_config.host}")
     console.print(f"  Concurrency: {concurrency}")
-    console.print(f"  Duration: {duration}s")
+    if profile:
+        console.print(
+            f"  Load profile: {profile.name} ({len(profile.phases)} phases, "
+            f"{profile.duration:g}s)"
+        )
+    else:
+        console.print(f"  Duration: {duration}s")
     console.print(f"  Warmup: {warmup}s")
     console.print(f"  Batch size: {batch_size}")
+    if rate:
+        console.print(f"  Target rate: {rate:.0f} writes/sec")
+    if pool_size:
+        console.print(f"  Pool size: {pool_size}")
+    console.print(f"  Workload: {workload}")
+    if trace:
+        console.print(f"  Trace: {trace} ({f'{speed:g}x speed' if speed else 'full speed'})")
+    if workload == "server-loop":
+        console.print(f"  Loop iterations: {loop_iterations}")
+    if target_config.schema:
+        console.print(f"  Schema: {target_config.schema.name} ({target_config.schema.table})")
+        console.print(f"  Primary key: {target_config.schema.primary_key}")
+    if target_config.seed is not None:
+        console.print(f"  Seed: {target_config.seed}")
+    if target_config.durability:
+        console.print(f"  Durability: {target_config.durability}")
+    if soak_segment_minutes:
+        console.print(f"  Soak segments: every {soak_segment_minutes:g} min")
 
-    runner = BenchmarkRunner(
+    runner_args = dict(
         target_name=target,
         target_config=target_config,
         concurrency=concurrency,
@@ -126,7 +380,24 @@ def run_benchmark(
         warmup=warmup,
         batch_size=batch_size,
         output_dir=output_dir,
+        target_rate=rate,
+        pool_size=pool_size,
+        workload=workload,
+        truncate=not no_truncate,
+        probe_interval=probe_interval_ms / 1000 or None,
+        load_profile=profile,
+        trace=trace,
+        speed=speed,
+        loop_iterations=loop_iterations,
     )
+    try:
+        if soak_segment_minutes:
+            runner = SoakRunner(**runner_args, segment_minutes=soak_segment_minutes)
+        else:
+            runner = BenchmarkRunner(**runner_args)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
 
     try:
         result = runner.run()
@@ -138,16 +409,111 @@ def run_benchmark(
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
 
-        table.add_row("Total Writes", f"{result.summary['total_writes']:,}")
-        table.add_row("Throughput (writes/sec)", f"{result.summary['throughput_wps']:.2f}")
+        if workload == "connect":
+            table.add_row("Total Connections", f"{result.summary['total_writes']:,}")
+            table.add_row("Connections/sec", f"{result.summary['connections_per_sec']:.2f}")
+            for phase in ("tcp", "tls", "auth", "tls_auth"):
+                if f"{phase}_p50_ms" in result.summary:
+                    table.add_row(
+                        f"{phase.upper().replace('_', ' + ')} P50 / P99 (ms)",
+                        f"{result.summary[f'{phase}_p50_ms']:.2f} / "
+                        f"{result.summary[f'{phase}_p99_ms']:.2f}",
+                    )
+        elif workload == "server-loop":
+            table.add_row("Total Commits", f"{result.summary['total_writes']:,}")
+            table.add_row("Commits/sec", f"{result.summary['throughput_wps']:.2f}")
+            if "loop_call_p50_ms" in result.summary:
+                table.add_row(
+                    "Loop Call P50 / P99 (ms)",
+                    f"{result.summary['loop_call_p50_ms']:.2f} / "
+                    f"{result.summary['loop_call_p99_ms']:.2f}",
+                )
+                table.add_row(
+                    "Loop Overhead P50 (ms)", f"{result.summary['loop_overhead_p50_ms']:.2f}"
+                )
+        elif workload == "replay":
+            table.add_row("Statements Replayed", f"{result.summary['total_writes']:,}")
+            table.add_row("Statements/sec", f"{result.summary['throughput_wps']:.2f}")
+            if "replay_lag_p99_ms" in result.summary:
+                table.add_row(
+                    "Schedule Lag P50 / P99 (ms)",
+                    f"{result.summary['replay_lag_p50_ms']:.2f} / "
+                    f"{result.summary['replay_lag_p99_ms']:.2f}",
+                )
+        else:
+            table.add_row("Total Writes", f"{result.summary['total_writes']:,}")
+            table.add_row("Throughput (writes/sec)", f"{result.summary['throughput_wps']:.2f}")
         table.add_row("Latency P50 (ms)", f"{result.summary['latency_p50_ms']:.2f}")
         table.add_row("Latency P95 (ms)", f"{result.summary['latency_p95_ms']:.2f}")
         table.add_row("Latency P99 (ms)", f"{result.summary['latency_p99_ms']:.2f}")
         table.add_row("Error Count", f"{result.summary['error_count']:,}")
         table.add_row("Error Rate", f"{result.summary['error_rate']:.2%}")
+        if "drain_sec" in result.summary:
+            table.add_row("Drain After Window (sec)", f"{result.summary['drain_sec']:.3f}")
+        for metric, label in (("rtt_tcp", "TCP Connect"), ("rtt_query", "SELECT 1")):
+            if f"{metric}_p50_ms" in result.summary:
+                table.add_row(
+                    f"{label} RTT P50 / P99 (ms)",
+                    f"{result.summary[f'{metric}_p50_ms']:.2f} / "
+                    f"{result.summary[f'{metric}_p99_ms']:.2f}",
+                )
+        # A profile that varies the rate reports attainment per phase instead
+        if "rate_attainment" in result.summary:
+            table.add_row("Target Rate (writes/sec)", f"{rate:.2f}")
+            table.add_row(
+                "Rate Attainment",
+                f"{result.summary['rate_attainment']:.1%}"
+                + ("" if result.summary["target_rate_met"] else " (target not met)"),
+            )
+        if pool_size and "pool_wait_p95_ms" in result.summary:
+            table.add_row("Pool Wait P50 (ms)", f"{result.summary['pool_wait_p50_ms']:.2f}")
+            table.add_row("Pool Wait P95 (ms)", f"{result.summary['pool_wait_p95_ms']:.2f}")
+            table.add_row("Pool Wait P99 (ms)", f"{result.summary['pool_wait_p99_ms']:.2f}")
 
         console.print(table)
 
+        if result.phases:
+            phase_table = Table(title=f"Load Phases ({result.load_profile})")
+            phase_table.add_column("Phase", style="cyan")
+            for column in (
+                "Workers", "Target Rate", "Writes/sec", "Attainment", "P50 (ms)", "P99 (ms)",
+                "Errors",
+            ):
+                phase_table.add_column(column, style="green")
+            for phase in result.phases:
+                target_rate = phase["target_rate_wps"]
+                phase_table.add_row(
+                    phase["phase"],
+                    "{}→{}".format(*phase["workers"]),
+                    "{:.0f}→{:.0f}".format(*target_rate) if target_rate else "-",
+                    f"{phase['throughput_wps']:.2f}",
+                    f"{phase['rate_attainment']:.1%}" if "rate_attainment" in phase else "-",
+                    f"{phase['latency_p50_ms']:.2f}",
+                    f"{phase['latency_p99_ms']:.2f}",
+                    f"{phase['error_count']:,}",
+                )
+            console.print(phase_table)
+
+        if result.templates:
+            template_table = Table(title="Statement Templates (by total time)")
+            template_table.add_column("Template", style="cyan", overflow="fold")
+            for column in ("Count", "Time Share", "P50 (ms)", "P99 (ms)", "Errors"):
+                template_table.add_column(column, style="green")
+            for entry in result.templates[:TEMPLATES_SHOWN]:
+                template_table.add_row(
+                    escape(entry["template"]),
+                    f"{entry['count']:,}",
+                    f"{entry['time_share']:.1%}",
+                    f"{entry['latency_p50_ms']:.2f}",
+                    f"{entry['latency_p99_ms']:.2f}",
+                    f"{entry['error_count']:,}",
+                )
+            console.print(template_table)
+        if result.summary.get("replay_error"):
+            console.print(
+                f"[yellow]Trace ended early: {escape(result.summary['replay_error'])}[/yellow]"
+            )
+
     except Exception as e:
         console.print(f"[red]Benchmark failed: {e}[/red]")
         raise typer.Exit(1)
@@ -159,7 +525,7 @@ def run_suite(
         ...,
         "--service",
         "-s",
-        help="Service type to benchmark (postgres, mysql, sqldb, all)",
+        help="Service type to benchmark (postgres, mysql, sqldb, sqlite, mock, all)",
     ),
     config: Path = typer.Option(
         Path("config.yaml"),
@@ -197,6 +563,85 @@ def run_suite(
         "-o",
         help="Output directory for results",
     ),
+    rate: Optional[float] = typer.Option(
+        None,
+        "--rate",
+        "-r",
+        help="Pin every target to this total write rate (writes/sec) instead of closed-loop",
+    ),
+    rate_fraction: Optional[float] = typer.Option(
+        None,
+        "--rate-fraction",
+        help=(
+            "After the closed-loop runs, re-run every target at this fraction of the "
+            "slowest target's throughput at each concurrency (e.g. 0.8)"
+        ),
+    ),
+    pool_size: Optional[int] = typer.Option(
+        None,
+        "--pool-size",
+        "-p",
+        help="Share a pool of this many connections across each run's workers",
+    ),
+    workload: str = typer.Option(
+        "write",
+        "--workload",
+        help="Workload to run: write (INSERTs), connect (open/close connections), "
+        "replay (statements from a --trace) or server-loop (INSERT + COMMIT loop on the server)",
+    ),
+    no_truncate: bool = typer.Option(
+        False,
+        "--no-truncate",
+        help="Keep existing rows (e.g. from prefill) instead of truncating the table",
+    ),
+    schemas: Optional[str] = typer.Option(
+        None,
+        "--schema",
+        help="Comma-separated schemas to run every target with (default: each target's own)",
+    ),
+    primary_keys: Optional[str] = typer.Option(
+        None,
+        "--primary-key",
+        help=f"Comma-separated primary key strategies to run each schema with "
+        f"({', '.join(PK_STRATEGIES)}; default: the schema's)",
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Seed row and key generation so the run can be reproduced (default: unseeded)",
+    ),
+    durability_levels: Optional[str] = typer.Option(
+        None,
+        "--durability",
+        help="Comma-separated session durability levels to sweep, e.g. "
+        "default,remote_write,local,off (targets skip levels their service lacks)",
+    ),
+    probe_interval_ms: float = typer.Option(
+        PROBE_INTERVAL_SEC * 1000,
+        "--probe-interval-ms",
+        help="Time between network RTT probe samples (0 turns the probe off)",
+    ),
+    load_profile: Optional[str] = typer.Option(
+        None,
+        "--load-profile",
+        help="Vary workers and rate by the phases of this profile from the config's "
+        "load_profiles section (replaces --duration)",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Trace file for the replay workload (.csv, .jsonl or .log, optionally .gz)",
+    ),
+    speed: float = typer.Option(
+        1.0,
+        "--speed",
+        help="Replay the trace at this multiple of its original pace (0: as fast as possible)",
+    ),
+    loop_iterations: int = typer.Option(
+        COMMIT_LOOP_ITERATIONS,
+        "--loop-iterations",
+        help="Server-loop workload: INSERT + COMMIT cycles the server runs per call",
+    ),
 ):
     """Run a suite of benchmarks for a service type across all HA/ZR modes."""
     try:
@@ -220,6 +665,8 @@ def run_suite(
             "sqldb": "sqldb",
             "sql": "sqldb",
             "azuresql": "sqldb",
+            "sqlite": "sqlite",
+            "mock": "mock",
         }
         service_name = service_map.get(service.lower())
         if not service_name:
@@ -237,12 +684,65 @@ def run_suite(
     console.print(f"Targets: {', '.join(filtered_targets.keys())}")
     console.print(f"Concurrency levels: {concurrency_levels}")
 
+    if seed is not None:
+        filtered_targets = {k: replace(v, seed=seed) for k, v in filtered_targets.items()}
+        console.print(f"Seed: {seed}")
+
+    # None runs each target with the schema its config gives it
+    schema_list = _select_schemas(config, schemas) if schemas else [None]
+    if schemas:
+        console.print(f"Schemas: {', '.join(s.name for s in schema_list)}")
+
+    # None keeps each schema's own key strategy
+    key_list = _select_primary_keys(primary_keys) if primary_keys else [None]
+    if primary_keys:
+        console.print(f"Primary keys: {', '.join(key_list)}")
+
+    # None keeps each target's own durability
+    durability_list = _select_durability(durability_levels) if durability_levels else [None]
+    if durability_levels:
+        console.print(
+            f"Durability: {', '.join(d or DEFAULT_DURABILITY for d in durability_list)}"
+        )
+    variants = [(s, k, d) for s in schema_list for k in key_list for d in durability_list]
+
+    if rate and rate_fraction:
+        console.print("[red]--rate and --rate-fraction are mutually exclusive[/red]")
+        raise typer.Exit(1)
+    profile = _select_load_profile(config, load_profile) if load_profile else None
+    if profile and rate_fraction:
+        console.print("[red]--load-profile and --rate-fraction are mutually exclusive[/red]")
+        raise typer.Exit(1)
+    if profile:
+        console.print(f"Load profile: {profile.name} ({profile.duration:g}s)")
+
     results = []
 
-    for target_name, target_config in filtered_targets.items():
-        for conc in concurrency_levels:
-            console.print(f"\n[bold cyan]Running: {target_name} @ concurrency={conc}[/bold cyan]")
+    def run_one(
+        target_name: str,
+        target_config: BenchmarkTarget,
+        conc: int,
+        target_rate=None,
+        schema: Optional[WorkloadSchema] = None,
+        primary_key: Optional[str] = None,
+        durability: Optional[str] = None,
+    ):
+        if schema:
+            target_config = replace(target_config, schema=schema)
+        if primary_key:
+            target_config = _with_primary_key(target_config, primary_key)
+        if durability:
+            target_config = replace(target_config, durability=durability)
+        label = f"{target_name} @ {conc}" + (f" ({target_rate:.0f} w/s)" if target_rate else "")
+        if schema:
+            label += f" schema={schema.name}"
+        if primary_key:
+            label += f" key={primary_key}"
+        if durability:
+            label += f" durability={durability}"
+        console.print(f"\n[bold cyan]Running: {label}[/bold cyan]")
 
+        try:
             runner = BenchmarkRunner(
                 target_name=target_name,
                 target_config=target_config,
@@ -251,18 +751,79 @@ def run_suite(
                 warmup=warmup,
                 batch_size=batch_size,
                 output_dir=output_dir,
+                target_rate=target_rate,
+                pool_size=pool_size,
+                workload=workload,
+                truncate=not no_truncate,
+                probe_interval=probe_interval_ms / 1000 or None,
+                load_profile=profile,
+                trace=trace,
+                speed=speed,
+                loop_iterations=loop_iterations,
+            )
+
+            result = runner.run()
+            results.append(result)
+            notes = ""
+            if pool_size and "pool_wait_p95_ms" in result.summary:
+                notes += f", pool wait p95={result.summary['pool_wait_p95_ms']:.2f}ms"
+            if target_rate and not result.summary.get("target_rate_met", True):
+                notes += " [yellow](target rate not met)[/yellow]"
+            unit = {
+                "connect": "connections/sec",
+                "replay": "statements/sec",
+                "server-loop": "commits/sec",
+            }.get(workload, "writes/sec")
+            console.print(
+                f"[green]✓ {label}: "
+                f"{result.summary['throughput_wps']:.2f} {unit}, "
+                f"p95={result.summary['latency_p95_ms']:.2f}ms[/green]{notes}"
             )
+            return result
+        except Exception as e:
+            console.print(f"[red]✗ {label}: {e}[/red]")
+            return None
 
-            try:
-                result = runner.run()
-                results.append(result)
+    for target_name, target_config in filtered_targets.items():
+        for schema, key, level in variants:
+            if not _supports_durability(target_config, level):
                 console.print(
-                    f"[green]✓ {target_name} @ {conc}: "
-                    f"{result.summary['throughput_wps']:.2f} writes/sec, "
-                    f"p95={result.summary['latency_p95_ms']:.2f}ms[/green]"
+                    f"[yellow]Skipping {target_name} durability={level}: "
+                    f"not available on {target_config.service}[/yellow]"
                 )
-            except Exception as e:
-                console.print(f"[red]✗ {target_name} @ {conc}: {e}[/red]")
+                continue
+            for conc in concurrency_levels:
+                run_one(target_name, target_config, conc, rate, schema, key, level)
+
+    if rate_fraction:
+        # Calibrate per concurrency level (and variant) from the slowest closed-loop target
+        for schema, key, level in variants:
+            for conc in concurrency_levels:
+                capacities = [
+                    r.summary["throughput_wps"]
+                    for r in results
+                    if r.concurrency == conc
+                    and not r.target_rate
+                    and (schema is None or r.schema == schema.name)
+                    and (key is None or r.primary_key == key)
+                    and r.durability == (level or DEFAULT_DURABILITY)
+                ]
+                if not capacities or min(capacities) <= 0:
+                    console.print(
+                        f"[yellow]Skipping matched runs @ {conc}: no capacity data[/yellow]"
+                    )
+                    continue
+
+                matched_rate = rate_fraction * min(capacities)
+                console.print(
+                    f"\n[bold]Matched-throughput runs @ concurrency={conc}: "
+                    f"{matched_rate:.0f} writes/sec ({rate_fraction:.0%} of slowest)[/bold]"
+                )
+                for target_name, target_config in filtered_targets.items():
+                    if _supports_durability(target_config, level):
+                        run_one(
+                            target_name, target_config, conc, matched_rate, schema, key, level
+                        )
 
     if results:
         console.print("\n[bold]Generating comparison report...[/bold]")
@@ -270,6 +831,205 @@ def run_suite(
         console.print(f"[green]Report saved to: {report_path}[/green]")
 
 
+@app.command("slo-search")
+def run_slo_search(
+    targets_arg: str = typer.Option(
+        ...,
+        "--target",
+        "-t",
+        help="Comma-separated target names from the config file",
+    ),
+    config: Path = typer.Option(
+        Path("config.yaml"),
+        "--config",
+        "-c",
+        help="Path to configuration file",
+    ),
+    p99_ms: float = typer.Option(
+        ...,
+        "--p99-ms",
+        help="SLO: highest allowed P99 write latency in milliseconds",
+    ),
+    max_error_rate: float = typer.Option(
+        0.001,
+        "--max-error-rate",
+        help="SLO: highest allowed error rate (0.001 = 0.1%)",
+    ),
+    concurrency: int = typer.Option(
+        16,
+        "--concurrency",
+        "-n",
+        help="Workers per step; enough to reach the rates searched",
+    ),
+    duration: int = typer.Option(
+        30,
+        "--duration",
+        "-d",
+        help="Measured seconds per step",
+    ),
+    warmup: int = typer.Option(
+        5,
+        "--warmup",
+        "-w",
+        help="Warmup seconds per step",
+    ),
+    start_rate: float = typer.Option(
+        SLO_START_RATE,
+        "--start-rate",
+        help="Rate of the first step (writes/sec)",
+    ),
+    growth: float = typer.Option(
+        SLO_GROWTH,
+        "--growth",
+        help="Multiply the rate by this after each passing step, until one fails",
+    ),
+    max_rate: Optional[float] = typer.Option(
+        None,
+        "--max-rate",
+        help="Stop ramping at this rate (writes/sec) even if it passes",
+    ),
+    method: str = typer.Option(
+        "binary",
+        "--method",
+        help=f"How to narrow in on the failing rate: {', '.join(SEARCH_METHODS)}",
+    ),
+    precision: float = typer.Option(
+        SLO_PRECISION,
+        "--precision",
+        help="Stop when the passing rate is within this fraction of the failing rate",
+    ),
+    max_steps: int = typer.Option(
+        SLO_MAX_STEPS,
+        "--max-steps",
+        help="Most steps per target",
+    ),
+    cooldown: float = typer.Option(
+        10.0,
+        "--cooldown",
+        help="Seconds to pause between steps, for queues and replicas to catch up",
+    ),
+    output_dir: Path = typer.Option(
+        Path("results"),
+        "--output",
+        "-o",
+        help="Output directory for results",
+    ),
+    no_truncate: bool = typer.Option(
+        False,
+        "--no-truncate",
+        help="Keep existing rows (e.g. from prefill) instead of truncating the table",
+    ),
+    probe_interval_ms: float = typer.Option(
+        PROBE_INTERVAL_SEC * 1000,
+        "--probe-interval-ms",
+        help="Time between network RTT probe samples (0 turns the probe off)",
+    ),
+):
+    """Find the highest write rate each target sustains within a P99 and error-rate SLO."""
+    try:
+        targets = load_config(config)
+    except FileNotFoundError:
+        console.print(f"[red]Config file not found: {config}[/red]")
+        raise typer.Exit(1)
+
+    names = [name.strip() for name in targets_arg.split(",") if name.strip()]
+    missing = [name for name in names if name not in targets]
+    if missing:
+        console.print(f"[red]Targets not found in config: {', '.join(missing)}[/red]")
+        console.print(f"Available targets: {', '.join(targets.keys())}")
+        raise typer.Exit(1)
+
+    try:
+        slo = Slo(latency_p99_ms=p99_ms, max_error_rate=max_error_rate)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold]SLO search: {slo.describe()}[/bold]")
+    console.print(f"Targets: {', '.join(names)}")
+    console.print(
+        f"Steps: {warmup}s warmup + {duration}s at {concurrency} workers, from "
+        f"{start_rate:g} writes/sec x{growth:g}, then {method} search to {precision:.0%}"
+    )
+
+    def report_step(result):
+        step = result.slo
+        verdict = (
+            "[green]passed[/green]"
+            if step["passed"]
+            else f"[red]failed ({', '.join(step['failures'])})[/red]"
+        )
+        console.print(
+            f"Step {step['step']}: {result.target_rate:.1f} writes/sec -> "
+            f"{result.summary['throughput_wps']:.1f} writes/sec, "
+            f"p99={result.summary['latency_p99_ms']:.2f}ms, "
+            f"errors={result.summary['error_rate']:.2%}: {verdict}"
+        )
+
+    results = []
+    outcomes = []
+    for name in names:
+        console.print(f"\n[bold cyan]Searching: {name}[/bold cyan]")
+        try:
+            search = SloSearch(
+                dict(
+                    target_name=name,
+                    target_config=targets[name],
+                    concurrency=concurrency,
+                    duration=duration,
+                    warmup=warmup,
+                    output_dir=output_dir,
+                    truncate=not no_truncate,
+                    probe_interval=probe_interval_ms / 1000 or None,
+                ),
+                slo,
+                start_rate=start_rate,
+                growth=growth,
+                max_rate=max_rate,
+                method=method,
+                precision=precision,
+                max_steps=max_steps,
+                cooldown=cooldown,
+                on_step=report_step,
+            )
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
+
+        try:
+            outcome = search.run()
+        except Exception as e:
+            console.print(f"[red]✗ {name}: {e}[/red]")
+            if not search.steps:
+                continue
+            outcome = search.outcome()
+        results.extend(search.steps)
+        outcomes.append(outcome)
+
+    if not outcomes:
+        raise typer.Exit(1)
+
+    table = Table(title=f"SLO Capacity ({slo.describe()})")
+    table.add_column("Target", style="cyan")
+    for column in ("Mode", "Sustainable (w/s)", "First Failing (w/s)", "Steps"):
+        table.add_column(column, style="green")
+    for outcome in outcomes:
+        sustainable = outcome["sustainable_rate_wps"]
+        failing = outcome["failing_rate_wps"]
+        table.add_row(
+            outcome["target_name"],
+            outcome["mode"],
+            f"{sustainable:.1f}" if sustainable is not None else "[red]none[/red]",
+            f"{failing:.1f}" if failing is not None else "-",
+            str(len(outcome["steps"])),
+        )
+    console.print(table)
+
+    console.print("\n[bold]Generating comparison report...[/bold]")
+    report_path = generate_report(results, output_dir)
+    console.print(f"[green]Report saved to: {report_path}[/green]")
+
+
 @app.command("report")
 def generate_comparison_report(
     results_dir: Path = typer.Option(
@@ -284,6 +1044,34 @@ def generate_comparison_report(
         "-o",
         help="Output directory for report (defaults to results_dir)",
     ),
+    max_points: int = typer.Option(
+        DEFAULT_CHART_POINTS,
+        "--max-points",
+        help="Maximum points per time series chart (full resolution is kept in report_data/)",
+    ),
+    where: Optional[List[str]] = typer.Option(
+        None,
+        "--where",
+        help="Only report runs where dimension=value[,value...], e.g. batch_size=1,10 "
+        "(repeatable)",
+    ),
+    pivot_rows: Optional[str] = typer.Option(
+        None,
+        "--pivot",
+        help="Comma-separated dimensions for the pivot's rows, e.g. durability,batch_size "
+        "(default: concurrency and whatever varies among closed-loop write runs)",
+    ),
+    pivot_column: str = typer.Option(
+        "mode",
+        "--pivot-column",
+        help="Dimension for the pivot's columns; deltas are against the first value "
+        "(for mode: the baseline mode)",
+    ),
+    pivot_metrics: str = typer.Option(
+        ",".join(PIVOT_METRICS),
+        "--pivot-metric",
+        help="Comma-separated summary metrics to pivot",
+    ),
 ):
     """Generate a comparison report from existing benchmark results."""
     from .report import load_results, generate_report
@@ -291,6 +1079,18 @@ def generate_comparison_report(
     if output_dir is None:
         output_dir = results_dir
 
+    try:
+        filters = parse_where(where or [])
+        rows = None
+        if pivot_rows:
+            rows = tuple(d.strip() for d in pivot_rows.split(",") if d.strip())
+            check_dimensions(rows)
+        check_dimensions([pivot_column])
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    metrics = tuple(m.strip() for m in pivot_metrics.split(",") if m.strip())
+
     console.print(f"[bold]Loading results from: {results_dir}[/bold]")
 
     try:
@@ -301,7 +1101,15 @@ def generate_comparison_report(
 
         console.print(f"Found {len(results)} result files")
 
-        report_path = generate_report(results, output_dir)
+        report_path = generate_report(
+            results,
+            output_dir,
+            max_points,
+            where=filters,
+            pivot_rows=rows,
+            pivot_column=pivot_column,
+            pivot_metrics=metrics,
+        )
         console.print(f"[green]Report saved to: {report_path}[/green]")
 
     except Exception as e:
@@ -309,5 +1117,619 @@ def generate_comparison_report(
         raise typer.Exit(1)
 
 
+@app.command("recover")
+def recover_soak_run(
+    run_dir: Path = typer.Option(
+        ...,
+        "--run-dir",
+        help="Run directory of a soak run (the one containing soak.json)",
+    ),
+):
+    """Rebuild result files for a crashed or interrupted soak run."""
+    if not is_soak_run(run_dir):
+        console.print(f"[red]No soak run found in {run_dir}[/red]")
+        raise typer.Exit(1)
+
+    result = load_soak_result(run_dir)
+    # Run directories are <results>/<timestamp>/<target>
+    save_results(result, run_dir, run_dir.parent.parent / STORE_FILE)
+
+    state = "partial" if result.summary["partial"] else "complete"
+    console.print(
+        f"[green]Recovered {state} run: {result.summary['soak_segments']} segments, "
+        f"{result.summary['actual_duration_sec']:.0f}s, "
+        f"{result.summary['total_writes']:,} writes[/green]"
+    )
+
+
+@app.command("import-results")
+def import_results(
+    results_dir: Path = typer.Option(
+        Path("results"),
+        "--results",
+        "-r",
+        help="Directory containing benchmark results",
+    ),
+    store: Optional[Path] = typer.Option(
+        None,
+        "--store",
+        help=f"Results store to import into (default: <results>/{STORE_FILE})",
+    ),
+):
+    """Import existing results directories into the results store."""
+    from .report import load_results
+
+    store_path = store or results_dir / STORE_FILE
+    results = load_results(results_dir)
+    if not results:
+        console.print("[red]No results found[/red]")
+        raise typer.Exit(1)
+
+    count = ResultsStore(store_path).add_many(results)
+    console.print(f"[green]Imported {count} runs into {store_path}[/green]")
+
+
+@app.command("query")
+def query_results(
+    store: Path = typer.Option(
+        Path("results") / STORE_FILE,
+        "--store",
+        help="Results store to query",
+    ),
+    target: Optional[str] = typer.Option(None, "--target", "-t", help="Target name"),
+    service: Optional[str] = typer.Option(None, "--service", "-s", help="Service type"),
+    mode: Optional[str] = typer.Option(None, "--mode", "-m", help="HA mode"),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-n", help="Concurrency level"
+    ),
+    workload: Optional[str] = typer.Option(None, "--workload", help="Workload"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only runs since this date or age (e.g. 2024-01-31, 90d, 12w)"
+    ),
+    where: Optional[List[str]] = typer.Option(
+        None,
+        "--where",
+        help="Only runs where dimension=value[,value...], e.g. durability=relaxed (repeatable)",
+    ),
+    limit: int = typer.Option(20, "--limit", "-l", help="Maximum number of runs to show"),
+    as_json: bool = typer.Option(False, "--json", help="Print JSON instead of a table"),
+):
+    """List stored runs matching the filters, newest first."""
+    try:
+        rows = ResultsStore(store).query_runs(
+            target, service, mode, concurrency, workload, since, limit, parse_where(where or [])
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    if as_json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    table = Table(title=f"Runs in {store}")
+    for column in (
+        "Start", "Target", "Conc.", "Workload", "Settings", "WPS", "P50", "P95", "P99", "Errors"
+    ):
+        table.add_column(column)
+    for row in rows:
+        table.add_row(
+            row["start_time"][:19],
+            row["target_name"],
+            str(row["concurrency"]),
+            row["workload"],
+            _settings_label(row["parameters"], ("concurrency", "workload")),
+            f"{row['throughput_wps']:.1f}",
+            f"{row['latency_p50_ms']:.2f}",
+            f"{row['latency_p95_ms']:.2f}",
+            f"{row['latency_p99_ms']:.2f}",
+            f"{row['error_rate']:.2%}",
+        )
+    console.print(table)
+
+
+@app.command("trend")
+def show_trend(
+    metric: str = typer.Option(
+        "latency_p99_ms",
+        "--metric",
+        help=f"Metric to trend: one of {', '.join(RUN_METRICS)} "
+        "(with --per-second: throughput_wps, avg_latency_ms, avg_pool_wait_ms)",
+    ),
+    bucket: str = typer.Option("day", "--bucket", help="Time bucket: day, week or month"),
+    per_second: bool = typer.Option(
+        False,
+        "--per-second",
+        help="Aggregate the per-second time series instead of run summaries",
+    ),
+    store: Path = typer.Option(
+        Path("results") / STORE_FILE,
+        "--store",
+        help="Results store to query",
+    ),
+    target: Optional[str] = typer.Option(None, "--target", "-t", help="Target name"),
+    service: Optional[str] = typer.Option(None, "--service", "-s", help="Service type"),
+    mode: Optional[str] = typer.Option(None, "--mode", "-m", help="HA mode"),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-n", help="Concurrency level"
+    ),
+    workload: Optional[str] = typer.Option(None, "--workload", help="Workload"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only runs since this date or age (e.g. 2024-01-31, 90d, 12w)"
+    ),
+    where: Optional[List[str]] = typer.Option(
+        None,
+        "--where",
+        help="Only runs where dimension=value[,value...], e.g. durability=relaxed (repeatable)",
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print JSON instead of a table"),
+):
+    """Show how a metric changed over time for each target and kind of run.
+
+    Runs that differ in any setting (concurrency, workload, rate, batch
+    size, pool size, schema, durability, network, ...), and soak runs, get
+    their own rows.
+    """
+    try:
+        rows = ResultsStore(store).trend(
+            metric,
+            bucket,
+            per_second,
+            target,
+            service,
+            mode,
+            concurrency,
+            workload,
+            since,
+            parse_where(where or []),
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    if as_json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    table = Table(title=f"{metric} by {bucket}" + (" (per-second)" if per_second else ""))
+    for column in (
+        "Bucket", "Target", "Conc.", "Workload", "Rate", "Batch", "Pool", "Settings", "Runs",
+        "Samples", "Mean", "Min", "Max",
+    ):
+        table.add_column(column)
+    for row in rows:
+        table.add_row(
+            row["bucket"],
+            row["target_name"],
+            str(row["concurrency"]),
+            row["workload"] + (" (soak)" if row["soak"] else ""),
+            f"{row['target_rate']:g}" if row["target_rate"] else "-",
+            str(row["batch_size"]),
+            str(row["pool_size"]) if row["pool_size"] else "-",
+            _settings_label(
+                row["parameters"],
+                ("concurrency", "workload", "target_rate", "batch_size", "pool_size"),
+            ),
+            str(row["runs"]),
+            f"{row['samples']:,}",
+            f"{row['mean']:.2f}" if row["mean"] is not None else "-",
+            f"{row['min']:.2f}" if row["min"] is not None else "-",
+            f"{row['max']:.2f}" if row["max"] is not None else "-",
+        )
+    console.print(table)
+
+
+@app.command("compare")
+def compare_results(
+    baseline_dir: Path = typer.Option(
+        ...,
+        "--baseline",
+        help="Directory containing the baseline results",
+    ),
+    candidate_dir: Path = typer.Option(
+        ...,
+        "--candidate",
+        help="Directory containing the candidate results",
+    ),
+    max_throughput_drop: float = typer.Option(
+        5.0,
+        "--max-throughput-drop",
+        help="Largest allowed throughput drop in percent",
+    ),
+    max_latency_increase: float = typer.Option(
+        10.0,
+        "--max-latency-increase",
+        help="Largest allowed P50/P95/P99 latency increase in percent",
+    ),
+    max_error_rate_increase: float = typer.Option(
+        0.01,
+        "--max-error-rate-increase",
+        help="Largest allowed absolute error-rate increase (0.01 = 1 percentage point)",
+    ),
+    alpha: float = typer.Option(
+        0.05,
+        "--alpha",
+        help="Significance level a change beyond a threshold must also reach",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the machine-readable diff to this JSON file",
+    ),
+):
+    """Compare candidate results against a baseline; exit 1 on regression."""
+    from .regression import RegressionThresholds, compare_result_sets
+    from .report import load_results
+
+    baseline = load_results(baseline_dir)
+    candidate = load_results(candidate_dir)
+    if not baseline or not candidate:
+        console.print("[red]No results found in baseline or candidate directory[/red]")
+        raise typer.Exit(2)
+
+    thresholds = RegressionThresholds(
+        max_throughput_drop_pct=max_throughput_drop,
+        max_latency_increase_pct=max_latency_increase,
+        max_error_rate_increase=max_error_rate_increase,
+        alpha=alpha,
+    )
+    diff = compare_result_sets(baseline, candidate, thresholds)
+    diff["baseline"] = str(baseline_dir)
+    diff["candidate"] = str(candidate_dir)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(diff, f, indent=2)
+
+    table = Table(title="Baseline vs Candidate")
+    for column in (
+        "Target", "Conc.", "Workload", "Settings", "WPS Δ", "P50 Δ", "P95 Δ", "P99 Δ", "Status"
+    ):
+        table.add_column(column)
+    styles = {"regression": "red", "improvement": "green", "ok": "dim"}
+
+    def fmt(metric: Dict) -> str:
+        delta = metric["delta_pct"]
+        return "-" if delta is None else f"{delta:+.1f}%"
+
+    for cell in diff["cells"]:
+        metrics = cell["metrics"]
+        table.add_row(
+            cell["cell"]["target_name"],
+            str(cell["cell"]["concurrency"]),
+            cell["cell"]["workload"],
+            _settings_label(cell["cell"], ("target_name", "concurrency", "workload")),
+            fmt(metrics["throughput_wps"]),
+            fmt(metrics["latency_p50_ms"]),
+            fmt(metrics["latency_p95_ms"]),
+            fmt(metrics["latency_p99_ms"]),
+            f"[{styles[cell['status']]}]{cell['status']}[/{styles[cell['status']]}]",
+        )
+    console.print(table)
+
+    for key in ("missing_in_candidate", "new_in_candidate"):
+        for cell in diff[key]:
+            console.print(
+                f"[yellow]{key.replace('_', ' ').capitalize()}: "
+                f"{cell['target_name']} c{cell['concurrency']} {cell['workload']} "
+                f"({_settings_label(cell, ('target_name', 'concurrency', 'workload'))})[/yellow]"
+            )
+
+    if output:
+        console.print(f"Diff saved to: {output}")
+
+    if not diff["passed"]:
+        console.print(f"[red]{diff['regressions']} regressed cell(s)[/red]")
+        raise typer.Exit(1)
+    console.print("[green]No regressions[/green]")
+
+
+@app.command("prefill")
+def prefill_table(
+    target: str = typer.Option(
+        ...,
+        "--target",
+        "-t",
+        help="Target name from config file",
+    ),
+    config: Path = typer.Option(
+        Path("config.yaml"),
+        "--config",
+        "-c",
+        help="Path to configuration file",
+    ),
+    rows: Optional[int] = typer.Option(
+        None,
+        "--rows",
+        help="Total number of rows the table should hold",
+    ),
+    size: Optional[str] = typer.Option(
+        None,
+        "--size",
+        help="Approximate table size to load instead of --rows (e.g. 50GB)",
+    ),
+    streams: int = typer.Option(
+        4,
+        "--streams",
+        "-n",
+        help="Number of parallel bulk-load streams",
+    ),
+    chunk_rows: int = typer.Option(
+        50_000,
+        "--chunk-rows",
+        help="Rows per committed chunk (the unit of progress and resume)",
+    ),
+    state_dir: Path = typer.Option(
+        Path("results/prefill"),
+        "--state-dir",
+        help="Directory for prefill checkpoints",
+    ),
+    restart: bool = typer.Option(
+        False,
+        "--restart",
+        help="Truncate the table and discard any checkpoint before loading",
+    ),
+    schema: Optional[str] = typer.Option(
+        None,
+        "--schema",
+        help="Table definition from the config's schemas section (default: the target's)",
+    ),
+    primary_key: Optional[str] = typer.Option(
+        None,
+        "--primary-key",
+        help=f"Primary key strategy: {', '.join(PK_STRATEGIES)} (default: the schema's)",
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Seed row and key generation so the run can be reproduced (default: unseeded)",
+    ),
+):
+    """Bulk-load the benchmark table to a realistic size before running benchmarks."""
+    from .prefill import rows_for_size, run_prefill
+
+    try:
+        targets = load_config(config)
+    except FileNotFoundError:
+        console.print(f"[red]Config file not found: {config}[/red]")
+        raise typer.Exit(1)
+
+    if target not in targets:
+        console.print(f"[red]Target '{target}' not found in config[/red]")
+        console.print(f"Available targets: {', '.join(targets.keys())}")
+        raise typer.Exit(1)
+
+    if (rows is None) == (size is None):
+        console.print("[red]Specify exactly one of --rows or --size[/red]")
+        raise typer.Exit(1)
+
+    target_config = targets[target]
+    if schema:
+        target_config = replace(target_config, schema=_select_schemas(config, schema)[0])
+    if primary_key:
+        target_config = _with_primary_key(target_config, _select_primary_keys(primary_key)[0])
+    if seed is not None:
+        target_config = replace(target_config, seed=seed)
+
+    try:
+        target_rows = rows if rows is not None else rows_for_size(size, target_config.schema)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold]Prefilling target: {target}[/bold]")
+    console.print(f"  Rows: {target_rows:,}")
+    console.print(f"  Streams: {streams}")
+    if target_config.schema:
+        console.print(f"  Schema: {target_config.schema.name} ({target_config.schema.table})")
+        console.print(f"  Primary key: {target_config.schema.primary_key}")
+
+    try:
+        stats = run_prefill(
+            target_name=target,
+            target_config=target_config,
+            rows=target_rows,
+            streams=streams,
+            chunk_rows=chunk_rows,
+            state_dir=state_dir,
+            restart=restart,
+        )
+    except Exception as e:
+        console.print(f"[red]Prefill failed: {e}[/red]")
+        console.print("Re-run the same command to resume from the last checkpoint.")
+        raise typer.Exit(1)
+
+    console.print(f"[green]Table holds {stats['rows_loaded']:,} prefilled rows[/green]")
+    console.print("Run benchmarks with --no-truncate to keep them.")
+
+
+@app.command("selftest")
+def run_selftest_command(
+    engines: str = typer.Option(
+        "mock,sqlite",
+        "--engines",
+        "-e",
+        help="Comma-separated local engines to benchmark (mock, sqlite)",
+    ),
+    concurrency: str = typer.Option(
+        "1,4,16,64",
+        "--concurrency",
+        "-n",
+        help="Comma-separated list of concurrency levels",
+    ),
+    duration: int = typer.Option(
+        5,
+        "--duration",
+        "-d",
+        help="Duration in seconds per run",
+    ),
+    warmup: int = typer.Option(
+        1,
+        "--warmup",
+        "-w",
+        help="Warmup duration in seconds",
+    ),
+    batch_size: int = typer.Option(
+        1,
+        "--batch-size",
+        "-b",
+        help="Number of rows per INSERT batch",
+    ),
+    latency_ms: float = typer.Option(
+        0.0,
+        "--latency-ms",
+        help="Fixed latency for the mock engine (0 measures pure harness overhead)",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the results as JSON to this file",
+    ),
+):
+    """Measure the harness's own maximum ops/s and per-op overhead."""
+    from .selftest import SELFTEST_ENGINES, run_selftest
+
+    engine_list = [e.strip() for e in engines.split(",")]
+    unknown = [e for e in engine_list if e not in SELFTEST_ENGINES]
+    if unknown:
+        console.print(f"[red]Unknown engine(s): {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    concurrency_levels = [int(c.strip()) for c in concurrency.split(",")]
+
+    rows = run_selftest(
+        engines=engine_list,
+        concurrency_levels=concurrency_levels,
+        duration=duration,
+        warmup=warmup,
+        batch_size=batch_size,
+        latency_ms=latency_ms,
+    )
+
+    table = Table(title="Harness Self-Benchmark")
+    table.add_column("Engine", style="cyan")
+    table.add_column("Concurrency", justify="right")
+    table.add_column("Ops/sec", justify="right", style="green")
+    table.add_column("Op Latency (ms)", justify="right")
+    table.add_column("Overhead/op (µs)", justify="right", style="yellow")
+    table.add_column("Efficiency", justify="right")
+
+    for row in rows:
+        table.add_row(
+            row["engine"],
+            str(row["concurrency"]),
+            f"{row['ops_per_sec']:,.0f}",
+            f"{row['op_latency_mean_ms']:.3f}",
+            f"{row['overhead_per_op_us']:.1f}",
+            f"{row['efficiency']:.1%}" if "efficiency" in row else "-",
+        )
+
+    console.print(table)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(rows, f, indent=2)
+        console.print(f"[green]Results saved to: {output}[/green]")
+
+@app.command("proxy")
+def run_proxy(
+    target: str = typer.Option(
+        ...,
+        "--target",
+        "-t",
+        help="Target whose server to proxy",
+    ),
+    config: Path = typer.Option(
+        Path("config.yaml"),
+        "--config",
+        "-c",
+        help="Path to config file",
+    ),
+    delay_ms: Optional[float] = typer.Option(
+        None,
+        "--delay-ms",
+        help="One-way delay in each direction (default: the target's proxy section)",
+    ),
+    jitter_ms: Optional[float] = typer.Option(
+        None,
+        "--jitter-ms",
+        help="Standard deviation of extra per-chunk delay",
+    ),
+    bandwidth_mbps: Optional[float] = typer.Option(
+        None,
+        "--bandwidth-mbps",
+        help="Link rate in each direction, in Mbit/s",
+    ),
+    reset_every_sec: Optional[float] = typer.Option(
+        None,
+        "--reset-every-sec",
+        help="Reset every open connection this often, as in a failover",
+    ),
+    outage_sec: Optional[float] = typer.Option(
+        None,
+        "--outage-sec",
+        help="Refuse new connections for this long after each reset",
+    ),
+    listen_port: Optional[int] = typer.Option(
+        None,
+        "--listen-port",
+        "-l",
+        help="Local port to listen on (default: the proxy section's, else any free port)",
+    ),
+):
+    """Run a target's latency proxy in the foreground, for other clients to use."""
+    from .proxy import ProxySpec, serve
+
+    try:
+        targets = load_config(config)
+    except FileNotFoundError:
+        console.print(f"[red]Config file not found: {config}[/red]")
+        raise typer.Exit(1)
+
+    if target not in targets:
+        console.print(f"[red]Target '{target}' not found in config[/red]")
+        console.print(f"Available targets: {', '.join(targets.keys())}")
+        raise typer.Exit(1)
+
+    target_config = targets[target]
+    overrides = {
+        "delay_ms": delay_ms,
+        "jitter_ms": jitter_ms,
+        "bandwidth_mbps": bandwidth_mbps,
+        "reset_every_sec": reset_every_sec,
+        "outage_sec": outage_sec,
+        "listen_port": listen_port,
+    }
+    try:
+        spec = replace(
+            target_config.proxy or ProxySpec(),
+            **{k: v for k, v in overrides.items() if v is not None},
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    class _Ready:
+        def send(self, message):
+            kind, value = message
+            if kind == "port":
+                console.print(
+                    f"[bold]Proxying 127.0.0.1:{value} -> "
+                    f"{target_config.host}:{target_config.port}[/bold] ({spec.describe()})"
+                )
+                console.print("Press Ctrl-C to stop")
+
+    stats = serve(spec, (target_config.host, target_config.port), ready=_Ready())
+    console.print(
+        f"\n{stats['connections']} connections, {stats['resets']} resets, "
+        f"{stats['refused']} refused, {stats['bytes_up']:,} bytes up, "
+        f"{stats['bytes_down']:,} bytes down"
+    )
+
+
 if __name__ == "__main__":
     app()
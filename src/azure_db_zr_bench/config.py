@@ -4,7 +4,33 @@ import os
 import yaml
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from .loadprofile import LoadProfile
+from .proxy import ProxySpec
+from .schema import DEFAULT_SCHEMA, WorkloadSchema
+
+# Commit durability levels a session can select, per service. Each is applied
+# when a connection opens:
+# - postgres: SET synchronous_commit
+# - sqldb: COMMIT WITH (DELAYED_DURABILITY = ON) for "delayed" (the database
+#   must allow delayed durability)
+# - sqlite: PRAGMA synchronous
+# MySQL's durability settings (innodb_flush_log_at_trx_commit, sync_binlog)
+# are global-only, so a session cannot change them.
+DURABILITY_LEVELS = {
+    "postgres": ("remote_apply", "on", "remote_write", "local", "off"),
+    "mysql": (),
+    "sqldb": ("full", "delayed"),
+    "sqlite": ("full", "normal", "off"),
+    "mock": (),
+}
+
+# Label for runs that leave durability at the server's setting
+DEFAULT_DURABILITY = "default"
+
+# The level each service's sessions get when they set none
+SERVER_DURABILITY = {"postgres": "on", "sqldb": "full", "sqlite": "full"}
 
 
 @dataclass
@@ -16,21 +42,45 @@ class BenchmarkTarget:
     database: str
     username: str
     password: str
-    service: str  # postgres, mysql, sqldb
-    mode: str  # no-ha, samezone-ha, crosszone-ha, non-zr, zr
+    service: str  # postgres, mysql, sqldb, sqlite, mock
+    mode: str  # no-ha, samezone-ha, crosszone-ha, non-zr, zr, local
     ssl_mode: Optional[str] = None
     driver: Optional[str] = None  # For SQL DB ODBC driver
+    latency: Optional[Dict[str, Any]] = None  # For the mock provider's latency model
+    schema: Optional[WorkloadSchema] = None  # Benchmark table definition (default if None)
+    seed: Optional[int] = None  # Seeds row and key generation, for reproducible runs
+    durability: Optional[str] = None  # Session commit durability (None: server default)
+    proxy: Optional[ProxySpec] = None  # Emulated network between the providers and the server
 
     def __post_init__(self):
         """Validate service and mode values."""
-        valid_services = {"postgres", "mysql", "sqldb"}
+        valid_services = {"postgres", "mysql", "sqldb", "sqlite", "mock"}
         if self.service not in valid_services:
             raise ValueError(f"Invalid service: {self.service}. Must be one of {valid_services}")
 
-        valid_modes = {"no-ha", "samezone-ha", "crosszone-ha", "non-zr", "zr"}
+        valid_modes = {"no-ha", "samezone-ha", "crosszone-ha", "non-zr", "zr", "local"}
         if self.mode not in valid_modes:
             raise ValueError(f"Invalid mode: {self.mode}. Must be one of {valid_modes}")
 
+        if self.proxy is not None:
+            if self.service in LOCAL_SERVICES:
+                raise ValueError(f"Service {self.service} has no network connection to proxy")
+            self.proxy = ProxySpec.from_config(self.proxy)
+
+        if self.durability is not None:
+            levels = DURABILITY_LEVELS[self.service]
+            if not levels:
+                raise ValueError(f"Service {self.service} has no session durability settings")
+            if self.durability not in levels:
+                raise ValueError(
+                    f"Invalid durability for {self.service}: {self.durability}. "
+                    f"Must be one of {levels}"
+                )
+
+
+# Local providers don't talk to a server, so connection fields are optional
+LOCAL_SERVICES = {"sqlite", "mock"}
+
 
 def resolve_env_vars(value: str) -> str:
     """Resolve environment variable references in config values.
@@ -84,6 +134,8 @@ def load_config(config_path: Path) -> Dict[str, BenchmarkTarget]:
     if "targets" not in config:
         raise ValueError("Config file must contain a 'targets' section")
 
+    schemas = _parse_schemas(config)
+
     targets = {}
     for name, target_config in config["targets"].items():
         # Resolve environment variables in string values
@@ -95,11 +147,64 @@ def load_config(config_path: Path) -> Dict[str, BenchmarkTarget]:
         resolved_config.setdefault("ssl_mode", None)
         resolved_config.setdefault("driver", None)
 
+        if resolved_config.get("service") in LOCAL_SERVICES:
+            resolved_config.setdefault("host", "localhost")
+            resolved_config.setdefault("port", 0)
+            resolved_config.setdefault(
+                "database", "zrbench.db" if resolved_config["service"] == "sqlite" else ""
+            )
+            resolved_config.setdefault("username", "")
+            resolved_config.setdefault("password", "")
+            resolved_config.setdefault("mode", "local")
+
+        if resolved_config.get("schema") is not None:
+            schema_name = resolved_config["schema"]
+            if schema_name not in schemas:
+                raise ValueError(f"Target {name}: unknown schema '{schema_name}'")
+            resolved_config["schema"] = schemas[schema_name]
+
         targets[name] = BenchmarkTarget(**resolved_config)
 
     return targets
 
 
+def load_schemas(config_path: Path) -> Dict[str, WorkloadSchema]:
+    """Load the named table definitions from a configuration file's ``schemas`` section.
+
+    The built-in ``default`` schema is always included.
+    """
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f) or {}
+
+    return _parse_schemas(config)
+
+
+def load_profiles(config_path: Path) -> Dict[str, LoadProfile]:
+    """Load the named load profiles from a configuration file's ``load_profiles`` section."""
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f) or {}
+
+    return {
+        name: LoadProfile.from_config(name, phases)
+        for name, phases in (config.get("load_profiles") or {}).items()
+    }
+
+
+def _parse_schemas(config: Dict) -> Dict[str, WorkloadSchema]:
+    schemas = {DEFAULT_SCHEMA: WorkloadSchema.default()}
+    for name, definition in (config.get("schemas") or {}).items():
+        if name in schemas:
+            raise ValueError(f"Schema name '{name}' is reserved")
+        schemas[name] = WorkloadSchema.from_dict(name, definition)
+    return schemas
+
+
 def get_default_config_template() -> str:
     """Return a template configuration file as a string."""
     return '''# Azure DB Zone Redundancy Benchmark Configuration
@@ -138,6 +243,7 @@ targets:
     service: "postgres"
     mode: "crosszone-ha"
     ssl_mode: "require"
+    # durability: "remote_write"   # session synchronous_commit (or --durability)
 
   # MySQL Flexible Server targets
   mysql-noha:
@@ -190,4 +296,51 @@ targets:
     service: "sqldb"
     mode: "zr"
     driver: "ODBC Driver 18 for SQL Server"
+
+  # Local stand-ins (no server needed)
+  # local-sqlite:
+  #   service: "sqlite"
+  #   database: "/tmp/zrbench.db"
+  #
+  # mock-crosszoneha:
+  #   service: "mock"
+  #   mode: "crosszone-ha"
+  #   latency:
+  #     distribution: "lognormal"   # fixed, lognormal, or replay
+  #     median_ms: 3.2
+  #     sigma: 0.4
+  #
+  # A local server behind an emulated cross-zone network
+  # pg-local-crosszoneha:
+  #   host: "localhost"
+  #   port: 5432
+  #   database: "benchmark"
+  #   username: "postgres"
+  #   password: "${PGPASSWORD:-postgres}"
+  #   service: "postgres"
+  #   mode: "crosszone-ha"
+  #   proxy:
+  #     delay_ms: 0.6             # one-way, so +1.2 ms round trip
+  #     jitter_ms: 0.1
+  #     bandwidth_mbps: 1000
+  #     reset_every_sec: 120      # failover-style connection resets
+  #     outage_sec: 15
+
+# Table definitions, selected with --schema (or "schema:" on a target).
+# Each gets its own table (benchmark_<name> unless "table" is set).
+# schemas:
+#   docs-5idx:
+#     primary_key: uuidv7                 # identity, uuidv4, uuidv7 or bigint
+#     columns:
+#       - {name: tenant_id, type: int, range: [1, 1000], distribution: zipfian}
+#       - {name: ts, type: timestamp}
+#       - {name: ref, type: uuid}
+#       - {name: doc, type: json, size: [3500, 4500], compressibility: 0.5}
+#     indexes:
+#       - tenant_id
+#       - {columns: [tenant_id, ts]}
+#       - ts
+#       - {columns: [tenant_id, ref], kind: unique}
+#       - {columns: [doc], kind: gin}        # postgres only
+#     partitioning: {column: tenant_id, method: hash, count: 16}   # not on sqlite
 '''
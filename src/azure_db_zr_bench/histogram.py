@@ -0,0 +1,275 @@
+"""Fixed-size, mergeable latency histograms and per-second heatmaps."""
+
+import math
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error.
+
+    Buckets grow geometrically by ``1 + precision`` from ``min_ms`` to
+    ``max_ms``, so any recorded value is reported within ``precision``
+    (default 1%) of its true value while memory stays constant no matter how
+    many values are recorded. Values outside the range are clamped into the
+    first or last bucket; the exact min and max are tracked separately.
+    Histograms with the same bucket layout can be merged, which is how
+    per-worker and per-segment histograms are combined.
+    """
+
+    def __init__(self, precision: float = 0.01, min_ms: float = 0.001, max_ms: float = 600_000.0):
+        self.precision = precision
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self._log_base = math.log1p(precision)
+        self._num_buckets = int(math.ceil(math.log(max_ms / min_ms) / self._log_base)) + 1
+        self.counts = np.zeros(self._num_buckets, dtype=np.int64)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.observed_min = math.inf
+        self.observed_max = 0.0
+
+    def _index(self, value_ms: float) -> int:
+        if value_ms <= self.min_ms:
+            return 0
+        index = int(math.log(value_ms / self.min_ms) / self._log_base)
+        return min(index, self._num_buckets - 1)
+
+    def record(self, value_ms: float) -> None:
+        """Record a single latency in milliseconds."""
+        self.counts[self._index(value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+        if value_ms < self.observed_min:
+            self.observed_min = value_ms
+        if value_ms > self.observed_max:
+            self.observed_max = value_ms
+
+    def record_many(self, values_ms: Iterable[float]) -> None:
+        """Record many latencies at once (vectorized)."""
+        values = np.asarray(list(values_ms) if not isinstance(values_ms, np.ndarray) else values_ms,
+                            dtype=float)
+        if values.size == 0:
+            return
+        clipped = np.maximum(values, self.min_ms)
+        indexes = (np.log(clipped / self.min_ms) / self._log_base).astype(np.int64)
+        np.clip(indexes, 0, self._num_buckets - 1, out=indexes)
+        self.counts += np.bincount(indexes, minlength=self._num_buckets)
+        self.total += int(values.size)
+        self.sum_ms += float(values.sum())
+        self.observed_min = min(self.observed_min, float(values.min()))
+        self.observed_max = max(self.observed_max, float(values.max()))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        if other._num_buckets != self._num_buckets or other.precision != self.precision:
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        self.counts += other.counts
+        self.total += other.total
+        self.sum_ms += other.sum_ms
+        self.observed_min = min(self.observed_min, other.observed_min)
+        self.observed_max = max(self.observed_max, other.observed_max)
+
+    def bucket_values(self) -> np.ndarray:
+        """Representative value (geometric midpoint) of each bucket, in ms."""
+        lower = self.min_ms * np.exp(np.arange(self._num_buckets) * self._log_base)
+        return lower * math.sqrt(1 + self.precision)
+
+    def percentile(self, p: float) -> float:
+        """Latency at percentile ``p`` (0-100), within the histogram's precision."""
+        return self.percentiles([p])[0]
+
+    def percentiles(self, ps: List[float]) -> List[float]:
+        """Latencies at several percentiles in one pass over the counts."""
+        if self.total == 0:
+            return [0.0 for _ in ps]
+        cumulative = np.cumsum(self.counts)
+        values = self.bucket_values()
+        result = []
+        for p in ps:
+            rank = max(1, math.ceil(p / 100 * self.total))
+            index = int(np.searchsorted(cumulative, rank))
+            value = float(values[index])
+            # Never report outside what was actually observed
+            result.append(min(max(value, self.observed_min), self.observed_max))
+        return result
+
+    @property
+    def mean(self) -> float:
+        return self.sum_ms / self.total if self.total else 0.0
+
+    @property
+    def min(self) -> float:
+        return self.observed_min if self.total else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.observed_max
+
+    def to_dict(self) -> Dict:
+        """Serialize sparsely: only non-empty buckets are stored."""
+        nonzero = np.nonzero(self.counts)[0]
+        return {
+            "precision": self.precision,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "total": self.total,
+            "sum_ms": self.sum_ms,
+            "observed_min_ms": self.min,
+            "observed_max_ms": self.max,
+            "buckets": nonzero.tolist(),
+            "counts": self.counts[nonzero].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        hist = cls(data["precision"], data["min_ms"], data["max_ms"])
+        hist.counts[np.asarray(data["buckets"], dtype=np.int64)] = data["counts"]
+        hist.total = data["total"]
+        hist.sum_ms = data["sum_ms"]
+        if hist.total:
+            hist.observed_min = data["observed_min_ms"]
+            hist.observed_max = data["observed_max_ms"]
+        return hist
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> Optional["LatencyHistogram"]:
+        """Merge several histograms into a new one (None if there are none)."""
+        result = None
+        for hist in histograms:
+            if result is None:
+                result = cls(hist.precision, hist.min_ms, hist.max_ms)
+            result.merge(hist)
+        return result
+
+
+# Heatmap latency bucket edges: 4 per decade from 0.1 ms to 100 s
+HEATMAP_EDGES_MS = np.logspace(-1, 5, 25)
+
+# Rows added at a time when a heatmap grows
+_HEATMAP_GROW_ROWS = 300
+
+
+class LatencyHeatmap:
+    """Operation counts per second and coarse latency bucket.
+
+    Row ``i`` holds second ``start_sec + i``; column ``j`` counts latencies
+    between ``edges_ms[j - 1]`` and ``edges_ms[j]`` (the first and last
+    columns catch everything below and above the edges). ``start_sec`` can
+    be any origin (e.g. a Unix second) and is fixed by the first record if
+    not given; ``shift()`` moves it, for example to seconds since the start
+    of measurement.
+    """
+
+    def __init__(self, start_sec: Optional[int] = None, edges_ms: Optional[np.ndarray] = None):
+        self.edges_ms = np.asarray(HEATMAP_EDGES_MS if edges_ms is None else edges_ms, dtype=float)
+        self._edges = self.edges_ms.tolist()
+        self.start_sec = start_sec
+        self._counts = np.zeros((0, len(self.edges_ms) + 1), dtype=np.int64)
+        self.seconds = 0
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts[: self.seconds]
+
+    def _ensure(self, first: int, last: int) -> None:
+        """Make room for seconds first..last (inclusive)."""
+        if self.start_sec is None:
+            self.start_sec = first
+        if first < self.start_sec:
+            pad = np.zeros((self.start_sec - first, self._counts.shape[1]), dtype=np.int64)
+            self._counts = np.vstack([pad, self._counts])
+            self.seconds += self.start_sec - first
+            self.start_sec = first
+        needed = last - self.start_sec + 1
+        if needed > len(self._counts):
+            grow = max(needed - len(self._counts), _HEATMAP_GROW_ROWS)
+            pad = np.zeros((grow, self._counts.shape[1]), dtype=np.int64)
+            self._counts = np.vstack([self._counts, pad])
+        self.seconds = max(self.seconds, needed)
+
+    def record(self, second: int, latency_ms: float) -> None:
+        """Record one operation that completed in ``second``."""
+        self._ensure(second, second)
+        self._counts[second - self.start_sec, bisect_right(self._edges, latency_ms)] += 1
+
+    def record_many(self, seconds: np.ndarray, latencies_ms: np.ndarray) -> None:
+        """Record many operations at once (vectorized)."""
+        seconds = np.asarray(seconds, dtype=np.int64)
+        if seconds.size == 0:
+            return
+        self._ensure(int(seconds.min()), int(seconds.max()))
+        buckets = np.searchsorted(
+            self.edges_ms, np.asarray(latencies_ms, dtype=float), side="right"
+        )
+        np.add.at(self._counts, (seconds - self.start_sec, buckets), 1)
+
+    def merge(self, other: "LatencyHeatmap") -> None:
+        if other.start_sec is None or other.seconds == 0:
+            return
+        if not np.array_equal(other.edges_ms, self.edges_ms):
+            raise ValueError("Cannot merge heatmaps with different latency buckets")
+        self._ensure(other.start_sec, other.start_sec + other.seconds - 1)
+        offset = other.start_sec - self.start_sec
+        self._counts[offset : offset + other.seconds] += other.counts
+
+    def shift(self, origin: int) -> None:
+        """Re-express seconds relative to ``origin``."""
+        if self.start_sec is not None:
+            self.start_sec -= origin
+
+    def downsample(self, max_columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum consecutive seconds into at most ``max_columns`` time columns.
+
+        Returns the first second of each column and the (columns x buckets)
+        counts.
+        """
+        counts = self.counts
+        if len(counts) == 0:
+            return np.zeros(0, dtype=np.int64), counts
+        step = max(1, -(-len(counts) // max_columns))
+        starts = np.arange(0, len(counts), step)
+        return starts + self.start_sec, np.add.reduceat(counts, starts, axis=0)
+
+    def bucket_labels(self) -> List[str]:
+        """Human-readable upper bound of each latency bucket."""
+
+        def fmt(ms: float) -> str:
+            return f"{ms / 1000:.3g} s" if ms >= 1000 else f"{ms:.3g} ms"
+
+        return [f"≤{fmt(e)}" for e in self.edges_ms] + [f">{fmt(self.edges_ms[-1])}"]
+
+    def to_dict(self) -> Dict:
+        return {
+            "start_sec": self.start_sec,
+            "edges_ms": self.edges_ms.tolist(),
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHeatmap":
+        heatmap = cls(data["start_sec"], np.asarray(data["edges_ms"]))
+        counts = np.asarray(data["counts"], dtype=np.int64).reshape(-1, len(heatmap.edges_ms) + 1)
+        heatmap._counts = counts
+        heatmap.seconds = len(counts)
+        return heatmap
+
+    def save(self, path: Path) -> None:
+        """Save as a compressed .npz file."""
+        np.savez_compressed(
+            path,
+            start_sec=np.int64(self.start_sec or 0),
+            edges_ms=self.edges_ms,
+            counts=self.counts,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "LatencyHeatmap":
+        with np.load(path) as data:
+            heatmap = cls(int(data["start_sec"]), data["edges_ms"])
+            heatmap._counts = data["counts"].astype(np.int64)
+        heatmap.seconds = len(heatmap._counts)
+        return heatmap
@@ -0,0 +1,179 @@
+"""Key distributions: which tenant, row or key each operation touches."""
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+KEY_DISTRIBUTIONS = ("uniform", "zipfian", "hotspot", "sequential")
+
+# YCSB's default zipfian skew
+DEFAULT_ZIPF_THETA = 0.99
+
+# Keys summed exactly when computing the zipfian normalization constant;
+# beyond this the tail of the sum is approximated by its integral
+_ZETA_EXACT_KEYS = 10_000_000
+_ZETA_CHUNK = 1_000_000
+
+# Large prime used to scatter hot keys across the key space
+_SCRAMBLE_PRIME = 2_147_483_647
+
+
+@dataclass
+class KeyDistribution:
+    """How integer keys are drawn from a range.
+
+    - ``uniform``: every key equally likely
+    - ``zipfian``: key rank ``i`` has probability proportional to
+      ``1 / i**theta`` (theta in (0, 1); YCSB uses 0.99). The hottest keys
+      are the lowest, unless ``scramble`` spreads them over the range
+    - ``hotspot``: ``hot_share`` of draws go to the first ``hot_fraction``
+      of the range, the rest uniformly to the remainder
+    - ``sequential``: consecutive keys, wrapping at the end of the range.
+      Parallel streams interleave, so together they never repeat a key
+      within one pass
+    """
+
+    kind: str = "uniform"
+    theta: float = DEFAULT_ZIPF_THETA
+    hot_fraction: float = 0.2
+    hot_share: float = 0.8
+    scramble: bool = False
+
+    def __post_init__(self):
+        if self.kind not in KEY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Invalid key distribution: {self.kind}. Must be one of {KEY_DISTRIBUTIONS}"
+            )
+        if not 0.0 < self.theta < 1.0:
+            raise ValueError("Zipfian theta must be between 0 and 1 (exclusive)")
+        if not 0.0 < self.hot_fraction < 1.0:
+            raise ValueError("Hotspot hot_fraction must be between 0 and 1 (exclusive)")
+        if not 0.0 <= self.hot_share <= 1.0:
+            raise ValueError("Hotspot hot_share must be between 0 and 1")
+
+    @classmethod
+    def from_config(cls, value: Union[str, Dict[str, Any], "KeyDistribution"]) -> "KeyDistribution":
+        """Build from a config value: a distribution name or a mapping with ``kind``."""
+        if isinstance(value, KeyDistribution):
+            return value
+        if isinstance(value, str):
+            return cls(kind=value)
+        return cls(**value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """Short label, e.g. ``zipfian(0.99)``."""
+        if self.kind == "zipfian":
+            return f"zipfian({self.theta:g})"
+        if self.kind == "hotspot":
+            return f"hotspot({self.hot_share:.0%}->{self.hot_fraction:.0%})"
+        return self.kind
+
+
+@lru_cache(maxsize=32)
+def zeta(n: int, theta: float) -> float:
+    """Generalized harmonic number: the sum of ``1 / i**theta`` for i in 1..n."""
+    exact = min(n, _ZETA_EXACT_KEYS)
+    total = 0.0
+    for start in range(1, exact + 1, _ZETA_CHUNK):
+        ranks = np.arange(start, min(start + _ZETA_CHUNK, exact + 1), dtype=float)
+        total += float(np.sum(ranks**-theta))
+    if n > exact:
+        # Integral of x**-theta over (exact + 0.5, n + 0.5]
+        total += ((n + 0.5) ** (1 - theta) - (exact + 0.5) ** (1 - theta)) / (1 - theta)
+    return total
+
+
+class KeyGenerator:
+    """Draws keys in ``low``..``high`` (inclusive) from a distribution.
+
+    ``sample()`` returns a numpy block of keys, which is how row generation
+    uses it; ``next()`` serves single keys from an internal block for
+    operations that need one key at a time (reads, updates). ``stream`` and
+    ``streams`` split sequential keys between parallel workers; the other
+    distributions draw independently from ``rng``.
+    """
+
+    BLOCK_KEYS = 4096
+
+    def __init__(
+        self,
+        distribution: KeyDistribution,
+        low: int,
+        high: int,
+        rng: Optional[np.random.Generator] = None,
+        stream: int = 0,
+        streams: int = 1,
+    ):
+        if low > high:
+            raise ValueError(f"Empty key range: {low}..{high}")
+        self.distribution = distribution
+        self.low = low
+        self.high = high
+        self.count = high - low + 1
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._stream = stream
+        self._streams = max(streams, 1)
+        self._position = 0
+        self._block = np.empty(0, dtype=np.int64)
+        self._index = 0
+
+        if distribution.kind == "zipfian":
+            theta = distribution.theta
+            n = self.count
+            self._zetan = zeta(n, theta)
+            self._alpha = 1.0 / (1.0 - theta)
+            zeta2 = zeta(2, theta) if n >= 2 else 1.0
+            self._eta = (1 - (2.0 / n) ** (1 - theta)) / (1 - zeta2 / self._zetan) if n > 2 else 0.0
+            self._half_pow_theta = 1.0 + 0.5**theta
+
+    def sample(self, count: int) -> np.ndarray:
+        """The next ``count`` keys as an int64 array."""
+        kind = self.distribution.kind
+        if kind == "uniform":
+            return self._rng.integers(self.low, self.high + 1, size=count, dtype=np.int64)
+        if kind == "sequential":
+            positions = self._position + np.arange(count, dtype=np.int64)
+            self._position += count
+            offsets = (self._stream + positions * self._streams) % self.count
+            return self.low + offsets
+        if kind == "zipfian":
+            ranks = self._zipf_ranks(count)
+        else:
+            ranks = self._hotspot_ranks(count)
+        if self.distribution.scramble:
+            # A bijection on 0..count-1 (the prime is coprime with any smaller count)
+            ranks = ((ranks + 1) * (_SCRAMBLE_PRIME % self.count or 1)) % self.count
+        return self.low + ranks
+
+    def next(self) -> int:
+        """A single key, served from a pre-drawn block."""
+        if self._index >= len(self._block):
+            self._block = self.sample(self.BLOCK_KEYS)
+            self._index = 0
+        key = int(self._block[self._index])
+        self._index += 1
+        return key
+
+    def _zipf_ranks(self, count: int) -> np.ndarray:
+        """Zero-based zipfian ranks, with the closed-form method YCSB uses."""
+        # Gray et al., "Quickly Generating Billion-Record Synthetic Databases"
+        u = self._rng.random(count)
+        uz = u * self._zetan
+        spread = np.floor(self.count * (self._eta * u - self._eta + 1) ** self._alpha)
+        ranks = np.where(uz < 1.0, 0, np.where(uz < self._half_pow_theta, 1, spread))
+        return np.minimum(ranks.astype(np.int64), self.count - 1)
+
+    def _hotspot_ranks(self, count: int) -> np.ndarray:
+        hot_keys = max(1, min(self.count - 1, int(self.count * self.distribution.hot_fraction)))
+        if self.count == 1:
+            return np.zeros(count, dtype=np.int64)
+        hot = self._rng.random(count) < self.distribution.hot_share
+        hot_ranks = self._rng.integers(0, hot_keys, size=count, dtype=np.int64)
+        cold_ranks = self._rng.integers(hot_keys, self.count, size=count, dtype=np.int64)
+        return np.where(hot, hot_ranks, cold_ranks)
+
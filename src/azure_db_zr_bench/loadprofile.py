@@ -0,0 +1,170 @@
+"""Load profiles: worker counts and write rates that change over a run."""
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+LOAD_SHAPES = ("linear", "steps", "diurnal")
+
+
+@dataclass
+class LoadPhase:
+    """One stretch of a load profile.
+
+    ``workers`` and ``rate`` (total writes/sec) are each a single level or a
+    ``[from, to]`` range; a phase that sets neither keeps the levels the
+    previous phase ended at. Ranges move from ``from`` to ``to`` by
+    ``shape``:
+
+    - ``linear``: a straight ramp over the phase
+    - ``steps``: ``steps`` equal steps, the first at ``from`` and the last
+      at ``to``
+    - ``diurnal``: a cosine wave that starts at ``from`` and peaks at ``to``
+      every ``period`` seconds (default: the phase's duration)
+    """
+
+    duration: float
+    name: Optional[str] = None
+    workers: Optional[Tuple[int, int]] = None
+    rate: Optional[Tuple[float, float]] = None
+    shape: str = "linear"
+    steps: int = 4
+    period: Optional[float] = None
+
+    def __post_init__(self):
+        if self.duration <= 0:
+            raise ValueError(f"Load phase duration must be positive, got {self.duration}")
+        if self.shape not in LOAD_SHAPES:
+            raise ValueError(f"Invalid load shape: {self.shape}. Must be one of {LOAD_SHAPES}")
+        if self.steps < 1:
+            raise ValueError("Load phase steps must be at least 1")
+        if self.period is not None and self.period <= 0:
+            raise ValueError("Load phase period must be positive")
+        self.workers = _level_range(self.workers, "workers", int)
+        self.rate = _level_range(self.rate, "rate", float)
+        if self.workers and min(self.workers) < 1:
+            raise ValueError("Load phase workers must be at least 1")
+        if self.rate and min(self.rate) <= 0:
+            raise ValueError("Load phase rate must be positive")
+
+    def level(self, levels: Tuple[float, float], offset: float) -> float:
+        """Where a ``[from, to]`` range is ``offset`` seconds into the phase."""
+        start, end = levels
+        if start == end:
+            return start
+        fraction = min(max(offset / self.duration, 0.0), 1.0)
+        if self.shape == "steps":
+            step = min(int(fraction * self.steps), self.steps - 1)
+            fraction = step / (self.steps - 1) if self.steps > 1 else 1.0
+        elif self.shape == "diurnal":
+            period = self.period or self.duration
+            fraction = (1 - math.cos(2 * math.pi * offset / period)) / 2
+        return start + (end - start) * fraction
+
+
+def _level_range(value: Any, field: str, kind) -> Optional[Tuple]:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        if len(value) != 2:
+            raise ValueError(f"Load phase {field} must be a level or [from, to]")
+        return kind(value[0]), kind(value[1])
+    return kind(value), kind(value)
+
+
+@dataclass(frozen=True)
+class LoadLevel:
+    """The load a run should be at right now."""
+
+    phase: int
+    workers: int
+    rate: Optional[float]
+
+
+class LoadProfile:
+    """A named sequence of load phases, run back to back.
+
+    The profile's total duration replaces the run's ``--duration``. Levels a
+    phase leaves unset carry over, starting from the run's own concurrency
+    and target rate.
+    """
+
+    def __init__(self, name: str, phases: List[LoadPhase]):
+        if not phases:
+            raise ValueError(f"Load profile {name} has no phases")
+        self.name = name
+        self.phases = phases
+        for index, phase in enumerate(phases):
+            if phase.name is None:
+                phase.name = f"phase-{index + 1}"
+        self._starts = []
+        offset = 0.0
+        for phase in phases:
+            self._starts.append(offset)
+            offset += phase.duration
+        self.duration = offset
+
+    @classmethod
+    def from_config(cls, name: str, phases: List[Dict[str, Any]]) -> "LoadProfile":
+        if not isinstance(phases, list):
+            raise ValueError(f"Load profile {name} must be a list of phases")
+        return cls(name, [LoadPhase(**phase) for phase in phases])
+
+    @property
+    def varies_workers(self) -> bool:
+        return any(phase.workers is not None for phase in self.phases)
+
+    @property
+    def varies_rate(self) -> bool:
+        return any(phase.rate is not None for phase in self.phases)
+
+    def max_workers(self, initial: int) -> int:
+        return max([initial] + [max(p.workers) for p in self.phases if p.workers])
+
+    def phase_at(self, offset: float) -> int:
+        """Index of the phase ``offset`` seconds into the profile (the last one past its end)."""
+        return max(bisect_right(self._starts, offset) - 1, 0)
+
+    def phase_bounds(self, index: int) -> Tuple[float, float]:
+        """Start and end of a phase, in seconds from the start of the profile."""
+        start = self._starts[index]
+        return start, start + self.phases[index].duration
+
+    def level_at(self, offset: float, workers: int, rate: Optional[float]) -> LoadLevel:
+        """The load ``offset`` seconds in, given the run's initial ``workers`` and ``rate``."""
+        index = self.phase_at(offset)
+        # Carry each level over from where the last phase that set it ended
+        for phase in reversed(self.phases[:index]):
+            if phase.workers is not None:
+                workers = round(phase.level(phase.workers, phase.duration))
+                break
+        for phase in reversed(self.phases[:index]):
+            if phase.rate is not None:
+                rate = phase.level(phase.rate, phase.duration)
+                break
+
+        phase = self.phases[index]
+        phase_offset = offset - self._starts[index]
+        if phase.workers is not None:
+            workers = round(phase.level(phase.workers, phase_offset))
+        if phase.rate is not None:
+            rate = phase.level(phase.rate, phase_offset)
+        return LoadLevel(index, max(int(workers), 1), rate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "phases": [
+                {
+                    "name": p.name,
+                    "duration": p.duration,
+                    "workers": list(p.workers) if p.workers else None,
+                    "rate": list(p.rate) if p.rate else None,
+                    "shape": p.shape,
+                    "steps": p.steps,
+                    "period": p.period,
+                }
+                for p in self.phases
+            ],
+        }
@@ -0,0 +1,179 @@
+"""Result dimensions: filter, group, pivot and compare runs along any run setting."""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .benchmark import PARAMETERS, BenchmarkResult
+
+# Everything a run can be filtered, grouped or pivoted by
+DIMENSIONS = ("service", "mode", "target_name") + PARAMETERS
+
+# Dimensions that are not plain BenchmarkResult attributes
+_DERIVED = ("network", "trace")
+
+# Metrics a pivot shows by default
+PIVOT_METRICS = ("throughput_wps", "latency_p50_ms", "latency_p99_ms")
+
+
+def check_dimensions(dimensions: Iterable[str]) -> None:
+    for dimension in dimensions:
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}. Must be one of {DIMENSIONS}")
+
+
+def dimension_getter(dimensions: Tuple[str, ...]) -> Callable[[BenchmarkResult], Tuple]:
+    """A function from a run to its values of ``dimensions``, as a tuple.
+
+    Plain attributes are read with one attrgetter, so grouping thousands of
+    runs does not build each run's parameters dict.
+    """
+    check_dimensions(dimensions)
+    if not any(d in _DERIVED for d in dimensions):
+        get = attrgetter(*dimensions)
+        return (lambda r: (get(r),)) if len(dimensions) == 1 else get
+
+    def get_values(result: BenchmarkResult) -> Tuple:
+        parameters = result.parameters
+        return tuple(
+            parameters[d] if d in _DERIVED else getattr(result, d) for d in dimensions
+        )
+
+    return get_values
+
+
+def format_value(value: Any) -> str:
+    """A dimension value as text: ``none`` for unset, whole numbers without ``.0``."""
+    if value is None:
+        return "none"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def sort_key(value: Any) -> Tuple:
+    """Order dimension values: unset first, then numbers, then text."""
+    if value is None:
+        return (0, 0, "")
+    if isinstance(value, (int, float)):
+        return (1, value, "")
+    return (2, 0, str(value))
+
+
+def parse_where(clauses: List[str]) -> Dict[str, List[str]]:
+    """Parse ``dimension=value[,value...]`` filters; a dimension's values are alternatives."""
+    where = {}
+    for clause in clauses:
+        dimension, sep, values = clause.partition("=")
+        dimension = dimension.strip()
+        if not sep or not values.strip():
+            raise ValueError(f"Invalid filter: {clause}. Use dimension=value[,value...]")
+        check_dimensions([dimension])
+        where.setdefault(dimension, []).extend(
+            format_value(_parse_number(v.strip())) for v in values.split(",")
+        )
+    return where
+
+
+def _parse_number(text: str) -> Any:
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def filter_results(
+    results: List[BenchmarkResult], where: Dict[str, List[str]]
+) -> List[BenchmarkResult]:
+    """Runs whose every filtered dimension has one of the allowed values."""
+    if not where:
+        return results
+    key = dimension_getter(tuple(where))
+    allowed = list(where.values())
+    return [
+        result
+        for result in results
+        if all(format_value(v) in a for v, a in zip(key(result), allowed))
+    ]
+
+
+def group_by(
+    results: List[BenchmarkResult], dimensions: Tuple[str, ...]
+) -> Dict[Tuple, List[BenchmarkResult]]:
+    """Runs by their values of ``dimensions``, in one pass; keys sorted by sort_key()."""
+    key = dimension_getter(dimensions)
+    groups = {}
+    for result in results:
+        groups.setdefault(key(result), []).append(result)
+    return dict(sorted(groups.items(), key=lambda item: tuple(map(sort_key, item[0]))))
+
+
+def varying_dimensions(
+    results: List[BenchmarkResult], candidates: Iterable[str] = PARAMETERS
+) -> List[str]:
+    """The candidate dimensions that take more than one value across ``results``."""
+    candidates = tuple(candidates)
+    key = dimension_getter(candidates)
+    seen = [set() for _ in candidates]
+    for result in results:
+        for values, value in zip(seen, key(result)):
+            values.add(format_value(value))
+    return [d for d, values in zip(candidates, seen) if len(values) > 1]
+
+
+def pivot(
+    results: List[BenchmarkResult],
+    rows: Tuple[str, ...],
+    column: str,
+    metrics: Tuple[str, ...] = PIVOT_METRICS,
+    baseline: Any = None,
+) -> Dict[str, Any]:
+    """Summary metrics with ``rows`` dimensions down and ``column`` across.
+
+    Each cell is the median of each metric over the cell's runs (repeated
+    runs are pooled rather than the newest hiding the rest), with the run
+    count under ``runs``. ``delta_pct`` compares each cell with the
+    ``baseline`` column value in the same row (default: the first column).
+    """
+    check_dimensions(rows + (column,))
+    groups = group_by(results, rows + (column,))
+    columns = sorted({key[-1] for key in groups}, key=sort_key)
+    if baseline not in columns:
+        baseline = columns[0] if columns else None
+
+    table = {}
+    for key, runs in groups.items():
+        cell = {"runs": len(runs)}
+        for metric in metrics:
+            values = [r.summary[metric] for r in runs if metric in r.summary]
+            cell[metric] = float(np.median(values)) if values else None
+        table.setdefault(key[:-1], {})[key[-1]] = cell
+
+    cells = []
+    for row, by_column in table.items():
+        base = by_column.get(baseline)
+        deltas = {}
+        for value, cell in by_column.items():
+            if base is None or value == baseline:
+                continue
+            deltas[value] = {
+                metric: (cell[metric] - base[metric]) / base[metric] * 100
+                if cell[metric] is not None and base[metric]
+                else None
+                for metric in metrics
+            }
+        cells.append({"row": row, "columns": by_column, "delta_pct": deltas})
+
+    return {
+        "rows": rows,
+        "column": column,
+        "columns": columns,
+        "baseline": baseline,
+        "metrics": metrics,
+        "cells": cells,
+    }
+
+
+def newest(runs: List[BenchmarkResult]) -> Optional[BenchmarkResult]:
+    return max(runs, key=lambda r: r.start_time) if runs else None
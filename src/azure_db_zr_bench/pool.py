@@ -0,0 +1,195 @@
+"""Shared connection pools for pooled benchmark mode."""
+
+import itertools
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from .config import BenchmarkTarget
+from .providers import DatabaseProvider, PostgresProvider, get_provider
+
+
+class PoolTimeout(Exception):
+    """Raised when a worker cannot acquire a pooled connection in time."""
+
+
+class _Waiter:
+    """A worker blocked in acquire(), waiting to be handed a connection."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.provider: Optional[DatabaseProvider] = None
+
+
+class ConnectionPool:
+    """Fixed-size pool of connections shared by many benchmark workers.
+
+    The pool opens ``size`` providers up front, so it works with any
+    provider. Workers block in acquire() when every connection is busy; that
+    wait is what pooled mode measures. Released connections are handed to
+    the longest-waiting worker (FIFO, like psycopg_pool) so a worker that
+    just released one cannot immediately take it back and starve the others.
+    """
+
+    def __init__(self, config: BenchmarkTarget, size: int, timeout: float = 30.0):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.config = config
+        self.size = size
+        self.timeout = timeout
+        self._providers: List[DatabaseProvider] = []
+        self._ids: Dict[DatabaseProvider, int] = {}
+        self._idle: Deque[DatabaseProvider] = deque()
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        """Open all pooled connections."""
+        for _ in range(self.size):
+            provider = get_provider(self.config, len(self._providers), self.size)
+            provider.connect()
+            self._ids[provider] = len(self._providers)
+            self._providers.append(provider)
+            self._idle.append(provider)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        for provider in self._providers:
+            provider.disconnect()
+        self._providers = []
+        self._idle.clear()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Tuple[DatabaseProvider, float]]:
+        """Check out a provider, yielding it with the acquire wait in milliseconds."""
+        start_time = time.perf_counter()
+        provider = self._checkout()
+        wait_ms = (time.perf_counter() - start_time) * 1000
+
+        try:
+            yield provider, wait_ms
+        finally:
+            self._checkin(provider)
+
+    def connection_id(self, provider: DatabaseProvider) -> int:
+        """Which of the pool's connections a checked-out provider is, from 0."""
+        return self._ids[provider]
+
+    def repair(self, provider: DatabaseProvider) -> bool:
+        """Reconnect a checked-out provider whose connection broke, e.g. in a failover.
+
+        Call after a failed operation, before releasing the provider; returns
+        whether it reconnected. Raises if the reconnect fails.
+        """
+        if provider.is_healthy():
+            return False
+        provider.reconnect()
+        return True
+
+    def _checkout(self) -> DatabaseProvider:
+        with self._lock:
+            if self._idle and not self._waiters:
+                return self._idle.popleft()
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+
+        if not waiter.event.wait(self.timeout):
+            with self._lock:
+                # The connection may have been handed over just as we timed out
+                if waiter.provider is None:
+                    self._waiters.remove(waiter)
+                    raise PoolTimeout(f"No pooled connection available after {self.timeout}s")
+        return waiter.provider
+
+    def _checkin(self, provider: DatabaseProvider) -> None:
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.provider = provider
+                waiter.event.set()
+            else:
+                self._idle.append(provider)
+
+
+class PostgresConnectionPool(ConnectionPool):
+    """PostgreSQL pool backed by psycopg_pool.ConnectionPool."""
+
+    def __init__(
+        self, config: BenchmarkTarget, size: int, timeout: float = 30.0, workers: int = 1
+    ):
+        super().__init__(config, size, timeout)
+        self._pool = None
+        # One provider per worker thread, reused across checkouts for its row generator
+        self._local = threading.local()
+        self._workers = workers
+        self._streams = itertools.count()
+        # Numbers for psycopg connections, in the order they are first checked out;
+        # a connection the pool replaces gets a new number
+        self._connection_ids = weakref.WeakKeyDictionary()
+        self._next_connection_id = itertools.count()
+        self._ids_lock = threading.Lock()
+
+    def open(self) -> None:
+        from psycopg_pool import ConnectionPool as PsycopgPool
+
+        provider = PostgresProvider(self.config)
+        self._pool = PsycopgPool(
+            conninfo=provider.conninfo(),
+            min_size=self.size,
+            max_size=self.size,
+            timeout=self.timeout,
+            kwargs={"autocommit": False},
+            configure=provider.configure_session,
+            open=True,
+        )
+        self._pool.wait()
+
+    def close(self) -> None:
+        if self._pool:
+            self._pool.close()
+            self._pool = None
+
+    @contextmanager
+    def acquire(self) -> Iterator[Tuple[DatabaseProvider, float]]:
+        from psycopg_pool import PoolTimeout as PsycopgPoolTimeout
+
+        start_time = time.perf_counter()
+        try:
+            with self._pool.connection() as conn:
+                wait_ms = (time.perf_counter() - start_time) * 1000
+                provider = getattr(self._local, "provider", None)
+                if provider is None:
+                    provider = self._local.provider = PostgresProvider(
+                        self.config, next(self._streams), self._workers
+                    )
+                provider.attach(conn)
+                yield provider, wait_ms
+        except PsycopgPoolTimeout as e:
+            raise PoolTimeout(str(e))
+
+    def connection_id(self, provider: DatabaseProvider) -> int:
+        with self._ids_lock:
+            connection = provider._connection
+            if connection not in self._connection_ids:
+                self._connection_ids[connection] = next(self._next_connection_id)
+            return self._connection_ids[connection]
+
+    def repair(self, provider: DatabaseProvider) -> bool:
+        # psycopg_pool discards broken connections when they are returned and opens new ones
+        return False
+
+
+def get_pool(config: BenchmarkTarget, size: int, workers: int = 1) -> ConnectionPool:
+    """Factory function to get the appropriate connection pool for a target.
+
+    PostgreSQL uses psycopg_pool; other services use the generic blocking
+    pool (mysql-connector's pool raises instead of waiting when exhausted,
+    and pyodbc only offers driver-level pooling). ``workers`` is the number
+    of threads sharing the pool.
+    """
+    if config.service == "postgres":
+        return PostgresConnectionPool(config, size, workers=workers)
+    return ConnectionPool(config, size)
@@ -0,0 +1,223 @@
+"""Parallel, resumable bulk prefill of the benchmark table."""
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import BenchmarkTarget
+from .providers import get_provider
+from .schema import DEFAULT_PRIMARY_KEY, DEFAULT_SCHEMA, WorkloadSchema
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def parse_size(size: str) -> int:
+    """Parse a size such as ``500MB`` or ``200GB`` into bytes."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B?)\s*", size.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {size}. Use e.g. 500MB, 20GB, 1TB")
+    value, unit = match.groups()
+    if unit and not unit.endswith("B"):
+        unit += "B"
+    return int(float(value) * _SIZE_UNITS[unit])
+
+
+def rows_for_size(size: str, schema: Optional[WorkloadSchema] = None) -> int:
+    """Estimate how many rows of ``schema`` make up a table of ``size``.
+
+    Uses the schema's rough on-disk row size, including its share of the
+    primary key and secondary indexes.
+    """
+    row_bytes = (schema or WorkloadSchema.default()).approx_row_bytes()
+    return max(1, parse_size(size) // row_bytes)
+
+
+class PrefillState:
+    """Checkpoint of completed prefill chunks, persisted as JSON.
+
+    A chunk is recorded only after its transaction commits, so a resumed
+    prefill never loses rows; if the process dies between the commit and the
+    checkpoint write, that one chunk is loaded again.
+    """
+
+    def __init__(self, path: Path, target_rows: int, chunk_rows: int):
+        self.path = path
+        self.target_rows = target_rows
+        self.chunk_rows = chunk_rows
+        self.completed = set()
+        self._lock = threading.Lock()
+
+    @property
+    def total_chunks(self) -> int:
+        return math.ceil(self.target_rows / self.chunk_rows)
+
+    def chunk_size(self, chunk: int) -> int:
+        return min(self.chunk_rows, self.target_rows - chunk * self.chunk_rows)
+
+    @property
+    def rows_loaded(self) -> int:
+        return sum(self.chunk_size(c) for c in self.completed)
+
+    @classmethod
+    def load_or_create(cls, path: Path, target_rows: int, chunk_rows: int) -> "PrefillState":
+        state = cls(path, target_rows, chunk_rows)
+        if path.exists():
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data["chunk_rows"] != chunk_rows:
+                raise ValueError(
+                    f"Existing prefill in {path} used chunk size {data['chunk_rows']}; "
+                    "resume with the same --chunk-rows or start over with --restart"
+                )
+            # Chunks beyond a smaller new target are simply not counted
+            state.completed = {c for c in data["completed_chunks"] if c < state.total_chunks}
+        return state
+
+    def mark_done(self, chunk: int) -> None:
+        with self._lock:
+            self.completed.add(chunk)
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "target_rows": self.target_rows,
+                    "chunk_rows": self.chunk_rows,
+                    "completed_chunks": sorted(self.completed),
+                    "rows_loaded": self.rows_loaded,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+
+def run_prefill(
+    target_name: str,
+    target_config: BenchmarkTarget,
+    rows: int,
+    streams: int = 4,
+    chunk_rows: int = 50_000,
+    state_dir: Path = Path("results/prefill"),
+    restart: bool = False,
+    progress_interval: float = 5.0,
+) -> Dict:
+    """Load ``rows`` rows into the benchmark table using parallel bulk-load streams.
+
+    The load is split into chunks of ``chunk_rows``; each stream takes the
+    next pending chunk and loads it in one transaction with the provider's
+    bulk path (COPY for PostgreSQL, multi-row INSERT for MySQL,
+    fast_executemany for SQL DB). Completed chunks are checkpointed in
+    ``state_dir/<target>.json`` so an interrupted prefill resumes where it
+    stopped. A checkpoint claiming more rows than the table holds (e.g. a
+    benchmark run truncated the table since) is discarded and the prefill
+    starts over. ``restart`` truncates the table and discards the
+    checkpoint. The table and its rows follow the target's schema.
+    """
+    schema = target_config.schema or WorkloadSchema.default()
+    # Each schema and key strategy has its own table, so it gets its own checkpoint
+    state_name = target_name if schema.name == DEFAULT_SCHEMA else f"{target_name}-{schema.name}"
+    if schema.primary_key != DEFAULT_PRIMARY_KEY:
+        state_name += f"-{schema.primary_key}"
+    state_path = state_dir / f"{state_name}.json"
+
+    setup_provider = get_provider(target_config)
+    setup_provider.connect()
+    setup_provider.create_benchmark_table()
+    if restart:
+        setup_provider.truncate_benchmark_table()
+        if state_path.exists():
+            state_path.unlink()
+
+    state = PrefillState.load_or_create(state_path, rows, chunk_rows)
+    if state.completed:
+        # A truncated table leaves the checkpoint behind; it must not be trusted
+        table_rows = setup_provider.count_rows()
+        if table_rows is not None and table_rows < state.rows_loaded:
+            print(
+                f"Checkpoint claims {state.rows_loaded:,} rows but {schema.table} has "
+                f"{table_rows:,} (truncated since?); starting the prefill over"
+            )
+            state_path.unlink()
+            state = PrefillState(state_path, rows, chunk_rows)
+    setup_provider.disconnect()
+    pending = [c for c in range(state.total_chunks) if c not in state.completed]
+    already_loaded = state.rows_loaded
+
+    if not pending:
+        print(f"Prefill already complete: {already_loaded:,} rows")
+        return {"target_rows": rows, "rows_loaded": already_loaded, "duration_sec": 0.0}
+
+    if already_loaded:
+        print(f"Resuming prefill: {already_loaded:,} of {rows:,} rows already loaded")
+
+    pending_lock = threading.Lock()
+    stop_event = threading.Event()
+
+    def stream(stream_id: int) -> None:
+        provider = get_provider(target_config, stream_id, streams)
+        provider.connect()
+        try:
+            while not stop_event.is_set():
+                with pending_lock:
+                    if not pending:
+                        return
+                    chunk = pending.pop(0)
+                provider.bulk_load(state.chunk_size(chunk))
+                state.mark_done(chunk)
+        finally:
+            provider.disconnect()
+
+    print(f"Prefilling {rows - already_loaded:,} rows with {streams} streams...")
+    start_time = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=streams)
+    futures = [executor.submit(stream, i) for i in range(streams)]
+
+    try:
+        while True:
+            done, not_done = wait(futures, timeout=progress_interval, return_when=FIRST_EXCEPTION)
+            _print_progress(state, already_loaded, time.perf_counter() - start_time)
+            if not not_done or any(f.exception() for f in done):
+                break
+    except KeyboardInterrupt:
+        print("Interrupted; finishing in-flight chunks (re-run to resume)...")
+        stop_event.set()
+        raise
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True)
+
+    for future in futures:
+        if future.exception():
+            raise future.exception()
+
+    duration = time.perf_counter() - start_time
+    loaded = state.rows_loaded
+    print(f"Prefill complete: {loaded:,} rows in {duration:.1f}s")
+
+    return {
+        "target_rows": rows,
+        "rows_loaded": loaded,
+        "rows_this_run": loaded - already_loaded,
+        "duration_sec": duration,
+        "rows_per_sec": (loaded - already_loaded) / duration if duration > 0 else 0,
+    }
+
+
+def _print_progress(state: PrefillState, already_loaded: int, elapsed: float) -> None:
+    loaded = state.rows_loaded
+    rate = (loaded - already_loaded) / elapsed if elapsed > 0 else 0
+    remaining = state.target_rows - loaded
+    eta = f"{remaining / rate:.0f}s" if rate > 0 else "?"
+    print(
+        f"  {loaded:,}/{state.target_rows:,} rows "
+        f"({loaded / state.target_rows:.1%}), {rate:,.0f} rows/sec, ETA {eta}"
+    )
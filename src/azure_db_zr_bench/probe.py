@@ -0,0 +1,199 @@
+"""Network round-trip probe that runs alongside a benchmark."""
+
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from .config import LOCAL_SERVICES, BenchmarkTarget
+from .histogram import LatencyHistogram
+from .providers import get_provider
+
+# Default time between probe samples
+PROBE_INTERVAL_SEC = 0.1
+
+# What each sample measures: the network round trip as the kernel sees it and
+# a SELECT 1 on an open connection (one round trip through the driver and
+# protocol, with next to no server work)
+PROBE_METRICS = ("rtt_tcp", "rtt_query")
+
+# Linux struct tcp_info: tcpi_rtt, the smoothed RTT in microseconds, is the
+# sixteenth u32 after eight single-byte fields
+TCP_INFO_LEN = 104
+TCP_INFO_RTT_OFFSET = 68
+
+# When the driver hides its socket, time a TCP connect once every this many
+# samples instead. Each one is a connection dropped before the handshake, which
+# servers log, so it is kept rare and never done against MySQL: enough of them
+# reach max_connect_errors and the server blocks the client host.
+TCP_CONNECT_EVERY = 50
+NO_TCP_CONNECT_SERVICES = {"mysql"}
+
+
+def tcp_rtt_ms(fd: int) -> Optional[float]:
+    """The kernel's smoothed RTT for a connected TCP socket, or None if unavailable."""
+    if not hasattr(socket, "TCP_INFO"):
+        return None
+    try:
+        # socket.fromfd() dups the descriptor, so closing it leaves the driver's open
+        sock = socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, TCP_INFO_LEN)
+        finally:
+            sock.close()
+    except OSError:
+        # Not a TCP socket, e.g. a Unix socket to a local server
+        return None
+    if len(info) < TCP_INFO_RTT_OFFSET + 4:
+        return None
+    rtt_us = struct.unpack_from("I", info, TCP_INFO_RTT_OFFSET)[0]
+    return rtt_us / 1000 if rtt_us else None
+
+
+@dataclass
+class ProbeSample:
+    """One probe measurement; a part is None if it failed or does not apply."""
+
+    timestamp: float
+    start_ns: int
+    tcp_ms: Optional[float] = None
+    query_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+class RttProbe:
+    """A thread that samples the network round trip to a target at a fixed rate.
+
+    Every ``interval_sec`` it times a ``SELECT 1`` on its own connection, reads
+    the kernel's RTT for that connection, and passes the ProbeSample to
+    ``record``. If the driver hides its socket, the network sample falls back
+    to a rare TCP connect (see TCP_CONNECT_EVERY). Services without a network
+    connection get the query only. The thread runs until ``stop_event`` is set.
+    """
+
+    def __init__(
+        self,
+        target_config: BenchmarkTarget,
+        interval_sec: float,
+        record: Callable[[ProbeSample], None],
+        stop_event: threading.Event,
+    ):
+        if interval_sec <= 0:
+            raise ValueError(f"Probe interval must be positive, got {interval_sec}")
+        self.target_config = target_config
+        self.interval_sec = interval_sec
+        self._record = record
+        self._stop_event = stop_event
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="rtt-probe", daemon=True)
+        self._thread.start()
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        provider = get_provider(self.target_config)
+        networked = self.target_config.service not in LOCAL_SERVICES
+        may_connect = networked and self.target_config.service not in NO_TCP_CONNECT_SERVICES
+        connected = False
+        samples = 0
+        next_sample = time.perf_counter()
+
+        try:
+            while not self._stop_event.is_set():
+                sample = ProbeSample(timestamp=time.time(), start_ns=time.perf_counter_ns())
+                try:
+                    if not connected:
+                        provider.connect()
+                        connected = True
+                    sample.query_ms = provider.ping()
+                    if networked:
+                        fd = provider.socket_fd()
+                        if fd is not None:
+                            sample.tcp_ms = tcp_rtt_ms(fd)
+                        fallback = sample.tcp_ms is None and may_connect
+                        if fallback and samples % TCP_CONNECT_EVERY == 0:
+                            tcp_start = time.perf_counter()
+                            sock = provider.open_socket()
+                            sample.tcp_ms = (time.perf_counter() - tcp_start) * 1000
+                            sock.close()
+                except Exception as e:
+                    sample.error = str(e)
+                    if connected:
+                        # Start over with a new connection on the next sample
+                        try:
+                            provider.disconnect()
+                        except Exception:
+                            pass
+                        connected = False
+                self._record(sample)
+                samples += 1
+
+                # Fixed rate; a sample that overran pushes the schedule back
+                next_sample = max(next_sample + self.interval_sec, time.perf_counter())
+                self._stop_event.wait(next_sample - time.perf_counter())
+        finally:
+            if connected:
+                provider.disconnect()
+
+
+class ProbeStats:
+    """Probe samples from a run (or one soak segment), in fixed-size histograms.
+
+    ``time_series`` holds one entry per sample for aggregate_time_series(),
+    which averages them into the per-second points.
+    """
+
+    def __init__(self):
+        self.tcp = LatencyHistogram()
+        self.query = LatencyHistogram()
+        self.errors = 0
+        self.time_series: List[Dict] = []
+
+    def record(self, sample: ProbeSample) -> None:
+        entry = {"timestamp": sample.timestamp}
+        if sample.tcp_ms is not None:
+            self.tcp.record(sample.tcp_ms)
+            entry["rtt_tcp_ms"] = sample.tcp_ms
+        if sample.query_ms is not None:
+            self.query.record(sample.query_ms)
+            entry["rtt_query_ms"] = sample.query_ms
+        if sample.error:
+            self.errors += 1
+        self.time_series.append(entry)
+
+    def merge(self, other: "ProbeStats") -> None:
+        self.tcp.merge(other.tcp)
+        self.query.merge(other.query)
+        self.errors += other.errors
+
+    def to_dict(self) -> Dict:
+        return {"tcp": self.tcp.to_dict(), "query": self.query.to_dict(), "errors": self.errors}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ProbeStats":
+        stats = cls()
+        stats.tcp = LatencyHistogram.from_dict(data["tcp"])
+        stats.query = LatencyHistogram.from_dict(data["query"])
+        stats.errors = data["errors"]
+        return stats
+
+    def summary(self) -> Dict:
+        """``rtt_tcp_*`` and ``rtt_query_*`` percentiles, for the run summary."""
+        summary = {}
+        for name, hist in zip(PROBE_METRICS, (self.tcp, self.query)):
+            if hist.total:
+                p50, p95, p99 = hist.percentiles([50, 95, 99])
+                summary[f"{name}_p50_ms"] = p50
+                summary[f"{name}_p95_ms"] = p95
+                summary[f"{name}_p99_ms"] = p99
+                summary[f"{name}_mean_ms"] = hist.mean
+                summary[f"{name}_samples"] = hist.total
+        if summary or self.errors:
+            summary["rtt_probe_errors"] = self.errors
+        return summary
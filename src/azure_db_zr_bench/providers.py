@@ -2,12 +2,28 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import json
+import socket
+import ssl
+import struct
 import time
 import random
 import string
 
+import numpy as np
+
 from .config import BenchmarkTarget
+from .schema import RowGenerator, WorkloadSchema
+
+# Rows per statement/COPY buffer within a bulk_load() transaction
+BULK_SUB_BATCH = 1000
+
+# Server-loop workload: the table its procedure writes to, and the procedure.
+# Rows carry a 512-character payload (an MD5 hex digest 16 times), like the
+# default schema's, so commits write about as much as a default-table write
+COMMIT_LOOP_TABLE = "benchmark_commit_loop"
+COMMIT_LOOP_PROCEDURE = "benchmark_commit_loop_run"
 
 
 @dataclass
@@ -19,6 +35,17 @@ class WriteResult:
     rows_written: int
     error: Optional[str] = None
     timestamp: float = 0.0
+    pool_wait_ms: float = 0.0  # Time spent acquiring a pooled connection
+    phases: Optional[Dict[str, float]] = None  # Connect/server-loop workload timings
+    template: Optional[str] = None  # Replay workload statement template
+    schedule_lag_ms: float = 0.0  # How late it started against the trace or send schedule
+    commit_ms: Optional[List[float]] = None  # Server-loop workload: each commit, server-timed
+    probe_ms: float = 0.0  # Connect workload: time spent in handshake_probe() before connect()
+    connection_id: Optional[int] = None  # Pooled mode: the pooled connection written on
+    load_phase: int = 0  # Load profile phase the operation ran under
+    # perf_counter_ns() bounds of the whole operation, set by the benchmark runner
+    start_ns: int = 0
+    end_ns: int = 0
 
     def __post_init__(self):
         if self.timestamp == 0.0:
@@ -28,9 +55,15 @@ class WriteResult:
 class DatabaseProvider(ABC):
     """Abstract base class for database providers."""
 
-    def __init__(self, config: BenchmarkTarget):
+    # SQL dialect the schema's DDL and INSERTs are rendered in
+    dialect: Optional[str] = None
+
+    def __init__(self, config: BenchmarkTarget, stream: int = 0, streams: int = 1):
         self.config = config
         self._connection = None
+        self.schema = config.schema or WorkloadSchema.default()
+        # stream/streams: this provider's worker number and the worker count
+        self._rows = RowGenerator(self.schema, config.seed, stream, streams, self.dialect)
 
     @abstractmethod
     def connect(self) -> None:
@@ -42,6 +75,23 @@ class DatabaseProvider(ABC):
         """Close the database connection."""
         pass
 
+    def attach(self, connection) -> None:
+        """Use an externally managed connection, e.g. one checked out of a pool."""
+        self._connection = connection
+
+    def is_healthy(self) -> bool:
+        """Whether the connection is still usable; checked after a failed write."""
+        return self._connection is not None
+
+    def reconnect(self) -> None:
+        """Replace a broken connection with a new one."""
+        try:
+            self.disconnect()
+        except Exception:
+            # Closing a dead connection can fail; it is discarded either way
+            self._connection = None
+        self.connect()
+
     @abstractmethod
     def create_benchmark_table(self) -> None:
         """Create the benchmark table if it doesn't exist."""
@@ -61,14 +111,227 @@ class DatabaseProvider(ABC):
         """Generate a random payload string."""
         return "".join(random.choices(string.ascii_letters + string.digits, k=size))
 
+    def generate_rows(self, count: int) -> List[Tuple]:
+        """Generate ``count`` rows of INSERT parameters for the schema's columns."""
+        return self._rows.rows(count)
+
+    @property
+    def insert_sql(self) -> str:
+        return self.schema.insert_sql(self.dialect)
+
+    def bulk_load(self, rows: int) -> int:
+        """Load ``rows`` rows as fast as the engine allows and return the count.
+
+        The default falls back to write_batch(); providers override this with
+        their bulk-load path. Overrides load everything in one transaction so
+        a prefill chunk is either fully committed or not at all.
+        """
+        loaded = 0
+        while loaded < rows:
+            result = self.write_batch(min(BULK_SUB_BATCH, rows - loaded))
+            if not result.success:
+                raise RuntimeError(result.error)
+            loaded += result.rows_written
+        return loaded
+
+    def count_rows(self) -> Optional[int]:
+        """Rows in the benchmark table (None if the provider keeps no rows)."""
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM {self.schema.table}")
+            count = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+        self._connection.rollback()
+        return count
+
+    def execute_statement(self, sql: str, params: Optional[Tuple] = None) -> WriteResult:
+        """Run one statement from a trace in its own transaction, timing it with the commit.
+
+        Each statement counts as one write, whatever rows it touches.
+        """
+        start_time = time.perf_counter()
+        cursor = None
+
+        try:
+            cursor = self._connection.cursor()
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            self._commit()
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(success=True, latency_ms=elapsed_ms, rows_written=1)
+
+        except Exception as e:
+            self._connection.rollback()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(
+                success=False, latency_ms=elapsed_ms, rows_written=0, error=str(e)
+            )
+
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+
+    @abstractmethod
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        """Create the commit-loop table and the server-side procedure that writes to it."""
+        pass
+
+    @abstractmethod
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        """Run the server-side loop and return the server's time for each commit, in ms."""
+        pass
+
+    def commit_loop(self, iterations: int) -> WriteResult:
+        """Have the server run ``iterations`` INSERT + COMMIT cycles in one call.
+
+        Each cycle is timed on the server, so ``commit_ms`` holds the commit
+        cost without client round trips or driver overhead; ``latency_ms``
+        is their mean. ``phases`` has the whole call as seen by the client
+        (``loop_call_ms``) and what the server's timings do not cover
+        (``loop_overhead_ms``: one round trip, the CALL and returning the
+        timings).
+        """
+        start_time = time.perf_counter()
+
+        try:
+            commit_ms = self._run_commit_loop(iterations)
+        except Exception as e:
+            try:
+                self._connection.rollback()
+            except Exception:
+                pass
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(
+                success=False, latency_ms=elapsed_ms, rows_written=0, error=str(e)
+            )
+
+        call_ms = (time.perf_counter() - start_time) * 1000
+        server_ms = sum(commit_ms)
+        return WriteResult(
+            success=True,
+            latency_ms=server_ms / len(commit_ms) if commit_ms else 0.0,
+            rows_written=len(commit_ms),
+            commit_ms=commit_ms,
+            phases={"loop_call_ms": call_ms, "loop_overhead_ms": max(call_ms - server_ms, 0.0)},
+        )
+
+    def ping(self) -> float:
+        """Time a trivial ``SELECT 1`` round trip on the open connection, in milliseconds.
+
+        The transaction the SELECT opens is rolled back outside the timing.
+        """
+        cursor = self._connection.cursor()
+        try:
+            start_time = time.perf_counter()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        finally:
+            cursor.close()
+        self._connection.rollback()
+        return elapsed_ms
+
+    def open_socket(self) -> socket.socket:
+        """Open a raw TCP connection to the target's host and port."""
+        return socket.create_connection((self.config.host, self.config.port), timeout=30)
+
+    def socket_fd(self) -> Optional[int]:
+        """File descriptor of the open connection's socket, or None if the driver hides it."""
+        return None
+
+    def tls_handshake(self, sock: socket.socket) -> Optional[ssl.SSLSocket]:
+        """Negotiate TLS on a raw socket the way the driver would.
+
+        Returns None if TLS is not in use or the protocol wraps TLS in a way
+        that cannot be reproduced without the driver; the TLS time then stays
+        inside the auth residual.
+        """
+        return None
+
+    def handshake_probe(self) -> Dict[str, float]:
+        """Time the handshake phases below the driver, in milliseconds.
+
+        Opens a throwaway connection to measure the TCP handshake and, where
+        tls_handshake() supports it, the TLS handshake.
+        """
+        start_time = time.perf_counter()
+        sock = self.open_socket()
+        phases = {"tcp_ms": (time.perf_counter() - start_time) * 1000}
+
+        try:
+            tls_start = time.perf_counter()
+            tls_sock = self.tls_handshake(sock)
+            if tls_sock is not None:
+                phases["tls_ms"] = (time.perf_counter() - tls_start) * 1000
+                sock = tls_sock
+        finally:
+            sock.close()
+
+        return phases
+
+    def measure_connect(self, probe: bool = True) -> WriteResult:
+        """Open and close a connection through connect(), timing the handshake.
+
+        latency_ms is the full connect() time through the real driver code
+        path (TCP, TLS, auth and session setup). If ``probe`` is set, phases
+        also holds the TCP (and TLS) handshake time from handshake_probe()
+        and the remainder attributed to auth: ``auth_ms`` if TLS was probed
+        separately, otherwise ``tls_auth_ms``. The probe's own time is in
+        probe_ms, so it can be left out of the connection rate.
+        """
+        start_time = time.perf_counter()
+        phases = None
+        probe_ms = 0.0
+
+        try:
+            if probe:
+                phases = self.handshake_probe()
+                probe_ms = (time.perf_counter() - start_time) * 1000
+
+            connect_start = time.perf_counter()
+            self.connect()
+            connect_ms = (time.perf_counter() - connect_start) * 1000
+            self.disconnect()
+
+        except Exception as e:
+            self._connection = None
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(
+                success=False,
+                latency_ms=elapsed_ms,
+                rows_written=0,
+                error=str(e),
+                probe_ms=probe_ms,
+            )
+
+        if phases is not None:
+            residual = connect_ms - sum(phases.values())
+            key = "auth_ms" if "tls_ms" in phases else "tls_auth_ms"
+            phases[key] = max(residual, 0.0)
+
+        return WriteResult(
+            success=True,
+            latency_ms=connect_ms,
+            rows_written=1,
+            phases=phases,
+            probe_ms=probe_ms,
+        )
+
 
 class PostgresProvider(DatabaseProvider):
     """PostgreSQL database provider using psycopg."""
 
-    def connect(self) -> None:
-        import psycopg
+    dialect = "postgres"
 
-        # Build connection string with SSL mode
+    def conninfo(self) -> str:
+        """Build the libpq connection string for this target."""
         conninfo = (
             f"host={self.config.host} "
             f"port={self.config.port} "
@@ -81,58 +344,141 @@ class PostgresProvider(DatabaseProvider):
         if self.config.ssl_mode:
             conninfo += f" sslmode={self.config.ssl_mode}"
 
-        self._connection = psycopg.connect(conninfo)
+        return conninfo
+
+    def connect(self) -> None:
+        import psycopg
+
+        self._connection = psycopg.connect(self.conninfo())
 
         # Set autocommit mode for explicit transaction control
         self._connection.autocommit = False
+        self.configure_session(self._connection)
+
+    def configure_session(self, connection) -> None:
+        """Apply the target's session settings to a new connection.
+
+        Also used as the pool's ``configure`` callback, so pooled connections
+        get the same settings.
+        """
+        if self.config.durability:
+            # Levels are validated against DURABILITY_LEVELS, so safe to inline
+            connection.execute(f"SET synchronous_commit = {self.config.durability}")
+            connection.commit()
+
+    def tls_handshake(self, sock: socket.socket) -> Optional[ssl.SSLSocket]:
+        if not self.config.ssl_mode or self.config.ssl_mode in ("disable", "allow"):
+            return None
+
+        # SSLRequest: length 8, request code 80877103; server answers 'S' or 'N'
+        sock.sendall(struct.pack("!II", 8, 80877103))
+        if sock.recv(1) != b"S":
+            return None
+
+        context = ssl.create_default_context()
+        if self.config.ssl_mode in ("prefer", "require"):
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context.wrap_socket(sock, server_hostname=self.config.host)
 
     def disconnect(self) -> None:
         if self._connection:
             self._connection.close()
             self._connection = None
 
+    def socket_fd(self) -> Optional[int]:
+        return self._connection.fileno()
+
+    def is_healthy(self) -> bool:
+        return (
+            self._connection is not None
+            and not self._connection.closed
+            and not self._connection.broken
+        )
+
     def create_benchmark_table(self) -> None:
         with self._connection.cursor() as cur:
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS benchmark_writes (
-                    id BIGSERIAL PRIMARY KEY,
-                    tenant_id INTEGER NOT NULL,
-                    ts TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    payload VARCHAR(1024) NOT NULL
-                )
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_benchmark_writes_tenant 
-                ON benchmark_writes(tenant_id)
-            """)
+            for statement in self.schema.create_table_sql(self.dialect):
+                cur.execute(statement)
         self._connection.commit()
 
     def truncate_benchmark_table(self) -> None:
         with self._connection.cursor() as cur:
-            cur.execute("TRUNCATE TABLE benchmark_writes")
+            cur.execute(f"TRUNCATE TABLE {self.schema.table}")
+        self._connection.commit()
+
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        with self._connection.cursor() as cur:
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS {COMMIT_LOOP_TABLE} ("
+                "id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+            # COMMIT inside a procedure needs PostgreSQL 11+ and a CALL outside a transaction
+            cur.execute(
+                f"""
+                CREATE OR REPLACE PROCEDURE {COMMIT_LOOP_PROCEDURE}(
+                    iterations INT, INOUT commit_us DOUBLE PRECISION[] DEFAULT NULL
+                )
+                LANGUAGE plpgsql AS $$
+                DECLARE
+                    started TIMESTAMPTZ;
+                BEGIN
+                    commit_us := ARRAY[]::DOUBLE PRECISION[];
+                    FOR i IN 1..iterations LOOP
+                        started := clock_timestamp();
+                        INSERT INTO {COMMIT_LOOP_TABLE} (payload)
+                        VALUES (repeat(md5(random()::text), 16));
+                        COMMIT;
+                        commit_us := commit_us || (
+                            EXTRACT(EPOCH FROM clock_timestamp() - started) * 1000000
+                        )::DOUBLE PRECISION;
+                    END LOOP;
+                END
+                $$
+                """
+            )
+            if truncate:
+                cur.execute(f"TRUNCATE TABLE {COMMIT_LOOP_TABLE}")
         self._connection.commit()
 
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        self._connection.autocommit = True
+        try:
+            with self._connection.cursor() as cur:
+                cur.execute(f"CALL {COMMIT_LOOP_PROCEDURE}({int(iterations)})")
+                commit_us = cur.fetchone()[0]
+        finally:
+            self._connection.autocommit = False
+        return [float(us) / 1000 for us in commit_us]
+
+    def bulk_load(self, rows: int) -> int:
+        columns = ", ".join(self.schema.insert_names)
+        try:
+            with self._connection.cursor() as cur:
+                with cur.copy(f"COPY {self.schema.table} ({columns}) FROM STDIN") as copy:
+                    for start in range(0, rows, BULK_SUB_BATCH):
+                        data = self.generate_rows(min(BULK_SUB_BATCH, rows - start))
+                        # Generated values need no COPY text escaping
+                        copy.write("".join("\t".join(map(str, row)) + "\n" for row in data))
+            self._connection.commit()
+        except Exception:
+            self._connection.rollback()
+            raise
+        return rows
+
     def write_batch(self, batch_size: int) -> WriteResult:
+        # Rows are generated before timing starts, so latency is the database's alone
+        data = self.generate_rows(batch_size)
         start_time = time.perf_counter()
 
         try:
             with self._connection.cursor() as cur:
                 if batch_size == 1:
                     # Single row insert
-                    cur.execute(
-                        "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (%s, %s)",
-                        (random.randint(1, 1000), self.generate_payload()),
-                    )
+                    cur.execute(self.insert_sql, data[0])
                 else:
                     # Batch insert using executemany
-                    data = [
-                        (random.randint(1, 1000), self.generate_payload())
-                        for _ in range(batch_size)
-                    ]
-                    cur.executemany(
-                        "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (%s, %s)",
-                        data,
-                    )
+                    cur.executemany(self.insert_sql, data)
 
             self._connection.commit()
 
@@ -150,6 +496,8 @@ class PostgresProvider(DatabaseProvider):
 class MySQLProvider(DatabaseProvider):
     """MySQL database provider using mysql-connector-python."""
 
+    dialect = "mysql"
+
     def connect(self) -> None:
         import mysql.connector
 
@@ -167,32 +515,117 @@ class MySQLProvider(DatabaseProvider):
             **ssl_config,
         )
 
+    def tls_handshake(self, sock: socket.socket) -> Optional[ssl.SSLSocket]:
+        if not self.config.ssl_mode or self.config.ssl_mode.upper() != "REQUIRED":
+            return None
+
+        # Read the server greeting (3-byte length + sequence id + payload)
+        header = sock.recv(4, socket.MSG_WAITALL)
+        length = int.from_bytes(header[:3], "little")
+        sock.recv(length, socket.MSG_WAITALL)
+
+        # SSLRequest: CLIENT_LONG_PASSWORD | PROTOCOL_41 | SSL | SECURE_CONNECTION
+        capabilities = 0x0001 | 0x0200 | 0x0800 | 0x8000
+        payload = struct.pack("<IIB23x", capabilities, 16 * 1024 * 1024, 45)
+        sock.sendall(len(payload).to_bytes(3, "little") + b"\x01" + payload)
+
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context.wrap_socket(sock, server_hostname=self.config.host)
+
     def disconnect(self) -> None:
         if self._connection:
             self._connection.close()
             self._connection = None
 
+    def socket_fd(self) -> Optional[int]:
+        # Only the pure-Python connector exposes its socket; the C extension keeps it inside
+        sock = getattr(getattr(self._connection, "_socket", None), "sock", None)
+        return sock.fileno() if sock is not None else None
+
+    def is_healthy(self) -> bool:
+        # Pings the server, but only runs after a failed write
+        return self._connection is not None and self._connection.is_connected()
+
     def create_benchmark_table(self) -> None:
         cursor = self._connection.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS benchmark_writes (
-                id BIGINT AUTO_INCREMENT PRIMARY KEY,
-                tenant_id INT NOT NULL,
-                ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                payload VARCHAR(1024) NOT NULL,
-                INDEX idx_tenant (tenant_id)
-            ) ENGINE=InnoDB
-        """)
+        for statement in self.schema.create_table_sql(self.dialect):
+            cursor.execute(statement)
         self._connection.commit()
         cursor.close()
 
     def truncate_benchmark_table(self) -> None:
         cursor = self._connection.cursor()
-        cursor.execute("TRUNCATE TABLE benchmark_writes")
+        cursor.execute(f"TRUNCATE TABLE {self.schema.table}")
         self._connection.commit()
         cursor.close()
 
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {COMMIT_LOOP_TABLE} ("
+                "id BIGINT AUTO_INCREMENT PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+            cursor.execute(f"DROP PROCEDURE IF EXISTS {COMMIT_LOOP_PROCEDURE}")
+            # SYSDATE(6), unlike NOW(6), is the time it runs, not when the CALL began
+            cursor.execute(
+                f"""
+                CREATE PROCEDURE {COMMIT_LOOP_PROCEDURE}(IN iterations INT)
+                BEGIN
+                    DECLARE i INT DEFAULT 0;
+                    DECLARE started DATETIME(6);
+                    DECLARE commit_us LONGTEXT DEFAULT '';
+                    WHILE i < iterations DO
+                        SET started = SYSDATE(6);
+                        START TRANSACTION;
+                        INSERT INTO {COMMIT_LOOP_TABLE} (payload) VALUES (REPEAT(MD5(RAND()), 16));
+                        COMMIT;
+                        SET commit_us = CONCAT(
+                            commit_us, TIMESTAMPDIFF(MICROSECOND, started, SYSDATE(6)), ','
+                        );
+                        SET i = i + 1;
+                    END WHILE;
+                    SELECT commit_us;
+                END
+                """
+            )
+            if truncate:
+                cursor.execute(f"TRUNCATE TABLE {COMMIT_LOOP_TABLE}")
+            self._connection.commit()
+        finally:
+            cursor.close()
+
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        cursor = self._connection.cursor()
+        try:
+            cursor.callproc(COMMIT_LOOP_PROCEDURE, (iterations,))
+            commit_us = next(cursor.stored_results()).fetchone()[0]
+        finally:
+            cursor.close()
+        self._connection.commit()
+        return [int(us) / 1000 for us in commit_us.rstrip(",").split(",") if us]
+
+    def bulk_load(self, rows: int) -> int:
+        # mysql-connector rewrites executemany() INSERTs into multi-row INSERTs.
+        # LOAD DATA LOCAL would need local_infile enabled on client and server.
+        cursor = self._connection.cursor()
+        try:
+            for start in range(0, rows, BULK_SUB_BATCH):
+                cursor.executemany(
+                    self.insert_sql, self.generate_rows(min(BULK_SUB_BATCH, rows - start))
+                )
+            self._connection.commit()
+        except Exception:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return rows
+
     def write_batch(self, batch_size: int) -> WriteResult:
+        data = self.generate_rows(batch_size)
         start_time = time.perf_counter()
         cursor = None
 
@@ -200,19 +633,9 @@ class MySQLProvider(DatabaseProvider):
             cursor = self._connection.cursor()
 
             if batch_size == 1:
-                cursor.execute(
-                    "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (%s, %s)",
-                    (random.randint(1, 1000), self.generate_payload()),
-                )
+                cursor.execute(self.insert_sql, data[0])
             else:
-                data = [
-                    (random.randint(1, 1000), self.generate_payload())
-                    for _ in range(batch_size)
-                ]
-                cursor.executemany(
-                    "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (%s, %s)",
-                    data,
-                )
+                cursor.executemany(self.insert_sql, data)
 
             self._connection.commit()
 
@@ -234,6 +657,8 @@ class MySQLProvider(DatabaseProvider):
 class SQLDBProvider(DatabaseProvider):
     """Azure SQL Database provider using pyodbc."""
 
+    dialect = "sqldb"
+
     def connect(self) -> None:
         import pyodbc
 
@@ -251,39 +676,143 @@ class SQLDBProvider(DatabaseProvider):
         )
 
         self._connection = pyodbc.connect(connection_string, autocommit=False)
+        if self.config.durability == "delayed":
+            self._check_delayed_durability()
+
+    def _check_delayed_durability(self) -> None:
+        # A delayed commit on a database that disallows it silently commits in full
+        cursor = self._connection.cursor()
+        try:
+            row = cursor.execute(
+                "SELECT delayed_durability_desc FROM sys.databases WHERE name = DB_NAME()"
+            ).fetchone()
+        finally:
+            cursor.close()
+        if row is None or row[0] == "DISABLED":
+            raise RuntimeError(
+                f"Delayed durability is disabled on {self.config.database}; run "
+                "ALTER DATABASE CURRENT SET DELAYED_DURABILITY = ALLOWED first"
+            )
+
+    def _commit(self) -> None:
+        """Commit, as a delayed-durable commit if the target asks for one."""
+        if self.config.durability == "delayed":
+            cursor = self._connection.cursor()
+            cursor.execute("COMMIT TRANSACTION WITH (DELAYED_DURABILITY = ON)")
+            cursor.close()
+        else:
+            self._connection.commit()
 
     def disconnect(self) -> None:
         if self._connection:
             self._connection.close()
             self._connection = None
 
+    def is_healthy(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            self._connection.cursor().execute("SELECT 1").fetchall()
+            return True
+        except Exception:
+            return False
+
     def create_benchmark_table(self) -> None:
         cursor = self._connection.cursor()
 
-        # Check if table exists
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'benchmark_writes')
-            BEGIN
-                CREATE TABLE benchmark_writes (
-                    id BIGINT IDENTITY(1,1) PRIMARY KEY,
-                    tenant_id INT NOT NULL,
-                    ts DATETIME2 DEFAULT GETUTCDATE(),
-                    payload NVARCHAR(1024) NOT NULL
-                );
-                CREATE INDEX idx_benchmark_writes_tenant ON benchmark_writes(tenant_id);
-            END
-        """)
+        # Guarded by a check that the table exists
+        for statement in self.schema.create_table_sql(self.dialect):
+            cursor.execute(statement)
 
         self._connection.commit()
         cursor.close()
 
     def truncate_benchmark_table(self) -> None:
         cursor = self._connection.cursor()
-        cursor.execute("TRUNCATE TABLE benchmark_writes")
+        cursor.execute(f"TRUNCATE TABLE {self.schema.table}")
         self._connection.commit()
         cursor.close()
 
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                f"IF OBJECT_ID('{COMMIT_LOOP_TABLE}', 'U') IS NULL "
+                f"CREATE TABLE {COMMIT_LOOP_TABLE} ("
+                "id BIGINT IDENTITY(1,1) PRIMARY KEY, payload VARCHAR(1024) NOT NULL)"
+            )
+            cursor.execute(
+                f"""
+                CREATE OR ALTER PROCEDURE {COMMIT_LOOP_PROCEDURE} @iterations INT, @delayed BIT = 0
+                AS
+                BEGIN
+                    SET NOCOUNT ON;
+                    DECLARE @i INT = 0, @started DATETIME2(7);
+                    DECLARE @timings TABLE (commit_us BIGINT);
+                    WHILE @i < @iterations
+                    BEGIN
+                        SET @started = SYSDATETIME();
+                        BEGIN TRANSACTION;
+                        INSERT INTO {COMMIT_LOOP_TABLE} (payload) VALUES (REPLICATE(
+                            CONVERT(
+                                VARCHAR(32), HASHBYTES('MD5', CONVERT(VARCHAR(36), NEWID())), 2
+                            ),
+                            16
+                        ));
+                        IF @delayed = 1
+                            COMMIT TRANSACTION WITH (DELAYED_DURABILITY = ON);
+                        ELSE
+                            COMMIT TRANSACTION;
+                        INSERT INTO @timings
+                        VALUES (DATEDIFF_BIG(MICROSECOND, @started, SYSDATETIME()));
+                        SET @i += 1;
+                    END;
+                    SELECT commit_us FROM @timings;
+                END
+                """
+            )
+            if truncate:
+                cursor.execute(f"TRUNCATE TABLE {COMMIT_LOOP_TABLE}")
+            self._connection.commit()
+        finally:
+            cursor.close()
+
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        # With autocommit off, pyodbc keeps a transaction open around the call,
+        # and the procedure's COMMITs would only end nested transactions
+        self._connection.autocommit = True
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                f"EXEC {COMMIT_LOOP_PROCEDURE} ?, ?",
+                iterations,
+                1 if self.config.durability == "delayed" else 0,
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+            self._connection.autocommit = False
+        return [row[0] / 1000 for row in rows]
+
+    def bulk_load(self, rows: int) -> int:
+        # fast_executemany sends each sub-batch as one ODBC parameter array
+        cursor = self._connection.cursor()
+        cursor.fast_executemany = True
+        try:
+            for start in range(0, rows, BULK_SUB_BATCH):
+                cursor.executemany(
+                    self.insert_sql, self.generate_rows(min(BULK_SUB_BATCH, rows - start))
+                )
+            self._commit()
+        except Exception:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return rows
+
     def write_batch(self, batch_size: int) -> WriteResult:
+        data = self.generate_rows(batch_size)
         start_time = time.perf_counter()
         cursor = None
 
@@ -291,19 +820,125 @@ class SQLDBProvider(DatabaseProvider):
             cursor = self._connection.cursor()
 
             if batch_size == 1:
-                cursor.execute(
-                    "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (?, ?)",
-                    (random.randint(1, 1000), self.generate_payload()),
-                )
+                cursor.execute(self.insert_sql, data[0])
             else:
-                data = [
-                    (random.randint(1, 1000), self.generate_payload())
-                    for _ in range(batch_size)
-                ]
+                cursor.executemany(self.insert_sql, data)
+
+            self._commit()
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(success=True, latency_ms=elapsed_ms, rows_written=batch_size)
+
+        except Exception as e:
+            self._connection.rollback()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            return WriteResult(
+                success=False, latency_ms=elapsed_ms, rows_written=0, error=str(e)
+            )
+
+        finally:
+            if cursor:
+                cursor.close()
+
+
+class SQLiteProvider(DatabaseProvider):
+    """Local SQLite provider for offline runs and harness testing."""
+
+    dialect = "sqlite"
+
+    def connect(self) -> None:
+        import sqlite3
+
+        # Pooled mode hands a connection to whichever worker thread checks it
+        # out (one at a time), so it must not be tied to the thread that opened it
+        self._connection = sqlite3.connect(
+            self.config.database, timeout=30, check_same_thread=False
+        )
+        if self.config.database == ":memory:":
+            # Every connection gets its own private database, so no contention
+            self.create_benchmark_table()
+        else:
+            # WAL lets readers overlap the single writer
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        if self.config.durability:
+            self._connection.execute(f"PRAGMA synchronous = {self.config.durability.upper()}")
+
+    def disconnect(self) -> None:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def handshake_probe(self) -> Dict[str, float]:
+        # No network handshake for an embedded database
+        return {}
+
+    def create_benchmark_table(self) -> None:
+        cursor = self._connection.cursor()
+        for statement in self.schema.create_table_sql(self.dialect):
+            cursor.execute(statement)
+        self._connection.commit()
+        cursor.close()
+
+    def truncate_benchmark_table(self) -> None:
+        cursor = self._connection.cursor()
+        cursor.execute(f"DELETE FROM {self.schema.table}")
+        self._connection.commit()
+        cursor.close()
+
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        cursor = self._connection.cursor()
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {COMMIT_LOOP_TABLE} ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL)"
+        )
+        if truncate:
+            cursor.execute(f"DELETE FROM {COMMIT_LOOP_TABLE}")
+        self._connection.commit()
+        cursor.close()
+
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        # SQLite has no procedures, but runs in this process: there is no
+        # round trip to take out, so the loop runs here
+        commit_ms = []
+        cursor = self._connection.cursor()
+        try:
+            for _ in range(iterations):
+                payload = "".join(random.choices("0123456789abcdef", k=32)) * 16
+                start_time = time.perf_counter()
+                cursor.execute(f"INSERT INTO {COMMIT_LOOP_TABLE} (payload) VALUES (?)", (payload,))
+                self._connection.commit()
+                commit_ms.append((time.perf_counter() - start_time) * 1000)
+        finally:
+            cursor.close()
+        return commit_ms
+
+    def bulk_load(self, rows: int) -> int:
+        cursor = self._connection.cursor()
+        try:
+            for start in range(0, rows, BULK_SUB_BATCH):
                 cursor.executemany(
-                    "INSERT INTO benchmark_writes (tenant_id, payload) VALUES (?, ?)",
-                    data,
+                    self.insert_sql, self.generate_rows(min(BULK_SUB_BATCH, rows - start))
                 )
+            self._connection.commit()
+        except Exception:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return rows
+
+    def write_batch(self, batch_size: int) -> WriteResult:
+        data = self.generate_rows(batch_size)
+        start_time = time.perf_counter()
+        cursor = None
+
+        try:
+            cursor = self._connection.cursor()
+
+            if batch_size == 1:
+                cursor.execute(self.insert_sql, data[0])
+            else:
+                cursor.executemany(self.insert_sql, data)
 
             self._connection.commit()
 
@@ -322,16 +957,144 @@ class SQLDBProvider(DatabaseProvider):
                 cursor.close()
 
 
-def get_provider(config: BenchmarkTarget) -> DatabaseProvider:
-    """Factory function to get the appropriate database provider."""
+class LatencyModel:
+    """Latency distribution for the mock provider.
+
+    Configured from the target's ``latency`` section:
+
+    - ``{distribution: fixed, ms: 2.0}``
+    - ``{distribution: lognormal, median_ms: 3.2, sigma: 0.4}``
+    - ``{distribution: replay, path: results/.../latencies.json}`` samples
+      from a previous run's recorded latencies
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, spec: Optional[Dict] = None):
+        spec = spec or {"distribution": "fixed", "ms": 0.0}
+        self.distribution = spec.get("distribution", "fixed")
+        self._rng = np.random.default_rng()
+        self._block = []
+        self._index = 0
+
+        if self.distribution == "fixed":
+            self._fixed_ms = float(spec.get("ms", 0.0))
+        elif self.distribution == "lognormal":
+            self._mu = float(np.log(spec["median_ms"]))
+            self._sigma = float(spec.get("sigma", 0.5))
+        elif self.distribution == "replay":
+            with open(spec["path"], "r") as f:
+                samples = json.load(f).get("latencies_ms", [])
+            if not samples:
+                raise ValueError(f"No latencies_ms samples in {spec['path']}")
+            self._samples = np.asarray(samples, dtype=float)
+        else:
+            raise ValueError(
+                f"Unknown latency distribution: {self.distribution}. "
+                "Must be one of fixed, lognormal, replay"
+            )
+
+    def sample(self) -> float:
+        """Return the next latency in milliseconds."""
+        if self.distribution == "fixed":
+            return self._fixed_ms
+
+        # Draw in blocks so the per-op cost stays a list index
+        if self._index >= len(self._block):
+            if self.distribution == "lognormal":
+                block = self._rng.lognormal(self._mu, self._sigma, self.BLOCK_SIZE)
+            else:
+                block = self._rng.choice(self._samples, self.BLOCK_SIZE)
+            self._block = block.tolist()
+            self._index = 0
+
+        value = self._block[self._index]
+        self._index += 1
+        return value
+
+
+class MockProvider(DatabaseProvider):
+    """In-process provider that sleeps for a modeled latency instead of writing.
+
+    Row generation still runs, so a mock run measures everything the harness
+    does per operation except the database round trip.
+    """
+
+    def connect(self) -> None:
+        self._latency = LatencyModel(self.config.latency)
+        self._connection = True
+
+    def disconnect(self) -> None:
+        self._connection = None
+
+    def handshake_probe(self) -> Dict[str, float]:
+        return {}
+
+    def ping(self) -> float:
+        # No server to reach; the modeled latency covers the round trip
+        return 0.0
+
+    def count_rows(self) -> Optional[int]:
+        return None
+
+    def create_benchmark_table(self) -> None:
+        pass
+
+    def truncate_benchmark_table(self) -> None:
+        pass
+
+    def write_batch(self, batch_size: int) -> WriteResult:
+        data = self.generate_rows(batch_size)
+        start_time = time.perf_counter()
+
+        delay_ms = self._latency.sample()
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return WriteResult(success=True, latency_ms=elapsed_ms, rows_written=len(data))
+
+    def install_commit_loop(self, truncate: bool = True) -> None:
+        pass
+
+    def _run_commit_loop(self, iterations: int) -> List[float]:
+        # The modeled latency is all commit; the mock has no transport
+        commit_ms = []
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            delay_ms = self._latency.sample()
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000)
+            commit_ms.append((time.perf_counter() - start_time) * 1000)
+        return commit_ms
+
+    def execute_statement(self, sql: str, params: Optional[Tuple] = None) -> WriteResult:
+        start_time = time.perf_counter()
+
+        delay_ms = self._latency.sample()
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return WriteResult(success=True, latency_ms=elapsed_ms, rows_written=1)
+
+
+def get_provider(config: BenchmarkTarget, stream: int = 0, streams: int = 1) -> DatabaseProvider:
+    """Factory function to get the appropriate database provider.
+
+    Providers that write in parallel should each get their own ``stream``
+    of ``streams``, so seeded runs don't repeat each other's rows.
+    """
     providers = {
         "postgres": PostgresProvider,
         "mysql": MySQLProvider,
         "sqldb": SQLDBProvider,
+        "sqlite": SQLiteProvider,
+        "mock": MockProvider,
     }
 
     provider_class = providers.get(config.service)
     if not provider_class:
         raise ValueError(f"Unknown service type: {config.service}")
 
-    return provider_class(config)
+    return provider_class(config, stream, streams)
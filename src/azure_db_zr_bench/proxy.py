@@ -0,0 +1,322 @@
+"""Latency-injecting TCP proxy that emulates cross-zone network conditions."""
+
+import asyncio
+import multiprocessing
+import socket
+import struct
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Bytes read from a socket at a time; each chunk is delayed as a unit
+CHUNK_BYTES = 65536
+
+# Chunks buffered per direction before the proxy stops reading (backpressure)
+QUEUE_CHUNKS = 256
+
+# The event loop's timers round up to whole milliseconds, so the last stretch
+# before a chunk's release time is spun instead of slept
+_SPIN_SEC = 0.002
+
+# Seconds to wait for the proxy process to start listening
+_START_TIMEOUT_SEC = 10.0
+
+
+@dataclass
+class ProxySpec:
+    """Network conditions the proxy adds between providers and a server.
+
+    - ``delay_ms``: one-way delay, added in each direction (so the round
+      trip grows by twice this)
+    - ``jitter_ms``: standard deviation of normally distributed extra
+      delay per chunk. Chunks are never reordered, as on a TCP stream
+    - ``bandwidth_mbps``: link rate in each direction (None: unlimited)
+    - ``reset_every_sec``: reset every open connection this often, as in a
+      failover (None: never)
+    - ``outage_sec``: after each reset, refuse new connections this long
+    - ``listen_port``: local port to listen on (0: any free port)
+    """
+
+    delay_ms: float = 0.0
+    jitter_ms: float = 0.0
+    bandwidth_mbps: Optional[float] = None
+    reset_every_sec: Optional[float] = None
+    outage_sec: float = 0.0
+    listen_port: int = 0
+
+    def __post_init__(self):
+        if self.delay_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("Proxy delay_ms and jitter_ms must not be negative")
+        if self.bandwidth_mbps is not None and self.bandwidth_mbps <= 0:
+            raise ValueError("Proxy bandwidth_mbps must be positive")
+        if self.reset_every_sec is not None and self.reset_every_sec <= 0:
+            raise ValueError("Proxy reset_every_sec must be positive")
+        if self.outage_sec < 0:
+            raise ValueError("Proxy outage_sec must not be negative")
+        if self.reset_every_sec is not None and self.outage_sec >= self.reset_every_sec:
+            raise ValueError("Proxy outage_sec must be shorter than reset_every_sec")
+
+    @classmethod
+    def from_config(cls, value: Union[Dict[str, Any], "ProxySpec"]) -> "ProxySpec":
+        if isinstance(value, ProxySpec):
+            return value
+        return cls(**value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """Short label, e.g. ``+0.6±0.1 ms, 1000 Mbit/s, reset/60s``."""
+        parts = [f"+{self.delay_ms:g}" + (f"±{self.jitter_ms:g}" if self.jitter_ms else "") + " ms"]
+        if self.bandwidth_mbps:
+            parts.append(f"{self.bandwidth_mbps:g} Mbit/s")
+        if self.reset_every_sec:
+            parts.append(f"reset/{self.reset_every_sec:g}s")
+        return ", ".join(parts)
+
+
+class _Link:
+    """One direction of a proxied connection: when each chunk may be delivered."""
+
+    def __init__(self, spec: ProxySpec, rng: np.random.Generator):
+        self._delay = spec.delay_ms / 1000
+        self._jitter = spec.jitter_ms / 1000
+        self._bits_per_sec = spec.bandwidth_mbps * 1e6 if spec.bandwidth_mbps else None
+        self._rng = rng
+        self._link_free = 0.0
+        self._last_release = 0.0
+
+    def release_time(self, now: float, size: int) -> float:
+        depart = now
+        if self._bits_per_sec:
+            # Serialization: the chunk leaves once the link has sent what is ahead of it
+            depart = max(now, self._link_free) + size * 8 / self._bits_per_sec
+            self._link_free = depart
+        delay = self._delay
+        if self._jitter:
+            delay = max(delay + self._rng.normal(0.0, self._jitter), 0.0)
+        # Never overtake an earlier chunk
+        self._last_release = max(depart + delay, self._last_release)
+        return self._last_release
+
+
+class _ProxyServer:
+    """The asyncio side of the proxy; runs in the proxy process."""
+
+    def __init__(self, spec: ProxySpec, upstream: Tuple[str, int]):
+        self.spec = spec
+        self.upstream = upstream
+        self.stats = {"connections": 0, "refused": 0, "resets": 0, "bytes_up": 0, "bytes_down": 0}
+        self._rng = np.random.default_rng()
+        self._open = set()
+        self._handlers = set()
+        self._resets = None
+        self._down_until = 0.0
+
+    async def start(self, host: str, port: int) -> int:
+        self._server = await asyncio.start_server(self._handle, host, port)
+        if self.spec.reset_every_sec:
+            self._resets = asyncio.get_running_loop().create_task(self._reset_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        self._server.close()
+        for writers in list(self._open):
+            for writer in writers:
+                writer.close()
+        await self._server.wait_closed()
+        if self._resets is not None:
+            self._resets.cancel()
+        # Closed connections end their handlers at EOF
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=_START_TIMEOUT_SEC)
+
+    async def _reset_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.spec.reset_every_sec)
+            self._down_until = loop.time() + self.spec.outage_sec
+            for writers in list(self._open):
+                for writer in writers:
+                    _abort(writer)
+            self.stats["resets"] += 1
+
+    async def _handle(self, client_reader, client_writer) -> None:
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._down_until:
+            self.stats["refused"] += 1
+            _abort(client_writer)
+            return
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(*self.upstream)
+        except OSError:
+            self.stats["refused"] += 1
+            _abort(client_writer)
+            return
+
+        self.stats["connections"] += 1
+        writers = (client_writer, upstream_writer)
+        self._open.add(writers)
+        self._handlers.add(asyncio.current_task())
+        try:
+            await asyncio.gather(
+                self._pipe(client_reader, upstream_writer, "bytes_up"),
+                self._pipe(upstream_reader, client_writer, "bytes_down"),
+                return_exceptions=True,
+            )
+        finally:
+            self._open.discard(writers)
+            self._handlers.discard(asyncio.current_task())
+            for writer in writers:
+                writer.close()
+
+    async def _pipe(self, reader, writer, counter: str) -> None:
+        """Copy one direction, releasing each chunk at its link's release time."""
+        loop = asyncio.get_running_loop()
+        link = _Link(self.spec, self._rng)
+        queue = asyncio.Queue(QUEUE_CHUNKS)
+
+        async def deliver() -> None:
+            while True:
+                release, data = await queue.get()
+                if data is None:
+                    break
+                wait = release - loop.time()
+                if wait > _SPIN_SEC:
+                    await asyncio.sleep(wait - _SPIN_SEC)
+                while loop.time() < release:
+                    await asyncio.sleep(0)
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+
+        delivery = loop.create_task(deliver())
+        try:
+            while not delivery.done():
+                data = await reader.read(CHUNK_BYTES)
+                if not data:
+                    break
+                self.stats[counter] += len(data)
+                await queue.put((link.release_time(loop.time(), len(data)), data))
+        finally:
+            if not delivery.done():
+                await queue.put((0.0, None))
+            await delivery
+
+
+def _abort(writer) -> None:
+    """Close a connection with a TCP RST instead of a FIN."""
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        except OSError:
+            pass
+    writer.transport.abort()
+
+
+def serve(
+    spec: ProxySpec,
+    upstream: Tuple[str, int],
+    listen_host: str = "127.0.0.1",
+    ready=None,
+    control=None,
+) -> Dict[str, int]:
+    """Run the proxy until ``control`` (a Connection) receives a message, or forever.
+
+    The listening port is sent on ``ready`` once the proxy accepts
+    connections. Returns the proxy's counters.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server = _ProxyServer(spec, upstream)
+    try:
+        port = loop.run_until_complete(server.start(listen_host, spec.listen_port))
+    except OSError as e:
+        if ready is not None:
+            ready.send(("error", str(e)))
+        raise
+    if ready is not None:
+        ready.send(("port", port))
+
+    stopped = loop.create_future()
+    if control is not None:
+        loop.add_reader(control.fileno(), lambda: stopped.done() or stopped.set_result(None))
+    try:
+        loop.run_until_complete(stopped)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.close())
+        loop.close()
+    return server.stats
+
+
+def _proxy_process(spec: Dict, upstream: Tuple[str, int], listen_host: str, conn) -> None:
+    stats = serve(ProxySpec(**spec), upstream, listen_host, ready=conn, control=conn)
+    conn.recv()
+    conn.send(("stats", stats))
+
+
+class LatencyProxy:
+    """A ProxySpec applied between this process and ``upstream``.
+
+    The proxy runs in its own process, so its timers do not compete with
+    benchmark worker threads for the GIL. Use as a context manager, or call
+    start() and stop(); ``port`` is the local port to connect to.
+    """
+
+    def __init__(self, spec: ProxySpec, upstream: Tuple[str, int], listen_host: str = "127.0.0.1"):
+        self.spec = spec
+        self.upstream = upstream
+        self.listen_host = listen_host
+        self.port: Optional[int] = None
+        self.stats: Dict[str, int] = {}
+        self._process = None
+        self._conn = None
+
+    def start(self) -> "LatencyProxy":
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_proxy_process,
+            args=(self.spec.to_dict(), self.upstream, self.listen_host, child_conn),
+            name="latency-proxy",
+            daemon=True,
+        )
+        self._process.start()
+        if not self._conn.poll(_START_TIMEOUT_SEC):
+            self.stop()
+            raise RuntimeError("Latency proxy did not start")
+        kind, value = self._conn.recv()
+        if kind == "error":
+            self.stop()
+            raise RuntimeError(f"Latency proxy could not listen: {value}")
+        self.port = value
+        return self
+
+    def stop(self) -> Dict[str, int]:
+        """Stop the proxy and return its counters."""
+        if self._process is None:
+            return self.stats
+        if self._process.is_alive():
+            try:
+                self._conn.send("stop")
+                if self._conn.poll(_START_TIMEOUT_SEC):
+                    _, self.stats = self._conn.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+            self._process.join(_START_TIMEOUT_SEC)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._process = None
+        self._conn.close()
+        return self.stats
+
+    def __enter__(self) -> "LatencyProxy":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
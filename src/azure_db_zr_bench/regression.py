@@ -0,0 +1,300 @@
+"""Regression gate: compare a candidate result set against a baseline."""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .benchmark import PARAMETERS, BenchmarkResult
+from .histogram import LatencyHistogram
+from .pivot import dimension_getter
+
+# Fields that must match for two runs to be compared: the target and every run setting
+CELL_KEY = ("target_name",) + PARAMETERS
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+# Resamples for the latency percentile bootstrap; seeded so a gate is repeatable
+BOOTSTRAP_RESAMPLES = 2000
+BOOTSTRAP_SEED = 0
+
+
+@dataclass
+class RegressionThresholds:
+    """When a candidate counts as a regression against the baseline."""
+
+    # Largest allowed throughput drop, in percent
+    max_throughput_drop_pct: float = 5.0
+    # Largest allowed latency increase at each percentile, in percent
+    max_latency_increase_pct: float = 10.0
+    # Largest allowed absolute error-rate increase (0.01 = one percentage point)
+    max_error_rate_increase: float = 0.01
+    # Significance level: a change beyond a threshold must also be significant
+    alpha: float = 0.05
+
+
+def mann_whitney_u(a: np.ndarray, b: np.ndarray) -> float:
+    """Two-sided Mann-Whitney U test p-value (normal approximation, tie-corrected)."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = np.concatenate([a, b])
+    order = np.argsort(combined, kind="mergesort")
+    ranks = np.empty(len(combined))
+    ranks[order] = np.arange(1, len(combined) + 1)
+
+    # Average ranks across ties
+    sorted_values = combined[order]
+    _, starts, counts = np.unique(sorted_values, return_index=True, return_counts=True)
+    for start, count in zip(starts[counts > 1], counts[counts > 1]):
+        ranks[order[start : start + count]] = start + (count + 1) / 2
+
+    u1 = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    tie_term = float((counts**3 - counts).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return 1.0
+
+    z = (abs(u1 - n1 * n2 / 2) - 0.5) / sigma
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def ks_two_sample(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    """Two-sample Kolmogorov-Smirnov statistic and asymptotic p-value."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    a, b = np.sort(a), np.sort(b)
+    values = np.concatenate([a, b])
+    cdf_a = np.searchsorted(a, values, side="right") / n1
+    cdf_b = np.searchsorted(b, values, side="right") / n2
+    d = float(np.max(np.abs(cdf_a - cdf_b)))
+
+    en = math.sqrt(n1 * n2 / (n1 + n2))
+    lam = (en + 0.12 + 0.11 / en) * d
+    if lam < 1e-3:
+        return d, 1.0
+    p = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 101))
+    return d, min(max(p, 0.0), 1.0)
+
+
+def bootstrap_percentiles(
+    a: LatencyHistogram,
+    b: LatencyHistogram,
+    percentiles: Tuple[float, ...],
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED,
+) -> List[float]:
+    """Two-sided bootstrap p-value for a change at each percentile from ``a`` to ``b``.
+
+    Each histogram is resampled as a whole (a multinomial draw over its
+    buckets), so the test sees the full distribution, tail included, rather
+    than only a shift in location. The p-value is twice the share of
+    resampled differences on the less likely side of zero.
+    """
+    if not a.total or not b.total:
+        return [1.0 for _ in percentiles]
+    rng = np.random.default_rng(seed)
+    draws = [_resampled_percentiles(h, percentiles, resamples, rng) for h in (a, b)]
+    diffs = draws[1] - draws[0]
+    p_values = []
+    for column in diffs.T:
+        below = (np.count_nonzero(column <= 0) + 1) / (resamples + 1)
+        above = (np.count_nonzero(column >= 0) + 1) / (resamples + 1)
+        p_values.append(float(min(1.0, 2 * min(below, above))))
+    return p_values
+
+
+def _resampled_percentiles(
+    hist: LatencyHistogram,
+    percentiles: Tuple[float, ...],
+    resamples: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Percentiles of ``resamples`` multinomial resamples of a histogram, one row each."""
+    buckets = np.nonzero(hist.counts)[0]
+    values = hist.bucket_values()[buckets]
+    counts = rng.multinomial(hist.total, hist.counts[buckets] / hist.total, size=resamples)
+    cumulative = np.cumsum(counts, axis=1)
+    ranks = [max(1, math.ceil(p / 100 * hist.total)) for p in percentiles]
+    indexes = np.stack([(cumulative < rank).sum(axis=1) for rank in ranks], axis=1)
+    return values[np.minimum(indexes, len(values) - 1)]
+
+
+def cell_histogram(runs: List[BenchmarkResult]) -> LatencyHistogram:
+    """The runs' latency histograms merged (raw samples for runs saved without one)."""
+    merged = LatencyHistogram()
+    for run in runs:
+        if run.latency_histogram is not None:
+            merged.merge(run.latency_histogram)
+        else:
+            merged.record_many(run.raw_latencies)
+    return merged
+
+
+cell_key = dimension_getter(CELL_KEY)
+
+
+def group_cells(results: List[BenchmarkResult]) -> Dict[Tuple, List[BenchmarkResult]]:
+    """Group runs into comparison cells; repeated runs share a cell."""
+    cells = {}
+    for result in results:
+        cells.setdefault(cell_key(result), []).append(result)
+    return cells
+
+
+def _pct_delta(baseline: float, candidate: float) -> Optional[float]:
+    if not baseline:
+        return None
+    return (candidate - baseline) / baseline * 100
+
+
+def compare_cell(
+    baseline: List[BenchmarkResult],
+    candidate: List[BenchmarkResult],
+    thresholds: RegressionThresholds,
+) -> Dict:
+    """Compare one cell's baseline and candidate runs.
+
+    Summary metrics use the median across repeated runs. Throughput is tested
+    on the per-second throughput samples with a Mann-Whitney U test. Each
+    latency percentile is tested on its own, with a bootstrap over the runs'
+    full latency histograms, so a regression confined to the tail is caught
+    even when the median has not moved; a Kolmogorov-Smirnov test on the raw
+    latency samples is reported as well. A metric regresses when its change
+    exceeds the threshold and is significant at ``alpha`` (or, when there
+    are no samples to test, on the threshold alone).
+    """
+
+    def median(runs: List[BenchmarkResult], metric: str) -> float:
+        return float(np.median([r.summary.get(metric, 0) for r in runs]))
+
+    def per_second(runs: List[BenchmarkResult]) -> np.ndarray:
+        return np.array([p["throughput_wps"] for r in runs for p in r.time_series], dtype=float)
+
+    def latencies(runs: List[BenchmarkResult]) -> np.ndarray:
+        return np.array([v for r in runs for v in r.raw_latencies], dtype=float)
+
+    metrics = {}
+
+    # Throughput
+    base_tput, cand_tput = median(baseline, "throughput_wps"), median(candidate, "throughput_wps")
+    base_ts, cand_ts = per_second(baseline), per_second(candidate)
+    p_value = mann_whitney_u(base_ts, cand_ts) if len(base_ts) and len(cand_ts) else None
+    delta = _pct_delta(base_tput, cand_tput)
+    metrics["throughput_wps"] = {
+        "baseline": base_tput,
+        "candidate": cand_tput,
+        "delta_pct": delta,
+        "p_value": p_value,
+        "regression": _is_regression(
+            -delta if delta is not None else None,
+            thresholds.max_throughput_drop_pct,
+            p_value,
+            thresholds.alpha,
+        ),
+        "improvement": _is_regression(
+            delta, thresholds.max_throughput_drop_pct, p_value, thresholds.alpha
+        ),
+    }
+
+    # Latency percentiles
+    base_lat, cand_lat = latencies(baseline), latencies(candidate)
+    ks_d = ks_p_value = None
+    if len(base_lat) and len(cand_lat):
+        ks_d, ks_p_value = ks_two_sample(base_lat, cand_lat)
+    base_hist, cand_hist = cell_histogram(baseline), cell_histogram(candidate)
+    lat_p_values = [None] * len(LATENCY_PERCENTILES)
+    if base_hist.total and cand_hist.total:
+        lat_p_values = bootstrap_percentiles(base_hist, cand_hist, LATENCY_PERCENTILES)
+
+    for p, lat_p_value in zip(LATENCY_PERCENTILES, lat_p_values):
+        metric = f"latency_p{p}_ms"
+        base_value, cand_value = median(baseline, metric), median(candidate, metric)
+        delta = _pct_delta(base_value, cand_value)
+        metrics[metric] = {
+            "baseline": base_value,
+            "candidate": cand_value,
+            "delta_pct": delta,
+            "p_value": lat_p_value,
+            "regression": _is_regression(
+                delta, thresholds.max_latency_increase_pct, lat_p_value, thresholds.alpha
+            ),
+            "improvement": _is_regression(
+                -delta if delta is not None else None,
+                thresholds.max_latency_increase_pct,
+                lat_p_value,
+                thresholds.alpha,
+            ),
+        }
+
+    # Error rate (absolute change; no test, errors are usually rare events)
+    base_err, cand_err = median(baseline, "error_rate"), median(candidate, "error_rate")
+    metrics["error_rate"] = {
+        "baseline": base_err,
+        "candidate": cand_err,
+        "delta": cand_err - base_err,
+        "regression": cand_err - base_err > thresholds.max_error_rate_increase,
+        "improvement": base_err - cand_err > thresholds.max_error_rate_increase,
+    }
+
+    regressed = [name for name, m in metrics.items() if m["regression"]]
+    improved = [name for name, m in metrics.items() if m["improvement"]]
+    if regressed:
+        status = "regression"
+    elif improved:
+        status = "improvement"
+    else:
+        status = "ok"
+
+    return {
+        "status": status,
+        "regressed_metrics": regressed,
+        "baseline_runs": len(baseline),
+        "candidate_runs": len(candidate),
+        "latency_samples": {"baseline": base_hist.total, "candidate": cand_hist.total},
+        "latency_ks": {"statistic": ks_d, "p_value": ks_p_value},
+        "metrics": metrics,
+    }
+
+
+def _is_regression(
+    worsening_pct: Optional[float], threshold_pct: float, p_value: Optional[float], alpha: float
+) -> bool:
+    if worsening_pct is None or worsening_pct <= threshold_pct:
+        return False
+    return p_value is None or p_value < alpha
+
+
+def compare_result_sets(
+    baseline: List[BenchmarkResult],
+    candidate: List[BenchmarkResult],
+    thresholds: RegressionThresholds,
+) -> Dict:
+    """Compare every cell present in both sets and collect the regressions."""
+    base_cells = group_cells(baseline)
+    cand_cells = group_cells(candidate)
+
+    cells = []
+    for key in sorted(base_cells.keys() & cand_cells.keys(), key=str):
+        comparison = compare_cell(base_cells[key], cand_cells[key], thresholds)
+        cells.append({"cell": dict(zip(CELL_KEY, key)), **comparison})
+
+    regressions = sum(1 for c in cells if c["status"] == "regression")
+
+    return {
+        "thresholds": asdict(thresholds),
+        "cells": cells,
+        "missing_in_candidate": [
+            dict(zip(CELL_KEY, k)) for k in sorted(base_cells.keys() - cand_cells.keys(), key=str)
+        ],
+        "new_in_candidate": [
+            dict(zip(CELL_KEY, k)) for k in sorted(cand_cells.keys() - base_cells.keys(), key=str)
+        ],
+        "regressions": regressions,
+        "passed": regressions == 0,
+    }
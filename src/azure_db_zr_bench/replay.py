@@ -0,0 +1,282 @@
+"""Trace replay: timestamped statements read lazily and split across workers by key."""
+
+import csv
+import gzip
+import json
+import queue
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+TRACE_FORMATS = ("csv", "jsonl", "log")
+
+# Records read ahead of each worker; bounds memory however long the trace is
+TRACE_QUEUE_RECORDS = 1024
+
+# How often a worker waiting on an empty queue checks for the end of the run
+_POLL_SEC = 0.1
+
+# Literals in a statement (strings and numbers not part of an identifier or $n)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|(?<![\w$])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_REPEATED_ROWS = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+_SPACE = re.compile(r"\s+")
+
+# Tokens that matter when rewriting ``?`` placeholders for a %s-style driver
+_PLACEHOLDER_TOKENS = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|\?|%")
+
+
+@dataclass
+class TraceRecord:
+    """One statement from a trace, due ``offset_sec`` after the trace's first record."""
+
+    offset_sec: float
+    sql: str
+    template: str
+    params: Optional[Tuple] = None
+    key: Optional[str] = None
+
+
+def statement_template(sql: str) -> str:
+    """``sql`` with its literal values replaced by ``?``.
+
+    Statements that differ only in their values share a template, so their
+    latencies are reported together. IN lists and multi-row VALUES lists
+    collapse to one entry, whatever their length.
+    """
+    template = _LITERALS.sub("?", sql)
+    template = _IN_LISTS.sub("IN (...)", template)
+    template = _REPEATED_ROWS.sub(r"\1", template)
+    return _SPACE.sub(" ", template).strip()
+
+
+def bind_placeholders(sql: str, placeholder: str) -> str:
+    """Rewrite a trace statement's ``?`` parameters for a driver that uses ``placeholder``.
+
+    For ``%s``-style drivers, literal ``%`` signs are doubled as well.
+    """
+    if placeholder == "?":
+        return sql
+
+    def swap(match: re.Match) -> str:
+        token = match.group(0)
+        if token == "?":
+            return placeholder
+        return token.replace("%", "%%")
+
+    return _PLACEHOLDER_TOKENS.sub(swap, sql)
+
+
+def trace_format(path: Path) -> str:
+    """A trace's format, from its extension (``.gz`` is read compressed)."""
+    suffixes = [s.lower() for s in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    suffix = suffixes[-1] if suffixes else ""
+    formats = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".log": "log", ".txt": "log"}
+    if suffix not in formats:
+        raise ValueError(
+            f"Unknown trace format for {path.name}: use .csv, .jsonl, .ndjson, .log or .txt "
+            "(optionally .gz)"
+        )
+    return formats[suffix]
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Seconds, from a number (e.g. Unix time) or an ISO 8601 timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value.strip()).timestamp()
+
+
+class TraceReader:
+    """Streams a trace file's records in order, without reading it all into memory.
+
+    Formats:
+
+    - ``csv``: a header row, then ``ts`` and ``sql`` columns, with optional
+      ``key``, ``params`` (a JSON array) and ``template``
+    - ``jsonl``: one JSON object per line with the same fields
+    - ``log``: ``<ts> <key> <sql>`` per line, ``-`` for no key; blank lines
+      and lines starting with ``#`` are skipped
+
+    ``ts`` is in seconds (any origin, e.g. Unix time) or ISO 8601. Statements
+    with ``params`` use ``?`` placeholders, rewritten for the target's
+    driver with ``placeholder``.
+    """
+
+    def __init__(self, path: Path, placeholder: str = "?"):
+        self.path = Path(path)
+        self.format = trace_format(self.path)
+        self.placeholder = placeholder
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Trace file not found: {self.path}")
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        opener = gzip.open if self.path.suffix.lower() == ".gz" else open
+        with opener(self.path, "rt", newline="") as f:
+            rows = {"csv": _csv_rows, "jsonl": _jsonl_rows, "log": _log_rows}[self.format](f)
+            origin = None
+            for line, row in rows:
+                try:
+                    record = self._record(row)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise ValueError(f"{self.path.name}:{line}: bad trace record ({e})") from e
+                if origin is None:
+                    origin = record.offset_sec
+                record.offset_sec -= origin
+                yield record
+
+    def _record(self, row: Dict[str, Any]) -> TraceRecord:
+        sql = row["sql"]
+        if not sql or not sql.strip():
+            raise ValueError("empty sql")
+        params = row.get("params")
+        if isinstance(params, str):
+            params = json.loads(params) if params.strip() else None
+        if params is not None and not isinstance(params, list):
+            raise ValueError("params must be a JSON array")
+        key = row.get("key")
+        return TraceRecord(
+            offset_sec=_parse_timestamp(row["ts"]),
+            sql=bind_placeholders(sql, self.placeholder) if params else sql,
+            template=row.get("template") or statement_template(sql),
+            params=tuple(params) if params else None,
+            key=str(key) if key not in (None, "", "-") else None,
+        )
+
+
+def _csv_rows(f) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    reader = csv.DictReader(f)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _jsonl_rows(f) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    for line, text in enumerate(f, start=1):
+        if text.strip():
+            yield line, json.loads(text)
+
+
+def _log_rows(f) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    for line, text in enumerate(f, start=1):
+        text = text.strip()
+        if not text or text.startswith("#"):
+            continue
+        parts = text.split(None, 2)
+        if len(parts) < 3:
+            raise ValueError(f"line {line}: expected <ts> <key> <sql>")
+        yield line, {"ts": parts[0], "key": parts[1], "sql": parts[2]}
+
+
+class TraceReplay:
+    """Deals a trace's records out to workers and releases each one on schedule.
+
+    A reader thread streams the trace into one bounded queue per worker.
+    Records with the same key always go to the same worker, so each key's
+    statements run in trace order; records without a key are dealt
+    round-robin. A worker's next() blocks until its next record is due,
+    ``offset_sec / speed`` after start() (``speed`` 0: as soon as possible).
+    """
+
+    def __init__(
+        self, reader: TraceReader, workers: int, speed: float, stop_event: threading.Event
+    ):
+        if speed < 0:
+            raise ValueError(f"Replay speed must not be negative, got {speed}")
+        self.reader = reader
+        self.speed = speed
+        self.records = 0
+        self.error: Optional[str] = None
+        # Set once every worker has run out of records
+        self.finished = threading.Event()
+        self._queues = [queue.Queue(TRACE_QUEUE_RECORDS) for _ in range(workers)]
+        self._stop_event = stop_event
+        self._remaining = workers
+        self._lock = threading.Lock()
+        self._origin = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._origin = time.perf_counter()
+        self._thread = threading.Thread(target=self._read, name="trace-reader", daemon=True)
+        self._thread.start()
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def worker_for(self, record: TraceRecord) -> int:
+        if record.key is None:
+            return self.records % len(self._queues)
+        return zlib.crc32(record.key.encode()) % len(self._queues)
+
+    def _read(self) -> None:
+        try:
+            for record in self.reader:
+                if not self._put(self._queues[self.worker_for(record)], record):
+                    return
+                self.records += 1
+        except Exception as e:
+            # A bad record ends the replay early; the error goes in the summary
+            self.error = str(e)
+        for worker_queue in self._queues:
+            if not self._put(worker_queue, None):
+                return
+
+    def _put(self, worker_queue: queue.Queue, record: Optional[TraceRecord]) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                worker_queue.put(record, timeout=_POLL_SEC)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def next(self, worker_id: int) -> Tuple[Optional[TraceRecord], float]:
+        """A worker's next record once it is due, and how late it is, in milliseconds.
+
+        Returns (None, 0.0) at the end of the trace or of the run.
+        """
+        worker_queue = self._queues[worker_id]
+        while True:
+            if self._stop_event.is_set():
+                return None, 0.0
+            try:
+                record = worker_queue.get(timeout=_POLL_SEC)
+                break
+            except queue.Empty:
+                continue
+
+        if record is None:
+            with self._lock:
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self.finished.set()
+            return None, 0.0
+
+        if not self.speed:
+            return record, 0.0
+        due = self._origin + record.offset_sec / self.speed
+        wait = due - time.perf_counter()
+        if wait > 0 and self._stop_event.wait(wait):
+            return None, 0.0
+        return record, max(time.perf_counter() - due, 0.0) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.reader.path),
+            "format": self.reader.format,
+            "speed": self.speed,
+            "records": self.records,
+            "error": self.error,
+        }
+
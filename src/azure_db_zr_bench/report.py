@@ -3,17 +3,77 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from jinja2 import Template
 
-from .benchmark import BenchmarkResult
+from .benchmark import (
+    HISTOGRAM_FILE,
+    STRAGGLER_P99_RATIO,
+    STRAGGLER_THROUGHPUT_RATIO,
+    BenchmarkResult,
+)
+from .charts import (
+    DEFAULT_CHART_POINTS,
+    cdf_chart,
+    heatmap_chart,
+    percentile_spectrum_chart,
+    slo_capacity_chart,
+    slo_steps_chart,
+    time_series_chart,
+    write_sidecars,
+)
+from .config import DEFAULT_DURABILITY, DURABILITY_LEVELS, SERVER_DURABILITY
+from .histogram import LatencyHistogram
+from .schema import DEFAULT_PRIMARY_KEY, DEFAULT_SCHEMA, WorkloadSchema
+from .pivot import (
+    PIVOT_METRICS,
+    format_value,
+    group_by,
+    filter_results,
+    newest,
+    pivot,
+    varying_dimensions,
+)
+from .slo import slo_outcome
+from .soak import MANIFEST_FILE, load_soak_result
+
+# Baseline mode each service's HA/ZR modes are compared against
+BASELINE_MODES = {
+    "postgres": "no-ha",
+    "mysql": "no-ha",
+    "sqldb": "non-zr",
+    "mock": "no-ha",
+}
+
+# Column headings for summary metrics in pivot tables
+METRIC_NAMES = {
+    "throughput_wps": "Throughput (writes/sec)",
+    "latency_p50_ms": "P50 Latency (ms)",
+    "latency_p95_ms": "P95 Latency (ms)",
+    "latency_p99_ms": "P99 Latency (ms)",
+    "latency_mean_ms": "Mean Latency (ms)",
+    "error_rate": "Error Rate",
+}
+
+# Client-server round trips in one single-row write: the INSERT, then the COMMIT
+WRITE_ROUND_TRIPS = 2
+
+# Service display names
+SERVICE_NAMES = {
+    "postgres": "PostgreSQL Flexible Server",
+    "mysql": "MySQL Flexible Server",
+    "sqldb": "Azure SQL Database (General Purpose)",
+    "sqlite": "SQLite (local)",
+    "mock": "Mock (in-process)",
+}
 
 
 def load_results(results_dir: Path) -> List[BenchmarkResult]:
     """Load benchmark results from a directory.
 
-    Scans for result.json files in subdirectories.
+    Scans for result.json files in subdirectories. Soak runs that never
+    wrote result.json (crashed or killed) are rebuilt from their segments.
     """
     results = []
 
@@ -30,6 +90,13 @@ def load_results(results_dir: Path) -> List[BenchmarkResult]:
                     lat_data = json.load(f)
                     raw_latencies = lat_data.get("latencies_ms", [])
 
+            # Full latency histogram (the heatmap is loaded when charted)
+            histogram_file = result_file.parent / HISTOGRAM_FILE
+            latency_histogram = None
+            if histogram_file.exists():
+                with open(histogram_file, "r") as f:
+                    latency_histogram = LatencyHistogram.from_dict(json.load(f))
+
             result = BenchmarkResult(
                 target_name=data["target_name"],
                 service=data["service"],
@@ -45,18 +112,75 @@ def load_results(results_dir: Path) -> List[BenchmarkResult]:
                 raw_latencies=raw_latencies,
                 errors=data.get("errors", []),
                 output_path=result_file.parent,
+                target_rate=data.get("target_rate"),
+                pool_size=data.get("pool_size"),
+                workload=data.get("workload", "write"),
+                latency_histogram=latency_histogram,
+                workers=data.get("workers", []),
+                connections=data.get("connections", []),
+                schema=data.get("schema", DEFAULT_SCHEMA),
+                schema_definition=data.get("schema_definition"),
+                primary_key=data.get("primary_key", DEFAULT_PRIMARY_KEY),
+                seed=data.get("seed"),
+                durability=data.get("durability", DEFAULT_DURABILITY),
+                proxy=data.get("proxy"),
+                load_profile=data.get("load_profile"),
+                phases=data.get("phases"),
+                trace=data.get("trace"),
+                templates=data.get("templates"),
+                slo=data.get("slo"),
             )
             results.append(result)
 
         except Exception as e:
             print(f"Warning: Failed to load {result_file}: {e}")
 
+    for manifest_file in results_dir.rglob(MANIFEST_FILE):
+        if (manifest_file.parent / "result.json").exists():
+            continue
+        try:
+            results.append(load_soak_result(manifest_file.parent))
+            print(f"Recovered partial soak run from {manifest_file.parent}")
+        except Exception as e:
+            print(f"Warning: Failed to recover {manifest_file.parent}: {e}")
+
     return results
 
 
-def generate_report(results: List[BenchmarkResult], output_dir: Path) -> Path:
-    """Generate an HTML comparison report from benchmark results."""
+def generate_report(
+    results: List[BenchmarkResult],
+    output_dir: Path,
+    max_points: int = DEFAULT_CHART_POINTS,
+    where: Optional[Dict[str, List[str]]] = None,
+    pivot_rows: Optional[Tuple[str, ...]] = None,
+    pivot_column: str = "mode",
+    pivot_metrics: Tuple[str, ...] = PIVOT_METRICS,
+) -> Path:
+    """Generate an HTML comparison report from benchmark results.
+
+    Time series charts are downsampled to ``max_points`` points each; the
+    full-resolution data goes to sidecar files under report_data/. Only
+    runs matching ``where`` (see pivot.parse_where) are reported. The pivot
+    section has ``pivot_rows`` down and ``pivot_column`` across (see
+    build_pivots).
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
+    results = filter_results(results, where or {})
+
+    # Runs along any chosen settings, before the sections below split them up
+    pivots = build_pivots(results, pivot_rows, pivot_column, pivot_metrics)
+
+    # SLO search steps are only shown as the searches they belong to
+    slo = group_slo_results(results)
+    results = [r for r in results if r.slo is None]
+
+    # Load-profile runs are compared phase by phase; every other section is steady load
+    profiles = group_load_profile_results(results)
+    results = [r for r in results if r.load_profile is None]
+
+    # Trace replays are compared statement template by template
+    replays = group_replay_results(results)
+    results = [r for r in results if r.workload != "replay"]
 
     # Group results by service and concurrency
     grouped = group_results(results)
@@ -64,14 +188,78 @@ def generate_report(results: List[BenchmarkResult], output_dir: Path) -> Path:
     # Calculate deltas
     comparisons = calculate_comparisons(grouped)
 
+    # Rate-limited runs are compared separately, at matched throughput
+    matched = group_matched_results(results)
+    matched_comparisons = calculate_matched_comparisons(matched)
+
+    # Pooled runs are shown on their own, with pool-acquire wait
+    pooled = group_pooled_results(results)
+
+    # Connect-workload runs measure handshakes, not writes
+    connect = group_connect_results(results)
+
+    # How evenly each run's load was spread across its workers
+    workers = group_worker_results(results)
+
+    # Runs on configured table definitions, with their HA/ZR cost per schema
+    schemas = group_schema_results(results)
+
+    # Runs at relaxed commit durability, against the HA/ZR penalty
+    durability = group_durability_results(results)
+
+    # Write latency split into network and server time, from the RTT probe
+    network = calculate_latency_breakdown(grouped)
+
+    # Per-commit cost measured on the server, against the client-side writes
+    commit_costs = calculate_commit_costs(results, grouped)
+
+    # Downsampled charts inline, full resolution in sidecar files
+    chart_data, full_resolution = build_chart_data(grouped, max_points)
+    sidecars = write_sidecars(full_resolution, output_dir)
+    chart_data.update(build_slo_charts(slo))
+
     # Generate HTML report
-    html_content = render_html_report(grouped, comparisons)
+    html_content = render_html_report(
+        grouped,
+        comparisons,
+        matched,
+        matched_comparisons,
+        pooled,
+        connect,
+        chart_data,
+        sidecars,
+        workers,
+        schemas,
+        durability,
+        network,
+        profiles,
+        replays,
+        commit_costs,
+        slo,
+        pivots,
+    )
     html_path = output_dir / "report.html"
     with open(html_path, "w") as f:
         f.write(html_content)
 
     # Generate Markdown summary
-    md_content = render_markdown_report(grouped, comparisons)
+    md_content = render_markdown_report(
+        grouped,
+        comparisons,
+        matched,
+        matched_comparisons,
+        pooled,
+        connect,
+        workers,
+        schemas,
+        durability,
+        network,
+        profiles,
+        replays,
+        commit_costs,
+        slo,
+        pivots,
+    )
     md_path = output_dir / "report.md"
     with open(md_path, "w") as f:
         f.write(md_content)
@@ -81,48 +269,92 @@ def generate_report(results: List[BenchmarkResult], output_dir: Path) -> Path:
     with open(comparison_path, "w") as f:
         json.dump(comparisons, f, indent=2)
 
+    if matched_comparisons:
+        with open(output_dir / "matched_comparison.json", "w") as f:
+            json.dump(matched_comparisons, f, indent=2)
+
     return html_path
 
 
+def _closed_loop_writes(results: List[BenchmarkResult]) -> List[BenchmarkResult]:
+    """Closed-loop write runs on the built-in table, candidates for the main tables."""
+    return [
+        r
+        for r in results
+        if not (r.target_rate or r.pool_size or r.workload != "write") and _default_setup(r)
+    ]
+
+
 def group_results(
     results: List[BenchmarkResult],
 ) -> Dict[str, Dict[int, Dict[str, BenchmarkResult]]]:
-    """Group results by service, concurrency, and mode."""
-    grouped = {}
+    """Group closed-loop write results by service, concurrency, and mode.
 
-    for result in results:
-        service = result.service
-        concurrency = result.concurrency
-        mode = result.mode
-
-        if service not in grouped:
-            grouped[service] = {}
-        if concurrency not in grouped[service]:
-            grouped[service][concurrency] = {}
+    Rate-limited, pooled, connect and server-loop runs, and runs on a
+    non-default table or with relaxed durability, are excluded; see
+    group_matched_results(), group_pooled_results(), group_connect_results(),
+    calculate_commit_costs(), group_schema_results() and group_durability_results().
+    Each service is shown at its smallest batch size, so runs at other batch
+    sizes do not replace them; build_pivots() compares those.
+    """
+    runs = _closed_loop_writes(results)
+    batch_sizes = {}
+    for result in runs:
+        batch_sizes[result.service] = min(
+            batch_sizes.get(result.service, result.batch_size), result.batch_size
+        )
+    runs = [r for r in runs if r.batch_size == batch_sizes[r.service]]
 
+    grouped = {}
+    for (service, concurrency, mode), cell in group_by(
+        runs, ("service", "concurrency", "mode")
+    ).items():
         # Use the most recent result for each combination
-        existing = grouped[service][concurrency].get(mode)
-        if existing is None or result.start_time > existing.start_time:
-            grouped[service][concurrency][mode] = result
+        grouped.setdefault(service, {}).setdefault(concurrency, {})[mode] = newest(cell)
 
     return grouped
 
 
+def build_pivots(
+    results: List[BenchmarkResult],
+    rows: Optional[Tuple[str, ...]] = None,
+    column: str = "mode",
+    metrics: Tuple[str, ...] = PIVOT_METRICS,
+) -> Dict[str, Dict[str, Any]]:
+    """A pivot() of each service's runs, with ``rows`` down and ``column`` across.
+
+    Without ``rows``, pivots each service's closed-loop write runs by
+    concurrency and whichever run settings vary among them (e.g. batch
+    size), skipping services where none do. With ``column`` ``mode``,
+    deltas are against the service's baseline mode.
+    """
+    if rows is None:
+        results = _closed_loop_writes(results)
+
+    pivots = {}
+    for (service,), runs in group_by(results, ("service",)).items():
+        service_rows = rows
+        if service_rows is None:
+            varying = [
+                d for d in varying_dimensions(runs) if d not in ("concurrency", column)
+            ]
+            if not varying:
+                continue
+            service_rows = ("concurrency", *varying)
+        baseline = BASELINE_MODES.get(service) if column == "mode" else None
+        pivots[service] = pivot(runs, service_rows, column, metrics, baseline)
+
+    return pivots
+
+
 def calculate_comparisons(
     grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
 ) -> Dict[str, Any]:
     """Calculate comparison metrics between baseline and HA/ZR modes."""
     comparisons = {}
 
-    # Define baselines for each service
-    baselines = {
-        "postgres": "no-ha",
-        "mysql": "no-ha",
-        "sqldb": "non-zr",
-    }
-
     for service, concurrency_data in grouped.items():
-        baseline_mode = baselines.get(service)
+        baseline_mode = BASELINE_MODES.get(service)
         if not baseline_mode:
             continue
 
@@ -169,6 +401,688 @@ def calculate_comparisons(
     return comparisons
 
 
+def calculate_latency_breakdown(
+    grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Split each run's P50 write latency into network and server time.
+
+    Network time is WRITE_ROUND_TRIPS times the run's P50 TCP round trip
+    from the RTT probe; server time is the rest (commit, including any wait
+    for a standby). ``replication_ms`` is a mode's server time minus the
+    baseline mode's at the same concurrency: the HA/ZR cost with the
+    difference in client-server distance taken out. Runs without probe
+    samples (local services, or the probe turned off) are skipped.
+    """
+    breakdown = {}
+
+    for service, concurrency_data in grouped.items():
+        baseline_mode = BASELINE_MODES.get(service)
+
+        for concurrency in sorted(concurrency_data):
+            entries = {}
+            for mode, result in concurrency_data[concurrency].items():
+                rtt_ms = result.summary.get("rtt_tcp_p50_ms")
+                if rtt_ms is None:
+                    continue
+                latency_ms = result.summary["latency_p50_ms"]
+                network_ms = min(WRITE_ROUND_TRIPS * rtt_ms, latency_ms)
+                entries[mode] = {
+                    "result": result,
+                    "rtt_tcp_ms": rtt_ms,
+                    "rtt_query_ms": result.summary.get("rtt_query_p50_ms"),
+                    "network_ms": network_ms,
+                    "server_ms": latency_ms - network_ms,
+                    "network_share_pct": network_ms / latency_ms * 100 if latency_ms > 0 else 0,
+                    "replication_ms": None,
+                }
+
+            baseline = entries.get(baseline_mode)
+            for mode, entry in entries.items():
+                if baseline is not None and mode != baseline_mode:
+                    entry["replication_ms"] = entry["server_ms"] - baseline["server_ms"]
+                breakdown.setdefault(service, []).append(entry)
+
+    return breakdown
+
+
+def calculate_commit_costs(
+    results: List[BenchmarkResult],
+    grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Server-side commit cost per mode, next to the client-side write latency.
+
+    Takes the most recent server-loop run per service, concurrency and mode
+    (server per-commit P50 and P99, no client round trips) and pairs it with
+    the single-row write run at the same concurrency and mode, if any.
+    ``transport_ms`` is the client P50 minus the server P50: network and
+    driver time. Against the baseline mode, ``client_delta_ms`` is the whole
+    HA/ZR delta a client sees, ``server_delta_ms`` the part the server spends
+    (replication) and ``transport_delta_ms`` the rest.
+    """
+    latest = {}
+    for result in results:
+        if result.workload != "server-loop" or not _default_setup(result):
+            continue
+        key = (result.service, result.concurrency, result.mode)
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    by_group = {}
+    for key in sorted(latest):
+        by_group.setdefault(key[:2], {})[key[2]] = latest[key]
+
+    costs = {}
+    for (service, concurrency), runs in by_group.items():
+        baseline_mode = BASELINE_MODES.get(service)
+        writes = grouped.get(service, {}).get(concurrency, {})
+        entries = {}
+        for mode in sorted(runs, key=lambda mode: (mode != baseline_mode, mode)):
+            result = runs[mode]
+            write = writes.get(mode)
+            if write is not None and write.batch_size != 1:
+                write = None
+            server_ms = result.summary["latency_p50_ms"]
+            client_ms = write.summary["latency_p50_ms"] if write else None
+            entries[mode] = {
+                "result": result,
+                "write": write,
+                "server_p50_ms": server_ms,
+                "server_p99_ms": result.summary["latency_p99_ms"],
+                "client_p50_ms": client_ms,
+                "client_p99_ms": write.summary["latency_p99_ms"] if write else None,
+                "transport_ms": client_ms - server_ms if write else None,
+                "server_delta_ms": None,
+                "client_delta_ms": None,
+                "transport_delta_ms": None,
+            }
+
+        baseline = entries.get(baseline_mode)
+        for mode, entry in entries.items():
+            if baseline is not None and mode != baseline_mode:
+                entry["server_delta_ms"] = entry["server_p50_ms"] - baseline["server_p50_ms"]
+                if entry["write"] and baseline["write"]:
+                    entry["client_delta_ms"] = entry["client_p50_ms"] - baseline["client_p50_ms"]
+                    entry["transport_delta_ms"] = (
+                        entry["client_delta_ms"] - entry["server_delta_ms"]
+                    )
+            costs.setdefault(service, []).append(entry)
+
+    return costs
+
+
+def group_matched_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Group rate-limited results by service, concurrency, and target rate.
+
+    Returns a list of groups per service, each with the shared concurrency and
+    target rate plus the most recent result for each mode.
+    """
+    by_key = {}
+
+    for result in results:
+        if not result.target_rate or result.pool_size or result.workload != "write":
+            continue
+        if not _default_setup(result):
+            continue
+
+        key = (result.service, result.concurrency, result.target_rate)
+        group = by_key.setdefault(key, {})
+        existing = group.get(result.mode)
+        if existing is None or result.start_time > existing.start_time:
+            group[result.mode] = result
+
+    matched = {}
+    for (service, concurrency, target_rate), mode_data in sorted(by_key.items()):
+        matched.setdefault(service, []).append({
+            "concurrency": concurrency,
+            "target_rate": target_rate,
+            "modes": mode_data,
+        })
+
+    return matched
+
+
+def group_pooled_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[BenchmarkResult]]:
+    """Collect pooled-mode results by service, ordered for pool sizing.
+
+    Keeps the most recent result for each mode, worker count, pool size and
+    target rate, sorted so each mode's pool sizes read top to bottom.
+    """
+    latest = {}
+
+    for result in results:
+        if not result.pool_size or not _default_setup(result):
+            continue
+
+        key = (
+            result.service,
+            result.mode,
+            result.concurrency,
+            result.pool_size,
+            result.target_rate,
+        )
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    pooled = {}
+    for key in sorted(latest, key=lambda k: (k[0], k[1], k[2], k[3], k[4] or 0)):
+        pooled.setdefault(key[0], []).append(latest[key])
+
+    return pooled
+
+
+def group_connect_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[BenchmarkResult]]:
+    """Collect connect-workload results by service, ordered by mode and concurrency."""
+    latest = {}
+
+    for result in results:
+        if result.workload != "connect":
+            continue
+
+        key = (result.service, result.mode, result.concurrency)
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    connect = {}
+    for key in sorted(latest):
+        connect.setdefault(key[0], []).append(latest[key])
+
+    return connect
+
+
+def _default_table(result: BenchmarkResult) -> bool:
+    """Whether a run wrote to the built-in table: default schema, identity key."""
+    return result.schema == DEFAULT_SCHEMA and result.primary_key == DEFAULT_PRIMARY_KEY
+
+
+def _default_setup(result: BenchmarkResult) -> bool:
+    """Whether a run used the built-in table at the server's own durability."""
+    return _default_table(result) and result.durability == DEFAULT_DURABILITY
+
+
+def group_schema_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Closed-loop write runs per service, schema and key strategy, with deltas.
+
+    Only returned when some run used a non-default schema or primary key;
+    runs on the default table are then included too, for comparison. Each
+    entry holds the most recent result per schema, key strategy,
+    concurrency and mode, and the schema's approximate row size, index
+    count and partitioning. Throughput and P99 deltas against the service's
+    baseline mode at the same schema, key and concurrency show the
+    replication cost of that table shape; the throughput delta against the
+    identity key at the same mode shows what the key strategy itself costs.
+    ``scaling_pct`` is per-worker throughput relative to the lowest
+    concurrency run of the same schema, key and mode (100% = linear
+    scaling), which shows where a table shape stops scaling.
+    """
+    if all(_default_table(r) for r in results):
+        return {}
+
+    latest = {}
+    for result in results:
+        if result.target_rate or result.pool_size or result.workload != "write":
+            continue
+        if result.durability != DEFAULT_DURABILITY:
+            continue
+        key = (result.service, result.schema, result.primary_key, result.concurrency, result.mode)
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    def pct_delta(value: float, base: float) -> Optional[float]:
+        return (value - base) / base * 100 if base > 0 else None
+
+    # Lowest-concurrency run of each service, schema, key and mode
+    lowest = {}
+    for key in sorted(latest):
+        lowest.setdefault(key[:3] + key[4:], latest[key])
+
+    schemas = {}
+    for key in sorted(latest):
+        service, schema_name, primary_key, concurrency, mode = key
+        result = latest[key]
+        definition = result.schema_definition
+        schema = (
+            WorkloadSchema.from_definition(definition) if definition else WorkloadSchema.default()
+        )
+        baseline_mode = BASELINE_MODES.get(service)
+        baseline = latest.get((service, schema_name, primary_key, concurrency, baseline_mode))
+        identity = latest.get((service, schema_name, DEFAULT_PRIMARY_KEY, concurrency, mode))
+        first = lowest[key[:3] + key[4:]]
+        first_rate = first.summary["throughput_wps"] / first.concurrency
+        entry = {
+            "result": result,
+            "row_bytes": schema.approx_row_bytes(),
+            "indexes": len(schema.indexes),
+            "partitioning": schema.describe_partitioning(),
+            "scaling_pct": (
+                result.summary["throughput_wps"] / concurrency / first_rate * 100
+                if first is not result and first_rate > 0
+                else None
+            ),
+            "baseline_mode": baseline_mode,
+            "throughput_delta_pct": None,
+            "latency_p99_delta_pct": None,
+            "key_throughput_delta_pct": None,
+        }
+        if identity is not None and primary_key != DEFAULT_PRIMARY_KEY:
+            entry["key_throughput_delta_pct"] = pct_delta(
+                result.summary["throughput_wps"], identity.summary["throughput_wps"]
+            )
+        if baseline is not None and mode != baseline_mode:
+            entry["throughput_delta_pct"] = pct_delta(
+                result.summary["throughput_wps"], baseline.summary["throughput_wps"]
+            )
+            entry["latency_p99_delta_pct"] = pct_delta(
+                result.summary["latency_p99_ms"], baseline.summary["latency_p99_ms"]
+            )
+        schemas.setdefault(service, []).append(entry)
+
+    return schemas
+
+
+def group_durability_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Closed-loop write runs per service and commit durability level, with deltas.
+
+    Only returned when some run relaxed durability. Each entry holds the
+    most recent run on the default table per concurrency, mode and
+    durability level. The reference is the same mode and concurrency at the
+    server's durability (a run that set none, or else one at the service's
+    default level): throughput and P99 deltas against it show what relaxing
+    durability buys. ``ha_penalty_pct`` is the throughput delta against the
+    baseline mode at the reference durability, and ``penalty_recovered_pct``
+    how much of the reference HA/ZR penalty the relaxed level wins back
+    (100% = as fast as the baseline mode).
+    """
+    if all(r.durability == DEFAULT_DURABILITY for r in results):
+        return {}
+
+    latest = {}
+    for result in results:
+        if result.target_rate or result.pool_size or result.workload != "write":
+            continue
+        if not _default_table(result):
+            continue
+        key = (result.service, result.concurrency, result.mode, result.durability)
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    def reference(service: str, concurrency: int, mode: str) -> Optional[BenchmarkResult]:
+        for level in (DEFAULT_DURABILITY, SERVER_DURABILITY.get(service)):
+            if (service, concurrency, mode, level) in latest:
+                return latest[(service, concurrency, mode, level)]
+        return None
+
+    def order(key: Tuple) -> Tuple:
+        service, concurrency, mode, durability = key
+        levels = (DEFAULT_DURABILITY,) + DURABILITY_LEVELS.get(service, ())
+        rank = levels.index(durability) if durability in levels else len(levels)
+        return service, concurrency, mode, rank
+
+    def pct_delta(value: float, base: float) -> Optional[float]:
+        return (value - base) / base * 100 if base > 0 else None
+
+    durability = {}
+    for key in sorted(latest, key=order):
+        service, concurrency, mode, level = key
+        result = latest[key]
+        throughput = result.summary["throughput_wps"]
+        baseline_mode = BASELINE_MODES.get(service)
+        strict = reference(service, concurrency, mode)
+        baseline = reference(service, concurrency, baseline_mode)
+        entry = {
+            "result": result,
+            "reference": strict is result,
+            "throughput_delta_pct": None,
+            "latency_p99_delta_pct": None,
+            "ha_penalty_pct": None,
+            "penalty_recovered_pct": None,
+        }
+        if strict is not None and strict is not result:
+            entry["throughput_delta_pct"] = pct_delta(
+                throughput, strict.summary["throughput_wps"]
+            )
+            entry["latency_p99_delta_pct"] = pct_delta(
+                result.summary["latency_p99_ms"], strict.summary["latency_p99_ms"]
+            )
+        if baseline is not None and mode != baseline_mode:
+            base_throughput = baseline.summary["throughput_wps"]
+            entry["ha_penalty_pct"] = pct_delta(throughput, base_throughput)
+            if strict is not None and base_throughput > strict.summary["throughput_wps"]:
+                penalty = base_throughput - strict.summary["throughput_wps"]
+                recovered = throughput - strict.summary["throughput_wps"]
+                entry["penalty_recovered_pct"] = recovered / penalty * 100
+        durability.setdefault(service, []).append(entry)
+
+    return durability
+
+
+def group_load_profile_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Load-profile runs per service, compared with the baseline mode phase by phase.
+
+    Keeps the most recent run per profile, concurrency, mode and target
+    rate. Each group holds its ``profile``, ``concurrency``, ``modes`` and
+    ``phases``: one entry per phase with the planned ``workers`` and
+    ``target_rate_wps``, each mode's phase summary under ``runs``, and
+    the throughput and P99 deltas against the baseline mode in the same
+    phase (``throughput_delta_pct`` and ``latency_p99_delta_pct``, by mode).
+    """
+    latest = {}
+    for result in results:
+        if result.load_profile is None or not result.phases:
+            continue
+        key = (
+            result.service,
+            result.load_profile,
+            result.concurrency,
+            result.target_rate or 0,
+            result.mode,
+        )
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    by_group = {}
+    for key in sorted(latest):
+        by_group.setdefault(key[:4], {})[key[4]] = latest[key]
+
+    def pct_delta(value: float, base: float) -> Optional[float]:
+        return (value - base) / base * 100 if base > 0 else None
+
+    profiles = {}
+    for (service, profile, concurrency, _), runs in by_group.items():
+        baseline_mode = BASELINE_MODES.get(service)
+        modes = sorted(runs, key=lambda mode: (mode != baseline_mode, mode))
+        phases = []
+        for index in range(max(len(r.phases) for r in runs.values())):
+            by_mode = {
+                mode: runs[mode].phases[index] for mode in modes if index < len(runs[mode].phases)
+            }
+            first = next(iter(by_mode.values()))
+            baseline = by_mode.get(baseline_mode)
+            entry = {
+                "phase": first["phase"],
+                "workers": first["workers"],
+                "target_rate_wps": first["target_rate_wps"],
+                "runs": by_mode,
+                "throughput_delta_pct": {},
+                "latency_p99_delta_pct": {},
+            }
+            for mode, phase in by_mode.items():
+                if baseline is not None and mode != baseline_mode:
+                    entry["throughput_delta_pct"][mode] = pct_delta(
+                        phase["throughput_wps"], baseline["throughput_wps"]
+                    )
+                    entry["latency_p99_delta_pct"][mode] = pct_delta(
+                        phase["latency_p99_ms"], baseline["latency_p99_ms"]
+                    )
+            phases.append(entry)
+        profiles.setdefault(service, []).append(
+            {"profile": profile, "concurrency": concurrency, "modes": modes, "phases": phases}
+        )
+
+    return profiles
+
+
+def group_replay_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Trace replays per service, compared with the baseline mode template by template.
+
+    Keeps the most recent run per trace file, speed, concurrency and mode.
+    Each group holds its ``trace`` (file name), ``speed``, ``concurrency``,
+    ``modes``, each mode's run under ``runs``, and ``templates``: one entry
+    per statement template with each mode's stats under ``runs`` and the
+    P50 and P99 deltas against the baseline mode (``latency_p50_delta_pct``
+    and ``latency_p99_delta_pct``, by mode). Templates are in the order the
+    baseline run ranked them, by total time.
+    """
+    latest = {}
+    for result in results:
+        if result.workload != "replay" or not result.trace:
+            continue
+        key = (
+            result.service,
+            Path(result.trace["path"]).name,
+            result.trace["speed"],
+            result.concurrency,
+            result.mode,
+        )
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    by_group = {}
+    for key in sorted(latest):
+        by_group.setdefault(key[:4], {})[key[4]] = latest[key]
+
+    def pct_delta(value: float, base: float) -> Optional[float]:
+        return (value - base) / base * 100 if base > 0 else None
+
+    replays = {}
+    for (service, trace, speed, concurrency), runs in by_group.items():
+        baseline_mode = BASELINE_MODES.get(service)
+        modes = sorted(runs, key=lambda mode: (mode != baseline_mode, mode))
+        order = []
+        stats = {}
+        for mode in modes:
+            for entry in runs[mode].templates or []:
+                if entry["template"] not in stats:
+                    order.append(entry["template"])
+                stats.setdefault(entry["template"], {})[mode] = entry
+
+        templates = []
+        for template in order:
+            by_mode = stats[template]
+            baseline = by_mode.get(baseline_mode)
+            entry = {
+                "template": template,
+                "runs": by_mode,
+                "latency_p50_delta_pct": {},
+                "latency_p99_delta_pct": {},
+            }
+            for mode, row in by_mode.items():
+                if baseline is not None and mode != baseline_mode:
+                    for p in ("p50", "p99"):
+                        entry[f"latency_{p}_delta_pct"][mode] = pct_delta(
+                            row[f"latency_{p}_ms"], baseline[f"latency_{p}_ms"]
+                        )
+            templates.append(entry)
+
+        replays.setdefault(service, []).append(
+            {
+                "trace": trace,
+                "speed": speed,
+                "concurrency": concurrency,
+                "modes": modes,
+                "runs": runs,
+                "templates": templates,
+            }
+        )
+
+    return replays
+
+
+def group_slo_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """SLO searches per service, with each mode's sustainable rate side by side.
+
+    Rebuilds every search from its steps with slo_outcome() and keeps the
+    most recent search per mode, concurrency and SLO. Each group holds its
+    ``slo``, ``concurrency``, ``modes``, each mode's search under
+    ``searches`` and ``capacity_delta_pct``: each mode's sustainable rate
+    against the baseline mode's, by mode.
+    """
+    steps = {}
+    for result in results:
+        if result.slo is not None:
+            steps.setdefault(result.slo["search"], []).append(result)
+
+    latest = {}
+    for search_steps in steps.values():
+        outcome = slo_outcome(search_steps)
+        outcome["start_time"] = min(r.start_time for r in search_steps)
+        slo = outcome["slo"]
+        key = (
+            outcome["service"],
+            slo["latency_p99_ms"],
+            slo["max_error_rate"],
+            outcome["concurrency"],
+            outcome["mode"],
+        )
+        existing = latest.get(key)
+        if existing is None or outcome["start_time"] > existing["start_time"]:
+            latest[key] = outcome
+
+    by_group = {}
+    for key in sorted(latest):
+        by_group.setdefault(key[:4], {})[key[4]] = latest[key]
+
+    groups = {}
+    for (service, _, _, concurrency), searches in by_group.items():
+        baseline_mode = BASELINE_MODES.get(service)
+        modes = sorted(searches, key=lambda mode: (mode != baseline_mode, mode))
+        baseline = searches.get(baseline_mode)
+        base_rate = baseline["sustainable_rate_wps"] if baseline else None
+        deltas = {}
+        for mode in modes:
+            rate = searches[mode]["sustainable_rate_wps"]
+            if mode != baseline_mode and base_rate and rate is not None:
+                deltas[mode] = (rate - base_rate) / base_rate * 100
+        groups.setdefault(service, []).append(
+            {
+                "slo": next(iter(searches.values()))["slo"],
+                "concurrency": concurrency,
+                "modes": modes,
+                "searches": {mode: searches[mode] for mode in modes},
+                "capacity_delta_pct": deltas,
+            }
+        )
+
+    return groups
+
+
+def build_slo_charts(slo: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Capacity and P99-by-rate charts for each group of SLO searches."""
+    chart_data = {}
+    for service, groups in slo.items():
+        for index, group in enumerate(groups):
+            limit = group["slo"]["latency_p99_ms"]
+            title = f"({service}, P99 <= {limit:g} ms, concurrency={group['concurrency']})"
+            chart_data[f"chart-slo-{service}-{index}"] = slo_capacity_chart(
+                group["searches"], f"SLO Capacity by Mode {title}"
+            )
+            chart_data[f"chart-slo-{service}-{index}-steps"] = slo_steps_chart(
+                group["searches"], limit, f"P99 by Target Rate {title}"
+            )
+    return chart_data
+
+
+def group_worker_results(
+    results: List[BenchmarkResult],
+) -> Dict[str, List[BenchmarkResult]]:
+    """Collect runs with per-worker stats by service, for the fairness section.
+
+    Keeps the most recent run per mode, workload, concurrency, pool size and
+    target rate; single-worker runs have nothing to compare and are skipped.
+    """
+    latest = {}
+
+    for result in results:
+        if len(result.workers) < 2:
+            continue
+
+        key = (
+            result.service,
+            result.mode,
+            result.workload,
+            result.concurrency,
+            result.pool_size or 0,
+            result.target_rate or 0,
+        )
+        existing = latest.get(key)
+        if existing is None or result.start_time > existing.start_time:
+            latest[key] = result
+
+    workers = {}
+    for key in sorted(latest):
+        workers.setdefault(key[0], []).append(latest[key])
+
+    return workers
+
+
+def calculate_matched_comparisons(
+    matched: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Compare latency between modes that ran at the same target write rate.
+
+    A comparison is only meaningful if both runs actually sustained the target
+    rate, so each entry records whether that was the case.
+    """
+    comparisons = {}
+
+    def pct_delta(value: float, base: float) -> float:
+        return (value - base) / base * 100 if base > 0 else 0
+
+    for service, groups in matched.items():
+        baseline_mode = BASELINE_MODES.get(service)
+        if not baseline_mode:
+            continue
+
+        for group in groups:
+            baseline = group["modes"].get(baseline_mode)
+            if not baseline:
+                continue
+
+            label = f"c{group['concurrency']}@{group['target_rate']:g}wps"
+            group_comparisons = {}
+
+            for mode, result in group["modes"].items():
+                if mode == baseline_mode:
+                    continue
+
+                group_comparisons[mode] = {
+                    "baseline_mode": baseline_mode,
+                    "concurrency": group["concurrency"],
+                    "target_rate_wps": group["target_rate"],
+                    "rate_met": bool(
+                        result.summary.get("target_rate_met")
+                        and baseline.summary.get("target_rate_met")
+                    ),
+                    "baseline_throughput_wps": baseline.summary["throughput_wps"],
+                    "target_throughput_wps": result.summary["throughput_wps"],
+                    "latency_p50_delta_pct": pct_delta(
+                        result.summary["latency_p50_ms"], baseline.summary["latency_p50_ms"]
+                    ),
+                    "latency_p95_delta_pct": pct_delta(
+                        result.summary["latency_p95_ms"], baseline.summary["latency_p95_ms"]
+                    ),
+                    "latency_p99_delta_pct": pct_delta(
+                        result.summary["latency_p99_ms"], baseline.summary["latency_p99_ms"]
+                    ),
+                }
+
+            comparisons.setdefault(service, {})[label] = group_comparisons
+
+    return comparisons
+
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -282,6 +1196,10 @@ HTML_TEMPLATE = """
             margin: 20px 0;
             min-height: 400px;
         }
+        .full-resolution {
+            margin: -10px 0 20px;
+            font-size: 12px;
+        }
         
         .service-section {
             margin-bottom: 40px;
@@ -361,7 +1279,7 @@ HTML_TEMPLATE = """
                             <td>{{ "%.2f"|format(result.summary.latency_p99_ms) }}</td>
                             <td>{{ "%.2f%%"|format(result.summary.error_rate * 100) }}</td>
                             <td>
-                                {% if comparisons[service][concurrency][mode] is defined %}
+                                {% if comparisons.get(service, {}).get(concurrency, {})[mode] is defined %}
                                     {% set delta = comparisons[service][concurrency][mode].throughput_delta_pct %}
                                     <span class="{{ 'delta-positive' if delta >= 0 else 'delta-negative' }}">
                                         {{ "%+.1f%%"|format(delta) }}
@@ -371,7 +1289,7 @@ HTML_TEMPLATE = """
                                 {% endif %}
                             </td>
                             <td>
-                                {% if comparisons[service][concurrency][mode] is defined %}
+                                {% if comparisons.get(service, {}).get(concurrency, {})[mode] is defined %}
                                     {% set delta = comparisons[service][concurrency][mode].latency_p95_delta_pct %}
                                     <span class="{{ 'delta-negative' if delta >= 0 else 'delta-positive' }}">
                                         {{ "%+.1f%%"|format(delta) }}
@@ -387,20 +1305,753 @@ HTML_TEMPLATE = """
                 
                 <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-throughput"></div>
                 <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-latency"></div>
+                {% if mode_data.values()|selectattr("summary.rtt_tcp_p50_ms", "defined")|list %}
+                <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-rtt"></div>
+                {% endif %}
+                <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-spectrum"></div>
+                <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-cdf"></div>
+                {% for mode in mode_data.keys() %}
+                <div class="chart-container" id="chart-{{ service }}-{{ concurrency }}-heatmap-{{ mode }}"></div>
+                {% endfor %}
             </div>
             {% endfor %}
         </div>
         {% endfor %}
+        
+        {% if matched %}
+        <h2>Latency at Matched Throughput</h2>
+        <p>Runs paced to the same total write rate, so latency differences are not confounded by load.
+        A comparison only counts if both runs sustained at least 95% of the target rate.</p>
+        {% for service, groups in matched.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Concurrency</th>
+                        <th>Target (writes/sec)</th>
+                        <th>Mode</th>
+                        <th>Achieved (writes/sec)</th>
+                        <th>Rate Met</th>
+                        <th>P50 Latency (ms)</th>
+                        <th>P95 Latency (ms)</th>
+                        <th>P99 Latency (ms)</th>
+                        <th>P95 Latency Δ</th>
+                        <th>P99 Latency Δ</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for group in groups %}
+                    {% set label = "c%d@%gwps"|format(group.concurrency, group.target_rate) %}
+                    {% for mode, result in group.modes.items() %}
+                    {% set comp = matched_comparisons.get(service, {}).get(label, {}).get(mode) %}
+                    <tr>
+                        <td>{{ group.concurrency }}</td>
+                        <td>{{ "%.0f"|format(group.target_rate) }}</td>
+                        <td><strong>{{ mode }}</strong></td>
+                        <td>{{ "%.2f"|format(result.summary.throughput_wps) }}</td>
+                        <td>{{ "yes" if result.summary.target_rate_met else "no" }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p95_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p99_ms) }}</td>
+                        {% if comp %}
+                        <td><span class="{{ 'delta-negative' if comp.latency_p95_delta_pct >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(comp.latency_p95_delta_pct) }}</span>{% if not comp.rate_met %} <em>(rate not met)</em>{% endif %}</td>
+                        <td><span class="{{ 'delta-negative' if comp.latency_p99_delta_pct >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(comp.latency_p99_delta_pct) }}</span></td>
+                        {% else %}
+                        <td><em>baseline</em></td>
+                        <td><em>baseline</em></td>
+                        {% endif %}
+                    </tr>
+                    {% endfor %}
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        
+        {% if pooled %}
+        <h2>Connection Pool Wait</h2>
+        <p>Workers sharing a fixed-size pool. Database latency excludes the time spent waiting to acquire a connection, which is shown separately.</p>
+        {% for service, pooled_results in pooled.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Workers</th>
+                        <th>Pool Size</th>
+                        <th>Throughput (writes/sec)</th>
+                        <th>DB P95 (ms)</th>
+                        <th>DB P99 (ms)</th>
+                        <th>Pool Wait P50 (ms)</th>
+                        <th>Pool Wait P95 (ms)</th>
+                        <th>Pool Wait P99 (ms)</th>
+                        <th>Error Rate</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for result in pooled_results %}
+                    <tr>
+                        <td><strong>{{ result.mode }}</strong></td>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ result.pool_size }}</td>
+                        <td>{{ "%.2f"|format(result.summary.throughput_wps) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p95_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p99_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.get("pool_wait_p50_ms", 0)) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.get("pool_wait_p95_ms", 0)) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.get("pool_wait_p99_ms", 0)) }}</td>
+                        <td>{{ "%.2f%%"|format(result.summary.error_rate * 100) }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        
+        {% if connect %}
+        <h2>Connection Storm</h2>
+        <p>Connections opened and closed through each driver's real <code>connect()</code> path.
+        TCP and TLS handshakes are probed on a sample of connections; the rest of <code>connect()</code>
+        is attributed to auth (or TLS + auth where TLS cannot be probed separately).</p>
+        {% for service, connect_results in connect.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Concurrency</th>
+                        <th>Connections/sec</th>
+                        <th>Connect P50 (ms)</th>
+                        <th>Connect P95 (ms)</th>
+                        <th>Connect P99 (ms)</th>
+                        <th>TCP P50 / P99 (ms)</th>
+                        <th>TLS P50 / P99 (ms)</th>
+                        <th>Auth P50 / P99 (ms)</th>
+                        <th>Error Rate</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for result in connect_results %}
+                    {% set s = result.summary %}
+                    <tr>
+                        <td><strong>{{ result.mode }}</strong></td>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ "%.2f"|format(s.throughput_wps) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p95_ms) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p99_ms) }}</td>
+                        <td>{% if s.tcp_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tcp_p50_ms, s.tcp_p99_ms) }}{% else %}-{% endif %}</td>
+                        <td>{% if s.tls_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tls_p50_ms, s.tls_p99_ms) }}{% else %}-{% endif %}</td>
+                        <td>{% if s.auth_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.auth_p50_ms, s.auth_p99_ms) }}{% elif s.tls_auth_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tls_auth_p50_ms, s.tls_auth_p99_ms) }} (incl. TLS){% else %}-{% endif %}</td>
+                        <td>{{ "%.2f%%"|format(s.error_rate * 100) }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        
+        {% if workers %}
+        <h2>Worker Fairness</h2>
+        <p>How evenly each run's load was spread across its workers. Fairness is Jain's index over
+        worker throughput (1.00 = perfectly even). A straggler is a worker below
+        {{ "%.0f%%"|format(straggler_throughput_ratio * 100) }} of the median worker's throughput
+        or above {{ "%g"|format(straggler_p99_ratio) }}x the median worker P99. Pooled workers
+        take whichever connection is free, so a slow connection is spread across them; for pooled
+        runs the same figures are also given per pooled connection.</p>
+        {% for service, worker_results in workers.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Workload</th>
+                        <th>Workers</th>
+                        <th>Fairness</th>
+                        <th>Throughput CV</th>
+                        <th>Worst P99 / Median</th>
+                        <th>Run P99 (ms)</th>
+                        <th>Reconnects</th>
+                        <th>Stragglers</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for result in worker_results %}
+                    {% set s = result.summary %}
+                    <tr>
+                        <td><strong>{{ result.mode }}</strong></td>
+                        <td>{{ result.workload }}{% if result.pool_size %} (pool {{ result.pool_size }}){% endif %}{% if result.target_rate %} @ {{ "%g"|format(result.target_rate) }} w/s{% endif %}</td>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ "%.3f"|format(s.get("worker_fairness", 1)) }}</td>
+                        <td>{{ "%.2f"|format(s.get("worker_throughput_cv", 0)) }}</td>
+                        <td>{{ "%.2fx"|format(s.get("worker_p99_max_ratio", 1)) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p99_ms) }}</td>
+                        <td>{{ s.get("reconnect_count", 0) }}</td>
+                        <td>{% for w in result.workers if w.straggler %}{% if not loop.first %}, {% endif %}<span class="delta-negative">#{{ w.worker_id }}</span> ({{ w.straggler_reasons|join("+") }}: {{ "%.1f"|format(w.throughput_wps) }} w/s, P99 {{ "%.2f"|format(w.latency_p99_ms) }} ms){% else %}none{% endfor %}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+            {% if worker_results|selectattr("connections")|list %}
+            <h4>Pooled Connections</h4>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Workload</th>
+                        <th>Connections</th>
+                        <th>Fairness</th>
+                        <th>Throughput CV</th>
+                        <th>Worst P99 / Median</th>
+                        <th>Stragglers</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for result in worker_results if result.connections %}
+                    {% set s = result.summary %}
+                    <tr>
+                        <td><strong>{{ result.mode }}</strong></td>
+                        <td>{{ result.workload }} (pool {{ result.pool_size }}){% if result.target_rate %} @ {{ "%g"|format(result.target_rate) }} w/s{% endif %}</td>
+                        <td>{{ result.connections|length }}</td>
+                        <td>{{ "%.3f"|format(s.get("connection_fairness", 1)) }}</td>
+                        <td>{{ "%.2f"|format(s.get("connection_throughput_cv", 0)) }}</td>
+                        <td>{{ "%.2fx"|format(s.get("connection_p99_max_ratio", 1)) }}</td>
+                        <td>{% for c in result.connections if c.straggler %}{% if not loop.first %}, {% endif %}<span class="delta-negative">#{{ c.connection_id }}</span> ({{ c.straggler_reasons|join("+") }}: {{ "%.1f"|format(c.throughput_wps) }} w/s, P99 {{ "%.2f"|format(c.latency_p99_ms) }} ms){% else %}none{% endfor %}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+            {% endif %}
+        </div>
+        {% endfor %}
+        {% endif %}
+        
+        {% if schemas %}
+        <h2>Schema Matrix</h2>
+        <p>Closed-loop runs on each configured table definition and primary key strategy. Row size
+        (approximate, including index entries), secondary index count and key order drive WAL/redo
+        volume; the baseline deltas show each HA/ZR mode against the baseline mode on the same
+        schema, key and concurrency, and the key delta compares the key strategy with an identity
+        key in the same mode. Scaling is throughput per worker relative to the lowest concurrency
+        run (100% = linear), which shows whether partitioning moves a concurrency bottleneck.</p>
+        {% for service, entries in schemas.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Schema</th>
+                        <th>Primary Key</th>
+                        <th>Row Size (B)</th>
+                        <th>Indexes</th>
+                        <th>Partitioning</th>
+                        <th>Concurrency</th>
+                        <th>Mode</th>
+                        <th>Throughput (writes/sec)</th>
+                        <th>Scaling</th>
+                        <th>P50 (ms)</th>
+                        <th>P99 (ms)</th>
+                        <th>Throughput vs Baseline</th>
+                        <th>P99 vs Baseline</th>
+                        <th>Throughput vs Identity</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in entries %}
+                    {% set result = entry.result %}
+                    <tr>
+                        <td><strong>{{ result.schema }}</strong></td>
+                        <td>{{ result.primary_key }}</td>
+                        <td>{{ "{:,}".format(entry.row_bytes) }}</td>
+                        <td>{{ entry.indexes }}</td>
+                        <td>{{ entry.partitioning }}</td>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ result.mode }}</td>
+                        <td>{{ "%.2f"|format(result.summary.throughput_wps) }}</td>
+                        <td>{{ "%.0f%%"|format(entry.scaling_pct) if entry.scaling_pct is not none else "-" }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p99_ms) }}</td>
+                        {% if entry.throughput_delta_pct is not none %}
+                        <td><span class="{{ 'delta-positive' if entry.throughput_delta_pct >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(entry.throughput_delta_pct) }}</span></td>
+                        <td><span class="{{ 'delta-negative' if entry.latency_p99_delta_pct >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(entry.latency_p99_delta_pct) }}</span></td>
+                        {% else %}
+                        <td>{{ "baseline" if result.mode == entry.baseline_mode else "-" }}</td>
+                        <td>{{ "baseline" if result.mode == entry.baseline_mode else "-" }}</td>
+                        {% endif %}
+                        {% if entry.key_throughput_delta_pct is not none %}
+                        <td><span class="{{ 'delta-positive' if entry.key_throughput_delta_pct >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(entry.key_throughput_delta_pct) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        
+        {% if durability %}
+        <h2>Durability Trade-off</h2>
+        <p>Closed-loop runs on the default table at each session commit durability level. The
+        reference is the same mode at the server's own durability; the HA penalty is throughput
+        against the baseline mode at that reference, and "penalty recovered" is how much of the
+        reference HA/ZR penalty the relaxed level wins back (100% = as fast as the baseline
+        mode). Relaxed levels can lose acknowledged commits on failover.</p>
+        {% for service, entries in durability.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Concurrency</th>
+                        <th>Mode</th>
+                        <th>Durability</th>
+                        <th>Throughput (writes/sec)</th>
+                        <th>P50 (ms)</th>
+                        <th>P99 (ms)</th>
+                        <th>Throughput vs Reference</th>
+                        <th>P99 vs Reference</th>
+                        <th>HA Penalty</th>
+                        <th>Penalty Recovered</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in entries %}
+                    {% set result = entry.result %}
+                    <tr>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ result.mode }}</td>
+                        <td><strong>{{ result.durability }}</strong></td>
+                        <td>{{ "%.2f"|format(result.summary.throughput_wps) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p99_ms) }}</td>
+                        {% if entry.throughput_delta_pct is not none %}
+                        <td><span class="{{ 'delta-positive' if entry.throughput_delta_pct >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(entry.throughput_delta_pct) }}</span></td>
+                        <td><span class="{{ 'delta-negative' if entry.latency_p99_delta_pct >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(entry.latency_p99_delta_pct) }}</span></td>
+                        {% else %}
+                        <td>{{ "reference" if entry.reference else "-" }}</td>
+                        <td>{{ "reference" if entry.reference else "-" }}</td>
+                        {% endif %}
+                        {% if entry.ha_penalty_pct is not none %}
+                        <td><span class="{{ 'delta-positive' if entry.ha_penalty_pct >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(entry.ha_penalty_pct) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                        <td>{{ "%.0f%%"|format(entry.penalty_recovered_pct) if entry.penalty_recovered_pct is not none else "-" }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        {% if network %}
+        <h2>Network vs Server Time</h2>
+        <p>Each run's P50 write latency split using the RTT probe that ran alongside it. A
+        single-row write takes {{ write_round_trips }} round trips (INSERT, then COMMIT), so
+        network time is {{ write_round_trips }} &times; the P50 TCP round trip and server
+        time is the rest. Replication is a mode's server time minus the baseline mode's: the
+        HA/ZR cost net of any difference in client-server distance. SELECT 1 is a full
+        driver round trip with next to no server work, for reference.</p>
+        {% for service, entries in network.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Concurrency</th>
+                        <th>Mode</th>
+                        <th>Write P50 (ms)</th>
+                        <th>TCP RTT P50 (ms)</th>
+                        <th>SELECT 1 P50 (ms)</th>
+                        <th>Network (ms)</th>
+                        <th>Server (ms)</th>
+                        <th>Network Share</th>
+                        <th>Replication (ms)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in entries %}
+                    {% set result = entry.result %}
+                    <tr>
+                        <td>{{ result.concurrency }}</td>
+                        <td>{{ result.mode }}</td>
+                        <td>{{ "%.2f"|format(result.summary.latency_p50_ms) }}</td>
+                        <td>{{ "%.3f"|format(entry.rtt_tcp_ms) }}</td>
+                        <td>{{ "%.3f"|format(entry.rtt_query_ms) if entry.rtt_query_ms is not none else "-" }}</td>
+                        <td>{{ "%.2f"|format(entry.network_ms) }}</td>
+                        <td>{{ "%.2f"|format(entry.server_ms) }}</td>
+                        <td>{{ "%.0f%%"|format(entry.network_share_pct) }}</td>
+                        <td>{{ "%+.2f"|format(entry.replication_ms) if entry.replication_ms is not none else "-" }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        {% if commit_costs %}
+        <h2>Server-Side Commit Cost</h2>
+        <p>Per-commit time measured on the server by the server-loop workload (INSERT and
+        COMMIT in a stored procedure, no client round trips), next to the client-side P50 of
+        single-row writes at the same concurrency. Transport is the difference: network and
+        driver time. Against the baseline mode, the client delta is the whole HA/ZR cost a
+        client sees; the server delta is the part spent committing (replication) and the
+        transport delta is the rest.</p>
+        {% for service, entries in commit_costs.items() %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Concurrency</th>
+                        <th>Mode</th>
+                        <th>Server P50 (ms)</th>
+                        <th>Server P99 (ms)</th>
+                        <th>Client P50 (ms)</th>
+                        <th>Client P99 (ms)</th>
+                        <th>Transport (ms)</th>
+                        <th>Client Delta (ms)</th>
+                        <th>Server Delta (ms)</th>
+                        <th>Transport Delta (ms)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in entries %}
+                    <tr>
+                        <td>{{ entry.result.concurrency }}</td>
+                        <td>{{ entry.result.mode }}</td>
+                        <td>{{ "%.3f"|format(entry.server_p50_ms) }}</td>
+                        <td>{{ "%.3f"|format(entry.server_p99_ms) }}</td>
+                        <td>{{ "%.3f"|format(entry.client_p50_ms) if entry.client_p50_ms is not none else "-" }}</td>
+                        <td>{{ "%.3f"|format(entry.client_p99_ms) if entry.client_p99_ms is not none else "-" }}</td>
+                        <td>{{ "%.3f"|format(entry.transport_ms) if entry.transport_ms is not none else "-" }}</td>
+                        <td>{{ "%+.3f"|format(entry.client_delta_ms) if entry.client_delta_ms is not none else "-" }}</td>
+                        <td>{{ "%+.3f"|format(entry.server_delta_ms) if entry.server_delta_ms is not none else "-" }}</td>
+                        <td>{{ "%+.3f"|format(entry.transport_delta_ms) if entry.transport_delta_ms is not none else "-" }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endif %}
+        {% if profiles %}
+        <h2>Load Profiles</h2>
+        <p>Runs that followed a load profile, phase by phase. An operation belongs to the phase
+        it started in. Deltas are against the baseline mode in the same phase; watch the phases
+        right after a spike or ramp for replicas falling behind.</p>
+        {% for service, groups in profiles.items() %}
+        {% for group in groups %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}: {{ group.profile }} (up to {{ group.concurrency }} workers)</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Phase</th>
+                        <th>Workers</th>
+                        <th>Target Rate</th>
+                        <th>Mode</th>
+                        <th>Throughput (writes/sec)</th>
+                        <th>P50 (ms)</th>
+                        <th>P99 (ms)</th>
+                        <th>Errors</th>
+                        <th>Throughput vs Baseline</th>
+                        <th>P99 vs Baseline</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in group.phases %}
+                    {% for mode, phase in entry.runs.items() %}
+                    <tr>
+                        {% if loop.first %}
+                        <td rowspan="{{ entry.runs|length }}"><strong>{{ entry.phase }}</strong></td>
+                        <td rowspan="{{ entry.runs|length }}">{{ entry.workers[0] }}&rarr;{{ entry.workers[1] }}</td>
+                        <td rowspan="{{ entry.runs|length }}">{% if entry.target_rate_wps %}{{ "%.0f"|format(entry.target_rate_wps[0] or 0) }}&rarr;{{ "%.0f"|format(entry.target_rate_wps[1] or 0) }}{% else %}-{% endif %}</td>
+                        {% endif %}
+                        <td>{{ mode }}</td>
+                        <td>{{ "%.2f"|format(phase.throughput_wps) }}</td>
+                        <td>{{ "%.2f"|format(phase.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(phase.latency_p99_ms) }}</td>
+                        <td>{{ phase.error_count }}</td>
+                        {% set tput_delta = entry.throughput_delta_pct.get(mode) %}
+                        {% set p99_delta = entry.latency_p99_delta_pct.get(mode) %}
+                        {% if tput_delta is not none %}
+                        <td><span class="{{ 'delta-positive' if tput_delta >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(tput_delta) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                        {% if p99_delta is not none %}
+                        <td><span class="{{ 'delta-negative' if p99_delta >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(p99_delta) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                    </tr>
+                    {% endfor %}
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endfor %}
+        {% endif %}
+        {% if replays %}
+        <h2>Trace Replay</h2>
+        <p>Replayed production traces, with latency per statement template (statements that
+        differ only in their values). Deltas are against the baseline mode on the same trace.
+        Schedule lag is how late statements started against the trace's timing; a high lag means
+        the target could not keep up with the trace's pace.</p>
+        {% for service, groups in replays.items() %}
+        {% for group in groups %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}: {{ group.trace }} at {{ "%gx"|format(group.speed) if group.speed else "full speed" }} ({{ group.concurrency }} workers)</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Statements/sec</th>
+                        <th>P50 (ms)</th>
+                        <th>P99 (ms)</th>
+                        <th>Schedule Lag P99 (ms)</th>
+                        <th>Errors</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for mode in group.modes %}
+                    {% set s = group.runs[mode].summary %}
+                    <tr>
+                        <td>{{ mode }}</td>
+                        <td>{{ "%.2f"|format(s.throughput_wps) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(s.latency_p99_ms) }}</td>
+                        <td>{{ "%.2f"|format(s.replay_lag_p99_ms) if s.replay_lag_p99_ms is defined else "-" }}</td>
+                        <td>{{ s.error_count }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Template</th>
+                        <th>Mode</th>
+                        <th>Count</th>
+                        <th>Time Share</th>
+                        <th>P50 (ms)</th>
+                        <th>P99 (ms)</th>
+                        <th>Errors</th>
+                        <th>P50 vs Baseline</th>
+                        <th>P99 vs Baseline</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for entry in group.templates %}
+                    {% for mode, row in entry.runs.items() %}
+                    <tr>
+                        {% if loop.first %}
+                        <td rowspan="{{ entry.runs|length }}"><code>{{ entry.template }}</code></td>
+                        {% endif %}
+                        <td>{{ mode }}</td>
+                        <td>{{ row.count }}</td>
+                        <td>{{ "%.1f%%"|format(row.time_share * 100) }}</td>
+                        <td>{{ "%.2f"|format(row.latency_p50_ms) }}</td>
+                        <td>{{ "%.2f"|format(row.latency_p99_ms) }}</td>
+                        <td>{{ row.error_count }}</td>
+                        {% for p in ("p50", "p99") %}
+                        {% set delta = entry["latency_" ~ p ~ "_delta_pct"].get(mode) %}
+                        {% if delta is not none %}
+                        <td><span class="{{ 'delta-negative' if delta >= 0 else 'delta-positive' }}">{{ "%+.1f%%"|format(delta) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                        {% endfor %}
+                    </tr>
+                    {% endfor %}
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endfor %}
+        {% endif %}
+        {% if pivots %}
+        <h2>Pivot</h2>
+        <p>Runs compared along their settings: each row is one combination of the row settings,
+        each column one value of the column setting. A cell is the median over its runs (n
+        when there are several), with its change against the baseline column in the same
+        row.</p>
+        {% for service, table in pivots.items() %}
+        {% for metric in table.metrics %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}: {{ metric_names.get(metric, metric) }} by {{ table.column }}</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        {% for row in table.rows %}
+                        <th>{{ row }}</th>
+                        {% endfor %}
+                        {% for value in table.columns %}
+                        <th>{{ format_value(value) }}{% if value == table.baseline %} (baseline){% endif %}</th>
+                        {% endfor %}
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for cell in table.cells %}
+                    <tr>
+                        {% for value in cell.row %}
+                        <td>{{ format_value(value) }}</td>
+                        {% endfor %}
+                        {% for value in table.columns %}
+                        {% set entry = cell.columns.get(value) %}
+                        {% if entry and entry[metric] is not none %}
+                        {% set delta = cell.delta_pct.get(value, {}).get(metric) %}
+                        <td>
+                            {{ "%.2f%%"|format(entry[metric] * 100) if metric == "error_rate" else "%.2f"|format(entry[metric]) }}{% if entry.runs > 1 %} <em>(n={{ entry.runs }})</em>{% endif %}
+                            {% if delta is not none %}
+                            <span class="{{ 'delta-positive' if (delta >= 0) == (metric == 'throughput_wps') else 'delta-negative' }}">{{ "%+.1f%%"|format(delta) }}</span>
+                            {% endif %}
+                        </td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                        {% endfor %}
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+        </div>
+        {% endfor %}
+        {% endfor %}
+        {% endif %}
+        {% if slo %}
+        <h2>SLO Capacity</h2>
+        <p>The highest write rate each mode sustained within the SLO, found by slo-search: short
+        rate-limited steps, ramped up until one failed and then narrowed between the highest
+        passing and the lowest failing rate. A step fails on P99, on errors, or if it fell short
+        of its target rate. The capacity delta is against the baseline mode.</p>
+        {% for service, groups in slo.items() %}
+        {% for group in groups %}
+        <div class="card">
+            <div class="service-header">
+                <h3>{{ service_names[service] }}: P99 &le; {{ "%g"|format(group.slo.latency_p99_ms) }} ms, errors &le; {{ "%.2f%%"|format(group.slo.max_error_rate * 100) }} (concurrency {{ group.concurrency }})</h3>
+                <span class="service-badge {{ service }}">{{ service }}</span>
+            </div>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Mode</th>
+                        <th>Target</th>
+                        <th>Sustainable Rate (w/s)</th>
+                        <th>First Failing Rate (w/s)</th>
+                        <th>Capacity Delta</th>
+                        <th>Steps</th>
+                        <th>P99 at Sustainable Rate (ms)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {% for mode in group.modes %}
+                    {% set search = group.searches[mode] %}
+                    {% set best = search.steps|selectattr("passed")|selectattr("target_rate_wps", "equalto", search.sustainable_rate_wps)|first %}
+                    <tr>
+                        <td>{{ mode }}</td>
+                        <td>{{ search.target_name }}</td>
+                        <td>{{ "%.1f"|format(search.sustainable_rate_wps) if search.sustainable_rate_wps is not none else "none" }}</td>
+                        <td>{{ "%.1f"|format(search.failing_rate_wps) if search.failing_rate_wps is not none else "-" }}</td>
+                        {% if mode in group.capacity_delta_pct %}
+                        {% set delta = group.capacity_delta_pct[mode] %}
+                        <td><span class="{{ 'delta-positive' if delta >= 0 else 'delta-negative' }}">{{ "%+.1f%%"|format(delta) }}</span></td>
+                        {% else %}
+                        <td>-</td>
+                        {% endif %}
+                        <td>{{ search.steps|length }}</td>
+                        <td>{{ "%.2f"|format(best.latency_p99_ms) if best else "-" }}</td>
+                    </tr>
+                    {% endfor %}
+                </tbody>
+            </table>
+            <div class="chart-container" id="chart-slo-{{ service }}-{{ loop.index0 }}"></div>
+            <div class="chart-container" id="chart-slo-{{ service }}-{{ loop.index0 }}-steps"></div>
+        </div>
+        {% endfor %}
+        {% endfor %}
+        {% endif %}
     </div>
     
     <script>
         // Chart data
         const chartData = {{ chart_data | safe }};
-        
+        // Full-resolution data for downsampled charts, loaded on demand
+        const sidecars = {{ sidecars | safe }};
+        window.zrbenchFullResolution = {};
+
+        function loadFullResolution(chartId, button) {
+            button.disabled = true;
+            button.textContent = "Loading...";
+            const script = document.createElement("script");
+            script.src = sidecars[chartId];
+            script.onload = () => {
+                Plotly.react(chartId, window.zrbenchFullResolution[chartId], chartData[chartId].layout);
+                button.remove();
+            };
+            script.onerror = () => {
+                button.textContent = "Full-resolution data not found";
+            };
+            document.head.appendChild(script);
+        }
+
         // Render charts
         for (const [chartId, data] of Object.entries(chartData)) {
-            if (document.getElementById(chartId)) {
+            const element = document.getElementById(chartId);
+            if (element) {
                 Plotly.newPlot(chartId, data.traces, data.layout, {responsive: true});
+                if (sidecars[chartId]) {
+                    const button = document.createElement("button");
+                    button.className = "full-resolution";
+                    button.textContent = "Load full resolution";
+                    button.onclick = () => loadFullResolution(chartId, button);
+                    element.after(button);
+                }
             }
         }
     </script>
@@ -409,73 +2060,111 @@ HTML_TEMPLATE = """
 """
 
 
-def render_html_report(
+def build_chart_data(
     grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
-    comparisons: Dict[str, Any],
-) -> str:
-    """Render the HTML report using Jinja2."""
-    # Prepare chart data
+    max_points: int = DEFAULT_CHART_POINTS,
+) -> Tuple[Dict[str, Any], Dict[str, List[Dict]]]:
+    """Build Plotly chart data, downsampled to ``max_points`` points per chart.
+
+    Returns the charts and, for charts that had to be downsampled, their
+    full-resolution traces (to be written as sidecar files).
+    """
     chart_data = {}
+    full_resolution = {}
 
     for service, concurrency_data in grouped.items():
         for concurrency, mode_data in concurrency_data.items():
-            # Throughput chart
-            throughput_traces = []
-            for mode, result in mode_data.items():
-                if result.time_series:
-                    throughput_traces.append({
-                        "x": [ts["elapsed_sec"] for ts in result.time_series],
-                        "y": [ts["throughput_wps"] for ts in result.time_series],
-                        "name": mode,
-                        "type": "scatter",
-                        "mode": "lines",
-                    })
-
-            chart_data[f"chart-{service}-{concurrency}-throughput"] = {
-                "traces": throughput_traces,
-                "layout": {
-                    "title": f"Throughput Over Time ({service}, concurrency={concurrency})",
-                    "xaxis": {"title": "Elapsed Time (seconds)"},
-                    "yaxis": {"title": "Writes/second"},
-                    "height": 350,
-                },
-            }
+            charts = [
+                ("throughput", "throughput_wps", "Throughput Over Time", "Writes/second"),
+                ("latency", "avg_latency_ms", "Average Latency Over Time", "Latency (ms)"),
+            ]
+            if any("rtt_tcp_p50_ms" in r.summary for r in mode_data.values()):
+                charts.append(("rtt", "avg_rtt_tcp_ms", "Network RTT Over Time", "TCP RTT (ms)"))
+            for metric, key, title, yaxis in charts:
+                chart_id = f"chart-{service}-{concurrency}-{metric}"
+                traces, full = time_series_chart(mode_data, key, max_points)
+
+                chart_data[chart_id] = {
+                    "traces": traces,
+                    "layout": {
+                        "title": f"{title} ({service}, concurrency={concurrency})",
+                        "xaxis": {"title": "Elapsed Time (seconds)"},
+                        "yaxis": {"title": yaxis},
+                        "height": 350,
+                    },
+                }
+                if any(len(t["x"]) < len(f["x"]) for t, f in zip(traces, full)):
+                    full_resolution[chart_id] = full
 
-            # Latency chart
-            latency_traces = []
+            # Latency distribution per mode, and when tail latency happened
+            title = f"({service}, concurrency={concurrency})"
+            chart_data[f"chart-{service}-{concurrency}-spectrum"] = percentile_spectrum_chart(
+                mode_data, f"Latency by Percentile {title}"
+            )
+            chart_data[f"chart-{service}-{concurrency}-cdf"] = cdf_chart(
+                mode_data, f"Latency CDF {title}"
+            )
             for mode, result in mode_data.items():
-                if result.time_series:
-                    latency_traces.append({
-                        "x": [ts["elapsed_sec"] for ts in result.time_series],
-                        "y": [ts["avg_latency_ms"] for ts in result.time_series],
-                        "name": mode,
-                        "type": "scatter",
-                        "mode": "lines",
-                    })
-
-            chart_data[f"chart-{service}-{concurrency}-latency"] = {
-                "traces": latency_traces,
-                "layout": {
-                    "title": f"Average Latency Over Time ({service}, concurrency={concurrency})",
-                    "xaxis": {"title": "Elapsed Time (seconds)"},
-                    "yaxis": {"title": "Latency (ms)"},
-                    "height": 350,
-                },
-            }
+                heatmap = heatmap_chart(result, f"Latency Heatmap: {mode} {title}", max_points)
+                if heatmap:
+                    chart_data[f"chart-{service}-{concurrency}-heatmap-{mode}"] = heatmap
+
+    return chart_data, full_resolution
+
 
-    # Service display names
-    service_names = {
-        "postgres": "PostgreSQL Flexible Server",
-        "mysql": "MySQL Flexible Server",
-        "sqldb": "Azure SQL Database (General Purpose)",
-    }
+def render_html_report(
+    grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
+    comparisons: Dict[str, Any],
+    matched: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    matched_comparisons: Optional[Dict[str, Any]] = None,
+    pooled: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    connect: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    chart_data: Optional[Dict[str, Any]] = None,
+    sidecars: Optional[Dict[str, str]] = None,
+    workers: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    schemas: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    durability: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    network: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    profiles: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    replays: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    commit_costs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    slo: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    pivots: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> str:
+    """Render the HTML report using Jinja2.
+
+    ``chart_data`` defaults to charts downsampled to DEFAULT_CHART_POINTS;
+    ``sidecars`` maps chart ids to full-resolution data files the report
+    can load on demand.
+    """
+    if chart_data is None:
+        chart_data, _ = build_chart_data(grouped)
 
     template = Template(HTML_TEMPLATE)
     return template.render(
         grouped=grouped,
         comparisons=comparisons,
-        chart_data=json.dumps(chart_data),
-        service_names=service_names,
+        matched=matched or {},
+        matched_comparisons=matched_comparisons or {},
+        pooled=pooled or {},
+        connect=connect or {},
+        chart_data=json.dumps(chart_data, separators=(",", ":")),
+        sidecars=json.dumps(sidecars or {}),
+        workers=workers or {},
+        schemas=schemas or {},
+        durability=durability or {},
+        network=network or {},
+        profiles=profiles or {},
+        replays=replays or {},
+        commit_costs=commit_costs or {},
+        slo=slo or {},
+        pivots=pivots or {},
+        format_value=format_value,
+        metric_names=METRIC_NAMES,
+        write_round_trips=WRITE_ROUND_TRIPS,
+        straggler_throughput_ratio=STRAGGLER_THROUGHPUT_RATIO,
+        straggler_p99_ratio=STRAGGLER_P99_RATIO,
+        service_names=SERVICE_NAMES,
         generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     )
 
@@ -497,7 +2186,7 @@ This report compares write performance across different HA/ZR modes for Azure ma
 | Mode | Throughput (w/s) | P50 (ms) | P95 (ms) | P99 (ms) | Errors | Throughput Δ | P95 Δ |
 | ---- | ---------------- | -------- | -------- | -------- | ------ | ------------ | ----- |
 {% for mode, result in mode_data.items() -%}
-| {{ mode }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.2f"|format(result.summary.latency_p95_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {{ result.summary.error_count }} | {% if comparisons[service][concurrency][mode] is defined %}{{ "%+.1f%%"|format(comparisons[service][concurrency][mode].throughput_delta_pct) }}{% else %}baseline{% endif %} | {% if comparisons[service][concurrency][mode] is defined %}{{ "%+.1f%%"|format(comparisons[service][concurrency][mode].latency_p95_delta_pct) }}{% else %}baseline{% endif %} |
+| {{ mode }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.2f"|format(result.summary.latency_p95_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {{ result.summary.error_count }} | {% if comparisons.get(service, {}).get(concurrency, {})[mode] is defined %}{{ "%+.1f%%"|format(comparisons[service][concurrency][mode].throughput_delta_pct) }}{% else %}baseline{% endif %} | {% if comparisons.get(service, {}).get(concurrency, {})[mode] is defined %}{{ "%+.1f%%"|format(comparisons[service][concurrency][mode].latency_p95_delta_pct) }}{% else %}baseline{% endif %} |
 {% endfor %}
 {% endfor %}
 {% endfor %}
@@ -514,6 +2203,217 @@ This report compares write performance across different HA/ZR modes for Azure ma
 {% endfor -%}
 {% endfor -%}
 {% endfor %}
+{% if matched %}
+## Latency at Matched Throughput
+
+Runs paced to the same total write rate. A comparison only counts if both runs sustained at least 95% of the target rate.
+{% for service, groups in matched.items() %}
+### {{ service_names[service] }}
+
+| Concurrency | Target (w/s) | Mode | Achieved (w/s) | Rate Met | P50 (ms) | P95 (ms) | P99 (ms) | P95 Δ | P99 Δ |
+| ----------- | ------------ | ---- | -------------- | -------- | -------- | -------- | -------- | ----- | ----- |
+{% for group in groups -%}
+{% set label = "c%d@%gwps"|format(group.concurrency, group.target_rate) -%}
+{% for mode, result in group.modes.items() -%}
+{% set comp = matched_comparisons.get(service, {}).get(label, {}).get(mode) -%}
+| {{ group.concurrency }} | {{ "%.0f"|format(group.target_rate) }} | {{ mode }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "yes" if result.summary.target_rate_met else "no" }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.2f"|format(result.summary.latency_p95_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {% if comp %}{{ "%+.1f%%"|format(comp.latency_p95_delta_pct) }}{% if not comp.rate_met %} (rate not met){% endif %}{% else %}baseline{% endif %} | {% if comp %}{{ "%+.1f%%"|format(comp.latency_p99_delta_pct) }}{% else %}baseline{% endif %} |
+{% endfor -%}
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if pooled %}
+## Connection Pool Wait
+
+Workers sharing a fixed-size pool. DB latency excludes pool-acquire wait, which is shown separately.
+{% for service, pooled_results in pooled.items() %}
+### {{ service_names[service] }}
+
+| Mode | Workers | Pool Size | Throughput (w/s) | DB P95 (ms) | DB P99 (ms) | Wait P50 (ms) | Wait P95 (ms) | Wait P99 (ms) | Errors |
+| ---- | ------- | --------- | ---------------- | ----------- | ----------- | ------------- | ------------- | ------------- | ------ |
+{% for result in pooled_results -%}
+| {{ result.mode }} | {{ result.concurrency }} | {{ result.pool_size }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "%.2f"|format(result.summary.latency_p95_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {{ "%.2f"|format(result.summary.get("pool_wait_p50_ms", 0)) }} | {{ "%.2f"|format(result.summary.get("pool_wait_p95_ms", 0)) }} | {{ "%.2f"|format(result.summary.get("pool_wait_p99_ms", 0)) }} | {{ result.summary.error_count }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if connect %}
+## Connection Storm
+
+Connections opened and closed through each driver's real `connect()` path. TCP and TLS handshakes are probed on a sample of connections; the rest of `connect()` is attributed to auth (or TLS + auth where TLS cannot be probed separately).
+{% for service, connect_results in connect.items() %}
+### {{ service_names[service] }}
+
+| Mode | Concurrency | Conn/s | P50 (ms) | P95 (ms) | P99 (ms) | TCP P50/P99 (ms) | TLS P50/P99 (ms) | Auth P50/P99 (ms) | Errors |
+| ---- | ----------- | ------ | -------- | -------- | -------- | ---------------- | ---------------- | ----------------- | ------ |
+{% for result in connect_results -%}
+{% set s = result.summary -%}
+| {{ result.mode }} | {{ result.concurrency }} | {{ "%.2f"|format(s.throughput_wps) }} | {{ "%.2f"|format(s.latency_p50_ms) }} | {{ "%.2f"|format(s.latency_p95_ms) }} | {{ "%.2f"|format(s.latency_p99_ms) }} | {% if s.tcp_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tcp_p50_ms, s.tcp_p99_ms) }}{% else %}-{% endif %} | {% if s.tls_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tls_p50_ms, s.tls_p99_ms) }}{% else %}-{% endif %} | {% if s.auth_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.auth_p50_ms, s.auth_p99_ms) }}{% elif s.tls_auth_p50_ms is defined %}{{ "%.2f / %.2f"|format(s.tls_auth_p50_ms, s.tls_auth_p99_ms) }} (incl. TLS){% else %}-{% endif %} | {{ s.error_count }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if workers %}
+## Worker Fairness
+
+How evenly each run's load was spread across its workers. Fairness is Jain's index over worker throughput (1.00 = perfectly even). A straggler is a worker below {{ "%.0f%%"|format(straggler_throughput_ratio * 100) }} of the median worker's throughput or above {{ "%g"|format(straggler_p99_ratio) }}x the median worker P99. Pooled workers take whichever connection is free, so a slow connection is spread across them; for pooled runs the same figures are also given per pooled connection.
+{% for service, worker_results in workers.items() %}
+### {{ service_names[service] }}
+
+| Mode | Workload | Workers | Fairness | Throughput CV | Worst P99 / Median | Run P99 (ms) | Reconnects | Stragglers |
+| ---- | -------- | ------- | -------- | ------------- | ------------------ | ------------ | ---------- | ---------- |
+{% for result in worker_results -%}
+{% set s = result.summary -%}
+| {{ result.mode }} | {{ result.workload }}{% if result.pool_size %} (pool {{ result.pool_size }}){% endif %}{% if result.target_rate %} @ {{ "%g"|format(result.target_rate) }} w/s{% endif %} | {{ result.concurrency }} | {{ "%.3f"|format(s.get("worker_fairness", 1)) }} | {{ "%.2f"|format(s.get("worker_throughput_cv", 0)) }} | {{ "%.2fx"|format(s.get("worker_p99_max_ratio", 1)) }} | {{ "%.2f"|format(s.latency_p99_ms) }} | {{ s.get("reconnect_count", 0) }} | {% for w in result.workers if w.straggler %}{% if not loop.first %}, {% endif %}#{{ w.worker_id }} ({{ w.straggler_reasons|join("+") }}){% else %}none{% endfor %} |
+{% endfor %}
+{%- if worker_results|selectattr("connections")|list %}
+Pooled connections:
+
+| Mode | Workload | Connections | Fairness | Throughput CV | Worst P99 / Median | Stragglers |
+| ---- | -------- | ----------- | -------- | ------------- | ------------------ | ---------- |
+{% for result in worker_results if result.connections -%}
+{% set s = result.summary -%}
+| {{ result.mode }} | {{ result.workload }} (pool {{ result.pool_size }}){% if result.target_rate %} @ {{ "%g"|format(result.target_rate) }} w/s{% endif %} | {{ result.connections|length }} | {{ "%.3f"|format(s.get("connection_fairness", 1)) }} | {{ "%.2f"|format(s.get("connection_throughput_cv", 0)) }} | {{ "%.2fx"|format(s.get("connection_p99_max_ratio", 1)) }} | {% for c in result.connections if c.straggler %}{% if not loop.first %}, {% endif %}#{{ c.connection_id }} ({{ c.straggler_reasons|join("+") }}){% else %}none{% endfor %} |
+{% endfor -%}
+{% endif %}
+{% endfor %}
+{% endif %}
+{% if schemas %}
+## Schema Matrix
+
+Closed-loop runs on each configured table definition and primary key strategy. Row size (approximate, including index entries), secondary index count and key order drive WAL/redo volume; the baseline deltas show each HA/ZR mode against the baseline mode on the same schema, key and concurrency, and the key delta compares the key strategy with an identity key in the same mode. Scaling is throughput per worker relative to the lowest concurrency run (100% = linear), which shows whether partitioning moves a concurrency bottleneck.
+{% for service, entries in schemas.items() %}
+### {{ service_names[service] }}
+
+| Schema | Primary Key | Row Size (B) | Indexes | Partitioning | Concurrency | Mode | Throughput (w/s) | Scaling | P50 (ms) | P99 (ms) | Throughput Δ | P99 Δ | Δ vs Identity |
+| ------ | ----------- | ------------ | ------- | ------------ | ----------- | ---- | ---------------- | ------- | -------- | -------- | ------------ | ----- | ------------- |
+{% for entry in entries -%}
+{% set result = entry.result -%}
+| {{ result.schema }} | {{ result.primary_key }} | {{ "{:,}".format(entry.row_bytes) }} | {{ entry.indexes }} | {{ entry.partitioning }} | {{ result.concurrency }} | {{ result.mode }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "%.0f%%"|format(entry.scaling_pct) if entry.scaling_pct is not none else "-" }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {% if entry.throughput_delta_pct is not none %}{{ "%+.1f%%"|format(entry.throughput_delta_pct) }} | {{ "%+.1f%%"|format(entry.latency_p99_delta_pct) }}{% else %}{{ "baseline" if result.mode == entry.baseline_mode else "-" }} | {{ "baseline" if result.mode == entry.baseline_mode else "-" }}{% endif %} | {{ "%+.1f%%"|format(entry.key_throughput_delta_pct) if entry.key_throughput_delta_pct is not none else "-" }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if durability %}
+## Durability Trade-off
+
+Closed-loop runs on the default table at each session commit durability level. The reference is the same mode at the server's own durability; the HA penalty is throughput against the baseline mode at that reference, and "recovered" is how much of the reference HA/ZR penalty the relaxed level wins back (100% = as fast as the baseline mode). Relaxed levels can lose acknowledged commits on failover.
+{% for service, entries in durability.items() %}
+### {{ service_names[service] }}
+
+| Concurrency | Mode | Durability | Throughput (w/s) | P50 (ms) | P99 (ms) | Throughput Δ | P99 Δ | HA Penalty | Recovered |
+| ----------- | ---- | ---------- | ---------------- | -------- | -------- | ------------ | ----- | ---------- | --------- |
+{% for entry in entries -%}
+{% set result = entry.result -%}
+| {{ result.concurrency }} | {{ result.mode }} | {{ result.durability }} | {{ "%.2f"|format(result.summary.throughput_wps) }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.2f"|format(result.summary.latency_p99_ms) }} | {% if entry.throughput_delta_pct is not none %}{{ "%+.1f%%"|format(entry.throughput_delta_pct) }} | {{ "%+.1f%%"|format(entry.latency_p99_delta_pct) }}{% else %}{{ "reference" if entry.reference else "-" }} | {{ "reference" if entry.reference else "-" }}{% endif %} | {{ "%+.1f%%"|format(entry.ha_penalty_pct) if entry.ha_penalty_pct is not none else "-" }} | {{ "%.0f%%"|format(entry.penalty_recovered_pct) if entry.penalty_recovered_pct is not none else "-" }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if network %}
+## Network vs Server Time
+
+Each run's P50 write latency split using the RTT probe that ran alongside it. A single-row write takes {{ write_round_trips }} round trips (INSERT, then COMMIT), so network time is {{ write_round_trips }} × the P50 TCP round trip and server time is the rest. Replication is a mode's server time minus the baseline mode's: the HA/ZR cost net of any difference in client-server distance.
+{% for service, entries in network.items() %}
+### {{ service_names[service] }}
+
+| Concurrency | Mode | Write P50 (ms) | TCP RTT (ms) | SELECT 1 (ms) | Network (ms) | Server (ms) | Network Share | Replication (ms) |
+| ----------- | ---- | -------------- | ------------ | ------------- | ------------ | ----------- | ------------- | ---------------- |
+{% for entry in entries -%}
+{% set result = entry.result -%}
+| {{ result.concurrency }} | {{ result.mode }} | {{ "%.2f"|format(result.summary.latency_p50_ms) }} | {{ "%.3f"|format(entry.rtt_tcp_ms) }} | {{ "%.3f"|format(entry.rtt_query_ms) if entry.rtt_query_ms is not none else "-" }} | {{ "%.2f"|format(entry.network_ms) }} | {{ "%.2f"|format(entry.server_ms) }} | {{ "%.0f%%"|format(entry.network_share_pct) }} | {{ "%+.2f"|format(entry.replication_ms) if entry.replication_ms is not none else "-" }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if commit_costs %}
+## Server-Side Commit Cost
+
+Per-commit time measured on the server by the server-loop workload (no client round trips), next to the client-side P50 of single-row writes at the same concurrency. Transport is the difference: network and driver time. Against the baseline mode, the client delta is the whole HA/ZR cost a client sees; the server delta is the part spent committing (replication) and the transport delta is the rest.
+{% for service, entries in commit_costs.items() %}
+### {{ service_names[service] }}
+
+| Concurrency | Mode | Server P50 (ms) | Server P99 (ms) | Client P50 (ms) | Client P99 (ms) | Transport (ms) | Client Delta (ms) | Server Delta (ms) | Transport Delta (ms) |
+| ----------- | ---- | --------------- | --------------- | --------------- | --------------- | -------------- | ----------------- | ----------------- | -------------------- |
+{% for entry in entries -%}
+| {{ entry.result.concurrency }} | {{ entry.result.mode }} | {{ "%.3f"|format(entry.server_p50_ms) }} | {{ "%.3f"|format(entry.server_p99_ms) }} | {{ "%.3f"|format(entry.client_p50_ms) if entry.client_p50_ms is not none else "-" }} | {{ "%.3f"|format(entry.client_p99_ms) if entry.client_p99_ms is not none else "-" }} | {{ "%.3f"|format(entry.transport_ms) if entry.transport_ms is not none else "-" }} | {{ "%+.3f"|format(entry.client_delta_ms) if entry.client_delta_ms is not none else "-" }} | {{ "%+.3f"|format(entry.server_delta_ms) if entry.server_delta_ms is not none else "-" }} | {{ "%+.3f"|format(entry.transport_delta_ms) if entry.transport_delta_ms is not none else "-" }} |
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if profiles %}
+## Load Profiles
+
+Runs that followed a load profile, phase by phase. An operation belongs to the phase it started in. Deltas are against the baseline mode in the same phase.
+{% for service, groups in profiles.items() %}
+{% for group in groups %}
+### {{ service_names[service] }}: {{ group.profile }} (up to {{ group.concurrency }} workers)
+
+| Phase | Workers | Target Rate | Mode | Throughput (w/s) | P50 (ms) | P99 (ms) | Errors | Throughput Δ | P99 Δ |
+| ----- | ------- | ----------- | ---- | ---------------- | -------- | -------- | ------ | ------------ | ----- |
+{% for entry in group.phases -%}
+{% for mode, phase in entry.runs.items() -%}
+{% set tput_delta = entry.throughput_delta_pct.get(mode) -%}
+{% set p99_delta = entry.latency_p99_delta_pct.get(mode) -%}
+| {{ entry.phase }} | {{ entry.workers[0] }}→{{ entry.workers[1] }} | {% if entry.target_rate_wps %}{{ "%.0f"|format(entry.target_rate_wps[0] or 0) }}→{{ "%.0f"|format(entry.target_rate_wps[1] or 0) }}{% else %}-{% endif %} | {{ mode }} | {{ "%.2f"|format(phase.throughput_wps) }} | {{ "%.2f"|format(phase.latency_p50_ms) }} | {{ "%.2f"|format(phase.latency_p99_ms) }} | {{ phase.error_count }} | {{ "%+.1f%%"|format(tput_delta) if tput_delta is not none else "-" }} | {{ "%+.1f%%"|format(p99_delta) if p99_delta is not none else "-" }} |
+{% endfor -%}
+{% endfor %}
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if replays %}
+## Trace Replay
+
+Replayed production traces, with latency per statement template. Deltas are against the baseline mode on the same trace.
+{% for service, groups in replays.items() %}
+{% for group in groups %}
+### {{ service_names[service] }}: {{ group.trace }} at {{ "%gx"|format(group.speed) if group.speed else "full speed" }} ({{ group.concurrency }} workers)
+
+| Mode | Statements/sec | P50 (ms) | P99 (ms) | Schedule Lag P99 (ms) | Errors |
+| ---- | -------------- | -------- | -------- | --------------------- | ------ |
+{% for mode in group.modes -%}
+{% set s = group.runs[mode].summary -%}
+| {{ mode }} | {{ "%.2f"|format(s.throughput_wps) }} | {{ "%.2f"|format(s.latency_p50_ms) }} | {{ "%.2f"|format(s.latency_p99_ms) }} | {{ "%.2f"|format(s.replay_lag_p99_ms) if s.replay_lag_p99_ms is defined else "-" }} | {{ s.error_count }} |
+{% endfor %}
+
+| Template | Mode | Count | Time Share | P50 (ms) | P99 (ms) | Errors | P50 Δ | P99 Δ |
+| -------- | ---- | ----- | ---------- | -------- | -------- | ------ | ----- | ----- |
+{% for entry in group.templates -%}
+{% for mode, row in entry.runs.items() -%}
+{% set p50_delta = entry.latency_p50_delta_pct.get(mode) -%}
+{% set p99_delta = entry.latency_p99_delta_pct.get(mode) -%}
+| `{{ entry.template|replace("|", "\\\\|") }}` | {{ mode }} | {{ row.count }} | {{ "%.1f%%"|format(row.time_share * 100) }} | {{ "%.2f"|format(row.latency_p50_ms) }} | {{ "%.2f"|format(row.latency_p99_ms) }} | {{ row.error_count }} | {{ "%+.1f%%"|format(p50_delta) if p50_delta is not none else "-" }} | {{ "%+.1f%%"|format(p99_delta) if p99_delta is not none else "-" }} |
+{% endfor -%}
+{% endfor %}
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if pivots %}
+## Pivot
+
+Runs compared along their settings. A cell is the median over its runs (n when there are several), with its change against the baseline column in the same row.
+{% for service, table in pivots.items() %}
+{% for metric in table.metrics %}
+### {{ service_names[service] }}: {{ metric_names.get(metric, metric) }} by {{ table.column }}
+
+|{% for row in table.rows %} {{ row }} |{% endfor %}{% for value in table.columns %} {{ format_value(value) }}{% if value == table.baseline %} (baseline){% endif %} |{% endfor %}
+|{% for row in table.rows %} --- |{% endfor %}{% for value in table.columns %} --- |{% endfor %}
+{% for cell in table.cells -%}
+|{% for value in cell.row %} {{ format_value(value) }} |{% endfor %}{% for value in table.columns %}{% set entry = cell.columns.get(value) %}{% if entry and entry[metric] is not none %}{% set delta = cell.delta_pct.get(value, {}).get(metric) %} {{ "%.2f%%"|format(entry[metric] * 100) if metric == "error_rate" else "%.2f"|format(entry[metric]) }}{% if entry.runs > 1 %} (n={{ entry.runs }}){% endif %}{% if delta is not none %} ({{ "%+.1f%%"|format(delta) }}){% endif %} |{% else %} - |{% endif %}{% endfor %}
+{% endfor %}
+{% endfor %}
+{% endfor %}
+{% endif %}
+{% if slo %}
+## SLO Capacity
+
+The highest write rate each mode sustained within the SLO, found by slo-search. A step fails on P99, on errors, or if it fell short of its target rate. The capacity delta is against the baseline mode.
+{% for service, groups in slo.items() %}
+{% for group in groups %}
+### {{ service_names[service] }}: P99 ≤ {{ "%g"|format(group.slo.latency_p99_ms) }} ms, errors ≤ {{ "%.2f%%"|format(group.slo.max_error_rate * 100) }} (concurrency {{ group.concurrency }})
+
+| Mode | Target | Sustainable Rate (w/s) | First Failing Rate (w/s) | Capacity Delta | Steps |
+| ---- | ------ | ---------------------- | ------------------------ | -------------- | ----- |
+{% for mode in group.modes -%}
+{% set search = group.searches[mode] -%}
+| {{ mode }} | {{ search.target_name }} | {{ "%.1f"|format(search.sustainable_rate_wps) if search.sustainable_rate_wps is not none else "none" }} | {{ "%.1f"|format(search.failing_rate_wps) if search.failing_rate_wps is not none else "-" }} | {{ "%+.1f%%"|format(group.capacity_delta_pct[mode]) if mode in group.capacity_delta_pct else "-" }} | {{ search.steps|length }} |
+{% endfor %}
+{% endfor %}
+{% endfor %}
+{% endif %}
 ---
 
 *Note: Negative throughput delta indicates slower performance. Positive latency delta indicates higher latency.*
@@ -523,18 +2423,43 @@ This report compares write performance across different HA/ZR modes for Azure ma
 def render_markdown_report(
     grouped: Dict[str, Dict[int, Dict[str, BenchmarkResult]]],
     comparisons: Dict[str, Any],
+    matched: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    matched_comparisons: Optional[Dict[str, Any]] = None,
+    pooled: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    connect: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    workers: Optional[Dict[str, List[BenchmarkResult]]] = None,
+    schemas: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    durability: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    network: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    profiles: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    replays: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    commit_costs: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    slo: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    pivots: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> str:
     """Render a Markdown summary report."""
-    service_names = {
-        "postgres": "PostgreSQL Flexible Server",
-        "mysql": "MySQL Flexible Server",
-        "sqldb": "Azure SQL Database (General Purpose)",
-    }
-
     template = Template(MARKDOWN_TEMPLATE)
     return template.render(
         grouped=grouped,
         comparisons=comparisons,
-        service_names=service_names,
+        matched=matched or {},
+        matched_comparisons=matched_comparisons or {},
+        pooled=pooled or {},
+        connect=connect or {},
+        workers=workers or {},
+        schemas=schemas or {},
+        durability=durability or {},
+        network=network or {},
+        profiles=profiles or {},
+        replays=replays or {},
+        commit_costs=commit_costs or {},
+        slo=slo or {},
+        pivots=pivots or {},
+        format_value=format_value,
+        metric_names=METRIC_NAMES,
+        write_round_trips=WRITE_ROUND_TRIPS,
+        straggler_throughput_ratio=STRAGGLER_THROUGHPUT_RATIO,
+        straggler_p99_ratio=STRAGGLER_P99_RATIO,
+        service_names=SERVICE_NAMES,
         generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     )
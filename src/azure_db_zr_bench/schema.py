@@ -0,0 +1,696 @@
+"""Benchmark table definitions: columns, payload shape and secondary indexes."""
+
+import re
+import string
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .keys import KeyDistribution, KeyGenerator
+
+COLUMN_TYPES = ("int", "bigint", "float", "text", "json", "uuid", "timestamp")
+INDEX_KINDS = ("btree", "unique", "hash", "gin")
+DIALECTS = ("postgres", "mysql", "sqldb", "sqlite")
+
+# Index kinds other engines don't have (MySQL silently turns HASH into BTREE)
+POSTGRES_ONLY_INDEXES = ("hash", "gin")
+
+PARTITION_METHODS = ("hash", "range")
+MAX_PARTITIONS = 1024
+
+# SQL DB has no hash partitioning; it range-partitions on this computed column instead
+PARTITION_BUCKET = "partition_bucket"
+
+DEFAULT_SCHEMA = "default"
+DEFAULT_TABLE = "benchmark_writes"
+
+# How the ``id`` primary key is generated:
+# - identity: server-side auto-increment, always appending at the index's right edge
+# - uuidv4: random client UUIDs, inserting all over the index (page splits)
+# - uuidv7: time-ordered client UUIDs, appending near the right edge
+# - bigint: random client-generated 63-bit integers
+PK_STRATEGIES = ("identity", "uuidv4", "uuidv7", "bigint")
+DEFAULT_PRIMARY_KEY = "identity"
+
+# Primary key column per key type and dialect
+PRIMARY_KEYS = {
+    "identity": {
+        "postgres": "id BIGSERIAL PRIMARY KEY",
+        "mysql": "id BIGINT AUTO_INCREMENT PRIMARY KEY",
+        "sqldb": "id BIGINT IDENTITY(1,1) PRIMARY KEY",
+        "sqlite": "id INTEGER PRIMARY KEY AUTOINCREMENT",
+    },
+    # InnoDB clusters rows by primary key, so MySQL gets the compact binary form
+    "uuid": {
+        "postgres": "id UUID PRIMARY KEY",
+        "mysql": "id BINARY(16) PRIMARY KEY",
+        "sqldb": "id UNIQUEIDENTIFIER PRIMARY KEY",
+        "sqlite": "id TEXT PRIMARY KEY",
+    },
+    "bigint": {
+        "postgres": "id BIGINT PRIMARY KEY",
+        "mysql": "id BIGINT PRIMARY KEY",
+        "sqldb": "id BIGINT PRIMARY KEY",
+        "sqlite": "id INTEGER PRIMARY KEY",
+    },
+}
+
+PLACEHOLDERS = {"postgres": "%s", "mysql": "%s", "sqldb": "?", "sqlite": "?"}
+
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+_ALPHANUMERIC = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype=np.uint8)
+
+# Repetitive text making up the compressible share of a payload
+_FILLER = np.frombuffer(b"lorem ipsum dolor sit amet consectetur adipiscing elit ", dtype=np.uint8)
+
+# JSON payloads are flat objects of string fields of this many characters
+JSON_FIELD_CHARS = 64
+
+# Rough per-row and per-index-entry overhead, for estimating table size
+ROW_OVERHEAD_BYTES = 24
+INDEX_ENTRY_OVERHEAD_BYTES = 16
+
+_FIXED_WIDTH_BYTES = {"int": 4, "bigint": 8, "float": 8, "uuid": 16, "timestamp": 8}
+
+
+@dataclass
+class ColumnSpec:
+    """One column of the benchmark table and how its values are generated.
+
+    Numeric columns draw from ``min_value``..``max_value``, integer columns
+    following ``distribution`` (uniform if not set). Text
+    and JSON payload lengths (in characters) draw uniformly from
+    ``min_size``..``max_size``; ``compressibility`` is the fraction of each
+    payload that is repetitive filler rather than random alphanumerics
+    (0 = incompressible). Timestamp columns are filled in by the server.
+    """
+
+    name: str
+    type: str
+    min_value: float = 1
+    max_value: float = 1000
+    min_size: int = 512
+    max_size: int = 512
+    compressibility: float = 0.0
+    # Declared text length (default: max_size)
+    length: Optional[int] = None
+    # Key distribution for int and bigint columns (config: a name or a mapping)
+    distribution: Optional[KeyDistribution] = None
+
+    def __post_init__(self):
+        if not _NAME.fullmatch(self.name) or self.name.lower() == "id":
+            raise ValueError(f"Invalid column name: {self.name}")
+        if self.type not in COLUMN_TYPES:
+            raise ValueError(f"Invalid column type: {self.type}. Must be one of {COLUMN_TYPES}")
+        if self.min_value > self.max_value:
+            raise ValueError(f"Column {self.name}: range minimum is above its maximum")
+        if not 0 < self.min_size <= self.max_size:
+            raise ValueError(f"Column {self.name}: size must be a positive range")
+        if not 0.0 <= self.compressibility <= 1.0:
+            raise ValueError(f"Column {self.name}: compressibility must be between 0 and 1")
+        if self.length is not None and self.length < self.max_size:
+            raise ValueError(f"Column {self.name}: length is shorter than the maximum size")
+        if self.distribution is not None:
+            self.distribution = KeyDistribution.from_config(self.distribution)
+            if self.type not in ("int", "bigint"):
+                raise ValueError(f"Column {self.name}: only integer columns take a distribution")
+
+    @property
+    def generated(self) -> bool:
+        """Whether the client supplies this column's values."""
+        return self.type != "timestamp"
+
+    @property
+    def approx_bytes(self) -> float:
+        if self.type in _FIXED_WIDTH_BYTES:
+            return _FIXED_WIDTH_BYTES[self.type]
+        return (self.min_size + self.max_size) / 2
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnSpec":
+        """Build from config, where ``range`` and ``size`` are a value or a [min, max] pair."""
+        data = dict(data)
+        if "range" in data:
+            data["min_value"], data["max_value"] = _pair(data.pop("range"))
+        if "size" in data:
+            data["min_size"], data["max_size"] = (int(v) for v in _pair(data.pop("size")))
+        return cls(**data)
+
+
+@dataclass
+class IndexSpec:
+    """A secondary index on one or more columns."""
+
+    columns: List[str]
+    kind: str = "btree"
+    name: Optional[str] = None
+
+    def __post_init__(self):
+        if self.kind not in INDEX_KINDS:
+            raise ValueError(f"Invalid index kind: {self.kind}. Must be one of {INDEX_KINDS}")
+        if not self.columns:
+            raise ValueError("An index needs at least one column")
+        if self.kind == "hash" and len(self.columns) > 1:
+            raise ValueError("Hash indexes cover a single column")
+
+
+@dataclass
+class PartitionSpec:
+    """Table partitioning on an integer column.
+
+    ``hash`` spreads rows over ``count`` partitions by the column's value
+    modulo ``count`` (PostgreSQL hashes it); ``range`` splits the column's
+    configured range into ``count`` equal slices, so a sequential column
+    gives time-style partitioning where all inserts go to the newest
+    partition.
+    """
+
+    column: str
+    method: str = "hash"
+    count: int = 8
+
+    def __post_init__(self):
+        if self.method not in PARTITION_METHODS:
+            raise ValueError(
+                f"Invalid partition method: {self.method}. Must be one of {PARTITION_METHODS}"
+            )
+        if not 2 <= self.count <= MAX_PARTITIONS:
+            raise ValueError(f"Partition count must be between 2 and {MAX_PARTITIONS}")
+
+
+@dataclass
+class WorkloadSchema:
+    """The benchmark table: its columns, secondary indexes and row generation.
+
+    Every provider derives its DDL and INSERT statements from this, so the
+    same definition runs against each engine. The table always has an
+    ``id`` primary key in addition to ``columns``, generated according to
+    ``primary_key`` (one of PK_STRATEGIES). Partitioned tables add the
+    partition column to the primary key, as the engines require.
+    """
+
+    name: str
+    table: str
+    columns: List[ColumnSpec]
+    indexes: List[IndexSpec] = field(default_factory=list)
+    primary_key: str = DEFAULT_PRIMARY_KEY
+    partitioning: Optional[PartitionSpec] = None
+
+    def __post_init__(self):
+        if not _NAME.fullmatch(self.table):
+            raise ValueError(f"Invalid table name: {self.table}")
+        if self.primary_key not in PK_STRATEGIES:
+            raise ValueError(
+                f"Invalid primary key strategy: {self.primary_key}. Must be one of {PK_STRATEGIES}"
+            )
+        names = [c.name for c in self.columns]
+        if len(set(n.lower() for n in names)) != len(names):
+            raise ValueError(f"Schema {self.name}: duplicate column names")
+        if not self.insert_columns:
+            raise ValueError(f"Schema {self.name}: needs at least one generated column")
+        for index in self.indexes:
+            missing = [c for c in index.columns if c not in names]
+            if missing:
+                raise ValueError(f"Schema {self.name}: index on unknown column(s) {missing}")
+            if index.kind == "gin" and any(
+                self.column(c).type != "json" for c in index.columns
+            ):
+                raise ValueError(f"Schema {self.name}: gin indexes need json columns")
+        if self.partitioning is not None:
+            self._check_partitioning(names)
+
+    def _check_partitioning(self, names: List[str]) -> None:
+        part = self.partitioning
+        if part.column not in names or self.column(part.column).type not in ("int", "bigint"):
+            raise ValueError(f"Schema {self.name}: partition on an int or bigint column")
+        column = self.column(part.column)
+        if part.method == "range" and column.max_value - column.min_value + 1 < part.count:
+            raise ValueError(f"Schema {self.name}: range of {part.column} is too small to split")
+        # Engines can only enforce uniqueness within a partition
+        for index in self.indexes:
+            if index.kind == "unique" and part.column not in index.columns:
+                raise ValueError(
+                    f"Schema {self.name}: unique indexes must include the partition column"
+                )
+
+    @classmethod
+    def default(cls) -> "WorkloadSchema":
+        """The original table: a tenant id, a 512-character payload, one index."""
+        return cls(
+            name=DEFAULT_SCHEMA,
+            table=DEFAULT_TABLE,
+            columns=[
+                ColumnSpec("tenant_id", "int", min_value=1, max_value=1000),
+                ColumnSpec("ts", "timestamp"),
+                ColumnSpec("payload", "text", min_size=512, max_size=512, length=1024),
+            ],
+            # Named as before, so existing tables don't get a duplicate index
+            indexes=[IndexSpec(["tenant_id"], name="idx_benchmark_writes_tenant")],
+        )
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "WorkloadSchema":
+        """Build a named schema from its config section."""
+        if not _NAME.fullmatch(name.replace("-", "_")):
+            raise ValueError(f"Invalid schema name: {name}")
+        return cls(
+            name=name,
+            table=data.get("table", f"benchmark_{name.replace('-', '_')}"),
+            columns=[ColumnSpec.from_dict(c) for c in data.get("columns", [])],
+            indexes=[
+                IndexSpec(**index) if isinstance(index, dict) else IndexSpec([index])
+                for index in data.get("indexes", [])
+            ],
+            primary_key=data.get("primary_key", DEFAULT_PRIMARY_KEY),
+            partitioning=(
+                PartitionSpec(**data["partitioning"]) if data.get("partitioning") else None
+            ),
+        )
+
+    @classmethod
+    def from_definition(cls, data: Dict[str, Any]) -> "WorkloadSchema":
+        """Rebuild a schema from to_dict() output, e.g. one saved with a result."""
+        return cls(
+            name=data["name"],
+            table=data["table"],
+            columns=[ColumnSpec(**c) for c in data["columns"]],
+            indexes=[IndexSpec(**i) for i in data["indexes"]],
+            primary_key=data.get("primary_key", DEFAULT_PRIMARY_KEY),
+            partitioning=(
+                PartitionSpec(**data["partitioning"]) if data.get("partitioning") else None
+            ),
+        )
+
+    def with_primary_key(self, strategy: str) -> "WorkloadSchema":
+        """This schema with another key strategy, in its own table (the DDL differs)."""
+        if strategy == self.primary_key:
+            return self
+        table = self.table if strategy == DEFAULT_PRIMARY_KEY else f"{self.table}_{strategy}"
+        return replace(self, table=table, primary_key=strategy)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def column(self, name: str) -> ColumnSpec:
+        return next(c for c in self.columns if c.name == name)
+
+    @property
+    def insert_columns(self) -> List[ColumnSpec]:
+        return [c for c in self.columns if c.generated]
+
+    @property
+    def client_keys(self) -> bool:
+        """Whether the client supplies ``id`` (as the first INSERT parameter)."""
+        return self.primary_key != DEFAULT_PRIMARY_KEY
+
+    @property
+    def key_type(self) -> str:
+        """Primary key column type: identity, uuid or bigint (see PRIMARY_KEYS)."""
+        return "uuid" if self.primary_key.startswith("uuid") else self.primary_key
+
+    @property
+    def insert_names(self) -> List[str]:
+        """Column names of each generated row, in order."""
+        names = [c.name for c in self.insert_columns]
+        return ["id"] + names if self.client_keys else names
+
+    def approx_row_bytes(self) -> int:
+        """Rough on-disk bytes per row, including primary key and index entries."""
+        key_bytes = _FIXED_WIDTH_BYTES["uuid" if self.key_type == "uuid" else "bigint"]
+        row = ROW_OVERHEAD_BYTES + key_bytes
+        row += sum(c.approx_bytes for c in self.columns)
+        keys = [[key_bytes]] + [
+            [self.column(c).approx_bytes for c in index.columns] for index in self.indexes
+        ]
+        row += sum(sum(key) + INDEX_ENTRY_OVERHEAD_BYTES for key in keys)
+        return int(row)
+
+    def index_name(self, index: IndexSpec) -> str:
+        return index.name or f"idx_{self.table}_{'_'.join(index.columns)}"
+
+    def partition_bounds(self) -> List[int]:
+        """Upper bounds (exclusive) of all range partitions but the last."""
+        column = self.column(self.partitioning.column)
+        low, count = int(column.min_value), self.partitioning.count
+        span = int(column.max_value) - low + 1
+        return [low + span * i // count for i in range(1, count)]
+
+    def describe_partitioning(self) -> str:
+        """Short label, e.g. ``hash(tenant_id) x 16``, or ``-`` if unpartitioned."""
+        part = self.partitioning
+        return f"{part.method}({part.column}) x {part.count}" if part else "-"
+
+    def create_table_sql(self, dialect: str) -> List[str]:
+        """Statements creating the table and its indexes if they don't exist."""
+        _check_dialect(dialect)
+        for index in self.indexes:
+            if index.kind in POSTGRES_ONLY_INDEXES and dialect != "postgres":
+                raise ValueError(
+                    f"Schema {self.name}: {index.kind} indexes are only supported on postgres"
+                )
+
+        part = self.partitioning
+        if part is not None and dialect == "sqlite":
+            raise ValueError(f"Schema {self.name}: partitioning is not supported on sqlite")
+
+        columns = [PRIMARY_KEYS[self.key_type][dialect]] + [
+            f"{c.name} {_column_type(c, dialect)}" for c in self.columns
+        ]
+        # Column the table is actually partitioned on
+        part_column = part.column if part else None
+        if part:
+            columns[0] = columns[0].replace(" PRIMARY KEY", " NOT NULL")
+            if dialect == "sqldb" and part.method == "hash":
+                part_column = PARTITION_BUCKET
+                columns.append(
+                    f"{PARTITION_BUCKET} AS CAST(ABS({part.column} % {part.count}) AS INT) "
+                    "PERSISTED NOT NULL"
+                )
+            columns.append(f"PRIMARY KEY (id, {part_column})")
+
+        def index_columns(index: IndexSpec) -> str:
+            names = list(index.columns)
+            if index.kind == "unique" and part_column and part_column not in names:
+                names.append(part_column)
+            return ", ".join(names)
+
+        if dialect == "mysql":
+            columns += [
+                f"{'UNIQUE ' if i.kind == 'unique' else ''}INDEX {self.index_name(i)} "
+                f"({index_columns(i)})"
+                for i in self.indexes
+            ]
+            return [
+                f"CREATE TABLE IF NOT EXISTS {self.table} (\n    "
+                + ",\n    ".join(columns)
+                + "\n) ENGINE=InnoDB"
+                + (self._mysql_partitions() if part else "")
+            ]
+
+        indexes = []
+        for index in self.indexes:
+            unique = "UNIQUE " if index.kind == "unique" else ""
+            using = f" USING {index.kind}" if index.kind in POSTGRES_ONLY_INDEXES else ""
+            exists = "" if dialect == "sqldb" else "IF NOT EXISTS "
+            indexes.append(
+                f"CREATE {unique}INDEX {exists}{self.index_name(index)} "
+                f"ON {self.table}{using} ({index_columns(index)})"
+            )
+
+        if dialect == "sqldb":
+            statements = []
+            placement = ""
+            if part:
+                statements = self._sqldb_partition_scheme()
+                placement = f" ON ps_{self.table}({part_column})"
+            # No IF NOT EXISTS for tables or indexes; guard the whole batch
+            body = ";\n    ".join(
+                [
+                    f"CREATE TABLE {self.table} (\n        "
+                    + ",\n        ".join(columns)
+                    + f"\n    ){placement}"
+                ]
+                + indexes
+            )
+            return statements + [
+                f"IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = '{self.table}')\n"
+                f"BEGIN\n    {body};\nEND"
+            ]
+
+        table = (
+            f"CREATE TABLE IF NOT EXISTS {self.table} (\n    " + ",\n    ".join(columns) + "\n)"
+        )
+        if part:
+            table += f" PARTITION BY {part.method.upper()} ({part.column})"
+            return [table] + self._postgres_partitions() + indexes
+        return [table] + indexes
+
+    def _postgres_partitions(self) -> List[str]:
+        part = self.partitioning
+        if part.method == "hash":
+            bounds = [f"WITH (MODULUS {part.count}, REMAINDER {i})" for i in range(part.count)]
+        else:
+            edges = ["MINVALUE"] + [str(b) for b in self.partition_bounds()] + ["MAXVALUE"]
+            bounds = [f"FROM ({lo}) TO ({hi})" for lo, hi in zip(edges, edges[1:])]
+        return [
+            f"CREATE TABLE IF NOT EXISTS {self.table}_p{i} PARTITION OF {self.table} "
+            f"FOR VALUES {bound}"
+            for i, bound in enumerate(bounds)
+        ]
+
+    def _mysql_partitions(self) -> str:
+        part = self.partitioning
+        if part.method == "hash":
+            return f"\nPARTITION BY HASH ({part.column}) PARTITIONS {part.count}"
+        bounds = [f"({b})" for b in self.partition_bounds()] + ["MAXVALUE"]
+        partitions = ",\n    ".join(
+            f"PARTITION p{i} VALUES LESS THAN {bound}" for i, bound in enumerate(bounds)
+        )
+        return f"\nPARTITION BY RANGE ({part.column}) (\n    {partitions}\n)"
+
+    def _sqldb_partition_scheme(self) -> List[str]:
+        """Partition function and scheme; hash partitioning ranges over the bucket column."""
+        part = self.partitioning
+        if part.method == "hash":
+            sql_type, bounds = "INT", list(range(1, part.count))
+        else:
+            sql_type = "INT" if self.column(part.column).type == "int" else "BIGINT"
+            bounds = self.partition_bounds()
+        function, scheme = f"pf_{self.table}", f"ps_{self.table}"
+        return [
+            f"IF NOT EXISTS (SELECT * FROM sys.partition_functions WHERE name = '{function}')\n"
+            f"    CREATE PARTITION FUNCTION {function} ({sql_type}) AS RANGE RIGHT "
+            f"FOR VALUES ({', '.join(str(b) for b in bounds)})",
+            f"IF NOT EXISTS (SELECT * FROM sys.partition_schemes WHERE name = '{scheme}')\n"
+            f"    CREATE PARTITION SCHEME {scheme} AS PARTITION {function} ALL TO ([PRIMARY])",
+        ]
+
+    def insert_sql(self, dialect: str) -> str:
+        """Parameterized single-row INSERT of the generated columns."""
+        _check_dialect(dialect)
+        names = self.insert_names
+        placeholders = ", ".join(PLACEHOLDERS[dialect] for _ in names)
+        return f"INSERT INTO {self.table} ({', '.join(names)}) VALUES ({placeholders})"
+
+
+def _pair(value) -> Tuple[float, float]:
+    if isinstance(value, (list, tuple)):
+        if len(value) != 2:
+            raise ValueError(f"Expected a value or a [min, max] pair, got {value}")
+        return value[0], value[1]
+    return value, value
+
+
+def _check_dialect(dialect: str) -> None:
+    if dialect not in DIALECTS:
+        raise ValueError(f"Invalid dialect: {dialect}. Must be one of {DIALECTS}")
+
+
+def _column_type(column: ColumnSpec, dialect: str) -> str:
+    length = column.length or column.max_size
+    if column.type == "text":
+        if dialect == "postgres":
+            return f"VARCHAR({length}) NOT NULL"
+        if dialect == "mysql":
+            # Longer VARCHARs run into InnoDB's 64 KB row limit
+            return f"VARCHAR({length}) NOT NULL" if length <= 4096 else "TEXT NOT NULL"
+        if dialect == "sqldb":
+            return f"NVARCHAR({length}) NOT NULL" if length <= 4000 else "NVARCHAR(MAX) NOT NULL"
+        return "TEXT NOT NULL"
+
+    types = {
+        "int": ("INTEGER", "INT", "INT", "INTEGER"),
+        "bigint": ("BIGINT", "BIGINT", "BIGINT", "INTEGER"),
+        "float": ("DOUBLE PRECISION", "DOUBLE", "FLOAT", "REAL"),
+        "json": ("JSONB", "JSON", "NVARCHAR(MAX)", "TEXT"),
+        "uuid": ("UUID", "CHAR(36)", "UNIQUEIDENTIFIER", "TEXT"),
+        "timestamp": (
+            "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP",
+            "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+            "DATETIME2 DEFAULT GETUTCDATE()",
+            "TEXT DEFAULT CURRENT_TIMESTAMP",
+        ),
+    }
+    sql_type = types[column.type][DIALECTS.index(dialect)]
+    return sql_type if column.type == "timestamp" else f"{sql_type} NOT NULL"
+
+
+class RowGenerator:
+    """Generates INSERT parameter rows for a schema.
+
+    Values are drawn with numpy a block of rows at a time, so a single-row
+    write costs a list slice rather than a round of per-column random calls.
+    Generated values never contain tabs, newlines or backslashes, so they
+    can go into PostgreSQL COPY text format unescaped.
+
+    With a ``seed``, each ``stream`` (one per worker) produces the same rows
+    on every run, apart from client-generated primary keys and uuid columns:
+    those come from an unseeded generator, so seeded runs never repeat them
+    in a table that already holds an earlier run's rows. ``keys``
+    holds the integer columns' key generators, which reads and updates can
+    draw from with the same distribution.
+
+    Client-generated primary keys come first in each row. UUID keys are
+    strings, except on MySQL where they go into a BINARY(16) column as
+    bytes; on SQL DB, uuidv7 keys put the timestamp in the last group, which
+    is what SQL Server sorts uniqueidentifier values by first (like
+    NEWSEQUENTIALID()).
+    """
+
+    BLOCK_ROWS = 256
+
+    def __init__(
+        self,
+        schema: WorkloadSchema,
+        seed: Optional[int] = None,
+        stream: int = 0,
+        streams: int = 1,
+        dialect: Optional[str] = None,
+    ):
+        self.schema = schema
+        self._dialect = dialect
+        self._columns = schema.insert_columns
+        # Last uuidv7 millisecond and the counter within it (RFC 9562 method 1)
+        self._v7_ms = 0
+        self._v7_seq = 0
+        # Each stream (worker) gets its own reproducible sequence for a given seed
+        self._rng = np.random.default_rng(None if seed is None else [seed, stream])
+        # Keys and uuids are never seeded: a seeded prefill and run, or a rerun
+        # with --no-truncate, would otherwise regenerate the same unique values
+        self._id_rng = np.random.default_rng()
+        self.keys: Dict[str, KeyGenerator] = {
+            c.name: KeyGenerator(
+                c.distribution or KeyDistribution(),
+                int(c.min_value),
+                int(c.max_value),
+                self._rng,
+                stream,
+                streams,
+            )
+            for c in self._columns
+            if c.type in ("int", "bigint")
+        }
+        self._block: List[Tuple] = []
+        self._index = 0
+
+    def rows(self, count: int) -> List[Tuple]:
+        """The next ``count`` rows of parameters, in the schema's insert_names order."""
+        if count > self.BLOCK_ROWS:
+            return self._generate(count)
+        if self._index + count > len(self._block):
+            self._block = self._generate(self.BLOCK_ROWS)
+            self._index = 0
+        rows = self._block[self._index : self._index + count]
+        self._index += count
+        return rows
+
+    def _generate(self, count: int) -> List[Tuple]:
+        values = [self._values(c, count) for c in self._columns]
+        if self.schema.client_keys:
+            values.insert(0, self._ids(count))
+        return list(zip(*values))
+
+    def _ids(self, count: int) -> List:
+        if self.schema.primary_key == "bigint":
+            return self._id_rng.integers(1, 2**63 - 1, size=count, dtype=np.int64).tolist()
+
+        raw = self._id_rng.integers(0, 256, size=(count, 16), dtype=np.uint8)
+        if self.schema.primary_key == "uuidv4":
+            _set_version(raw, 4)
+        else:
+            ms, seq = self._v7_clock(count)
+            stamp = ((ms[:, None] >> _MS_SHIFTS) & 0xFF).astype(np.uint8)
+            _set_version(raw, 7)
+            if self._dialect == "sqldb":
+                raw[:, 10:16] = stamp
+                raw[:, 8] = 0x80 | (seq >> 8)
+                raw[:, 9] = seq & 0xFF
+            else:
+                raw[:, 0:6] = stamp
+                raw[:, 6] = 0x70 | (seq >> 8)
+                raw[:, 7] = seq & 0xFF
+
+        if self._dialect == "mysql":
+            data = raw.tobytes()
+            return [data[i : i + 16] for i in range(0, len(data), 16)]
+        return _uuid_strings(raw)
+
+    def _v7_clock(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Millisecond timestamps and 12-bit counters keeping this stream's keys increasing."""
+        now = time.time_ns() // 1_000_000
+        if now > self._v7_ms:
+            self._v7_ms, self._v7_seq = now, 0
+        # The counter carries into the next millisecond when it overflows
+        ticks = self._v7_seq + np.arange(count, dtype=np.int64)
+        ms = self._v7_ms + (ticks >> 12)
+        seq = ticks & 0xFFF
+        self._v7_ms, self._v7_seq = int(ms[-1]), int(seq[-1]) + 1
+        return ms, seq
+
+    def _values(self, column: ColumnSpec, count: int) -> List:
+        rng = self._rng
+        if column.type in ("int", "bigint"):
+            return self.keys[column.name].sample(count).tolist()
+        if column.type == "float":
+            return np.round(rng.uniform(column.min_value, column.max_value, count), 4).tolist()
+        if column.type == "uuid":
+            raw = self._id_rng.integers(0, 256, size=(count, 16), dtype=np.uint8)
+            _set_version(raw, 4)
+            return _uuid_strings(raw)
+        if column.type == "json":
+            # Size the text so the whole document comes out near the target size
+            ratio = JSON_FIELD_CHARS / (JSON_FIELD_CHARS + 9)
+            texts = self._text(
+                max(1, int(column.min_size * ratio)),
+                max(1, int(column.max_size * ratio)),
+                column.compressibility,
+                count,
+            )
+            return [_json_document(t) for t in texts]
+        return self._text(column.min_size, column.max_size, column.compressibility, count)
+
+    def _text(self, min_size: int, max_size: int, compressibility: float, count: int) -> List[str]:
+        rng = self._rng
+        lengths = rng.integers(min_size, max_size + 1, size=count)
+        choices = rng.integers(0, len(_ALPHANUMERIC), size=(count, max_size), dtype=np.uint8)
+        codes = _ALPHANUMERIC[choices]
+        if compressibility > 0:
+            # The first `compressibility` of each payload is repeated filler
+            positions = np.arange(max_size)
+            filler = _FILLER[positions % len(_FILLER)]
+            fill = positions < (lengths * compressibility).astype(np.int64)[:, None]
+            codes = np.where(fill, filler, codes)
+        flat = codes.tobytes().decode("ascii")
+        return [flat[i * max_size : i * max_size + length] for i, length in enumerate(lengths)]
+
+
+# Big-endian byte shifts of a 48-bit millisecond timestamp
+_MS_SHIFTS = np.array([40, 32, 24, 16, 8, 0], dtype=np.int64)
+
+
+def _set_version(raw: np.ndarray, version: int) -> None:
+    """Stamp the RFC 9562 version and variant bits into 16-byte UUID rows."""
+    raw[:, 6] = (raw[:, 6] & 0x0F) | (version << 4)
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+
+def _uuid_strings(raw: np.ndarray) -> List[str]:
+    """Format 16-byte rows as canonical 8-4-4-4-12 UUID strings."""
+    h = raw.tobytes().hex()
+    return [
+        f"{h[i : i + 8]}-{h[i + 8 : i + 12]}-{h[i + 12 : i + 16]}-{h[i + 16 : i + 20]}-"
+        f"{h[i + 20 : i + 32]}"
+        for i in range(0, len(h), 32)
+    ]
+
+
+def _json_document(text: str) -> str:
+    fields = (
+        f'"f{i}":"{text[start : start + JSON_FIELD_CHARS]}"'
+        for i, start in enumerate(range(0, len(text), JSON_FIELD_CHARS))
+    )
+    return "{" + ",".join(fields) + "}"
+
@@ -0,0 +1,98 @@
+"""Self-benchmark of the harness itself, using local stand-in providers."""
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from .benchmark import BenchmarkRunner
+from .config import BenchmarkTarget
+
+SELFTEST_ENGINES = ("mock", "sqlite")
+
+
+def selftest_target(engine: str, workdir: Path, latency_ms: float = 0.0) -> BenchmarkTarget:
+    """Build a local target for the self-benchmark."""
+    if engine == "mock":
+        return BenchmarkTarget(
+            host="localhost",
+            port=0,
+            database="",
+            username="",
+            password="",
+            service="mock",
+            mode="local",
+            latency={"distribution": "fixed", "ms": latency_ms},
+        )
+    if engine == "sqlite":
+        return BenchmarkTarget(
+            host="localhost",
+            port=0,
+            database=str(workdir / "selftest.db"),
+            username="",
+            password="",
+            service="sqlite",
+            mode="local",
+        )
+    raise ValueError(f"Unknown selftest engine: {engine}. Must be one of {SELFTEST_ENGINES}")
+
+
+def run_selftest(
+    engines: List[str],
+    concurrency_levels: List[int],
+    duration: int = 5,
+    warmup: int = 1,
+    batch_size: int = 1,
+    latency_ms: float = 0.0,
+) -> List[Dict]:
+    """Measure the harness's maximum ops/s and per-op overhead.
+
+    Each engine runs through the normal BenchmarkRunner at every concurrency
+    level. Per-op overhead is the wall time each worker spends per operation
+    outside write_batch(): ``concurrency * duration / ops - mean latency``.
+    With the mock engine at zero latency this is the harness's own cost;
+    with a fixed latency, ``efficiency`` shows how close the harness gets to
+    the ideal ``concurrency / latency`` ops/s.
+    """
+    rows = []
+
+    with tempfile.TemporaryDirectory(prefix="zrbench-selftest-") as tmp:
+        workdir = Path(tmp)
+
+        for engine in engines:
+            target = selftest_target(engine, workdir, latency_ms)
+
+            for concurrency in concurrency_levels:
+                runner = BenchmarkRunner(
+                    target_name=f"selftest-{engine}",
+                    target_config=target,
+                    concurrency=concurrency,
+                    duration=duration,
+                    warmup=warmup,
+                    batch_size=batch_size,
+                    output_dir=workdir / "results",
+                    # Harness overhead only; no network to probe
+                    probe_interval=None,
+                )
+                summary = runner.run().summary
+
+                ops = summary["total_operations"]
+                ops_per_sec = ops / summary["actual_duration_sec"] if ops else 0.0
+                per_op_ms = concurrency / ops_per_sec * 1000 if ops_per_sec else 0.0
+                overhead_ms = max(per_op_ms - summary["latency_mean_ms"], 0.0)
+
+                row = {
+                    "engine": engine,
+                    "concurrency": concurrency,
+                    "batch_size": batch_size,
+                    "ops_per_sec": ops_per_sec,
+                    "rows_per_sec": summary["throughput_wps"],
+                    "op_latency_mean_ms": float(summary["latency_mean_ms"]),
+                    "overhead_per_op_us": overhead_ms * 1000,
+                    "error_count": summary["error_count"],
+                }
+                if engine == "mock" and latency_ms > 0:
+                    ideal = concurrency / (latency_ms / 1000)
+                    row["efficiency"] = ops_per_sec / ideal
+                rows.append(row)
+
+    return rows
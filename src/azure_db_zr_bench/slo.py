@@ -0,0 +1,313 @@
+"""SLO capacity search: the highest write rate a target sustains within a latency SLO."""
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .benchmark import RATE_MET_TOLERANCE, BenchmarkResult, BenchmarkRunner, WorkerState
+from .loadprofile import LoadLevel
+from .providers import WriteResult
+
+SEARCH_METHODS = ("binary", "golden")
+
+# Golden-section search puts the next step this far into the bracket, from
+# the passing end: fewer steps overload the target than with bisection
+GOLDEN_SPLIT = (3 - math.sqrt(5)) / 2
+
+# Defaults for the search
+SLO_START_RATE = 100.0
+SLO_GROWTH = 2.0
+SLO_PRECISION = 0.05
+SLO_MAX_STEPS = 12
+
+
+@dataclass
+class Slo:
+    """What a rate step must meet to count as sustained.
+
+    A step fails if its P99 latency is above ``latency_p99_ms``, its error
+    rate is above ``max_error_rate``, or it wrote less than
+    ``min_rate_attainment`` of the rate it was asked for (the target, or
+    the workers, could not keep up).
+    """
+
+    latency_p99_ms: float
+    max_error_rate: float = 0.001
+    min_rate_attainment: float = RATE_MET_TOLERANCE
+
+    def __post_init__(self):
+        if self.latency_p99_ms <= 0:
+            raise ValueError(f"SLO P99 must be positive, got {self.latency_p99_ms}")
+        if not 0 <= self.max_error_rate < 1:
+            raise ValueError(f"SLO error rate must be in [0, 1), got {self.max_error_rate}")
+        if not 0 < self.min_rate_attainment <= 1:
+            raise ValueError(
+                f"SLO rate attainment must be in (0, 1], got {self.min_rate_attainment}"
+            )
+
+    def failures(self, summary: Dict) -> List[str]:
+        """Which parts of the SLO a run missed: ``p99``, ``errors`` and/or ``rate``."""
+        failures = []
+        if summary["latency_p99_ms"] > self.latency_p99_ms:
+            failures.append("p99")
+        if summary["error_rate"] > self.max_error_rate:
+            failures.append("errors")
+        if summary.get("rate_attainment", 0) < self.min_rate_attainment:
+            failures.append("rate")
+        return failures
+
+    def describe(self) -> str:
+        return (
+            f"P99 <= {self.latency_p99_ms:g} ms, errors <= {self.max_error_rate:.2%}, "
+            f">= {self.min_rate_attainment:.0%} of the rate"
+        )
+
+
+class SendSchedule:
+    """Paces a worker on a fixed schedule of send times, one every ``1 / rate``.
+
+    Unlike TokenBucket, a worker that falls behind does not skip the slots it
+    missed: it sends them back to back until it has caught up, and
+    ``lag_sec`` is how late the last one went out. Timing each write from its
+    slot counts the queue a stalled target builds up, which a client that
+    simply waited would leave out of its latencies (coordinated omission).
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.lag_sec = 0.0
+        self._next = time.perf_counter()
+
+    def acquire(self, tokens: float = 1.0, stop_event: Optional[threading.Event] = None) -> float:
+        """Block until the next slot and return the seconds waited.
+
+        Returns early (without taking the slot) if ``stop_event`` is set.
+        """
+        start = time.perf_counter()
+        if self._next > start:
+            if stop_event is not None:
+                if stop_event.wait(self._next - start):
+                    return time.perf_counter() - start
+            else:
+                time.sleep(self._next - start)
+        now = time.perf_counter()
+        self.lag_sec = max(now - self._next, 0.0)
+        self._next += tokens / self.rate
+        return now - start
+
+    def set_rate(self, rate: float, burst: float) -> None:
+        """Change the rate for the slots after the next one (``burst`` is unused)."""
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+
+
+class SloStepRunner(BenchmarkRunner):
+    """One step of an SLO search: a rate-limited run, judged against the SLO.
+
+    Workers follow a SendSchedule, and each write's latency runs from the
+    slot it was due in to when it finished, so a target that stalls fails
+    on P99 even though each worker has only one write in flight.
+
+    The verdict goes in ``result.slo`` (and result.json) with the search it
+    belongs to, so the report can rebuild every search from its steps.
+    """
+
+    def __init__(self, *args, slo: Slo, search: str, step: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.target_rate:
+            raise ValueError("An SLO step needs a target rate")
+        if self.load_profile is not None or self.workload != "write":
+            raise ValueError("SLO search runs the write workload at a fixed rate")
+        self.slo = slo
+        self.search = search
+        self.step = step
+
+    def _pace(self, bucket: Optional[SendSchedule], load: LoadLevel) -> SendSchedule:
+        worker_rate = load.rate / load.workers
+        if bucket is None:
+            return SendSchedule(worker_rate)
+        bucket.set_rate(worker_rate, 0.0)
+        return bucket
+
+    def _record_result(self, worker_id: int, state: WorkerState, result: WriteResult) -> None:
+        # From the write's slot: time behind schedule, pool wait, then the write itself
+        result.latency_ms += result.schedule_lag_ms + result.pool_wait_ms
+        super()._record_result(worker_id, state, result)
+
+    def _build_result(self, *args, **kwargs) -> BenchmarkResult:
+        result = super()._build_result(*args, **kwargs)
+        lags = [r.schedule_lag_ms for state in self._worker_states for r in state.results]
+        if lags:
+            result.summary["schedule_lag_p50_ms"] = np.percentile(lags, 50)
+            result.summary["schedule_lag_p99_ms"] = np.percentile(lags, 99)
+            result.summary["schedule_lag_max_ms"] = np.max(lags)
+        failures = self.slo.failures(result.summary)
+        result.slo = {
+            "search": self.search,
+            "step": self.step,
+            **asdict(self.slo),
+            "passed": not failures,
+            "failures": failures,
+        }
+        return result
+
+
+class SloSearch:
+    """Finds the highest write rate a target holds within an SLO.
+
+    Each step is a short rate-limited run (``runner_args`` as for
+    BenchmarkRunner, with the step's ``target_rate``). Steps start at
+    ``start_rate`` and multiply by ``growth`` until one fails the SLO (or
+    ``max_rate`` passes). The bracket between the highest passing and the
+    lowest failing rate is then narrowed, by bisection or by golden-section
+    splits nearer the passing end, until it is within ``precision`` of the
+    failing rate or ``max_steps`` steps have run. ``cooldown`` seconds
+    between steps let queues and replicas catch up after an overload.
+    """
+
+    def __init__(
+        self,
+        runner_args: Dict[str, Any],
+        slo: Slo,
+        start_rate: float = SLO_START_RATE,
+        growth: float = SLO_GROWTH,
+        max_rate: Optional[float] = None,
+        method: str = "binary",
+        precision: float = SLO_PRECISION,
+        max_steps: int = SLO_MAX_STEPS,
+        cooldown: float = 0.0,
+        on_step: Optional[Callable[[BenchmarkResult], None]] = None,
+    ):
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"Invalid search method: {method}. Must be one of {SEARCH_METHODS}")
+        if start_rate <= 0:
+            raise ValueError(f"Start rate must be positive, got {start_rate}")
+        if growth <= 1:
+            raise ValueError(f"Rate growth must be above 1, got {growth}")
+        if max_rate is not None and max_rate < start_rate:
+            raise ValueError("Max rate must be at least the start rate")
+        if not 0 < precision < 1:
+            raise ValueError(f"Search precision must be in (0, 1), got {precision}")
+        if max_steps < 1:
+            raise ValueError("Max steps must be at least 1")
+        if runner_args.get("target_rate") or runner_args.get("load_profile"):
+            raise ValueError("SLO search sets each step's rate itself")
+        self.runner_args = runner_args
+        self.slo = slo
+        self.start_rate = start_rate
+        self.growth = growth
+        self.max_rate = max_rate
+        self.method = method
+        self.precision = precision
+        self.max_steps = max_steps
+        self.cooldown = cooldown
+        self._on_step = on_step
+        self.search_id = (
+            f"{runner_args['target_name']}-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        self.steps: List[BenchmarkResult] = []
+
+    def run(self) -> Dict[str, Any]:
+        """Run the search and return its outcome (see outcome())."""
+        passed: Optional[float] = None
+        failed: Optional[float] = None
+        rate = self.start_rate
+
+        while len(self.steps) < self.max_steps:
+            if self.steps and self.cooldown:
+                time.sleep(self.cooldown)
+            result = self._step(rate)
+            if result.slo["passed"]:
+                passed = rate
+            else:
+                failed = rate
+
+            if failed is None:
+                # Still ramping up
+                if self.max_rate is not None and rate >= self.max_rate:
+                    break
+                rate = rate * self.growth
+                if self.max_rate is not None:
+                    rate = min(rate, self.max_rate)
+                continue
+
+            low = passed or 0.0
+            if failed - low <= self.precision * failed:
+                break
+            if self.method == "golden":
+                rate = low + (failed - low) * GOLDEN_SPLIT
+            else:
+                rate = (low + failed) / 2
+
+        return self.outcome()
+
+    def _step(self, rate: float) -> BenchmarkResult:
+        step = len(self.steps) + 1
+        print(f"\nSLO step {step}: {rate:.1f} writes/sec")
+        runner = SloStepRunner(
+            **self.runner_args,
+            target_rate=rate,
+            slo=self.slo,
+            search=self.search_id,
+            step=step,
+        )
+        result = runner.run()
+        self.steps.append(result)
+        if self._on_step:
+            self._on_step(result)
+        return result
+
+    def outcome(self) -> Dict[str, Any]:
+        """The search so far: its steps and the sustainable rate they bracket.
+
+        ``sustainable_rate_wps`` is the highest rate that passed (None if
+        none did) and ``failing_rate_wps`` the lowest that failed above it
+        (None if the search stopped at ``max_rate`` or ran out of steps
+        while still passing).
+        """
+        return slo_outcome(self.steps)
+
+
+def slo_outcome(steps: List[BenchmarkResult]) -> Dict[str, Any]:
+    """Sustainable and failing rate, and per-step stats, from a search's steps."""
+    steps = sorted(steps, key=lambda r: r.slo["step"])
+    passing = [r.target_rate for r in steps if r.slo["passed"]]
+    sustainable = max(passing) if passing else None
+    failing = [
+        r.target_rate
+        for r in steps
+        if not r.slo["passed"] and (sustainable is None or r.target_rate > sustainable)
+    ]
+    first = steps[0]
+    return {
+        "search": first.slo["search"],
+        "target_name": first.target_name,
+        "service": first.service,
+        "mode": first.mode,
+        "concurrency": first.concurrency,
+        "slo": {key: first.slo[key] for key in ("latency_p99_ms", "max_error_rate")},
+        "sustainable_rate_wps": sustainable,
+        "failing_rate_wps": min(failing) if failing else None,
+        "steps": [
+            {
+                "step": r.slo["step"],
+                "target_rate_wps": r.target_rate,
+                "throughput_wps": r.summary["throughput_wps"],
+                "rate_attainment": r.summary.get("rate_attainment", 0),
+                "latency_p50_ms": r.summary["latency_p50_ms"],
+                "latency_p99_ms": r.summary["latency_p99_ms"],
+                "error_rate": r.summary["error_rate"],
+                "passed": r.slo["passed"],
+                "failures": r.slo["failures"],
+            }
+            for r in steps
+        ],
+    }
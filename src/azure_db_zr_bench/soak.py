@@ -0,0 +1,500 @@
+"""Bounded-memory soak runs with rolling, recoverable output segments."""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .benchmark import (
+    RATE_MET_TOLERANCE,
+    BenchmarkResult,
+    BenchmarkRunner,
+    WorkerState,
+    aggregate_time_series,
+    connection_rate,
+    summarize_workers,
+    worker_stats,
+)
+from .config import DEFAULT_DURABILITY
+from .histogram import LatencyHeatmap, LatencyHistogram
+from .probe import PROBE_METRICS, ProbeStats
+from .providers import WriteResult
+from .schema import DEFAULT_PRIMARY_KEY, DEFAULT_SCHEMA
+
+MANIFEST_FILE = "soak.json"
+SEGMENTS_DIR = "segments"
+
+# Error messages kept per segment (the count is always exact)
+MAX_SEGMENT_ERRORS = 100
+
+# Per-worker counters stored in each segment
+WORKER_COUNTERS = ("writes", "operations", "errors", "reconnects", "probe_ms")
+
+# Time series values that are per-second averages rather than counts
+SERIES_AVERAGES = ("avg_latency_ms", "avg_pool_wait_ms") + tuple(
+    f"avg_{metric}_ms" for metric in PROBE_METRICS
+)
+
+
+class SegmentAccumulator:
+    """What one worker recorded during the current segment.
+
+    Latencies go into fixed-size histograms instead of a list, so a worker's
+    memory does not grow with the number of operations.
+    """
+
+    def __init__(self, pooled: bool = False):
+        self.latency = LatencyHistogram()
+        self.heatmap = LatencyHeatmap()
+        self.pool_wait = LatencyHistogram() if pooled else None
+        self.phases: Dict[str, LatencyHistogram] = {}
+        self.total_writes = 0
+        self.total_operations = 0
+        self.error_count = 0
+        self.reconnect_count = 0
+        self.probe_ms = 0.0
+        self.errors: List[str] = []
+        self.time_series: List[Dict] = []
+
+    def record(self, result: WriteResult) -> None:
+        self.total_operations += 1
+        self.probe_ms += result.probe_ms
+        if self.pool_wait is not None:
+            self.pool_wait.record(result.pool_wait_ms)
+        if result.success:
+            self.total_writes += result.rows_written
+            self.latency.record(result.latency_ms)
+            self.heatmap.record(int(result.timestamp), result.latency_ms)
+            for phase, ms in (result.phases or {}).items():
+                if phase not in self.phases:
+                    self.phases[phase] = LatencyHistogram()
+                self.phases[phase].record(ms)
+        else:
+            self.error_count += 1
+            if result.error and len(self.errors) < MAX_SEGMENT_ERRORS:
+                self.errors.append(result.error)
+
+
+class SoakRunner(BenchmarkRunner):
+    """BenchmarkRunner for long runs: constant memory, output flushed as it goes.
+
+    Instead of keeping every operation result until the end, workers record
+    into per-segment histograms and counters. Every ``segment_minutes`` the
+    current segment (its per-second time series and histograms) is written to
+    ``segments/segment_NNNN.json`` and dropped from memory. ``soak.json``
+    describes the run, so a crashed or interrupted run can be rebuilt from
+    whatever segments reached disk with load_soak_result().
+    """
+
+    def __init__(self, *args, segment_minutes: float = 10.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        if segment_minutes <= 0:
+            raise ValueError(f"Segment length must be positive, got {segment_minutes}")
+        if self.load_profile is not None:
+            raise ValueError("Load profiles are not supported in soak mode")
+        if self.workload == "replay":
+            # Per-template latency needs every operation result
+            raise ValueError("The replay workload is not supported in soak mode")
+        if self.workload == "server-loop":
+            raise ValueError("The server-loop workload is not supported in soak mode")
+        self.segment_minutes = segment_minutes
+
+        self._pooled = bool(self.pool_size)
+        self._segments = [SegmentAccumulator(self._pooled) for _ in range(self.concurrency)]
+        self._segment_locks = [threading.Lock() for _ in range(self.concurrency)]
+        # Each worker's reconnect count as of the last rotation
+        self._reconnects_flushed = [0] * self.concurrency
+        self._segment_count = 0
+        self._segment_start: Optional[datetime] = None
+        self._measure_start_second = 0
+        self._interrupted = False
+
+    def _record_result(self, worker_id: int, state: WorkerState, result: WriteResult) -> None:
+        with self._segment_locks[worker_id]:
+            self._segments[worker_id].record(result)
+
+    def _record_interval(self, worker_id: int, entry: Dict) -> None:
+        with self._segment_locks[worker_id]:
+            self._segments[worker_id].time_series.append(entry)
+
+    def _measure(self, run_dir: Path, start_time: datetime, warmup_end_time: datetime) -> None:
+        """Run for the measurement window, rotating segments as it goes."""
+        (run_dir / SEGMENTS_DIR).mkdir(exist_ok=True)
+        self._segment_start = warmup_end_time
+        self._measure_start_second = int(warmup_end_time.timestamp())
+        self._write_manifest(run_dir, start_time, warmup_end_time)
+
+        segment_sec = self.segment_minutes * 60
+        deadline = time.monotonic() + self.duration
+        next_rotation = time.monotonic() + segment_sec
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                until_rotation = next_rotation - time.monotonic()
+                if until_rotation >= remaining:
+                    time.sleep(remaining)
+                    break
+                time.sleep(max(until_rotation, 0))
+                self._rotate(run_dir, datetime.now())
+                next_rotation += segment_sec
+        except KeyboardInterrupt:
+            print("Interrupted; flushing the current segment...")
+            self._interrupted = True
+
+    def _build_result(
+        self,
+        worker_states: List[WorkerState],
+        start_time: datetime,
+        warmup_end_time: datetime,
+        window_end_time: datetime,
+        end_time: datetime,
+        run_dir: Path,
+    ) -> BenchmarkResult:
+        # Workers have stopped, so the last segment is complete; it ends with
+        # the window, so the drain does not dilute its throughput
+        self._rotate(run_dir, max(window_end_time, self._segment_start))
+        self._write_manifest(
+            run_dir,
+            start_time,
+            warmup_end_time,
+            window_end_time=window_end_time,
+            end_time=end_time,
+            complete=not self._interrupted,
+        )
+        return load_soak_result(run_dir)
+
+    def _rotate(self, run_dir: Path, end_time: datetime) -> None:
+        """Swap out every worker's segment and write the closed one to disk."""
+        closed = []
+        for i in range(self.concurrency):
+            with self._segment_locks[i]:
+                closed.append(self._segments[i])
+                self._segments[i] = SegmentAccumulator(self._pooled)
+            reconnects = self._worker_states[i].reconnect_count
+            closed[i].reconnect_count = reconnects - self._reconnects_flushed[i]
+            self._reconnects_flushed[i] = reconnects
+        with self._probe_lock:
+            probe, self._probe_stats = self._probe_stats, ProbeStats()
+
+        self._segment_count += 1
+        segment = _segment_record(
+            self._segment_count,
+            self._segment_start,
+            end_time,
+            closed,
+            self._measure_start_second,
+            probe,
+        )
+        _write_json_atomic(
+            run_dir / SEGMENTS_DIR / f"segment_{self._segment_count:04d}.json", segment
+        )
+        self._segment_start = end_time
+
+        print(
+            f"  Segment {self._segment_count}: {segment['total_writes']:,} writes, "
+            f"{segment['error_count']} errors"
+        )
+
+    def _write_manifest(
+        self,
+        run_dir: Path,
+        start_time: datetime,
+        warmup_end_time: datetime,
+        window_end_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        complete: bool = False,
+    ) -> None:
+        _write_json_atomic(
+            run_dir / MANIFEST_FILE,
+            {
+                "target_name": self.target_name,
+                "service": self.target_config.service,
+                "mode": self.target_config.mode,
+                "concurrency": self.concurrency,
+                "duration": self.duration,
+                "warmup": self.warmup,
+                "batch_size": self.batch_size,
+                "target_rate": self.target_rate,
+                "pool_size": self.pool_size,
+                "workload": self.workload,
+                "schema": self.schema.name,
+                "schema_definition": self.schema.to_dict(),
+                "primary_key": self.schema.primary_key,
+                "seed": self.target_config.seed,
+                "durability": self.target_config.durability or DEFAULT_DURABILITY,
+                "proxy": self.target_config.proxy.to_dict() if self.target_config.proxy else None,
+                "segment_minutes": self.segment_minutes,
+                "start_time": start_time.isoformat(),
+                "measure_start_time": warmup_end_time.isoformat(),
+                "measure_end_time": window_end_time.isoformat() if window_end_time else None,
+                "end_time": end_time.isoformat() if end_time else None,
+                "drain_sec": self._drain_sec if end_time else None,
+                "complete": complete,
+            },
+        )
+
+
+def _segment_record(
+    index: int,
+    start_time: datetime,
+    end_time: datetime,
+    accumulators: List[SegmentAccumulator],
+    start_second: int,
+    probe: Optional[ProbeStats] = None,
+) -> Dict:
+    """Merge the workers' accumulators (and RTT probe samples) into one serializable segment."""
+    errors = [e for a in accumulators for e in a.errors][:MAX_SEGMENT_ERRORS]
+    series = [e for a in accumulators for e in a.time_series]
+    if probe is not None:
+        series += probe.time_series
+
+    segment = {
+        "index": index,
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "duration_sec": (end_time - start_time).total_seconds(),
+        "total_writes": sum(a.total_writes for a in accumulators),
+        "total_operations": sum(a.total_operations for a in accumulators),
+        "error_count": sum(a.error_count for a in accumulators),
+        "errors": errors,
+        "latency_histogram": LatencyHistogram.merged(a.latency for a in accumulators).to_dict(),
+        "time_series": aggregate_time_series(series, start_second),
+        # Heatmap rows are keyed by Unix second until the run is loaded
+        "heatmap": _merge_heatmaps(a.heatmap for a in accumulators).to_dict(),
+        # Indexed by worker id
+        "workers": [
+            {
+                "writes": a.total_writes,
+                "operations": a.total_operations,
+                "errors": a.error_count,
+                "reconnects": a.reconnect_count,
+                "probe_ms": a.probe_ms,
+                "latency_histogram": a.latency.to_dict(),
+            }
+            for a in accumulators
+        ],
+    }
+
+    if probe is not None:
+        segment["rtt_probe"] = probe.to_dict()
+
+    if accumulators[0].pool_wait is not None:
+        segment["pool_wait_histogram"] = LatencyHistogram.merged(
+            a.pool_wait for a in accumulators
+        ).to_dict()
+
+    phase_names = sorted({p for a in accumulators for p in a.phases})
+    if phase_names:
+        segment["phase_histograms"] = {
+            phase: LatencyHistogram.merged(
+                a.phases[phase] for a in accumulators if phase in a.phases
+            ).to_dict()
+            for phase in phase_names
+        }
+
+    return segment
+
+
+def _merge_heatmaps(heatmaps: Iterator[LatencyHeatmap]) -> LatencyHeatmap:
+    merged = LatencyHeatmap()
+    for heatmap in heatmaps:
+        merged.merge(heatmap)
+    return merged
+
+
+def _write_json_atomic(path: Path, data: Dict) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _iter_segments(run_dir: Path) -> Iterator[Dict]:
+    """Yield the segments of a soak run in order, one at a time."""
+    for path in sorted((run_dir / SEGMENTS_DIR).glob("segment_*.json")):
+        with open(path, "r") as f:
+            yield json.load(f)
+
+
+def is_soak_run(run_dir: Path) -> bool:
+    return (run_dir / MANIFEST_FILE).exists()
+
+
+def load_soak_result(run_dir: Path) -> BenchmarkResult:
+    """Rebuild a BenchmarkResult from a soak run's segments on disk.
+
+    Works for finished runs and for runs that crashed or were interrupted:
+    the result then covers the segments that were written and its summary
+    has ``partial`` set. Segments are merged one at a time, so memory stays
+    bounded by one segment plus the output time series.
+    """
+    with open(run_dir / MANIFEST_FILE, "r") as f:
+        manifest = json.load(f)
+
+    latency = LatencyHistogram()
+    heatmap = LatencyHeatmap()
+    pool_wait = LatencyHistogram() if manifest.get("pool_size") else None
+    phases: Dict[str, LatencyHistogram] = {}
+    probe = ProbeStats()
+    workers: List[Dict] = []
+    total_writes = total_operations = total_errors = 0
+    duration = 0.0
+    errors: List[str] = []
+    by_second: Dict[int, Dict] = {}
+    end_time = manifest.get("end_time") or manifest["measure_start_time"]
+    segment_count = 0
+
+    for segment in _iter_segments(run_dir):
+        segment_count += 1
+        total_writes += segment["total_writes"]
+        total_operations += segment["total_operations"]
+        total_errors += segment["error_count"]
+        duration += segment["duration_sec"]
+        errors.extend(segment["errors"][: 100 - len(errors)])
+        end_time = segment["end_time"]
+
+        latency.merge(LatencyHistogram.from_dict(segment["latency_histogram"]))
+        if "heatmap" in segment:
+            heatmap.merge(LatencyHeatmap.from_dict(segment["heatmap"]))
+        if pool_wait is not None and "pool_wait_histogram" in segment:
+            pool_wait.merge(LatencyHistogram.from_dict(segment["pool_wait_histogram"]))
+        for worker_id, data in enumerate(segment.get("workers", [])):
+            if worker_id == len(workers):
+                workers.append({key: 0 for key in WORKER_COUNTERS})
+                workers[worker_id]["latency"] = LatencyHistogram()
+            for key in WORKER_COUNTERS:
+                workers[worker_id][key] += data.get(key, 0)
+            hist = LatencyHistogram.from_dict(data["latency_histogram"])
+            workers[worker_id]["latency"].merge(hist)
+        if "rtt_probe" in segment:
+            probe.merge(ProbeStats.from_dict(segment["rtt_probe"]))
+        for phase, data in segment.get("phase_histograms", {}).items():
+            hist = LatencyHistogram.from_dict(data)
+            if phase in phases:
+                phases[phase].merge(hist)
+            else:
+                phases[phase] = hist
+
+        # A second that straddles a segment boundary appears in both segments
+        for point in segment["time_series"]:
+            existing = by_second.get(point["elapsed_sec"])
+            if existing is None:
+                by_second[point["elapsed_sec"]] = dict(point)
+            else:
+                # Each segment's averages count by the writes it had in that second
+                weight, other = existing["throughput_wps"], point["throughput_wps"]
+                existing["throughput_wps"] += other
+                for key in SERIES_AVERAGES:
+                    if key not in point:
+                        continue
+                    if key not in existing:
+                        existing[key] = point[key]
+                    elif weight + other > 0:
+                        existing[key] = (existing[key] * weight + point[key] * other) / (
+                            weight + other
+                        )
+                    else:
+                        existing[key] = (existing[key] + point[key]) / 2
+
+    heatmap.shift(int(datetime.fromisoformat(manifest["measure_start_time"]).timestamp()))
+
+    throughput = total_writes / duration if duration > 0 else 0
+    latency_p50, latency_p95, latency_p99 = latency.percentiles([50, 95, 99])
+
+    summary = {
+        "total_writes": total_writes,
+        "total_operations": total_operations,
+        "actual_duration_sec": duration,
+        "throughput_wps": throughput,
+        "latency_p50_ms": latency_p50,
+        "latency_p95_ms": latency_p95,
+        "latency_p99_ms": latency_p99,
+        "latency_mean_ms": latency.mean,
+        "latency_min_ms": latency.min,
+        "latency_max_ms": latency.max,
+        "error_count": total_errors,
+        "error_rate": total_errors / total_operations if total_operations > 0 else 0,
+        "soak_segments": segment_count,
+        "partial": not manifest.get("complete", False),
+    }
+    if manifest.get("drain_sec") is not None:
+        summary["drain_sec"] = manifest["drain_sec"]
+
+    worker_summaries = [
+        worker_stats(
+            worker_id,
+            w["latency"],
+            writes=w["writes"],
+            operations=w["operations"],
+            errors=w["errors"],
+            reconnects=w["reconnects"],
+            duration_sec=duration,
+        )
+        for worker_id, w in enumerate(workers)
+    ]
+    summary.update(summarize_workers(worker_summaries))
+    summary.update(probe.summary())
+
+    if manifest.get("workload") == "connect":
+        summary["connections_per_sec"] = connection_rate(
+            [(w["writes"], w["probe_ms"] / 1000) for w in workers], duration
+        )
+        for phase, hist in phases.items():
+            name = phase[: -len("_ms")]
+            p50, p95, p99 = hist.percentiles([50, 95, 99])
+            summary[f"{name}_p50_ms"] = p50
+            summary[f"{name}_p95_ms"] = p95
+            summary[f"{name}_p99_ms"] = p99
+            summary[f"{name}_mean_ms"] = hist.mean
+            summary[f"{name}_samples"] = hist.total
+
+    if pool_wait is not None:
+        summary["pool_size"] = manifest["pool_size"]
+        if pool_wait.total:
+            p50, p95, p99 = pool_wait.percentiles([50, 95, 99])
+            summary["pool_wait_p50_ms"] = p50
+            summary["pool_wait_p95_ms"] = p95
+            summary["pool_wait_p99_ms"] = p99
+            summary["pool_wait_mean_ms"] = pool_wait.mean
+            summary["pool_wait_max_ms"] = pool_wait.max
+
+    if manifest.get("target_rate"):
+        attainment = throughput / manifest["target_rate"]
+        summary["target_rate_wps"] = manifest["target_rate"]
+        summary["rate_attainment"] = attainment
+        summary["target_rate_met"] = attainment >= RATE_MET_TOLERANCE
+
+    return BenchmarkResult(
+        target_name=manifest["target_name"],
+        service=manifest["service"],
+        mode=manifest["mode"],
+        concurrency=manifest["concurrency"],
+        duration=manifest["duration"],
+        warmup=manifest["warmup"],
+        batch_size=manifest["batch_size"],
+        start_time=manifest["start_time"],
+        end_time=end_time,
+        summary=summary,
+        time_series=[by_second[s] for s in sorted(by_second)],
+        raw_latencies=[],
+        errors=errors,
+        output_path=run_dir,
+        target_rate=manifest.get("target_rate"),
+        pool_size=manifest.get("pool_size"),
+        workload=manifest.get("workload", "write"),
+        latency_histogram=latency,
+        latency_heatmap=heatmap,
+        workers=worker_summaries,
+        schema=manifest.get("schema", DEFAULT_SCHEMA),
+        schema_definition=manifest.get("schema_definition"),
+        primary_key=manifest.get("primary_key", DEFAULT_PRIMARY_KEY),
+        seed=manifest.get("seed"),
+        durability=manifest.get("durability", DEFAULT_DURABILITY),
+        proxy=manifest.get("proxy"),
+    )
@@ -0,0 +1,323 @@
+"""Embedded SQLite store of benchmark results for cross-run queries."""
+
+import json
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    # benchmark.py writes to the store, so only import this for annotations
+    from .benchmark import BenchmarkResult
+
+# Default store location, relative to the results directory
+STORE_FILE = "results.db"
+
+# Summary metrics copied into indexed columns of the runs table
+RUN_METRICS = (
+    "throughput_wps",
+    "latency_p50_ms",
+    "latency_p95_ms",
+    "latency_p99_ms",
+    "latency_mean_ms",
+    "latency_max_ms",
+    "error_rate",
+    "total_writes",
+)
+
+# Per-second time series columns
+SECOND_METRICS = ("throughput_wps", "avg_latency_ms", "avg_pool_wait_ms")
+
+TREND_BUCKETS = {
+    "day": "substr(r.start_time, 1, 10)",
+    "week": "strftime('%Y-W%W', r.start_time)",
+    "month": "substr(r.start_time, 1, 7)",
+}
+
+# What makes runs comparable in a trend line, besides being a soak run or not.
+# ``parameters`` is the run's settings as canonical JSON, so runs that differ
+# in any setting (schema, durability, emulated network, ...) stay apart
+TREND_KEY = (
+    "r.target_name, r.concurrency, r.workload, r.target_rate, r.batch_size, r.pool_size, "
+    "r.parameters"
+)
+
+# Run columns --where can filter on directly; other dimensions are read from parameters
+RUN_DIMENSIONS = ("service", "mode", "target_name")
+TREND_SOAK = "json_extract(r.summary, '$.soak_segments') IS NOT NULL"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    target_name TEXT NOT NULL,
+    service TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    concurrency INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    warmup INTEGER NOT NULL,
+    batch_size INTEGER NOT NULL,
+    target_rate REAL,
+    pool_size INTEGER,
+    workload TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    output_path TEXT,
+    parameters TEXT,
+    {", ".join(f"{m} REAL" for m in RUN_METRICS)},
+    summary TEXT NOT NULL,
+    errors TEXT NOT NULL,
+    UNIQUE (target_name, start_time)
+);
+CREATE INDEX IF NOT EXISTS runs_by_target ON runs (target_name, concurrency, start_time);
+CREATE INDEX IF NOT EXISTS runs_by_service ON runs (service, mode, start_time);
+CREATE TABLE IF NOT EXISTS time_series (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    elapsed_sec INTEGER NOT NULL,
+    {", ".join(f"{m} REAL" for m in SECOND_METRICS)},
+    PRIMARY KEY (run_id, elapsed_sec)
+) WITHOUT ROWID;
+"""
+
+
+def parse_since(since: str) -> str:
+    """Turn ``90d``, ``12w`` or an ISO date into an ISO timestamp lower bound."""
+    match = re.fullmatch(r"(\d+)([dw])", since.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        days = amount * 7 if unit == "w" else amount
+        return (datetime.now() - timedelta(days=days)).isoformat()
+    try:
+        return datetime.fromisoformat(since).isoformat()
+    except ValueError:
+        raise ValueError(f"Invalid --since: {since}. Use e.g. 90d, 12w or 2024-01-31")
+
+
+class ResultsStore:
+    """SQLite database holding every run's metadata, summary and time series.
+
+    One row per run goes in ``runs`` (key summary metrics are real, indexed
+    columns; the full summary is kept as JSON) and one row per run-second in
+    ``time_series``, so trends across months of runs are a single indexed
+    SQL query instead of a rescan of every results directory. Runs are
+    identified by target name and start time; saving a run again replaces it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        # Stores created before run settings were kept get the column, empty for old runs
+        if "parameters" not in {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}:
+            conn.execute("ALTER TABLE runs ADD COLUMN parameters TEXT")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, result: "BenchmarkResult") -> None:
+        """Add (or replace) one run."""
+        self.add_many([result])
+
+    def add_many(self, results: List["BenchmarkResult"]) -> int:
+        """Add (or replace) several runs in one transaction."""
+        columns = (
+            "target_name, service, mode, concurrency, duration, warmup, batch_size, "
+            "target_rate, pool_size, workload, start_time, end_time, output_path, parameters, "
+            + ", ".join(RUN_METRICS)
+            + ", summary, errors"
+        )
+        placeholders = ", ".join("?" for _ in columns.split(", "))
+
+        with self.connect() as conn:
+            for result in results:
+                conn.execute(
+                    "DELETE FROM runs WHERE target_name = ? AND start_time = ?",
+                    (result.target_name, result.start_time),
+                )
+                cursor = conn.execute(
+                    f"INSERT INTO runs ({columns}) VALUES ({placeholders})",
+                    (
+                        result.target_name,
+                        result.service,
+                        result.mode,
+                        result.concurrency,
+                        result.duration,
+                        result.warmup,
+                        result.batch_size,
+                        result.target_rate,
+                        result.pool_size,
+                        result.workload,
+                        result.start_time,
+                        result.end_time,
+                        str(result.output_path) if result.output_path else None,
+                        json.dumps(result.parameters, sort_keys=True),
+                        *(_to_float(result.summary.get(m)) for m in RUN_METRICS),
+                        json.dumps(result.summary, default=float),
+                        json.dumps(result.errors),
+                    ),
+                )
+                run_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT OR REPLACE INTO time_series VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (
+                            run_id,
+                            point["elapsed_sec"],
+                            *(_to_float(point.get(m)) for m in SECOND_METRICS),
+                        )
+                        for point in result.time_series
+                    ),
+                )
+
+        return len(results)
+
+    def query_runs(
+        self,
+        target: Optional[str] = None,
+        service: Optional[str] = None,
+        mode: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        workload: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+        dimensions: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Dict]:
+        """Runs matching the filters, newest first.
+
+        ``dimensions`` holds ``--where`` filters (see pivot.parse_where()),
+        on any run dimension including the settings in ``parameters``.
+        """
+        where, params = _filters(target, service, mode, concurrency, workload, since, dimensions)
+        sql = (
+            "SELECT run_id, target_name, service, mode, concurrency, batch_size, target_rate, "
+            f"pool_size, workload, start_time, parameters, {', '.join(RUN_METRICS)} "
+            f"FROM runs r {where} ORDER BY start_time DESC"
+        )
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+
+        with self.connect() as conn:
+            return [_with_parameters(row) for row in conn.execute(sql, params)]
+
+    def trend(
+        self,
+        metric: str,
+        bucket: str = "day",
+        per_second: bool = False,
+        target: Optional[str] = None,
+        service: Optional[str] = None,
+        mode: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        workload: Optional[str] = None,
+        since: Optional[str] = None,
+        dimensions: Optional[Dict[str, List[str]]] = None,
+    ) -> List[Dict]:
+        """Aggregate a metric per time bucket and kind of run.
+
+        Runs are only aggregated with runs of the same target and settings
+        (every entry of ``parameters``), and soak runs (``soak`` is 1) apart
+        from regular ones, so each trend line compares like with like. By default ``metric`` is a run summary metric and each
+        bucket reports the mean, min and max across runs. With ``per_second``
+        it is a time series column, aggregated over every matching run-second.
+        """
+        allowed = SECOND_METRICS if per_second else RUN_METRICS
+        if metric not in allowed:
+            raise ValueError(f"Invalid metric: {metric}. Must be one of {allowed}")
+        if bucket not in TREND_BUCKETS:
+            raise ValueError(f"Invalid bucket: {bucket}. Must be one of {tuple(TREND_BUCKETS)}")
+
+        where, params = _filters(target, service, mode, concurrency, workload, since, dimensions)
+
+        if per_second:
+            # Reduce each run's seconds to count/sum/min/max first (in primary
+            # key order), so the bucket expression runs once per run, not per row
+            source = (
+                "runs r JOIN ("
+                f"SELECT run_id, COUNT({metric}) AS n, SUM({metric}) AS total, "
+                f"MIN({metric}) AS lo, MAX({metric}) AS hi FROM time_series "
+                f"WHERE run_id IN (SELECT r.run_id FROM runs r {where}) GROUP BY run_id"
+                ") t ON t.run_id = r.run_id"
+            )
+            aggregates = (
+                "SUM(t.n) AS samples, SUM(t.total) / SUM(t.n) AS mean, "
+                "MIN(t.lo) AS min, MAX(t.hi) AS max"
+            )
+            where = ""
+        else:
+            source = "runs r"
+            aggregates = (
+                f"COUNT(r.{metric}) AS samples, AVG(r.{metric}) AS mean, "
+                f"MIN(r.{metric}) AS min, MAX(r.{metric}) AS max"
+            )
+
+        sql = (
+            f"SELECT {TREND_BUCKETS[bucket]} AS bucket, {TREND_KEY}, {TREND_SOAK} AS soak, "
+            f"COUNT(*) AS runs, {aggregates} "
+            f"FROM {source} {where} "
+            f"GROUP BY bucket, {TREND_KEY}, soak "
+            f"ORDER BY {TREND_KEY}, soak, bucket"
+        )
+
+        with self.connect() as conn:
+            return [_with_parameters(row) for row in conn.execute(sql, params)]
+
+
+def _filters(target, service, mode, concurrency, workload, since, dimensions=None):
+    clauses, params = [], []
+    for column, value in (
+        ("target_name", target),
+        ("service", service),
+        ("mode", mode),
+        ("concurrency", concurrency),
+        ("workload", workload),
+    ):
+        if value is not None:
+            clauses.append(f"r.{column} = ?")
+            params.append(value)
+    if since:
+        clauses.append("r.start_time >= ?")
+        params.append(parse_since(since))
+    for dimension, values in (dimensions or {}).items():
+        if not re.fullmatch(r"[a-z_]+", dimension):
+            raise ValueError(f"Invalid dimension: {dimension}")
+        if dimension in RUN_DIMENSIONS:
+            column = f"r.{dimension}"
+        else:
+            column = f"json_extract(r.parameters, '$.{dimension}')"
+        matches = []
+        for value in values:
+            if value == "none":
+                matches.append(f"{column} IS NULL")
+                continue
+            matches.append(f"{column} = ?")
+            params.append(value)
+            try:
+                # Numbers are stored as numbers; ``10`` also matches 10.0
+                params.append(float(value))
+                matches.append(f"{column} = ?")
+            except ValueError:
+                pass
+        clauses.append(f"({' OR '.join(matches)})")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _with_parameters(row: sqlite3.Row) -> Dict:
+    """A result row as a dict, with ``parameters`` decoded (None for runs stored before it)."""
+    data = dict(row)
+    data["parameters"] = json.loads(data["parameters"]) if data["parameters"] else None
+    return data
+
+
+def _to_float(value) -> Optional[float]:
+    return None if value is None else float(value)